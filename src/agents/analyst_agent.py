@@ -4,6 +4,7 @@ InsightCosmos Analyst Agent
 Analyzes article content using LLM, extracts insights, and scores priority.
 
 Classes:
+    EmbeddingBatcher: Collects embedding requests into multi-content API calls
     AnalystAgentRunner: Main runner for article analysis workflow
 
 Functions:
@@ -38,14 +39,17 @@ Usage:
     batch_results = await runner.analyze_batch([1, 2, 3, 4, 5])
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from pathlib import Path
+from contextlib import contextmanager, nullcontext
+import hashlib
 import json
 import re
 import logging
 from datetime import datetime
 import asyncio
 
+import numpy as np
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
@@ -53,7 +57,10 @@ from google.genai.types import Content, Part
 from google.genai import Client
 
 from src.memory.article_store import ArticleStore
-from src.memory.embedding_store import EmbeddingStore
+from src.memory.embedding_store import ANALYSIS_EMBEDDING_MODEL, EmbeddingStore
+from src.memory.write_queue import WriteBehindQueue
+from src.utils.disk_cache import DiskCache
+from src.utils.llm_cache import LLMResponseCache
 from src.utils.logger import Logger
 from src.utils.config import Config
 
@@ -113,6 +120,195 @@ def create_analyst_agent(
     return agent
 
 
+class EmbeddingBatcher:
+    """
+    Embedding micro-batcher
+
+    Concurrent ``embed()`` calls are collected for up to ``max_wait`` seconds
+    (or until ``max_batch_size`` texts are waiting) and sent as one
+    multi-content ``embed_content`` request. The blocking client call runs in
+    a worker thread, so the event loop keeps serving other analyses.
+
+    Analyses finish seconds apart, so a window long enough to merge their
+    texts would also delay the last ones. Callers that will embed register
+    via ``participant()``; once every registered caller is waiting for an
+    embedding, the pending texts are sent without waiting out the window.
+
+    Attributes:
+        client: google.genai Client (or any object with ``models.embed_content``)
+        model (str): Default embedding model
+        max_batch_size (int): Maximum texts per request
+        max_wait (float): Seconds a text waits for its batch to fill
+
+    Example:
+        >>> batcher = EmbeddingBatcher(Client(api_key=key))
+        >>> vectors = await asyncio.gather(*[batcher.embed(t) for t in texts])
+        >>> print(batcher.stats())
+
+        >>> with batcher.participant():
+        ...     text = await summarize(article)  # seconds of LLM work
+        ...     vector = await batcher.embed(text)
+    """
+
+    MAX_BATCH_SIZE = 100  # Gemini batch embedding limit
+    DEFAULT_MAX_WAIT = 0.05
+
+    def __init__(
+        self,
+        client: Any,
+        model: str = ANALYSIS_EMBEDDING_MODEL,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize EmbeddingBatcher
+
+        Args:
+            client: google.genai Client (or a stub with ``models.embed_content``)
+            model: Default embedding model (default: ANALYSIS_EMBEDDING_MODEL)
+            max_batch_size: Maximum texts per request (default: 100)
+            max_wait: Seconds to wait for more texts before sending (default: 0.05);
+                registered participants may trigger an earlier send
+            logger: Logger instance (optional)
+        """
+        self.client = client
+        self.model = model
+        self.max_batch_size = max(1, min(max_batch_size, self.MAX_BATCH_SIZE))
+        self.max_wait = max_wait
+        self.logger = logger or Logger.get_logger("EmbeddingBatcher")
+
+        # model -> [(text, future)]; only touched from the event loop thread
+        self._pending: Dict[str, List[tuple]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set = set()
+        # Registered callers, and how many of them wait for an embedding
+        self._participants = 0
+        self._waiting = 0
+        self._stats = {"texts": 0, "requests": 0, "failed_requests": 0}
+
+    @contextmanager
+    def participant(self) -> Iterator[None]:
+        """
+        Register the current task as a caller that is going to embed
+
+        While registered callers are still busy (e.g. waiting for the LLM),
+        pending texts wait for them up to ``max_wait``; when all of them wait
+        for an embedding, the batch is sent right away.
+
+        Must be entered from the event loop thread.
+        """
+        self._bind_loop()
+        self._participants += 1
+        try:
+            yield
+        finally:
+            self._participants -= 1
+            self._flush_if_all_waiting()
+
+    async def embed(self, text: str, model: Optional[str] = None) -> List[float]:
+        """
+        Embed one text as part of the next batch
+
+        Args:
+            text: Text to embed
+            model: Embedding model (default: ``self.model``)
+
+        Returns:
+            List[float]: Embedding values
+
+        Raises:
+            Exception: Whatever the embedding request raised
+        """
+        model = model or self.model
+        loop = self._bind_loop()
+
+        future = loop.create_future()
+        batch = self._pending.setdefault(model, [])
+        batch.append((text, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._dispatch(model)
+        elif model not in self._timers:
+            self._timers[model] = loop.call_later(self.max_wait, self._dispatch, model)
+
+        self._waiting += 1
+        try:
+            self._flush_if_all_waiting()
+            return await future
+        finally:
+            self._waiting -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get batching statistics
+
+        Returns:
+            dict: texts, requests, failed_requests
+        """
+        return dict(self._stats)
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running loop, dropping state left by a previous one"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # New event loop (e.g. another asyncio.run): drop state of the old one
+            self._loop = loop
+            self._pending = {}
+            self._timers = {}
+            self._tasks = set()
+            self._participants = 0
+            self._waiting = 0
+        return loop
+
+    def _flush_if_all_waiting(self) -> None:
+        """Send pending texts once no registered caller can add more"""
+        if self._participants and self._waiting >= self._participants:
+            for model in list(self._pending):
+                self._dispatch(model)
+
+    def _dispatch(self, model: str) -> None:
+        """Send the pending texts of a model as one request"""
+        timer = self._timers.pop(model, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(model, [])
+        if batch:
+            task = asyncio.ensure_future(self._send(model, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, model: str, batch: List[tuple]) -> None:
+        """Embed a batch off the event loop and resolve its futures"""
+        texts = [text for text, _ in batch]
+        self._stats["texts"] += len(texts)
+        self._stats["requests"] += 1
+
+        try:
+            result = await asyncio.to_thread(
+                self.client.models.embed_content, model=model, contents=texts
+            )
+            embeddings = [embedding.values for embedding in result.embeddings]
+            if len(embeddings) != len(texts):
+                raise RuntimeError(
+                    f"Expected {len(texts)} embeddings, got {len(embeddings)}"
+                )
+        except Exception as e:
+            self._stats["failed_requests"] += 1
+            self.logger.error(f"Batch embedding of {len(texts)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.logger.debug(f"Embedded {len(texts)} texts in one request")
+        for (_, future), values in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(values)
+
+
 class AnalystAgentRunner:
     """
     Analyst Agent Runner
@@ -130,6 +326,10 @@ class AnalystAgentRunner:
         logger (Logger): Logger instance
         session_service (InMemorySessionService): ADK session service
         app_name (str): ADK application name
+        adk_runner (Runner): ADK Runner shared by all analyses
+        embedding_batcher (EmbeddingBatcher): Batches embedding requests
+        embedding_cache (DiskCache): Embeddings keyed by model and text hash (optional)
+        llm_cache (LLMResponseCache): Cached analysis responses (optional)
 
     Example:
         >>> runner = AnalystAgentRunner(agent, article_store, embedding_store)
@@ -144,7 +344,12 @@ class AnalystAgentRunner:
         article_store: ArticleStore,
         embedding_store: EmbeddingStore,
         logger: Optional[logging.Logger] = None,
-        config: Optional[Config] = None
+        config: Optional[Config] = None,
+        write_queue: Optional[WriteBehindQueue] = None,
+        embedding_cache: Optional[DiskCache] = None,
+        llm_cache: Optional[LLMResponseCache] = None,
+        embedding_batch_size: int = EmbeddingBatcher.MAX_BATCH_SIZE,
+        embedding_batch_wait: float = EmbeddingBatcher.DEFAULT_MAX_WAIT
     ):
         """
         Initialize AnalystAgentRunner
@@ -155,24 +360,81 @@ class AnalystAgentRunner:
             embedding_store: Embedding storage
             logger: Logger instance (optional)
             config: Configuration instance (optional)
+            write_queue: Write-behind queue for results (optional; when set,
+                results are persisted in batches and embedding_id is None)
+            embedding_cache: Persistent embedding cache (optional; identical
+                text is then embedded once per model)
+            llm_cache: LLM response cache (optional; identical prompts are
+                then answered without calling the model)
+            embedding_batch_size: Maximum texts per embedding request (default: 100)
+            embedding_batch_wait: Seconds an embedding text waits for others
+                (default: 0.05); analyses in flight send their batch earlier
+                once all of them wait for an embedding
         """
         self.agent = agent
         self.article_store = article_store
         self.embedding_store = embedding_store
+        self.write_queue = write_queue
+        self.embedding_cache = embedding_cache
+        self.llm_cache = llm_cache
         self.logger = logger or Logger.get_logger("AnalystAgentRunner")
         self.config = config or Config()
 
-        # ADK Runner setup
+        # ADK Runner setup: one Runner for all analyses; each analysis gets
+        # an ephemeral session that is deleted after its final response
         self.session_service = InMemorySessionService()
         self.app_name = "insightcosmos_analyst"
+        self._adk_runner: Optional[Runner] = None
+        self._session_stats = {"created": 0, "deleted": 0, "peak_active": 0}
+        # Sessions not deleted yet: session ID -> events received from the Runner
+        self._live_sessions: Dict[str, int] = {}
 
-        # Embedding client
+        # Embedding client; concurrent analyses share batched requests
         self.genai_client = Client(api_key=self.config.google_api_key)
+        self.embedding_batcher = EmbeddingBatcher(
+            self.genai_client,
+            max_batch_size=embedding_batch_size,
+            max_wait=embedding_batch_wait,
+            logger=self.logger
+        )
+
+    @property
+    def adk_runner(self) -> Runner:
+        """Shared ADK Runner (created on first use)"""
+        if self._adk_runner is None:
+            self._adk_runner = Runner(
+                agent=self.agent,
+                app_name=self.app_name,
+                session_service=self.session_service
+            )
+        return self._adk_runner
+
+    def session_stats(self) -> Dict[str, int]:
+        """
+        Get ADK session statistics
+
+        Returns:
+            dict: sessions_created, sessions_deleted, active_sessions,
+                peak_active_sessions and active_events (events received by
+                sessions that are not deleted yet)
+
+        Example:
+            >>> stats = runner.session_stats()
+            >>> print(f"{stats['active_sessions']} sessions alive")
+        """
+        return {
+            "sessions_created": self._session_stats["created"],
+            "sessions_deleted": self._session_stats["deleted"],
+            "active_sessions": len(self._live_sessions),
+            "peak_active_sessions": self._session_stats["peak_active"],
+            "active_events": sum(self._live_sessions.values()),
+        }
 
     async def analyze_article(
         self,
         article_id: int,
-        skip_if_analyzed: bool = True
+        skip_if_analyzed: bool = True,
+        llm_slots: Optional[asyncio.Semaphore] = None
     ) -> Dict[str, Any]:
         """
         Analyze single article
@@ -180,6 +442,9 @@ class AnalystAgentRunner:
         Args:
             article_id: Article ID
             skip_if_analyzed: Skip if article already analyzed (default: True)
+            llm_slots: Semaphore held only around the LLM call (optional);
+                the embedding wait happens outside it, so the texts of more
+                analyses than there are slots can share one request
 
         Returns:
             dict: Analysis result
@@ -199,78 +464,110 @@ class AnalystAgentRunner:
             >>> if result['status'] == 'success':
             ...     print(f"Priority: {result['analysis']['priority_score']}")
         """
-        try:
-            # 1. Fetch article
-            article = self.article_store.get_by_id(article_id)
-            if not article:
-                raise ValueError(f"Article not found: {article_id}")
-
-            # Skip if already analyzed
-            if skip_if_analyzed and article.get('status') == 'analyzed':
-                self.logger.info(f"Article {article_id} already analyzed, skipping")
+        # Registered for the whole analysis, so the batcher knows this text
+        # is still coming while the LLM call runs
+        with self.embedding_batcher.participant():
+            try:
+                # 1. Fetch article (a previous analysis is never read here)
+                article = self.article_store.get_by_id(article_id, parse_analysis=False)
+                if not article:
+                    raise ValueError(f"Article not found: {article_id}")
+
+                # Skip if already analyzed
+                if skip_if_analyzed and article.get('status') == 'analyzed':
+                    self.logger.info(f"Article {article_id} already analyzed, skipping")
+                    return {
+                        "status": "skipped",
+                        "article_id": article_id,
+                        "message": "Article already analyzed"
+                    }
+
+                # Check content
+                if not article.get('content'):
+                    raise ValueError(f"Article content is empty: {article_id}")
+
+                self.logger.info(f"Analyzing article {article_id}: {article['title'][:50]}...")
+
+                # 2. Prepare input
+                user_input = self._prepare_input(article)
+
+                # 3. Invoke LLM
+                async with llm_slots if llm_slots is not None else nullcontext():
+                    response_text = await self._invoke_llm(article_id, user_input)
+
+                # 4. Parse analysis
+                analysis = self._parse_analysis(response_text)
+
+                # 5. Generate embedding
+                embedding_text = self._prepare_embedding_text(analysis)
+                embedding = await self._generate_embedding(embedding_text)
+
+                # 6-7. Store results and embedding
+                embedding_id = None
+                if self.write_queue is not None:
+                    # Batched by the queue's writer thread; submitting may block
+                    # when the queue is full, so keep it off the event loop
+                    await asyncio.to_thread(
+                        self._enqueue_results, article_id, analysis, embedding
+                    )
+                else:
+                    self.article_store.update_analysis(
+                        article_id=article_id,
+                        analysis=analysis,
+                        priority_score=analysis['priority_score']
+                    )
+
+                    if embedding:
+                        embedding_id = self.embedding_store.store(
+                            article_id=article_id,
+                            vector=np.array(embedding),
+                            model=ANALYSIS_EMBEDDING_MODEL
+                        )
+
+                self.logger.info(
+                    f"Successfully analyzed article {article_id} "
+                    f"(priority: {analysis['priority_score']:.2f})"
+                )
+
                 return {
-                    "status": "skipped",
+                    "status": "success",
                     "article_id": article_id,
-                    "message": "Article already analyzed"
+                    "analysis": analysis,
+                    "embedding_id": embedding_id,
+                    "analyzed_at": datetime.utcnow().isoformat()
                 }
 
-            # Check content
-            if not article.get('content'):
-                raise ValueError(f"Article content is empty: {article_id}")
-
-            self.logger.info(f"Analyzing article {article_id}: {article['title'][:50]}...")
-
-            # 2. Prepare input
-            user_input = self._prepare_input(article)
-
-            # 3. Invoke LLM
-            response_text = await self._invoke_llm(article_id, user_input)
-
-            # 4. Parse analysis
-            analysis = self._parse_analysis(response_text)
-
-            # 5. Generate embedding
-            embedding_text = self._prepare_embedding_text(analysis)
-            embedding = await self._generate_embedding(embedding_text)
-
-            # 6. Store results
-            self.article_store.update_analysis(
-                article_id=article_id,
-                analysis=analysis,
-                priority_score=analysis['priority_score']
-            )
-
-            # 7. Store embedding
-            embedding_id = None
-            if embedding:
-                import numpy as np
-                embedding_id = self.embedding_store.store(
-                    article_id=article_id,
-                    vector=np.array(embedding),
-                    model="text-embedding-004"  # Gemini embedding model
-                )
-
-            self.logger.info(
-                f"Successfully analyzed article {article_id} "
-                f"(priority: {analysis['priority_score']:.2f})"
-            )
+            except Exception as e:
+                self.logger.error(f"Failed to analyze article {article_id}: {e}")
+                return {
+                    "status": "error",
+                    "article_id": article_id,
+                    "error_message": str(e),
+                    "suggestion": self._get_error_suggestion(e)
+                }
 
-            return {
-                "status": "success",
-                "article_id": article_id,
-                "analysis": analysis,
-                "embedding_id": embedding_id,
-                "analyzed_at": datetime.utcnow().isoformat()
-            }
+    def _enqueue_results(
+        self,
+        article_id: int,
+        analysis: Dict[str, Any],
+        embedding: Optional[List[float]]
+    ) -> None:
+        """
+        Submit analysis and embedding to the write-behind queue (written
+        in one transaction)
 
-        except Exception as e:
-            self.logger.error(f"Failed to analyze article {article_id}: {e}")
-            return {
-                "status": "error",
-                "article_id": article_id,
-                "error_message": str(e),
-                "suggestion": self._get_error_suggestion(e)
-            }
+        Args:
+            article_id: Article ID
+            analysis: Parsed analysis
+            embedding: Embedding values (optional)
+        """
+        self.write_queue.submit_result(
+            article_id=article_id,
+            analysis=analysis,
+            priority_score=analysis['priority_score'],
+            vector=np.array(embedding) if embedding else None,
+            model=ANALYSIS_EMBEDDING_MODEL
+        )
 
     async def analyze_batch(
         self,
@@ -283,7 +580,7 @@ class AnalystAgentRunner:
 
         Args:
             article_ids: List of article IDs
-            max_concurrent: Maximum concurrent analyses (default: 5)
+            max_concurrent: Maximum concurrent LLM calls (default: 5)
             skip_if_analyzed: Skip already analyzed articles (default: True)
 
         Returns:
@@ -302,16 +599,16 @@ class AnalystAgentRunner:
         """
         self.logger.info(f"Starting batch analysis of {len(article_ids)} articles")
 
-        # Create semaphore for concurrency control
+        # Create semaphore for concurrency control (held around LLM calls only,
+        # so embeddings of all articles can share requests)
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def _analyze_with_semaphore(article_id: int) -> Dict[str, Any]:
-            async with semaphore:
-                return await self.analyze_article(article_id, skip_if_analyzed)
-
         # Run analyses concurrently
         results = await asyncio.gather(
-            *[_analyze_with_semaphore(aid) for aid in article_ids],
+            *[
+                self.analyze_article(aid, skip_if_analyzed, llm_slots=semaphore)
+                for aid in article_ids
+            ],
             return_exceptions=True
         )
 
@@ -352,7 +649,7 @@ class AnalystAgentRunner:
         self.logger.info(f"Fetching pending articles (limit={limit})")
 
         # Get pending articles
-        pending_articles = self.article_store.get_by_status('pending', limit=limit)
+        pending_articles = self.article_store.get_by_status('pending', limit=limit, fields=['id'])
         article_ids = [a['id'] for a in pending_articles]
 
         if not article_ids:
@@ -403,6 +700,10 @@ URL：{article.get('url', 'Unknown')}
         """
         Invoke LLM for analysis
 
+        Returns the cached response for an identical prompt if an LLM cache
+        is set. Otherwise runs the shared ADK Runner in a fresh session, which
+        is deleted once the final response arrived (or the call failed).
+
         Args:
             article_id: Article ID (for session ID)
             user_input: Input text
@@ -413,29 +714,37 @@ URL：{article.get('url', 'Unknown')}
         Raises:
             RuntimeError: If LLM invocation fails
         """
-        try:
-            # Create runner
-            runner = Runner(
-                agent=self.agent,
-                app_name=self.app_name,
-                session_service=self.session_service
-            )
+        # Cache lookups and writes are SQLite calls; keep them off the event loop
+        if self.llm_cache is not None:
+            cached = await asyncio.to_thread(self.llm_cache.get, self.agent, user_input)
+            if cached is not None:
+                self.logger.info(f"Using cached LLM response for article {article_id}")
+                return cached
 
-            # Create session
-            session_id = f"analysis_{article_id}_{datetime.utcnow().timestamp()}"
+        session_id = f"analysis_{article_id}_{datetime.utcnow().timestamp()}"
+        session_created = False
+
+        try:
             await self.session_service.create_session(
                 app_name=self.app_name,
                 user_id="system",
                 session_id=session_id
             )
+            session_created = True
+            self._live_sessions[session_id] = 0
+            self._session_stats["created"] += 1
+            self._session_stats["peak_active"] = max(
+                self._session_stats["peak_active"], len(self._live_sessions)
+            )
 
             # Run agent
             response_text = ""
-            async for event in runner.run_async(
+            async for event in self.adk_runner.run_async(
                 user_id="system",
                 session_id=session_id,
                 new_message=Content(parts=[Part(text=user_input)], role="user")
             ):
+                self._live_sessions[session_id] += 1
                 if event.is_final_response() and event.content and event.content.parts:
                     response_text = event.content.parts[0].text
                     break
@@ -443,12 +752,29 @@ URL：{article.get('url', 'Unknown')}
             if not response_text:
                 raise RuntimeError("LLM returned empty response")
 
+            if self.llm_cache is not None:
+                await asyncio.to_thread(self.llm_cache.set, self.agent, user_input, response_text)
+
             return response_text
 
         except Exception as e:
             self.logger.error(f"LLM invocation failed: {e}")
             raise RuntimeError(f"LLM invocation failed: {e}")
 
+        finally:
+            # Sessions are single-use; drop them so long backfills stay flat
+            if session_created:
+                try:
+                    await self.session_service.delete_session(
+                        app_name=self.app_name,
+                        user_id="system",
+                        session_id=session_id
+                    )
+                    del self._live_sessions[session_id]
+                    self._session_stats["deleted"] += 1
+                except Exception as e:
+                    self.logger.warning(f"Failed to delete session {session_id}: {e}")
+
     def _parse_analysis(self, response_text: str) -> Dict[str, Any]:
         """
         Parse LLM response JSON
@@ -553,6 +879,12 @@ URL：{article.get('url', 'Unknown')}
         """
         Generate embedding vector
 
+        With an embedding cache, text embedded before with the same model
+        (after whitespace normalization) is returned without an API call.
+        Otherwise the text joins the batcher's next multi-content request, so
+        concurrent analyses share round-trips and the event loop is not
+        blocked while the request is in flight.
+
         Args:
             text: Text to embed
             model: Embedding model name (optional)
@@ -565,13 +897,22 @@ URL：{article.get('url', 'Unknown')}
             return None
 
         try:
-            model = model or "text-embedding-004"  # Default embedding model
-            result = self.genai_client.models.embed_content(
-                model=model,
-                contents=text
-            )
+            model = model or ANALYSIS_EMBEDDING_MODEL
 
-            embedding = result.embeddings[0].values
+            cache_key = self._embedding_cache_key(text, model)
+            # Cache lookups and writes are SQLite calls; keep them off the event loop
+            if self.embedding_cache is not None:
+                cached = await asyncio.to_thread(self.embedding_cache.get, cache_key)
+                if cached is not None:
+                    self.logger.debug(f"Embedding cache hit (dim={len(cached)})")
+                    return cached.tolist()
+
+            embedding = await self.embedding_batcher.embed(text, model=model)
+
+            if self.embedding_cache is not None:
+                await asyncio.to_thread(
+                    self.embedding_cache.set, cache_key, np.asarray(embedding, dtype=np.float32)
+                )
             self.logger.debug(f"Generated embedding (dim={len(embedding)})")
 
             return embedding
@@ -581,6 +922,22 @@ URL：{article.get('url', 'Unknown')}
             # Return None instead of zero vector to indicate failure
             return None
 
+    @staticmethod
+    def _embedding_cache_key(text: str, model: str) -> str:
+        """
+        Embedding cache key: model plus SHA-256 of the whitespace-normalized text
+
+        Args:
+            text: Text to embed
+            model: Embedding model name
+
+        Returns:
+            str: Cache key
+        """
+        normalized = ' '.join(text.split())
+        digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return f"{model}:{digest}"
+
     def _get_error_suggestion(self, error: Exception) -> str:
         """
         Get error suggestion based on exception type
@@ -52,6 +52,7 @@ Usage:
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime, date, timedelta
+import asyncio
 import json
 import re
 
@@ -68,7 +69,9 @@ from src.memory.report_store import ReportStore
 from src.tools.email_sender import EmailSender, EmailConfig
 from src.tools.digest_formatter import DigestFormatter
 from src.utils.config import Config
+from src.utils.llm_cache import LLMResponseCache
 from src.utils.logger import Logger
+from src.utils.url_utils import is_redirect_url
 
 
 def create_curator_agent(config: Config) -> LlmAgent:
@@ -154,7 +157,8 @@ class CuratorDailyRunner:
         self,
         agent: LlmAgent,
         article_store: ArticleStore,
-        config: Config
+        config: Config,
+        llm_cache: Optional[LLMResponseCache] = None
     ):
         """
         Initialize CuratorDailyRunner
@@ -163,10 +167,12 @@ class CuratorDailyRunner:
             agent: Curator Daily Agent
             article_store: Article storage instance
             config: Application configuration
+            llm_cache: LLM response cache (optional)
         """
         self.agent = agent
         self.article_store = article_store
         self.config = config
+        self.llm_cache = llm_cache
         self.logger = Logger.get_logger(__name__)
 
         # Initialize formatter and email sender
@@ -421,7 +427,8 @@ class CuratorDailyRunner:
                 limit=max_articles * 3,  # Fetch 3x to have buffer for dedup
                 status='analyzed',
                 fetched_after=fetched_after,
-                fetched_before=fetched_before
+                fetched_before=fetched_before,
+                fields=ArticleStore.LISTING_FIELDS + ('analysis',)  # content is not needed
             )
 
             # Ensure all articles have required fields
@@ -454,7 +461,8 @@ class CuratorDailyRunner:
                 priority_reasoning = analysis.get('priority_reasoning', '')
 
                 # Get title - prefer analysis summary for google_search_grounding articles
-                # (their original titles are often garbled URL encodings)
+                # whose redirect URL was never resolved (their titles are garbled
+                # URL encodings of the redirect token)
                 original_title = article.get('title', 'Untitled')
                 analysis_summary = analysis.get('summary', '')
 
@@ -462,7 +470,10 @@ class CuratorDailyRunner:
                 is_garbled = (
                     len(original_title) > 50 and
                     original_title.startswith('Auziyq')
-                ) or article.get('source') == 'google_search_grounding'
+                ) or (
+                    article.get('source') == 'google_search_grounding' and
+                    is_redirect_url(article.get('url', ''))
+                )
 
                 # Use analysis summary as title if original is garbled, truncate to first sentence
                 if is_garbled and analysis_summary:
@@ -635,12 +646,21 @@ class CuratorDailyRunner:
         """
         Invoke LLM and get response (async)
 
+        Identical input is answered from the LLM cache when one is set.
+        Cache reads and writes run in a worker thread, off the event loop.
+
         Args:
             user_input: User input message
 
         Returns:
             Optional[str]: LLM response or None if failed
         """
+        if self.llm_cache is not None:
+            cached = await asyncio.to_thread(self.llm_cache.get, self.agent, user_input)
+            if cached is not None:
+                self.logger.info("Using cached digest response")
+                return cached
+
         try:
             # Create session
             session_id = "curator_session"
@@ -669,7 +689,11 @@ class CuratorDailyRunner:
                 self.logger.warning("LLM returned empty response")
                 return None
 
-            return response_text.strip()
+            response_text = response_text.strip()
+            if self.llm_cache is not None:
+                await asyncio.to_thread(self.llm_cache.set, self.agent, user_input, response_text)
+
+            return response_text
 
         except Exception as e:
             import traceback
@@ -742,7 +766,8 @@ class CuratorDailyRunner:
 def generate_daily_digest(
     config: Config,
     recipient_email: str,
-    max_articles: int = 10
+    max_articles: int = 10,
+    llm_cache: Optional[LLMResponseCache] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to generate and send daily digest
@@ -751,6 +776,7 @@ def generate_daily_digest(
         config: Application configuration
         recipient_email: Recipient email address
         max_articles: Maximum number of articles (default: 10)
+        llm_cache: LLM response cache (optional)
 
     Returns:
         dict: Result of digest generation and sending
@@ -776,7 +802,8 @@ def generate_daily_digest(
     runner = CuratorDailyRunner(
         agent=agent,
         article_store=article_store,
-        config=config
+        config=config,
+        llm_cache=llm_cache
     )
 
     # Generate and send digest
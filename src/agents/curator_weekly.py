@@ -24,10 +24,11 @@ from google.adk.runners import Runner
 from google.genai import types as genai_types
 
 from src.utils.config import Config
+from src.utils.llm_cache import LLMResponseCache
 from src.utils.logger import setup_logger
 from src.memory.database import Database
 from src.memory.article_store import ArticleStore
-from src.memory.embedding_store import EmbeddingStore
+from src.memory.embedding_store import ANALYSIS_EMBEDDING_MODEL, EmbeddingStore
 from src.tools.vector_clustering import VectorClusteringTool
 from src.tools.trend_analysis import TrendAnalysisTool
 from src.tools.digest_formatter import DigestFormatter
@@ -80,17 +81,20 @@ class CuratorWeeklyRunner:
         db (Database): 資料庫連接
         article_store (ArticleStore): 文章存儲
         embedding_store (EmbeddingStore): 向量存儲
+        llm_cache (LLMResponseCache): LLM 回應快取（可選）
         logger (Logger): 日誌記錄器
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, llm_cache: Optional[LLMResponseCache] = None):
         """
         初始化 Weekly Curator Runner
 
         Args:
             config: 配置對象
+            llm_cache: LLM 回應快取（可選；相同輸入直接重用先前的報告）
         """
         self.config = config
+        self.llm_cache = llm_cache
         self.db = Database.from_config(config)
         self.article_store = ArticleStore(self.db)
         self.embedding_store = EmbeddingStore(self.db)
@@ -252,7 +256,8 @@ class CuratorWeeklyRunner:
             start_date=start_date.isoformat(),
             end_date=end_date.isoformat(),
             status="analyzed",
-            min_priority=0.6  # 過濾低優先度文章
+            min_priority=0.6,  # 過濾低優先度文章
+            fields=ArticleStore.LISTING_FIELDS  # 不載入全文與分析 JSON
         )
 
         return articles
@@ -273,10 +278,12 @@ class CuratorWeeklyRunner:
         # 獲取文章 IDs
         article_ids = [a["id"] for a in articles]
 
-        # 查詢 Embeddings
-        embeddings_data = self.embedding_store.get_embeddings(article_ids)
+        # 從記憶體映射的向量檔取得矩陣（依 article_ids 順序，不經 SQLAlchemy）
+        found_ids, embeddings_matrix = self.embedding_store.get_matrix(
+            article_ids, model=ANALYSIS_EMBEDDING_MODEL
+        )
 
-        if not embeddings_data:
+        if len(found_ids) == 0:
             return {
                 "status": "error",
                 "error_type": "no_embeddings",
@@ -284,13 +291,11 @@ class CuratorWeeklyRunner:
                 "suggestion": "Ensure Analyst Agent has generated embeddings"
             }
 
-        # 建立 article_id -> embedding 的映射
-        embedding_map = {e["article_id"]: e["embedding"] for e in embeddings_data}
-
-        # 只保留有 embedding 的文章
+        # 只保留有 embedding 的文章（順序與矩陣列一致）
+        found = set(found_ids.tolist())
         articles_with_embeddings = [
             article for article in articles
-            if article["id"] in embedding_map
+            if article["id"] in found
         ]
 
         # 檢查是否有足夠的文章進行聚類
@@ -307,12 +312,6 @@ class CuratorWeeklyRunner:
             f"(filtered from {len(articles)} total)"
         )
 
-        # 組織成 numpy 矩陣（按過濾後的文章順序）
-        embeddings_matrix = np.array([
-            embedding_map[article["id"]]
-            for article in articles_with_embeddings
-        ])
-
         # 準備元數據（使用過濾後的文章）
         metadata = []
         for article in articles_with_embeddings:
@@ -433,6 +432,11 @@ class CuratorWeeklyRunner:
             input_json = json.dumps(input_data, ensure_ascii=False, indent=2)
             user_input = f"請根據以下數據生成週報：\n\n{input_json}"
 
+            # 相同 Agent 與輸入已有快取回應時，不再呼叫 LLM
+            cached_response = (
+                self.llm_cache.get(agent, user_input) if self.llm_cache is not None else None
+            )
+
             # 創建 session service 和 runner
             session_service = InMemorySessionService()
             runner = Runner(
@@ -470,11 +474,18 @@ class CuratorWeeklyRunner:
                 return response_text.strip() if response_text else None
 
             # 執行 async 函數
-            final_response = asyncio.run(invoke_llm_async())
+            if cached_response is not None:
+                self.logger.info("Using cached LLM report")
+                final_response = cached_response
+            else:
+                final_response = asyncio.run(invoke_llm_async())
 
             if not final_response:
                 raise Exception("No final response from LLM")
 
+            if cached_response is None and self.llm_cache is not None:
+                self.llm_cache.set(agent, user_input, final_response)
+
             # 解析輸出
             report_json = self._parse_llm_output(final_response)
 
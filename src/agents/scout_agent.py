@@ -5,13 +5,19 @@ InsightCosmos Scout Agent
 Scout Agent 是信息收集代理，负责从 RSS feeds 和 Google Search 收集 AI/Robotics 领域的文章。
 
 Classes:
+    ScoutArtifactStore: 单次收集运行的文章暂存区（工具写入，Runner 直接组装结果）
     ScoutAgentRunner: Scout Agent 运行器
 
 Functions:
     fetch_rss: ADK 工具包装器 - RSS 文章抓取
     search_articles: ADK 工具包装器 - Google Search 文章搜索
+    load_scout_plan: 读取声明式来源计划（feeds、queries、每个来源的上限）
     create_scout_agent: 创建 Scout Agent 实例
 
+Modes:
+    fast: 按来源计划直接并行执行 RSS 抓取与搜索，不经过 LLM（默认）
+    explore: 由 Scout LLM Agent 决定如何调用工具
+
 Usage:
     from src.agents.scout_agent import ScoutAgentRunner
 
@@ -19,16 +25,22 @@ Usage:
     result = runner.collect_articles()
     print(f"Collected {result['total_count']} articles")
 
+    # LLM 驱动的探索模式
+    runner = ScoutAgentRunner(mode="explore")
+
 References:
     - Planning Doc: docs/planning/stage5_scout_agent.md
     - ADK LlmAgent: https://github.com/google/adk-docs/blob/main/docs/agents/llm-agents.md
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime, timezone
 import json
 import logging
 import os
+import threading
 
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
@@ -36,8 +48,12 @@ from google.adk.sessions import InMemorySessionService
 from google.adk.plugins import LoggingPlugin
 from google.genai import types
 
-from src.tools import RSSFetcher, GoogleSearchGroundingTool
+from src.tools import RSSFetcher, GoogleSearchGroundingTool, RedirectResolver
 from src.utils.logger import Logger
+from src.utils.config import Config
+from src.utils.disk_cache import DiskCache
+from src.utils.search_cache import SearchResultCache
+from src.utils.url_utils import normalize_url
 
 
 # ============================================================================
@@ -172,6 +188,142 @@ def get_article_stats(articles: list) -> dict:
     return stats
 
 
+# ============================================================================
+# Run-scoped Artifact Store
+# ============================================================================
+
+class ScoutArtifactStore:
+    """
+    单次收集运行的文章暂存区
+
+    工具把抓取到的文章存入暂存区，只把简短的 handle 与数量返回给 LLM；
+    Agent 的最终输出只需列出要采用的 handle，Runner 再从暂存区直接组装
+    文章列表。这样文章内容不必经过 LLM 重新输出，耗时与 token 用量不再
+    随文章数增长。
+
+    Attributes:
+        handles (List[str]): 已存入的 handle（依存入顺序）
+
+    Example:
+        >>> store = ScoutArtifactStore()
+        >>> handle = store.put("rss", [{"url": "https://example.com/a", "title": "A"}])
+        >>> handle
+        'rss-1'
+        >>> len(store.articles([handle]))
+        1
+    """
+
+    def __init__(self):
+        self._artifacts: Dict[str, List[Dict[str, Any]]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """暂存的文章总数"""
+        with self._lock:
+            return sum(len(articles) for articles in self._artifacts.values())
+
+    @property
+    def handles(self) -> List[str]:
+        with self._lock:
+            return list(self._artifacts)
+
+    def put(self, kind: str, articles: List[Dict[str, Any]]) -> str:
+        """
+        存入一批文章
+
+        Args:
+            kind: 来源类型（如 "rss"、"search"），用作 handle 前缀
+            articles: 文章列表
+
+        Returns:
+            str: 这批文章的 handle（如 "rss-1"）
+        """
+        with self._lock:
+            self._counts[kind] = self._counts.get(kind, 0) + 1
+            handle = f"{kind}-{self._counts[kind]}"
+            self._artifacts[handle] = list(articles)
+            return handle
+
+    def articles(self, handles: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        组装文章列表
+
+        Args:
+            handles: 要采用的 handle（默认全部；未知的 handle 会被忽略）
+
+        Returns:
+            List[Dict]: 依 handle 顺序合并的文章
+        """
+        with self._lock:
+            selected = list(self._artifacts) if handles is None else list(handles)
+            articles = []
+            for handle in selected:
+                articles.extend(self._artifacts.get(handle, []))
+            return articles
+
+
+# 当前收集运行的暂存区（由 ScoutAgentRunner.collect_articles 设定；
+# 未设定时工具照旧返回完整文章列表）
+_current_artifacts: ContextVar[Optional[ScoutArtifactStore]] = ContextVar(
+    "scout_artifacts", default=None
+)
+
+
+def _stash_articles(kind: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    把工具结果中的文章存入当前暂存区，返回给 LLM 的结果只保留 handle 与数量
+
+    Args:
+        kind: 来源类型（handle 前缀）
+        result: 工具的完整结果
+
+    Returns:
+        dict: 精简后的结果（没有暂存区时原样返回）
+    """
+    store = _current_artifacts.get()
+    if store is None or not result.get("articles"):
+        return result
+
+    compact = {key: value for key, value in result.items() if key != "articles"}
+    compact["handle"] = store.put(kind, result["articles"])
+    compact["article_count"] = len(result["articles"])
+    return compact
+
+
+_search_cache: Optional[SearchResultCache] = None
+_search_cache_loaded = False
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SearchResultCache]:
+    """
+    取得 search_articles 共用的搜索结果缓存（进程内共享，首次调用时创建）
+
+    重复或重试的查询在新鲜期内直接返回缓存结果，不消耗 Grounding 配额。
+
+    Returns:
+        Optional[SearchResultCache]: 缓存；配置无法加载或 TTL 为 0 时为 None
+
+    Example:
+        >>> search_cache = get_search_cache()
+        >>> if search_cache:
+        ...     print(search_cache.stats()["hit_rate"])
+    """
+    global _search_cache, _search_cache_loaded
+
+    with _search_cache_lock:
+        if not _search_cache_loaded:
+            _search_cache_loaded = True
+            try:
+                _search_cache = SearchResultCache.from_config(Config.load())
+            except (FileNotFoundError, ValueError) as e:
+                Logger.get_logger("search_articles").warning(
+                    f"Search result cache disabled: {e}"
+                )
+        return _search_cache
+
+
 # ============================================================================
 # ADK Tool Wrappers
 # ============================================================================
@@ -182,6 +334,8 @@ def fetch_rss(feed_urls: List[str], max_articles_per_feed: int = 10) -> Dict[str
 
     这是一个 ADK 兼容的工具函数，包装了 RSSFetcher 类的功能。
     LLM 将根据此 docstring 理解如何使用这个工具。
+    在 Scout 收集运行中，文章存入暂存区，结果以 "handle" 与
+    "article_count" 取代 "articles"。
 
     Args:
         feed_urls: RSS feed URL 列表
@@ -190,12 +344,14 @@ def fetch_rss(feed_urls: List[str], max_articles_per_feed: int = 10) -> Dict[str
     Returns:
         dict: {
             "status": "success" | "partial" | "error",
-            "articles": List[Dict],  # 文章列表
+            "articles": List[Dict],  # 文章列表（收集运行中改为 handle / article_count）
             "errors": List[Dict],    # 错误列表
             "summary": {
                 "total_feeds": int,
                 "successful_feeds": int,
-                "total_articles": int
+                "total_articles": int,
+                "skipped_feeds": int,  # 未变更（304 / 内容相同）的 feed 数
+                "bytes_saved": int
             }
         }
 
@@ -215,14 +371,20 @@ def fetch_rss(feed_urls: List[str], max_articles_per_feed: int = 10) -> Dict[str
     start_time = time.time()
 
     try:
-        fetcher = RSSFetcher(timeout=30)
+        # Per-feed ETag / Last-Modified cache so unchanged feeds are not re-parsed
+        feed_cache = DiskCache(
+            os.path.join(os.getenv("CACHE_DIR", "data/cache"), "cache.db"),
+            namespace="rss_feeds",
+            max_entries=5000
+        )
+        fetcher = RSSFetcher(timeout=30, cache=feed_cache)
         result = fetcher.fetch_rss_feeds(
             feed_urls=feed_urls,
             max_articles_per_feed=max_articles_per_feed
         )
         elapsed = time.time() - start_time
         logger.info(f"  ✓ fetch_rss returned {result['summary']['total_articles']} articles in {elapsed:.1f}s")
-        return result
+        return _stash_articles("rss", result)
 
     except Exception as e:
         logger.error(f"fetch_rss failed: {e}")
@@ -247,6 +409,8 @@ def search_articles(query: str, max_results: int = 10) -> Dict[str, Any]:
 
     这是一个 ADK 兼容的工具函数，包装了 GoogleSearchGroundingTool 类的功能。
     LLM 将根据此 docstring 理解如何使用这个工具。
+    在 Scout 收集运行中，文章存入暂存区，结果以 "handle" 与
+    "article_count" 取代 "articles"。
 
     Args:
         query: 搜索查询字符串
@@ -256,7 +420,7 @@ def search_articles(query: str, max_results: int = 10) -> Dict[str, Any]:
         dict: {
             "status": "success" | "error",
             "query": str,
-            "articles": List[Dict],
+            "articles": List[Dict],  # 收集运行中改为 handle / article_count
             "total_results": int,
             "error_message": str (if error)
         }
@@ -274,13 +438,13 @@ def search_articles(query: str, max_results: int = 10) -> Dict[str, Any]:
     start_time = time.time()
 
     try:
-        search_tool = GoogleSearchGroundingTool()
+        search_tool = GoogleSearchGroundingTool(search_cache=get_search_cache())
         result = search_tool.search_articles(query=query, max_results=max_results)
         search_tool.close()
 
         elapsed = time.time() - start_time
         logger.info(f"  ✓ search_articles returned {result['total_results']} articles in {elapsed:.1f}s")
-        return result
+        return _stash_articles("search", result)
 
     except Exception as e:
         logger.error(f"search_articles failed: {e}")
@@ -293,6 +457,81 @@ def search_articles(query: str, max_results: int = 10) -> Dict[str, Any]:
         }
 
 
+# ============================================================================
+# Source Plan
+# ============================================================================
+
+DEFAULT_PLAN_FILE = "prompts/scout_plan.json"
+
+
+def load_scout_plan(plan_file: str = DEFAULT_PLAN_FILE) -> Dict[str, Any]:
+    """
+    读取声明式来源计划
+
+    计划文件为 JSON：
+        {
+            "feeds": [url, {"url": url, "max_articles": 5}, ...],
+            "max_articles_per_feed": 3,
+            "queries": [query, {"query": query, "max_results": 10}, ...],
+            "max_results_per_query": 5
+        }
+    每个 feed / query 可用对象形式覆盖默认上限。
+
+    Args:
+        plan_file: 计划文件路径（默认 prompts/scout_plan.json）
+
+    Returns:
+        dict: {
+            "feeds": List[Dict],    # {"url": str, "max_articles": int}
+            "queries": List[Dict]   # {"query": str, "max_results": int}
+        }
+
+    Raises:
+        FileNotFoundError: 如果计划文件不存在
+        ValueError: 如果计划格式无效
+
+    Example:
+        >>> plan = load_scout_plan()
+        >>> print(len(plan["feeds"]), len(plan["queries"]))
+        8 5
+    """
+    if not os.path.exists(plan_file):
+        raise FileNotFoundError(f"Scout plan not found: {plan_file}")
+
+    with open(plan_file, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    if not isinstance(raw, dict):
+        raise ValueError(f"Scout plan must be a JSON object: {plan_file}")
+
+    default_feed_cap = int(raw.get("max_articles_per_feed", 10))
+    default_query_cap = int(raw.get("max_results_per_query", 10))
+
+    feeds = []
+    for entry in raw.get("feeds", []):
+        if isinstance(entry, str):
+            entry = {"url": entry}
+        if not isinstance(entry, dict) or not entry.get("url"):
+            raise ValueError(f"Invalid feed entry in scout plan: {entry!r}")
+        feeds.append({
+            "url": entry["url"],
+            "max_articles": int(entry.get("max_articles", default_feed_cap))
+        })
+
+    queries = []
+    for entry in raw.get("queries", []):
+        if isinstance(entry, str):
+            entry = {"query": entry}
+        if not isinstance(entry, dict) or not entry.get("query"):
+            raise ValueError(f"Invalid query entry in scout plan: {entry!r}")
+        queries.append({
+            "query": entry["query"],
+            "max_results": int(entry.get("max_results", default_query_cap))
+        })
+
+    return {"feeds": feeds, "queries": queries}
+
+
 # ============================================================================
 # Scout Agent Creation
 # ============================================================================
@@ -378,11 +617,15 @@ class ScoutAgentRunner:
     """
     Scout Agent 运行器
 
-    提供简单的接口来运行 Scout Agent 并收集文章。
+    提供简单的接口来收集文章。fast 模式按来源计划直接并行抓取；
+    explore 模式运行 Scout Agent，由 LLM 决定如何调用工具。
 
     Attributes:
-        agent: Scout Agent 实例
-        runner: ADK Runner 实例
+        mode: 收集模式（"fast" 或 "explore"）
+        plan_file: fast 模式的来源计划文件
+        agent: Scout Agent 实例（explore 模式）
+        redirect_resolver: 去重前把搜索结果的跳转 URL 解析为原始 URL（可选）
+        runner: ADK Runner 实例（explore 模式）
         session_service: 会话管理服务
         logger: 日志记录器
 
@@ -395,29 +638,45 @@ class ScoutAgentRunner:
     APP_NAME = "agents"  # 必須匹配 ADK agent 載入路徑推斷的名稱
     USER_ID = "system"
     SESSION_ID = "scout_session_001"
+    MODES = ("fast", "explore")
 
     def __init__(
         self,
         agent: Optional[LlmAgent] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        mode: str = "fast",
+        plan_file: str = DEFAULT_PLAN_FILE,
+        redirect_resolver: Optional[RedirectResolver] = None
     ):
         """
         初始化 Scout Agent Runner
 
         Args:
-            agent: Scout Agent 实例（可选，默认创建新实例）
+            agent: Scout Agent 实例（可选；explore 模式下默认创建新实例）
             logger: Logger 实例（可选）
+            mode: 收集模式，"fast"（默认）或 "explore"
+            plan_file: fast 模式的来源计划文件（默认 prompts/scout_plan.json）
+            redirect_resolver: 跳转 URL 解析器（可选；未提供时不解析）
+
+        Raises:
+            ValueError: 如果 mode 无效
 
         Example:
             >>> runner = ScoutAgentRunner()
-            >>> # 或使用自定义 Agent
+            >>> # 或使用自定义 Agent（explore 模式）
             >>> custom_agent = create_scout_agent()
-            >>> runner = ScoutAgentRunner(agent=custom_agent)
+            >>> runner = ScoutAgentRunner(agent=custom_agent, mode="explore")
         """
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid scout mode: {mode}. Must be one of {list(self.MODES)}")
+
         self.logger = logger or Logger.get_logger("ScoutAgentRunner")
+        self.mode = mode
+        self.plan_file = plan_file
+        self.redirect_resolver = redirect_resolver
 
-        # 创建或使用提供的 Agent
-        self.agent = agent or create_scout_agent()
+        # 创建或使用提供的 Agent（fast 模式不需要 LLM）
+        self.agent = agent or (create_scout_agent() if mode == "explore" else None)
 
         # 初始化会话服务
         self.session_service = InMemorySessionService()
@@ -427,12 +686,12 @@ class ScoutAgentRunner:
             agent=self.agent,
             app_name=self.APP_NAME,
             session_service=self.session_service
-        )
+        ) if self.agent is not None else None
 
         # Session 會在首次調用 collect_articles 時創建
         self._session_initialized = False
 
-        self.logger.info("ScoutAgentRunner initialized")
+        self.logger.info(f"ScoutAgentRunner initialized (mode={mode})")
 
     async def _ensure_session(self):
         """確保 session 已創建（內部使用）"""
@@ -447,10 +706,14 @@ class ScoutAgentRunner:
 
     def collect_articles(self, user_prompt: Optional[str] = None) -> Dict[str, Any]:
         """
-        运行 Scout Agent 收集文章
+        收集文章
+
+        fast 模式按来源计划直接抓取（见 collect_from_plan）。explore 模式
+        运行 Scout Agent：工具抓取的文章存入本次运行的 ScoutArtifactStore，
+        Agent 只返回要采用的 handle，结果文章直接从暂存区组装。
 
         Args:
-            user_prompt: 用户提示（可选，默认使用标准提示）
+            user_prompt: 用户提示（可选，仅 explore 模式使用）
 
         Returns:
             dict: {
@@ -469,6 +732,9 @@ class ScoutAgentRunner:
         """
         import asyncio
 
+        if self.mode == "fast":
+            return self.collect_from_plan()
+
         self.logger.info("Starting article collection...")
 
         # 使用默认提示或自定义提示
@@ -482,6 +748,11 @@ class ScoutAgentRunner:
         )
 
         async def _collect_async():
+            # 本次运行的文章暂存区；ADK 在同一事件循环内调用工具，工具可经由
+            # ContextVar 取得它
+            artifacts = ScoutArtifactStore()
+            artifacts_token = _current_artifacts.set(artifacts)
+
             try:
                 # 確保 session 已創建
                 self.logger.info("  [1/4] Creating session...")
@@ -518,7 +789,12 @@ class ScoutAgentRunner:
 
                     if event.is_final_response() and event.content:
                         self.logger.info(f"  ✓ Received final response (elapsed: {elapsed:.1f}s)")
-                        final_result = self._parse_agent_output(event)
+                        final_result = self._parse_agent_output(event, artifacts)
+
+                # 没有最终回应但工具已抓到文章：直接采用全部暂存结果
+                if final_result is None and len(artifacts):
+                    self.logger.warning("  ✗ No final response, using all collected articles")
+                    final_result = self._assemble_from_artifacts(artifacts)
 
                 # 如果没有获取到最终结果
                 if final_result is None:
@@ -554,15 +830,123 @@ class ScoutAgentRunner:
                     "error_message": f"Collection error: {str(e)}"
                 }
 
+            finally:
+                _current_artifacts.reset(artifacts_token)
+
         # 使用 asyncio.run 執行 async 函數
         return asyncio.run(_collect_async())
 
-    def _parse_agent_output(self, event) -> Dict[str, Any]:
+    def collect_from_plan(self, plan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        按来源计划直接收集文章（不经过 LLM）
+
+        RSS feeds（按每个 feed 的上限分组）与每个搜索查询同时执行，
+        总耗时约等于最慢的一次网络调用。单一来源失败只记录在 errors 中。
+
+        Args:
+            plan: 来源计划（可选，默认读取 plan_file，格式见 load_scout_plan）
+
+        Returns:
+            dict: {
+                "status": "success" | "error",
+                "articles": List[Dict],
+                "total_count": int,
+                "sources": Dict[str, int],
+                "errors": List[Dict],
+                "collected_at": datetime,
+                "error_message": str (if error)
+            }
+
+        Example:
+            >>> result = runner.collect_from_plan()
+            >>> print(result['total_count'])
+            38
+        """
+        import time
+
+        start_time = time.time()
+        try:
+            plan = plan or load_scout_plan(self.plan_file)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Failed to load scout plan: {e}")
+            return {
+                "status": "error",
+                "articles": [],
+                "total_count": 0,
+                "sources": {},
+                "errors": [],
+                "collected_at": datetime.now(timezone.utc),
+                "error_message": f"Invalid scout plan: {e}"
+            }
+
+        # 同一上限的 feeds 合并为一次 fetch_rss（RSSFetcher 内部再并行抓取）
+        feeds_by_cap: Dict[int, List[str]] = {}
+        for feed in plan["feeds"]:
+            feeds_by_cap.setdefault(feed["max_articles"], []).append(feed["url"])
+
+        tasks = [
+            ("rss", fetch_rss, (urls, cap)) for cap, urls in feeds_by_cap.items()
+        ] + [
+            ("search", search_articles, (q["query"], q["max_results"])) for q in plan["queries"]
+        ]
+        self.logger.info(
+            f"Collecting from plan: {len(plan['feeds'])} feeds, "
+            f"{len(plan['queries'])} queries ({len(tasks)} parallel calls)"
+        )
+
+        articles: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [
+                    (kind, executor.submit(func, *args)) for kind, func, args in tasks
+                ]
+                # 依计划顺序合并，结果与执行完成的先后无关
+                for kind, future in futures:
+                    result = future.result()
+                    articles.extend(result.get("articles", []))
+                    if kind == "rss":
+                        errors.extend(result.get("errors", []))
+                    elif result.get("status") == "error":
+                        errors.append({
+                            "query": result.get("query"),
+                            "error_message": result.get("error_message", "Unknown error")
+                        })
+
+        articles = self._deduplicate_articles(articles)
+        elapsed = time.time() - start_time
+        self.logger.info(
+            f"Plan collection completed: {len(articles)} articles, "
+            f"{len(errors)} source errors in {elapsed:.1f}s"
+        )
+
+        result = {
+            "status": "success" if articles or not errors else "error",
+            "articles": articles,
+            "total_count": len(articles),
+            "sources": self._count_sources(articles),
+            "errors": errors,
+            "collected_at": datetime.now(timezone.utc)
+        }
+        if result["status"] == "error":
+            result["error_message"] = "All sources failed"
+        return result
+
+    def _parse_agent_output(
+        self,
+        event,
+        artifacts: Optional[ScoutArtifactStore] = None
+    ) -> Dict[str, Any]:
         """
         解析 Agent 输出事件
 
+        有暂存文章时，Agent 只需输出 {"selected": [handle, ...]}，文章从
+        暂存区组装（输出无法解析时采用全部暂存文章）；否则按旧格式解析
+        Agent 输出的完整文章 JSON。
+
         Args:
             event: ADK Event 对象
+            artifacts: 本次运行的文章暂存区（可选）
 
         Returns:
             dict: 解析后的结果
@@ -572,12 +956,12 @@ class ScoutAgentRunner:
         """
         self.logger.info("  → Parsing agent output...")
 
+        text_content = None
         try:
             # 获取文本内容
             if not event.content or not event.content.parts:
                 raise ValueError("Event has no content or parts")
 
-            text_content = None
             for part in event.content.parts:
                 if hasattr(part, 'text') and part.text:
                     text_content = part.text
@@ -590,27 +974,14 @@ class ScoutAgentRunner:
             self.logger.info(f"  → Raw text content length: {content_length} chars")
             self.logger.debug(f"Raw text content preview: {text_content[:500]}...")
 
-            # 尝试解析 JSON
-            # Agent 可能返回 Markdown 格式的 JSON（```json ... ```）
-            text_content = text_content.strip()
-
-            # 移除可能的 Markdown 代码块标记
-            if text_content.startswith("```json"):
-                text_content = text_content[7:]  # 移除 ```json
-            if text_content.startswith("```"):
-                text_content = text_content[3:]  # 移除 ```
-            if text_content.endswith("```"):
-                text_content = text_content[:-3]  # 移除结尾的 ```
-
-            text_content = text_content.strip()
+            if artifacts is not None and len(artifacts):
+                return self._assemble_from_artifacts(
+                    artifacts, self._parse_selection(text_content)
+                )
 
             # 解析 JSON
             self.logger.info("  → Parsing JSON...")
-
-            # 修復常見的 JSON 轉義問題
-            text_content = self._sanitize_json_string(text_content)
-
-            result = json.loads(text_content)
+            result = json.loads(self._extract_json_text(text_content))
             self.logger.info("  ✓ JSON parsed successfully")
 
             # 验证必需字段
@@ -647,9 +1018,91 @@ class ScoutAgentRunner:
             self.logger.error(f"Failed to parse agent output: {e}")
             raise
 
+    def _extract_json_text(self, text_content: str) -> str:
+        """
+        去除 Markdown 代码块标记并修复常见转义问题
+
+        Args:
+            text_content: Agent 输出的原始文本
+
+        Returns:
+            str: 可交给 json.loads 的字串
+        """
+        # Agent 可能返回 Markdown 格式的 JSON（```json ... ```）
+        text_content = text_content.strip()
+
+        # 移除可能的 Markdown 代码块标记
+        if text_content.startswith("```json"):
+            text_content = text_content[7:]  # 移除 ```json
+        if text_content.startswith("```"):
+            text_content = text_content[3:]  # 移除 ```
+        if text_content.endswith("```"):
+            text_content = text_content[:-3]  # 移除结尾的 ```
+
+        # 修復常見的 JSON 轉義問題
+        return self._sanitize_json_string(text_content.strip())
+
+    def _parse_selection(self, text_content: str) -> Optional[List[str]]:
+        """
+        解析 Agent 选择的 handle 列表
+
+        Args:
+            text_content: Agent 输出的原始文本
+
+        Returns:
+            Optional[List[str]]: handle 列表；无法解析时返回 None（采用全部）
+        """
+        try:
+            result = json.loads(self._extract_json_text(text_content))
+        except json.JSONDecodeError:
+            self.logger.warning("  ✗ Agent selection is not valid JSON, using all collected articles")
+            return None
+
+        selected = result.get("selected") if isinstance(result, dict) else None
+        if not isinstance(selected, list):
+            self.logger.warning("  ✗ Agent output has no 'selected' list, using all collected articles")
+            return None
+
+        return [str(handle) for handle in selected]
+
+    def _assemble_from_artifacts(
+        self,
+        artifacts: ScoutArtifactStore,
+        selected: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        从暂存区组装收集结果
+
+        Args:
+            artifacts: 本次运行的文章暂存区
+            selected: 要采用的 handle（默认全部）
+
+        Returns:
+            dict: {"status", "articles", "total_count", "sources", "handles"}
+        """
+        handles = artifacts.handles if selected is None else [
+            handle for handle in selected if handle in artifacts.handles
+        ]
+        articles = self._deduplicate_articles(artifacts.articles(handles))
+
+        self.logger.info(
+            f"  ✓ Assembled {len(articles)} unique articles from "
+            f"{len(handles)}/{len(artifacts.handles)} tool results"
+        )
+        return {
+            "status": "success",
+            "articles": articles,
+            "total_count": len(articles),
+            "sources": self._count_sources(articles),
+            "handles": handles
+        }
+
     def _deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        去重文章列表（基于 URL）
+        去重文章列表（基于正规化 URL）
+
+        有 redirect_resolver 时先把搜索结果的跳转 URL 解析为原始 URL，
+        让同一篇文章的 RSS 与搜索结果在抓取与分析前就被去除。
 
         Args:
             articles: 文章列表
@@ -657,13 +1110,20 @@ class ScoutAgentRunner:
         Returns:
             List[Dict]: 去重后的文章列表
         """
+        if self.redirect_resolver is not None:
+            try:
+                articles = self.redirect_resolver.resolve_articles(articles)
+            except Exception as e:
+                self.logger.warning(f"Redirect resolution failed: {e}")
+
         seen_urls = set()
         unique_articles = []
 
         for article in articles:
             url = article.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
+            key = normalize_url(url)
+            if url and key not in seen_urls:
+                seen_urls.add(key)
                 unique_articles.append(article)
 
         removed_count = len(articles) - len(unique_articles)
@@ -789,12 +1249,15 @@ class ScoutAgentRunner:
 # Convenience Function
 # ============================================================================
 
-def collect_articles() -> Dict[str, Any]:
+def collect_articles(mode: str = "fast") -> Dict[str, Any]:
     """
     便捷函数：快速收集文章
 
     这是一个简化的接口，用于快速运行 Scout Agent。
 
+    Args:
+        mode: 收集模式，"fast"（默认）或 "explore"
+
     Returns:
         dict: 收集结果
 
@@ -803,7 +1266,7 @@ def collect_articles() -> Dict[str, Any]:
         >>> result = collect_articles()
         >>> print(f"Collected {result['total_count']} articles")
     """
-    runner = ScoutAgentRunner()
+    runner = ScoutAgentRunner(mode=mode)
     return runner.collect_articles()
 
 
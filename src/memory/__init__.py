@@ -9,6 +9,7 @@ Modules:
     - models: SQLAlchemy ORM models
     - article_store: Article CRUD operations
     - embedding_store: Embedding vector storage and similarity search
+    - redirect_store: Redirect URL to canonical URL map
 
 Usage:
     from src.memory import Database, ArticleStore, EmbeddingStore
@@ -29,10 +30,11 @@ Usage:
 """
 
 from src.memory.database import Database
-from src.memory.models import Article, Embedding, DailyReport, WeeklyReport, Base
+from src.memory.models import Article, Embedding, DailyReport, WeeklyReport, UrlRedirect, Base
 from src.memory.article_store import ArticleStore
 from src.memory.embedding_store import EmbeddingStore
 from src.memory.report_store import ReportStore
+from src.memory.redirect_store import RedirectStore
 
 __all__ = [
     'Database',
@@ -40,10 +42,12 @@ __all__ = [
     'Embedding',
     'DailyReport',
     'WeeklyReport',
+    'UrlRedirect',
     'Base',
     'ArticleStore',
     'EmbeddingStore',
     'ReportStore',
+    'RedirectStore',
 ]
 
 __version__ = '1.0.0'
@@ -0,0 +1,363 @@
+"""
+InsightCosmos Approximate Nearest-Neighbour Index
+
+Pure-numpy IVF-flat index for cosine similarity over unit vectors.
+
+Classes:
+    IVFIndex: Inverted-file index with flat (exact) scoring inside each list
+
+How it works:
+    - Training: spherical k-means splits the vectors into ``n_lists`` cells
+    - Search: the query is compared to all centroids, the ``n_probe`` closest
+      cells are scanned exactly, and the top K is taken with argpartition
+    - Updates: inserts are assigned to their nearest centroid; the centroids
+      themselves only change on rebuild, so the owner tracks staleness and
+      rebuilds once enough of the index has changed
+    - Versions: each entry carries a version set by the owner (e.g. the
+      embedding row ID), persisted with the index, so an owner reloading
+      the index can tell a vector that was replaced since it was saved
+
+Usage:
+    from src.memory.ann_index import IVFIndex
+
+    index = IVFIndex(dimension=768)
+    index.build(article_ids, unit_vectors)
+    results = index.search(query_unit_vector, top_k=10)
+
+    index.save(Path("data/insights.text-embedding-004.ivf.npz"))
+    index = IVFIndex.load(Path("data/insights.text-embedding-004.ivf.npz"))
+"""
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+import os
+import time
+
+import numpy as np
+
+
+class IVFIndex:
+    """
+    IVF-flat index over pre-normalized float32 vectors
+
+    Attributes:
+        dimension (int): Vector dimension
+        n_probe (int): Number of cells scanned per query
+        centroids (np.ndarray): Cell centroids, shape (n_lists, dimension)
+        built_size (int): Number of vectors at the last build
+        build_seconds (float): Duration of the last build
+        inserts_since_build (int): Vectors added since the last build
+        removals_since_build (int): Vectors removed since the last build
+
+    Example:
+        >>> index = IVFIndex(dimension=3)
+        >>> index.build(np.array([1, 2]), np.eye(3, dtype=np.float32)[:2])
+        >>> index.search(np.array([1, 0, 0], dtype=np.float32), top_k=1)
+        [(1, 1.0)]
+    """
+
+    FORMAT_VERSION = 2
+    KMEANS_ITERATIONS = 10
+    TRAINING_SAMPLES_PER_LIST = 256
+    MAX_LISTS = 4096
+
+    def __init__(self, dimension: int, n_lists: Optional[int] = None, n_probe: int = 8):
+        """
+        Initialize an empty index
+
+        Args:
+            dimension: Vector dimension
+            n_lists: Number of cells (default: sqrt(N) at build time)
+            n_probe: Number of cells scanned per query (default: 8)
+        """
+        self.dimension = dimension
+        self.n_probe = n_probe
+        self._requested_lists = n_lists
+
+        self.centroids = np.zeros((0, dimension), dtype=np.float32)
+        self._list_ids: List[np.ndarray] = []
+        self._list_vectors: List[np.ndarray] = []
+        self._list_versions: List[np.ndarray] = []
+
+        self.built_size = 0
+        self.build_seconds = 0.0
+        self.inserts_since_build = 0
+        self.removals_since_build = 0
+
+    @property
+    def n_lists(self) -> int:
+        """Number of cells"""
+        return len(self.centroids)
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._list_ids)
+
+    @property
+    def stale_fraction(self) -> float:
+        """Share of the index changed since the last build"""
+        changes = self.inserts_since_build + self.removals_since_build
+        return changes / max(1, self.built_size)
+
+    def build(
+        self,
+        ids: np.ndarray,
+        matrix: np.ndarray,
+        seed: int = 0,
+        versions: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Train centroids and assign all vectors
+
+        Args:
+            ids: Article IDs, shape (N,)
+            matrix: Unit vectors, shape (N, dimension)
+            seed: Random seed for centroid initialization
+            versions: Entry versions, shape (N,) (default: all 0, unknown)
+        """
+        start = time.perf_counter()
+        ids = np.asarray(ids, dtype=np.int64)
+        matrix = np.asarray(matrix, dtype=np.float32)
+        versions = (
+            np.zeros(len(ids), dtype=np.int64) if versions is None
+            else np.asarray(versions, dtype=np.int64)
+        )
+        n = len(ids)
+
+        if n == 0:
+            self.centroids = np.zeros((0, self.dimension), dtype=np.float32)
+            self._list_ids, self._list_vectors, self._list_versions = [], [], []
+        else:
+            n_lists = self._requested_lists or int(np.sqrt(n))
+            n_lists = max(1, min(n_lists, n, self.MAX_LISTS))
+            rng = np.random.default_rng(seed)
+            self.centroids = self._train_centroids(matrix, n_lists, rng)
+
+            assignments = self._assign(matrix)
+            order = np.argsort(assignments, kind="stable")
+            bounds = np.searchsorted(assignments[order], np.arange(n_lists + 1))
+            self._list_ids = [ids[order[bounds[i]:bounds[i + 1]]] for i in range(n_lists)]
+            self._list_vectors = [matrix[order[bounds[i]:bounds[i + 1]]] for i in range(n_lists)]
+            self._list_versions = [versions[order[bounds[i]:bounds[i + 1]]] for i in range(n_lists)]
+
+        self.built_size = n
+        self.inserts_since_build = 0
+        self.removals_since_build = 0
+        self.build_seconds = time.perf_counter() - start
+
+    def add(
+        self,
+        article_id: int,
+        unit_vector: np.ndarray,
+        replace: bool = True,
+        version: int = 0
+    ) -> None:
+        """
+        Add a vector to its nearest cell
+
+        Args:
+            article_id: Article ID
+            unit_vector: Normalized vector
+            replace: Remove any previous entry for the article first
+            version: Entry version (default: 0, unknown)
+        """
+        if self.n_lists == 0:
+            # Nothing trained yet: a single cell holding everything
+            self.centroids = np.asarray(unit_vector, dtype=np.float32).reshape(1, -1).copy()
+            self._list_ids = [np.empty(0, dtype=np.int64)]
+            self._list_vectors = [np.empty((0, self.dimension), dtype=np.float32)]
+            self._list_versions = [np.empty(0, dtype=np.int64)]
+
+        if replace:
+            self.remove(article_id, count_change=False)
+
+        cell = int(np.argmax(self.centroids @ unit_vector))
+        self._list_ids[cell] = np.append(self._list_ids[cell], np.int64(article_id))
+        self._list_vectors[cell] = np.vstack(
+            [self._list_vectors[cell], np.asarray(unit_vector, dtype=np.float32)]
+        )
+        self._list_versions[cell] = np.append(self._list_versions[cell], np.int64(version))
+        self.inserts_since_build += 1
+
+    def remove(self, article_id: int, count_change: bool = True) -> bool:
+        """
+        Remove a vector
+
+        Args:
+            article_id: Article ID
+            count_change: Whether the removal counts towards staleness
+
+        Returns:
+            bool: True if the vector was present
+        """
+        for cell, ids in enumerate(self._list_ids):
+            positions = np.nonzero(ids == article_id)[0]
+            if len(positions):
+                keep = ids != article_id
+                self._list_ids[cell] = ids[keep]
+                self._list_vectors[cell] = self._list_vectors[cell][keep]
+                self._list_versions[cell] = self._list_versions[cell][keep]
+                if count_change:
+                    self.removals_since_build += 1
+                return True
+        return False
+
+    def ids(self) -> np.ndarray:
+        """All indexed article IDs"""
+        if not self._list_ids:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(self._list_ids)
+
+    def versions(self) -> np.ndarray:
+        """Versions of all entries, aligned with ``ids()``"""
+        if not self._list_versions:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(self._list_versions)
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int = 10,
+        threshold: float = -1.0,
+        n_probe: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Approximate top-K search
+
+        Args:
+            query: Normalized query vector
+            top_k: Number of results
+            threshold: Minimum similarity
+            n_probe: Cells to scan (default: ``self.n_probe``)
+
+        Returns:
+            List[Tuple[int, float]]: (article_id, similarity) ordered by similarity
+        """
+        if self.n_lists == 0 or top_k <= 0:
+            return []
+
+        n_probe = max(1, min(n_probe or self.n_probe, self.n_lists))
+        centroid_scores = self.centroids @ query
+        if n_probe < self.n_lists:
+            cells = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+        else:
+            cells = np.arange(self.n_lists)
+
+        ids = np.concatenate([self._list_ids[c] for c in cells])
+        if len(ids) == 0:
+            return []
+        vectors = np.concatenate([self._list_vectors[c] for c in cells])
+
+        scores = vectors @ query
+        candidates = np.nonzero(scores >= threshold)[0]
+        k = min(top_k, len(candidates))
+        if k == 0:
+            return []
+        if k < len(candidates):
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        top = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+    def save(self, path: Path) -> None:
+        """
+        Persist the index atomically (write to a temp file, then rename)
+
+        Args:
+            path: Target file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        sizes = np.array([len(ids) for ids in self._list_ids], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        ids = self.ids()
+        versions = self.versions()
+        vectors = (
+            np.concatenate(self._list_vectors)
+            if self._list_vectors else np.zeros((0, self.dimension), dtype=np.float32)
+        )
+        meta = np.array(
+            [self.FORMAT_VERSION, self.dimension, self.n_probe, self.built_size,
+             self.inserts_since_build, self.removals_since_build],
+            dtype=np.int64
+        )
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, meta=meta, centroids=self.centroids, ids=ids,
+                     vectors=vectors, versions=versions, offsets=offsets)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["IVFIndex"]:
+        """
+        Load a persisted index
+
+        Args:
+            path: Index file path
+
+        Returns:
+            Optional[IVFIndex]: Loaded index, or None if missing or incompatible
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+
+        with np.load(path) as data:
+            meta = data["meta"]
+            if int(meta[0]) != cls.FORMAT_VERSION:
+                return None
+
+            index = cls(dimension=int(meta[1]), n_probe=int(meta[2]))
+            index.centroids = data["centroids"]
+            offsets = data["offsets"]
+            ids = data["ids"]
+            vectors = data["vectors"]
+            versions = data["versions"]
+
+        index._list_ids = [ids[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        index._list_vectors = [vectors[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        index._list_versions = [versions[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        index.built_size = int(meta[3])
+        index.inserts_since_build = int(meta[4])
+        index.removals_since_build = int(meta[5])
+        return index
+
+    def _train_centroids(
+        self,
+        matrix: np.ndarray,
+        n_lists: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """Spherical k-means (Lloyd iterations) on a sample of the vectors"""
+        sample_size = n_lists * self.TRAINING_SAMPLES_PER_LIST
+        if len(matrix) > sample_size:
+            sample = matrix[rng.choice(len(matrix), sample_size, replace=False)]
+        else:
+            sample = matrix
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+        for _ in range(self.KMEANS_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+
+            # Re-seed empty cells with random samples
+            empty = np.bincount(assignments, minlength=n_lists) == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        return centroids
+
+    def _assign(self, matrix: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+        """Nearest centroid for each row, computed in chunks"""
+        assignments = np.empty(len(matrix), dtype=np.int64)
+        for start in range(0, len(matrix), chunk_size):
+            chunk = matrix[start:start + chunk_size]
+            assignments[start:start + chunk_size] = np.argmax(chunk @ self.centroids.T, axis=1)
+        return assignments
@@ -23,18 +23,26 @@ Usage:
     # Query article
     article = store.get_by_id(article_id)
     articles = store.get_by_status("pending")
+
+    # Stream the whole archive in constant memory
+    for article in store.iter_articles(status="analyzed", fields=["id", "title"]):
+        ...
+
+    # Ingest a batch (one lookup + one transaction, duplicates skipped)
+    new_ids = store.bulk_upsert([{"url": "...", "title": "..."}, ...])
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Sequence
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 import json
 import logging
 
-from src.memory.models import Article
+from src.memory.models import Article, UrlRedirect
 from src.memory.database import Database
 from src.utils.logger import Logger
+from src.utils.url_utils import normalize_url
 
 
 class ArticleStore:
@@ -45,7 +53,11 @@ class ArticleStore:
     - Creating and updating articles
     - Querying by ID, URL, status, date range
     - Priority-based sorting
-    - Deduplication by URL
+    - Deduplication by URL (stored in ``normalize_url`` form, so links that
+      only differ in tracking parameters, case or fragment are one article)
+    - Column projection for listings (``fields=``)
+    - Streaming iteration with keyset pagination
+    - Bulk ingestion in a single transaction
     - Status tracking
 
     Attributes:
@@ -59,6 +71,15 @@ class ArticleStore:
         >>> articles = store.get_by_status("pending", limit=10)
     """
 
+    # Maximum bound parameters per IN (...) lookup (SQLite's historic limit is 999)
+    LOOKUP_CHUNK_SIZE = 500
+
+    # Projection for listings: every column except the large content/analysis text
+    LISTING_FIELDS = (
+        'id', 'url', 'title', 'summary', 'source', 'source_name', 'published_at',
+        'fetched_at', 'status', 'priority_score', 'tags', 'created_at', 'updated_at'
+    )
+
     def __init__(self, database: Database, logger: Optional[logging.Logger] = None):
         """
         Initialize ArticleStore
@@ -85,7 +106,7 @@ class ArticleStore:
         Create new article
 
         Args:
-            url: Article URL (must be unique)
+            url: Article URL (must be unique; stored normalized)
             title: Article title
             content: Article content (optional)
             summary: Article summary (optional)
@@ -116,7 +137,7 @@ class ArticleStore:
         try:
             with self.database.get_session() as session:
                 article = Article(
-                    url=url,
+                    url=normalize_url(url),
                     title=title,
                     content=content,
                     summary=summary,
@@ -141,12 +162,18 @@ class ArticleStore:
             self.logger.error(f"Failed to create article: {e}")
             raise
 
-    def get_by_id(self, article_id: int) -> Optional[Dict[str, Any]]:
+    def get_by_id(
+        self,
+        article_id: int,
+        parse_analysis: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
         Get article by ID
 
         Args:
             article_id: Article ID
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
 
         Returns:
             Optional[dict]: Article data or None if not found
@@ -156,23 +183,33 @@ class ArticleStore:
             >>> print(article['title'])
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 article = session.query(Article).filter(Article.id == article_id).first()
 
                 if article:
-                    return article.to_dict()
+                    return article.to_dict(parse_analysis=parse_analysis)
                 return None
 
         except Exception as e:
             self.logger.error(f"Failed to get article by ID {article_id}: {e}")
             raise
 
-    def get_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+    def get_by_url(
+        self,
+        url: str,
+        parse_analysis: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
         Get article by URL (for deduplication)
 
+        The URL is matched in ``normalize_url`` form (and as given, for rows
+        stored before URLs were normalized). A redirect URL recorded in
+        url_redirects also finds the article stored under its canonical URL.
+
         Args:
-            url: Article URL
+            url: Article URL (or a resolved redirect URL)
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
 
         Returns:
             Optional[dict]: Article data or None if not found
@@ -181,11 +218,22 @@ class ArticleStore:
             >>> article = store.get_by_url("https://example.com/article")
         """
         try:
-            with self.database.get_session() as session:
-                article = session.query(Article).filter(Article.url == url).first()
+            with self.database.get_read_session() as session:
+                article = session.query(Article)\
+                    .filter(Article.url.in_(self._url_forms(url)))\
+                    .first()
+
+                if article is None:
+                    canonical_url = session.query(UrlRedirect.canonical_url)\
+                        .filter(UrlRedirect.redirect_url == url)\
+                        .scalar()
+                    if canonical_url:
+                        article = session.query(Article)\
+                            .filter(Article.url.in_(self._url_forms(canonical_url)))\
+                            .first()
 
                 if article:
-                    return article.to_dict()
+                    return article.to_dict(parse_analysis=parse_analysis)
                 return None
 
         except Exception as e:
@@ -195,7 +243,9 @@ class ArticleStore:
     def get_by_status(
         self,
         status: str,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        parse_analysis: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get articles by status
@@ -203,16 +253,20 @@ class ArticleStore:
         Args:
             status: Article status ('pending', 'analyzed', 'reported')
             limit: Maximum number of results (optional)
+            fields: Columns to load (optional, default: all; see LISTING_FIELDS)
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
 
         Returns:
             List[dict]: List of articles
 
         Example:
             >>> pending_articles = store.get_by_status("pending", limit=10)
+            >>> rows = store.get_by_status("collected", fields=["id", "url", "title"])
         """
         try:
-            with self.database.get_session() as session:
-                query = session.query(Article).filter(Article.status == status)
+            with self.database.get_read_session() as session:
+                query = self._select(session, fields).filter(Article.status == status)
                 query = query.order_by(desc(Article.fetched_at))
 
                 if limit:
@@ -220,7 +274,7 @@ class ArticleStore:
 
                 articles = query.all()
 
-                return [article.to_dict() for article in articles]
+                return self._rows_to_dicts(articles, fields, parse_analysis)
 
         except Exception as e:
             self.logger.error(f"Failed to get articles by status: {e}")
@@ -229,7 +283,9 @@ class ArticleStore:
     def get_recent(
         self,
         days: int = 7,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        parse_analysis: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get recent articles (last N days)
@@ -237,6 +293,9 @@ class ArticleStore:
         Args:
             days: Number of days to look back (default: 7)
             limit: Maximum number of results (optional)
+            fields: Columns to load (optional, default: all; see LISTING_FIELDS)
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
 
         Returns:
             List[dict]: List of articles
@@ -247,8 +306,8 @@ class ArticleStore:
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-            with self.database.get_session() as session:
-                query = session.query(Article).filter(
+            with self.database.get_read_session() as session:
+                query = self._select(session, fields).filter(
                     Article.fetched_at >= cutoff_date
                 )
                 query = query.order_by(desc(Article.fetched_at))
@@ -258,7 +317,7 @@ class ArticleStore:
 
                 articles = query.all()
 
-                return [article.to_dict() for article in articles]
+                return self._rows_to_dicts(articles, fields, parse_analysis)
 
         except Exception as e:
             self.logger.error(f"Failed to get recent articles: {e}")
@@ -270,7 +329,9 @@ class ArticleStore:
         end_date: str,
         status: Optional[str] = None,
         min_priority: Optional[float] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        parse_analysis: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get articles within specific date range
@@ -281,6 +342,9 @@ class ArticleStore:
             status: Filter by status (optional: 'pending', 'analyzed', 'failed')
             min_priority: Minimum priority score (optional, range: 0.0-1.0)
             limit: Maximum number of results (optional)
+            fields: Columns to load (optional, default: all; see LISTING_FIELDS)
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
 
         Returns:
             List[dict]: List of articles matching criteria, ordered by fetched_at (newest first)
@@ -295,9 +359,9 @@ class ArticleStore:
             ... )
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 # Build base query
-                query = session.query(Article).filter(
+                query = self._select(session, fields).filter(
                     Article.fetched_at >= start_date,
                     Article.fetched_at <= end_date
                 )
@@ -324,7 +388,7 @@ class ArticleStore:
                     + (f" and min_priority={min_priority}" if min_priority else "")
                 )
 
-                return [article.to_dict() for article in articles]
+                return self._rows_to_dicts(articles, fields, parse_analysis)
 
         except Exception as e:
             self.logger.error(f"Failed to get articles by date range: {e}")
@@ -335,7 +399,9 @@ class ArticleStore:
         limit: int = 10,
         status: Optional[str] = None,
         fetched_after: Optional[datetime] = None,
-        fetched_before: Optional[datetime] = None
+        fetched_before: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        parse_analysis: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get top priority articles with optional time filtering
@@ -345,6 +411,9 @@ class ArticleStore:
             status: Filter by status (optional)
             fetched_after: Only include articles fetched AFTER this time (exclusive)
             fetched_before: Only include articles fetched BEFORE or AT this time (inclusive)
+            fields: Columns to load (optional, default: all; see LISTING_FIELDS)
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
 
         Returns:
             List[dict]: List of articles ordered by priority score (descending)
@@ -365,8 +434,8 @@ class ArticleStore:
             ... )
         """
         try:
-            with self.database.get_session() as session:
-                query = session.query(Article).filter(
+            with self.database.get_read_session() as session:
+                query = self._select(session, fields).filter(
                     Article.priority_score.isnot(None)
                 )
 
@@ -395,12 +464,90 @@ class ArticleStore:
                     f"after={fetched_after}, before={fetched_before})"
                 )
 
-                return [article.to_dict() for article in articles]
+                return self._rows_to_dicts(articles, fields, parse_analysis)
 
         except Exception as e:
             self.logger.error(f"Failed to get top priority articles: {e}")
             raise
 
+    def iter_articles(
+        self,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        min_priority: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: int = 500,
+        parse_analysis: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over articles in ID order without loading them all at once
+
+        Uses keyset pagination (``WHERE id > :last_id ORDER BY id LIMIT n``):
+        each batch is read in its own short session, so memory stays bounded
+        by batch_size and no transaction is held open between batches.
+
+        Args:
+            status: Filter by status (optional)
+            start_date: Only articles fetched at or after this time (optional, ISO format)
+            end_date: Only articles fetched at or before this time (optional, ISO format)
+            min_priority: Minimum priority score (optional)
+            fields: Columns to load (optional, default: all; see LISTING_FIELDS)
+            batch_size: Rows fetched per query (default: 500)
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
+
+        Yields:
+            dict: Article data
+
+        Example:
+            >>> for article in store.iter_articles(status="analyzed", fields=["id", "url"]):
+            ...     print(article["url"])
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        # The keyset needs the id column even if the caller did not ask for it
+        query_fields = fields
+        if fields is not None and 'id' not in fields:
+            query_fields = ['id', *fields]
+
+        last_id = 0
+        while True:
+            try:
+                with self.database.get_read_session() as session:
+                    query = self._select(session, query_fields).filter(Article.id > last_id)
+
+                    if status:
+                        query = query.filter(Article.status == status)
+                    if start_date is not None:
+                        query = query.filter(Article.fetched_at >= start_date)
+                    if end_date is not None:
+                        query = query.filter(Article.fetched_at <= end_date)
+                    if min_priority is not None:
+                        query = query.filter(Article.priority_score >= min_priority)
+
+                    rows = self._rows_to_dicts(
+                        query.order_by(Article.id).limit(batch_size).all(), query_fields,
+                        parse_analysis
+                    )
+
+            except Exception as e:
+                self.logger.error(f"Failed to iterate articles after ID {last_id}: {e}")
+                raise
+
+            if not rows:
+                return
+
+            last_id = rows[-1]['id']
+            for row in rows:
+                if query_fields is not fields:
+                    del row['id']
+                yield row
+
+            if len(rows) < batch_size:
+                return
+
     def update(
         self,
         article_id: int,
@@ -493,6 +640,72 @@ class ArticleStore:
             status='analyzed'
         )
 
+    def update_analysis_many(
+        self,
+        updates: List[Dict[str, Any]],
+        session: Optional[Session] = None
+    ) -> List[int]:
+        """
+        Update analysis results of several articles in one transaction
+
+        Args:
+            updates: Dictionaries with article_id, analysis and priority_score
+            session: Open writer session to join (optional; the caller
+                commits it, e.g. together with the articles' embeddings)
+
+        Returns:
+            List[int]: IDs of the articles that were found and updated
+
+        Example:
+            >>> store.update_analysis_many([
+            ...     {"article_id": 1, "analysis": {...}, "priority_score": 0.85},
+            ...     {"article_id": 2, "analysis": {...}, "priority_score": 0.4}
+            ... ])
+        """
+        if not updates:
+            return []
+
+        try:
+            if session is not None:
+                return self._update_analysis_many(session, updates)
+            with self.database.get_session() as session:
+                return self._update_analysis_many(session, updates)
+
+        except Exception as e:
+            self.logger.error(f"Failed to update analysis batch: {e}")
+            raise
+
+    def _update_analysis_many(
+        self,
+        session: Session,
+        updates: List[Dict[str, Any]]
+    ) -> List[int]:
+        """Apply analysis updates in the given session (see update_analysis_many)"""
+        by_id = {update['article_id']: update for update in updates}
+        ids = list(by_id)
+        articles = []
+        for start in range(0, len(ids), self.LOOKUP_CHUNK_SIZE):
+            articles.extend(
+                session.query(Article).filter(
+                    Article.id.in_(ids[start:start + self.LOOKUP_CHUNK_SIZE])
+                ).all()
+            )
+
+        for article in articles:
+            update = by_id[article.id]
+            article.analysis = json.dumps(update['analysis'])
+            article.priority_score = update['priority_score']
+            article.status = 'analyzed'
+
+        updated = [article.id for article in articles]
+        missing = set(ids) - set(updated)
+        if missing:
+            self.logger.warning(f"Articles not found for analysis update: {sorted(missing)}")
+
+        self.logger.info(f"Updated analysis of {len(updated)} articles")
+
+        return updated
+
     def delete(self, article_id: int) -> bool:
         """
         Delete article (and cascade delete embeddings)
@@ -529,7 +742,7 @@ class ArticleStore:
         Check if article URL already exists (for deduplication)
 
         Args:
-            url: Article URL
+            url: Article URL (compared in ``normalize_url`` form)
 
         Returns:
             bool: True if URL exists
@@ -539,8 +752,10 @@ class ArticleStore:
             ...     store.create(url=url, title=title, ...)
         """
         try:
-            with self.database.get_session() as session:
-                count = session.query(Article).filter(Article.url == url).count()
+            with self.database.get_read_session() as session:
+                count = session.query(Article)\
+                    .filter(Article.url.in_(self._url_forms(url)))\
+                    .count()
                 return count > 0
 
         except Exception as e:
@@ -562,7 +777,7 @@ class ArticleStore:
             >>> print(f"Pending articles: {pending_count}")
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 count = session.query(Article).filter(Article.status == status).count()
                 return count
 
@@ -570,12 +785,20 @@ class ArticleStore:
             self.logger.error(f"Failed to count articles by status: {e}")
             raise
 
-    def get_all(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_all(
+        self,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        parse_analysis: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Get all articles
 
         Args:
             limit: Maximum number of results (optional)
+            fields: Columns to load (optional, default: all; see LISTING_FIELDS)
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
 
         Returns:
             List[dict]: List of all articles
@@ -584,15 +807,15 @@ class ArticleStore:
             >>> all_articles = store.get_all(limit=100)
         """
         try:
-            with self.database.get_session() as session:
-                query = session.query(Article).order_by(desc(Article.created_at))
+            with self.database.get_read_session() as session:
+                query = self._select(session, fields).order_by(desc(Article.created_at))
 
                 if limit:
                     query = query.limit(limit)
 
                 articles = query.all()
 
-                return [article.to_dict() for article in articles]
+                return self._rows_to_dicts(articles, fields, parse_analysis)
 
         except Exception as e:
             self.logger.error(f"Failed to get all articles: {e}")
@@ -640,34 +863,7 @@ class ArticleStore:
 
         try:
             with self.database.get_session() as session:
-                # Handle tags conversion
-                tags = article_data.get('tags')
-                if isinstance(tags, list):
-                    tags = ','.join(tags)
-
-                # Build analysis JSON from key_insights and priority_reasoning
-                analysis_dict = {}
-                if 'key_insights' in article_data:
-                    analysis_dict['key_insights'] = article_data['key_insights']
-                if 'priority_reasoning' in article_data:
-                    analysis_dict['priority_reasoning'] = article_data['priority_reasoning']
-
-                analysis = json.dumps(analysis_dict) if analysis_dict else None
-
-                article = Article(
-                    url=article_data['url'],
-                    title=article_data['title'],
-                    content=article_data.get('content'),
-                    summary=article_data.get('summary'),
-                    priority_score=article_data.get('priority_score'),
-                    analysis=analysis,
-                    tags=tags,
-                    source=article_data.get('source', 'unknown'),
-                    source_name=article_data.get('source_name'),
-                    published_at=article_data.get('published_at'),
-                    fetched_at=article_data.get('fetched_at', datetime.utcnow()),
-                    status=article_data.get('status', 'pending')
-                )
+                article = self._build_article(article_data)
 
                 session.add(article)
                 session.flush()
@@ -681,3 +877,189 @@ class ArticleStore:
         except Exception as e:
             self.logger.error(f"Failed to store article: {e}")
             raise
+
+    def bulk_upsert(self, articles: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert a batch of articles, skipping URLs that already exist
+
+        URLs are stored in ``normalize_url`` form, so an RSS link with
+        tracking parameters and a resolved search link to the same article
+        are one article. Existing URLs are found with chunked ``IN (...)``
+        lookups and duplicates within the batch are dropped (first occurrence
+        wins), then all new rows are inserted in one transaction with a
+        single commit.
+        Articles with an empty url or title are skipped (logged), so one bad
+        item does not fail the batch.
+
+        Args:
+            articles: Article dictionaries (same fields as store_article)
+
+        Returns:
+            List[int]: IDs of the newly inserted articles, in input order
+
+        Example:
+            >>> new_ids = store.bulk_upsert([
+            ...     {"url": "https://example.com/a", "title": "A", "status": "collected"},
+            ...     {"url": "https://example.com/b", "title": "B", "status": "collected"}
+            ... ])
+            >>> print(f"Inserted {len(new_ids)} articles")
+        """
+        valid = [
+            article_data for article_data in articles
+            if article_data.get('url') and article_data.get('title')
+        ]
+        if len(valid) < len(articles):
+            self.logger.warning(
+                f"Bulk upsert: skipping {len(articles) - len(valid)} articles "
+                f"missing url or title"
+            )
+        # Raw URL -> normalized URL; raw forms are looked up too, for rows
+        # stored before URLs were normalized
+        url_forms = {
+            article_data['url']: normalize_url(article_data['url'])
+            for article_data in valid
+        }
+        articles = [
+            {**article_data, 'url': url_forms[article_data['url']]}
+            for article_data in valid
+        ]
+
+        if not articles:
+            return []
+
+        try:
+            with self.database.get_session() as session:
+                urls = list(dict.fromkeys(
+                    [*url_forms.values(), *url_forms.keys()]
+                ))
+                existing = set()
+                for start in range(0, len(urls), self.LOOKUP_CHUNK_SIZE):
+                    chunk = urls[start:start + self.LOOKUP_CHUNK_SIZE]
+                    existing.update(
+                        url for (url,) in
+                        session.query(Article.url).filter(Article.url.in_(chunk))
+                    )
+                existing.update(url_forms[url] for url in existing & url_forms.keys())
+
+                new_articles = []
+                for article_data in articles:
+                    if article_data['url'] in existing:
+                        continue
+                    existing.add(article_data['url'])
+                    new_articles.append(self._build_article(article_data))
+
+                session.add_all(new_articles)
+                session.flush()
+
+                new_ids = [article.id for article in new_articles]
+
+                self.logger.info(
+                    f"Bulk upsert: {len(new_ids)} inserted, "
+                    f"{len(articles) - len(new_ids)} skipped as duplicates"
+                )
+
+                return new_ids
+
+        except Exception as e:
+            self.logger.error(f"Failed to bulk upsert articles: {e}")
+            raise
+
+    def _select(self, session: Session, fields: Optional[Sequence[str]]):
+        """
+        Start a query for full Article objects or for selected columns only
+
+        Args:
+            session: Database session
+            fields: Field names to load (None = full ORM objects)
+
+        Returns:
+            Query: SQLAlchemy query
+
+        Raises:
+            ValueError: If a field is not an Article column
+        """
+        if fields is None:
+            return session.query(Article)
+
+        unknown = [name for name in fields if name not in Article.FIELDS]
+        if unknown or not fields:
+            raise ValueError(f"Unknown article fields: {unknown or fields}")
+
+        return session.query(*[getattr(Article, name) for name in fields])
+
+    @staticmethod
+    def _rows_to_dicts(
+        rows,
+        fields: Optional[Sequence[str]],
+        parse_analysis: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert query results to dictionaries
+
+        Projected rows only carry the selected fields, serialized as in
+        Article.to_dict() (``analysis`` is only parsed when selected).
+
+        Args:
+            rows: Article objects or column tuples from _select()
+            fields: Field names passed to _select()
+            parse_analysis: Parse the analysis JSON (False keeps the string)
+
+        Returns:
+            List[dict]: Article dictionaries
+        """
+        if fields is None:
+            return [article.to_dict(parse_analysis=parse_analysis) for article in rows]
+
+        return [
+            {
+                name: Article.serialize_field(name, value, parse_analysis=parse_analysis)
+                for name, value in zip(fields, row)
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _url_forms(url: str) -> List[str]:
+        """URL in normalized form, plus as given if that differs (pre-normalization rows)"""
+        normalized = normalize_url(url)
+        return [normalized] if normalized == url else [normalized, url]
+
+    @staticmethod
+    def _build_article(article_data: Dict[str, Any]) -> Article:
+        """
+        Build an Article row from an article dictionary
+
+        Args:
+            article_data: Article dictionary (see store_article)
+
+        Returns:
+            Article: Unsaved ORM object
+        """
+        # Handle tags conversion
+        tags = article_data.get('tags')
+        if isinstance(tags, list):
+            tags = ','.join(tags)
+
+        # Build analysis JSON from key_insights and priority_reasoning
+        analysis_dict = {}
+        if 'key_insights' in article_data:
+            analysis_dict['key_insights'] = article_data['key_insights']
+        if 'priority_reasoning' in article_data:
+            analysis_dict['priority_reasoning'] = article_data['priority_reasoning']
+
+        analysis = json.dumps(analysis_dict) if analysis_dict else None
+
+        return Article(
+            url=normalize_url(article_data['url']),
+            title=article_data['title'],
+            content=article_data.get('content'),
+            summary=article_data.get('summary'),
+            priority_score=article_data.get('priority_score'),
+            analysis=analysis,
+            tags=tags,
+            source=article_data.get('source', 'unknown'),
+            source_name=article_data.get('source_name'),
+            published_at=article_data.get('published_at'),
+            fetched_at=article_data.get('fetched_at', datetime.utcnow()),
+            status=article_data.get('status', 'pending')
+        )
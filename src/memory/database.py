@@ -6,6 +6,9 @@ Handles database connection, initialization, and session management.
 Classes:
     Database: Database connection and session manager
 
+Constants:
+    DATABASE_PROFILES: Named SQLite pragma sets ("default", "throughput")
+
 Usage:
     from src.utils.config import Config
     from src.memory.database import Database
@@ -15,15 +18,19 @@ Usage:
     db.init_db()
 
     with db.get_session() as session:
-        # Use session to query database
+        # Writes go through the single writer connection
+        session.add(article)
+
+    with db.get_read_session() as session:
+        # Reads use a pool of read-only connections and can run in parallel
         articles = session.query(Article).all()
 """
 
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 from contextlib import contextmanager
 import sqlite3
 import logging
@@ -33,6 +40,28 @@ from src.utils.logger import Logger
 from src.memory.models import Base
 
 
+# SQLite pragmas applied to every new connection
+DATABASE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # SQLite defaults except for the lock timeout: safest, smallest footprint
+    "default": {
+        "synchronous": "FULL",
+        "cache_size": -2000,        # KiB (negative) -> 2 MB page cache
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 30000,      # ms
+    },
+    # Batch pipelines: NORMAL is durable across crashes under WAL (only the
+    # last transactions can be lost on power failure), larger cache and mmap
+    "throughput": {
+        "synchronous": "NORMAL",
+        "cache_size": -65536,       # 64 MB
+        "mmap_size": 268435456,     # 256 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+
+
 class Database:
     """
     Database connection and session manager
@@ -40,14 +69,26 @@ class Database:
     Responsibilities:
     - Create and manage SQLite database connection
     - Initialize database schema
-    - Provide session context manager
+    - Provide session context managers (read-write and read-only)
     - Enable SQLite foreign key constraints
     - Enable WAL mode for better concurrency
+    - Apply a tunable pragma profile to every connection
+
+    Connection layout (file databases):
+    - Writer: a single pooled connection; concurrent writers wait for it
+      instead of interleaving statements on a shared connection
+    - Readers: a pool of ``query_only`` connections, one per concurrent
+      reader, which WAL lets run in parallel with the writer
+    In-memory databases keep a single shared connection for both.
 
     Attributes:
         database_url (str): Database connection URL
-        engine: SQLAlchemy engine
-        SessionLocal: SQLAlchemy session factory
+        profile (str): Pragma profile name
+        pragmas (dict): Effective pragma values
+        engine: SQLAlchemy engine used for writes (and init_db)
+        read_engine: SQLAlchemy engine used for read-only sessions
+        SessionLocal: SQLAlchemy session factory (writer)
+        ReadSessionLocal: SQLAlchemy session factory (readers)
         logger (Logger): Logger instance
 
     Example:
@@ -58,51 +99,128 @@ class Database:
         ...     articles = session.query(Article).all()
     """
 
-    def __init__(self, database_url: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        database_url: str,
+        logger: Optional[logging.Logger] = None,
+        profile: str = "default",
+        pragmas: Optional[Dict[str, Any]] = None,
+        read_pool_size: int = 4
+    ):
         """
         Initialize database connection
 
         Args:
             database_url: SQLite database URL (e.g., 'sqlite:///data/insights.db')
             logger: Logger instance for logging database operations
+            profile: Pragma profile name from DATABASE_PROFILES (default: "default")
+            pragmas: Individual pragma overrides (e.g., {"cache_size": -32768})
+            read_pool_size: Number of pooled read-only connections (default: 4)
+
+        Raises:
+            ValueError: If the profile or a pragma name is unknown
 
         Example:
             >>> db = Database('sqlite:///data/insights.db')
+            >>> db = Database('sqlite:///data/insights.db', profile="throughput")
         """
+        if profile not in DATABASE_PROFILES:
+            raise ValueError(
+                f"Unknown database profile: {profile}. "
+                f"Must be one of {sorted(DATABASE_PROFILES)}"
+            )
+        unknown = set(pragmas or {}) - set(DATABASE_PROFILES[profile])
+        if unknown:
+            raise ValueError(f"Unknown pragmas: {sorted(unknown)}")
+
         self.database_url = database_url
         self.logger = logger or Logger.get_logger("Database")
+        self.profile = profile
+        self.pragmas = {**DATABASE_PROFILES[profile], **(pragmas or {})}
 
         # Ensure database directory exists
         self._ensure_database_directory()
 
-        # Create SQLAlchemy engine
-        self.engine = create_engine(
-            database_url,
-            connect_args={
-                "check_same_thread": False,  # Allow multi-threading
-                "timeout": 30.0  # 30 seconds timeout for locks
-            },
-            poolclass=StaticPool,  # Use static pool for SQLite
-            echo=False  # Set to True for SQL debugging
-        )
-
-        # Enable foreign key constraints for all connections
+        connect_args = {
+            "check_same_thread": False,  # Connections are handed between threads by the pool
+            "timeout": self.pragmas["busy_timeout"] / 1000.0
+        }
+
+        if self.database_file is None:
+            # In-memory database: every connection would be a separate
+            # database, so share a single one for reads and writes
+            self.engine = create_engine(
+                database_url,
+                connect_args=connect_args,
+                poolclass=StaticPool,
+                echo=False  # Set to True for SQL debugging
+            )
+            self.read_engine = self.engine
+        else:
+            # Single writer: one connection, other writers wait for it
+            self.engine = create_engine(
+                database_url,
+                connect_args=connect_args,
+                poolclass=QueuePool,
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=self.pragmas["busy_timeout"] / 1000.0,
+                echo=False
+            )
+            self.read_engine = create_engine(
+                database_url,
+                connect_args=connect_args,
+                poolclass=QueuePool,
+                pool_size=max(1, read_pool_size),
+                max_overflow=max(1, read_pool_size),
+                echo=False
+            )
+
+        # Enable foreign keys, WAL and the profile pragmas for all connections
         @event.listens_for(self.engine, "connect")
         def set_sqlite_pragma(dbapi_conn, connection_record):
-            """Enable foreign keys and WAL mode for each connection"""
-            cursor = dbapi_conn.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.close()
+            """Enable foreign keys, WAL mode and profile pragmas for each connection"""
+            self._apply_pragmas(dbapi_conn, read_only=False)
+
+        if self.read_engine is not self.engine:
+            @event.listens_for(self.read_engine, "connect")
+            def set_sqlite_read_pragma(dbapi_conn, connection_record):
+                """Same pragmas as the writer, plus query_only"""
+                self._apply_pragmas(dbapi_conn, read_only=True)
 
-        # Create session factory
+        # Create session factories
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
             bind=self.engine
         )
+        self.ReadSessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self.read_engine
+        )
+
+        self.logger.info(f"Database initialized: {database_url} (profile={profile})")
+
+    def _apply_pragmas(self, dbapi_conn, read_only: bool) -> None:
+        """
+        Apply connection pragmas
 
-        self.logger.info(f"Database initialized: {database_url}")
+        Args:
+            dbapi_conn: Raw sqlite3 connection
+            read_only: Whether to set ``query_only`` (reader pool)
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(self.pragmas['busy_timeout'])}")
+        cursor.execute(f"PRAGMA synchronous={self.pragmas['synchronous']}")
+        cursor.execute(f"PRAGMA cache_size={int(self.pragmas['cache_size'])}")
+        cursor.execute(f"PRAGMA mmap_size={int(self.pragmas['mmap_size'])}")
+        cursor.execute(f"PRAGMA temp_store={self.pragmas['temp_store']}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
 
     @classmethod
     def from_config(cls, config: Config) -> "Database":
@@ -125,7 +243,24 @@ class Database:
         logger = Logger.get_logger("Database")
         logger.info(f"Creating database from config: {database_path}")
 
-        return cls(database_url, logger)
+        return cls(database_url, logger, profile=config.database_profile)
+
+    @property
+    def database_file(self) -> Optional[Path]:
+        """
+        Path of the SQLite database file
+
+        Returns:
+            Optional[Path]: File path, or None for in-memory databases
+        """
+        if not self.database_url.startswith('sqlite:///'):
+            return None
+
+        db_path = self.database_url.replace('sqlite:///', '')
+        if not db_path or db_path == ':memory:':
+            return None
+
+        return Path(db_path)
 
     def _ensure_database_directory(self) -> None:
         """
@@ -211,7 +346,9 @@ class Database:
         Raises:
             RuntimeError: If required tables are missing
         """
-        expected_tables = ['articles', 'embeddings', 'daily_reports', 'weekly_reports']
+        expected_tables = [
+            'articles', 'embeddings', 'daily_reports', 'weekly_reports', 'url_redirects'
+        ]
 
         with self.engine.connect() as conn:
             result = conn.execute(text(
@@ -256,6 +393,29 @@ class Database:
         finally:
             session.close()
 
+    @contextmanager
+    def get_read_session(self) -> Generator[Session, None, None]:
+        """
+        Get a read-only database session as context manager
+
+        The session uses the reader pool, so reads from several threads run
+        in parallel and do not wait for the writer. Nothing is committed;
+        write attempts fail with "attempt to write a readonly database".
+
+        Yields:
+            Session: SQLAlchemy session
+
+        Example:
+            >>> with db.get_read_session() as session:
+            ...     count = session.query(Article).count()
+        """
+        session = self.ReadSessionLocal()
+        try:
+            yield session
+        finally:
+            session.rollback()
+            session.close()
+
     def execute_raw_sql(self, sql: str) -> None:
         """
         Execute raw SQL statement
@@ -312,6 +472,8 @@ class Database:
         """
         if self.engine:
             self.engine.dispose()
+            if self.read_engine is not self.engine:
+                self.read_engine.dispose()
             self.logger.info("Database connection closed")
 
     def __enter__(self):
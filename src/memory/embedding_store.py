@@ -21,18 +21,121 @@ Usage:
     # Find similar articles
     query_vector = np.array([0.15, 0.25, 0.35, ...])
     similar = store.find_similar(vector=query_vector, top_k=5)
+
+    # Approximate search through the IVF index persisted beside the database
+    similar = store.find_similar(vector=query_vector, top_k=5, search_mode="ann")
+    print(store.evaluate_ann(model="text-embedding-3"))
+
+    # Memory-mapped matrix for clustering / analysis (no SQLAlchemy round trip)
+    ids, matrix = store.get_matrix([1, 2, 3], model="text-embedding-3")
 """
 
 import numpy as np
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Iterator
 import pickle
+import struct
+from pathlib import Path
 import logging
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from src.memory.models import Embedding, Article
 from src.memory.database import Database
+from src.memory.ann_index import IVFIndex
+from src.memory.vector_file import VectorFile
 from src.utils.logger import Logger
 
 
+# Binary vector format (version 1):
+#   16-byte header: magic b"ICVE", version (u8), dtype code (u8),
+#   2 pad bytes, dimension (u32), 4 pad bytes -- all little-endian
+#   followed by `dimension` raw values of the given dtype.
+VECTOR_MAGIC = b"ICVE"
+VECTOR_FORMAT_VERSION = 1
+_VECTOR_HEADER = struct.Struct("<4sBB2xI4x")
+_VECTOR_DTYPES = {1: np.dtype("<f4")}
+_VECTOR_DTYPE_CODES = {dtype: code for code, dtype in _VECTOR_DTYPES.items()}
+
+SEARCH_MODES = ("exact", "ann")
+
+# Model the Analyst stores article embeddings under (read by weekly clustering)
+ANALYSIS_EMBEDDING_MODEL = "text-embedding-004"
+
+
+class _VectorBlock:
+    """
+    Growable, pre-normalized float32 matrix for one (model, dimension) pair
+
+    Rows are unit vectors so cosine similarity reduces to a dot product.
+    Capacity doubles on demand, so appends are amortized O(dimension).
+
+    Attributes:
+        ids (np.ndarray): Article IDs (int64), valid up to ``size``
+        matrix (np.ndarray): Unit vectors (float32), valid up to ``size``
+        versions (np.ndarray): Embedding row IDs (int64), valid up to ``size``
+        size (int): Number of valid rows
+    """
+
+    __slots__ = ("ids", "matrix", "versions", "size")
+
+    def __init__(self, dimension: int, capacity: int = 64):
+        self.ids = np.empty(capacity, dtype=np.int64)
+        self.matrix = np.empty((capacity, dimension), dtype=np.float32)
+        self.versions = np.empty(capacity, dtype=np.int64)
+        self.size = 0
+
+    def append(
+        self,
+        article_id: int,
+        unit_vector: np.ndarray,
+        replace: bool = True,
+        version: int = 0
+    ) -> None:
+        """Append a row, replacing any existing row for the same article"""
+        if replace:
+            self.remove(article_id)
+
+        if self.size == len(self.ids):
+            capacity = max(64, len(self.ids) * 2)
+            ids = np.empty(capacity, dtype=np.int64)
+            matrix = np.empty((capacity, self.matrix.shape[1]), dtype=np.float32)
+            versions = np.empty(capacity, dtype=np.int64)
+            ids[:self.size] = self.ids[:self.size]
+            matrix[:self.size] = self.matrix[:self.size]
+            versions[:self.size] = self.versions[:self.size]
+            self.ids, self.matrix, self.versions = ids, matrix, versions
+
+        self.ids[self.size] = article_id
+        self.matrix[self.size] = unit_vector
+        self.versions[self.size] = version
+        self.size += 1
+
+    def remove(self, article_id: int) -> bool:
+        """Remove the row for an article (swap-with-last), return True if found"""
+        positions = np.nonzero(self.ids[:self.size] == article_id)[0]
+        if len(positions) == 0:
+            return False
+
+        last = self.size - 1
+        pos = positions[0]
+        if pos != last:
+            self.ids[pos] = self.ids[last]
+            self.matrix[pos] = self.matrix[last]
+            self.versions[pos] = self.versions[last]
+        self.size = last
+        return True
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (ids, matrix) views over the valid rows"""
+        return self.ids[:self.size], self.matrix[:self.size]
+
+
 class EmbeddingStore:
     """
     Embedding vector storage and similarity search
@@ -40,12 +143,35 @@ class EmbeddingStore:
     Provides functionality for:
     - Storing embedding vectors
     - Retrieving embeddings
-    - Cosine similarity search
+    - Cosine similarity search (in-memory matrix cache)
     - Vector serialization/deserialization
 
+    Similarity search is served from a per-model cache of pre-normalized
+    float32 matrices. The cache for a model is loaded from the database on
+    the first query and kept in sync by ``store()`` and ``delete()`` on the
+    same instance. Writes made through other instances or processes are not
+    seen until ``invalidate_cache()`` is called.
+
+    With ``search_mode="ann"`` queries go through an IVF index built from the
+    same cache and persisted beside the database file
+    (``<db>.<model>.<dim>.ivf.npz``). Inserts and deletes update the index in
+    place; it is rebuilt on the next ANN query once the share of changed
+    vectors exceeds ``ann_staleness_threshold``. A loaded sidecar is
+    reconciled with the cache by embedding row ID, so vectors re-stored
+    elsewhere since it was saved are replaced.
+
+    ``get_matrix()`` serves raw vectors from an append-only memory-mapped
+    file per (model, dimension) beside the database
+    (``<db>.<model>.<dim>.f32`` / ``.ids`` / ``.ver``). The file is synced
+    with the database when first opened and then appended to by ``store()``.
+    For in-memory databases the files live in a temporary directory that
+    ``close()`` removes.
+
     Attributes:
         database (Database): Database instance
         logger (Logger): Logger instance
+        ann_staleness_threshold (float): Changed share that triggers a rebuild
+        ann_n_probe (int): Default number of IVF cells scanned per query
 
     Example:
         >>> store = EmbeddingStore(db)
@@ -54,16 +180,45 @@ class EmbeddingStore:
         >>> similar = store.find_similar(vector=query_vector, top_k=5)
     """
 
-    def __init__(self, database: Database, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        database: Database,
+        logger: Optional[logging.Logger] = None,
+        ann_staleness_threshold: float = 0.2,
+        ann_n_probe: int = 8
+    ):
         """
         Initialize EmbeddingStore
 
         Args:
             database: Database instance
             logger: Logger instance (optional)
+            ann_staleness_threshold: Share of inserted/removed vectors since the
+                                     last build that triggers a rebuild (default: 0.2)
+            ann_n_probe: Default IVF cells scanned per ANN query (default: 8)
         """
         self.database = database
         self.logger = logger or Logger.get_logger("EmbeddingStore")
+        self.ann_staleness_threshold = ann_staleness_threshold
+        self.ann_n_probe = ann_n_probe
+
+        # Similarity cache: model -> {dimension -> _VectorBlock}
+        self._matrix_cache: Dict[str, Dict[int, _VectorBlock]] = {}
+        self._cache_lock = threading.Lock()
+        # Models being loaded: model -> [loader count, cache writes made during
+        # the load], replayed onto the loaded blocks before they are published
+        self._loading: Dict[str, list] = {}
+
+        # ANN indexes: (model, dimension) -> IVFIndex, guarded by _cache_lock
+        self._ann_indexes: Dict[Tuple[str, int], IVFIndex] = {}
+        self._search_stats: Dict[str, Dict[str, float]] = {
+            mode: {"queries": 0, "total_seconds": 0.0} for mode in SEARCH_MODES
+        }
+
+        # Memory-mapped vector files: (model, dimension) -> VectorFile
+        self._vector_files: Dict[Tuple[str, int], VectorFile] = {}
+        self._vector_file_lock = threading.RLock()
+        self._vector_dir: Optional[Path] = None
 
     def store(
         self,
@@ -130,17 +285,140 @@ class EmbeddingStore:
 
                 embedding_id = embedding.id
 
-                self.logger.info(
-                    f"Stored embedding {embedding_id} for article {article_id} "
-                    f"(model: {model}, dim: {len(vector)})"
-                )
+            self._cache_add(model, article_id, vector, embedding_id)
+            self._vector_file_add(model, article_id, vector, embedding_id)
 
-                return embedding_id
+            self.logger.info(
+                f"Stored embedding {embedding_id} for article {article_id} "
+                f"(model: {model}, dim: {len(vector)})"
+            )
+
+            return embedding_id
 
         except Exception as e:
             self.logger.error(f"Failed to store embedding: {e}")
             raise
 
+    def store_many(
+        self,
+        items: List[Dict[str, Any]],
+        session: Optional[Session] = None
+    ) -> List[Optional[int]]:
+        """
+        Store several embeddings in one transaction
+
+        Unlike store(), articles that do not exist or already have an
+        embedding for the model are skipped (logged) instead of raising, so
+        one bad item does not fail the batch.
+
+        Args:
+            items: Dictionaries with article_id, vector (1-D numpy array) and
+                model (optional, default: "default")
+            session: Open writer session to join (optional; the caller
+                commits it, and the in-memory cache and vector files are
+                updated once that commit succeeded)
+
+        Returns:
+            List[Optional[int]]: Embedding ID per item (None if skipped)
+
+        Raises:
+            ValueError: If a vector is not a 1-dimensional numpy array
+
+        Example:
+            >>> ids = store.store_many([
+            ...     {"article_id": 1, "vector": np.array([0.1, 0.2]), "model": "text-embedding-004"},
+            ...     {"article_id": 2, "vector": np.array([0.3, 0.4]), "model": "text-embedding-004"}
+            ... ])
+        """
+        for item in items:
+            vector = item['vector']
+            if not isinstance(vector, np.ndarray) or vector.ndim != 1:
+                raise ValueError(
+                    f"Vector for article {item['article_id']} must be a 1-dimensional numpy array"
+                )
+
+        if not items:
+            return []
+
+        try:
+            if session is not None:
+                embedding_ids = self._insert_many(session, items)
+                event.listen(
+                    session, "after_commit",
+                    lambda _session: self._publish_many(items, embedding_ids),
+                    once=True
+                )
+                return embedding_ids
+
+            with self.database.get_session() as session:
+                embedding_ids = self._insert_many(session, items)
+            self._publish_many(items, embedding_ids)
+
+            return embedding_ids
+
+        except Exception as e:
+            self.logger.error(f"Failed to store embedding batch: {e}")
+            raise
+
+    def _insert_many(
+        self,
+        session: Session,
+        items: List[Dict[str, Any]]
+    ) -> List[Optional[int]]:
+        """Insert embedding rows in the given session (see store_many)"""
+        article_ids = list({item['article_id'] for item in items})
+        known_articles = {
+            row[0] for row in
+            session.query(Article.id).filter(Article.id.in_(article_ids))
+        }
+        taken = {
+            (row[0], row[1]) for row in
+            session.query(Embedding.article_id, Embedding.model).filter(
+                Embedding.article_id.in_(article_ids)
+            )
+        }
+
+        embeddings: List[Optional[Embedding]] = []
+        for item in items:
+            key = (item['article_id'], item.get('model', 'default'))
+            if key[0] not in known_articles or key in taken:
+                self.logger.warning(
+                    f"Skipping embedding for article {key[0]} (model: {key[1]}): "
+                    + ("article not found" if key[0] not in known_articles else "already exists")
+                )
+                embeddings.append(None)
+                continue
+
+            taken.add(key)
+            embedding = Embedding(
+                article_id=key[0],
+                embedding=self.serialize_vector(item['vector']),
+                model=key[1],
+                dimension=len(item['vector'])
+            )
+            session.add(embedding)
+            embeddings.append(embedding)
+
+        session.flush()
+        return [emb.id if emb is not None else None for emb in embeddings]
+
+    def _publish_many(
+        self,
+        items: List[Dict[str, Any]],
+        embedding_ids: List[Optional[int]]
+    ) -> None:
+        """Add committed embeddings to the similarity cache and vector files"""
+        for item, embedding_id in zip(items, embedding_ids):
+            if embedding_id is not None:
+                model = item.get('model', 'default')
+                self._cache_add(model, item['article_id'], item['vector'], embedding_id)
+                self._vector_file_add(model, item['article_id'], item['vector'], embedding_id)
+
+        self.logger.info(
+            f"Stored {sum(1 for eid in embedding_ids if eid is not None)} of "
+            f"{len(items)} embeddings"
+        )
+
     def get(self, article_id: int, model: str = "default") -> Optional[np.ndarray]:
         """
         Get embedding vector for an article
@@ -158,7 +436,7 @@ class EmbeddingStore:
             ...     print(f"Vector dimension: {len(vector)}")
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 embedding = session.query(Embedding).filter(
                     Embedding.article_id == article_id,
                     Embedding.model == model
@@ -181,7 +459,9 @@ class EmbeddingStore:
         vector: np.ndarray,
         top_k: int = 10,
         model: str = "default",
-        threshold: float = 0.0
+        threshold: float = 0.0,
+        search_mode: str = "exact",
+        n_probe: Optional[int] = None
     ) -> List[Tuple[int, float]]:
         """
         Find most similar articles using cosine similarity
@@ -191,6 +471,8 @@ class EmbeddingStore:
             top_k: Number of top results to return (default: 10)
             model: Model name to search within (default: "default")
             threshold: Minimum similarity threshold (default: 0.0)
+            search_mode: "exact" (full scan) or "ann" (IVF index, default: "exact")
+            n_probe: IVF cells to scan in "ann" mode (default: ``ann_n_probe``)
 
         Returns:
             List[Tuple[int, float]]: List of (article_id, similarity_score) tuples
@@ -203,8 +485,11 @@ class EmbeddingStore:
             ...     print(f"Article {article_id}: {score:.3f}")
 
         Note:
-            This implementation uses full scan. For large datasets (>10,000 vectors),
-            consider using specialized vector databases like Faiss or Annoy.
+            Exact search over the in-memory matrix cache: one matrix-vector
+            product followed by ``argpartition`` for the top K. The database is
+            only read the first time a model is queried. ANN search only scans
+            the ``n_probe`` closest IVF cells and may miss some neighbours;
+            use ``evaluate_ann()`` to measure recall.
         """
         # Validate vector
         if not isinstance(vector, np.ndarray):
@@ -213,52 +498,651 @@ class EmbeddingStore:
         if vector.ndim != 1:
             raise ValueError(f"Vector must be 1-dimensional, got shape {vector.shape}")
 
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Invalid search_mode '{search_mode}', expected one of {SEARCH_MODES}"
+            )
+
         try:
-            with self.database.get_session() as session:
-                # Get all embeddings for the specified model
-                embeddings = session.query(Embedding).filter(
-                    Embedding.model == model
-                ).all()
+            blocks = self._get_model_blocks(model)
+            dimension = len(vector)
+
+            # Writers add blocks to the dict under the lock; snapshot it there
+            with self._cache_lock:
+                block_sizes = {dim: b.size for dim, b in blocks.items()}
+                block = blocks.get(dimension)
+
+            if not block_sizes:
+                self.logger.warning(f"No embeddings found for model '{model}'")
+                return []
+
+            skipped = sum(size for dim, size in block_sizes.items() if dim != dimension)
+            if skipped:
+                self.logger.warning(
+                    f"Dimension mismatch: skipped {skipped} embedding(s) "
+                    f"of model '{model}' not matching dim {dimension}"
+                )
+
+            if block is None or top_k <= 0:
+                return []
+
+            query = self._normalize(vector)
 
-                if not embeddings:
-                    self.logger.warning(f"No embeddings found for model '{model}'")
+            with self._cache_lock:
+                if block.size == 0:
                     return []
+                start = time.perf_counter()
+                if search_mode == "ann":
+                    index = self._get_ann_index(model, dimension, block)
+                    results = index.search(
+                        query, top_k, threshold, n_probe or self.ann_n_probe
+                    )
+                else:
+                    results = self._exact_search(block, query, top_k, threshold)
+                stats = self._search_stats[search_mode]
+                stats["queries"] += 1
+                stats["total_seconds"] += time.perf_counter() - start
+                searched = block.size
 
-                # Calculate similarities
-                similarities = []
+            self.logger.info(
+                f"Found {len(results)} similar articles "
+                f"({search_mode} search over {searched} embeddings)"
+            )
 
-                for embedding in embeddings:
-                    stored_vector = self.deserialize_vector(embedding.embedding)
+            return results
 
-                    # Check dimension match
-                    if len(stored_vector) != len(vector):
-                        self.logger.warning(
-                            f"Dimension mismatch for embedding {embedding.id}: "
-                            f"expected {len(vector)}, got {len(stored_vector)}"
-                        )
-                        continue
+        except Exception as e:
+            self.logger.error(f"Failed to find similar articles: {e}")
+            raise
 
-                    # Calculate cosine similarity
-                    similarity = self.cosine_similarity(vector, stored_vector)
+    @staticmethod
+    def _exact_search(
+        block: _VectorBlock,
+        query: np.ndarray,
+        top_k: int,
+        threshold: float
+    ) -> List[Tuple[int, float]]:
+        """Full scan of a cached block (caller holds the cache lock)"""
+        ids, matrix = block.view()
+        scores = matrix @ query
+
+        candidates = np.nonzero(scores >= threshold)[0]
+        k = min(top_k, len(candidates))
+        if k == 0:
+            return []
+        if k < len(candidates):
+            part = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[part]
+        order = np.argsort(-scores[candidates], kind="stable")
+
+        return [(int(ids[i]), float(scores[i])) for i in candidates[order]]
+
+    def build_ann_index(self, model: str = "default", n_lists: Optional[int] = None) -> Dict[str, Any]:
+        """
+        (Re)build the ANN index for a model and persist it
 
-                    # Apply threshold
-                    if similarity >= threshold:
-                        similarities.append((embedding.article_id, float(similarity)))
+        Args:
+            model: Model name (default: "default")
+            n_lists: Number of IVF cells (default: sqrt of the vector count)
 
-                # Sort by similarity (descending) and take top K
-                similarities.sort(key=lambda x: x[1], reverse=True)
-                results = similarities[:top_k]
+        Returns:
+            dict: Index statistics per dimension (see ``get_ann_stats``)
 
-                self.logger.info(
-                    f"Found {len(results)} similar articles (searched {len(embeddings)} embeddings)"
-                )
+        Example:
+            >>> store.build_ann_index(model="text-embedding-004")
+        """
+        blocks = self._get_model_blocks(model)
 
-                return results
+        with self._cache_lock:
+            for dimension, block in blocks.items():
+                self._build_ann_index(model, dimension, block, n_lists)
+
+        return self.get_ann_stats(model)
+
+    def get_ann_stats(self, model: str = "default") -> Dict[str, Any]:
+        """
+        Get ANN index state and observed query latency
+
+        Args:
+            model: Model name (default: "default")
+
+        Returns:
+            dict: ``indexes`` (per-dimension size, cells, staleness, build time,
+                  sidecar path) and ``latency`` (queries and mean ms per search mode)
+
+        Example:
+            >>> stats = store.get_ann_stats(model="text-embedding-004")
+            >>> stats["latency"]["ann"]["avg_ms"]
+        """
+        with self._cache_lock:
+            indexes = {}
+            for (index_model, dimension), index in self._ann_indexes.items():
+                if index_model != model:
+                    continue
+                path = self._ann_index_path(model, dimension)
+                indexes[dimension] = {
+                    "vectors": len(index),
+                    "n_lists": index.n_lists,
+                    "stale_fraction": round(index.stale_fraction, 4),
+                    "build_seconds": round(index.build_seconds, 4),
+                    "path": str(path) if path else None
+                }
+
+            latency = {
+                mode: {
+                    "queries": int(stats["queries"]),
+                    "avg_ms": (
+                        round(stats["total_seconds"] / stats["queries"] * 1000, 3)
+                        if stats["queries"] else 0.0
+                    )
+                }
+                for mode, stats in self._search_stats.items()
+            }
+
+        return {"model": model, "indexes": indexes, "latency": latency}
+
+    def evaluate_ann(
+        self,
+        model: str = "default",
+        sample_size: int = 100,
+        top_k: int = 10,
+        n_probe: Optional[int] = None,
+        seed: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Measure ANN recall and latency against exact search
+
+        Stored vectors are sampled as queries; recall@K is the share of the
+        exact top K that the ANN search also returns.
+
+        Args:
+            model: Model name (default: "default")
+            sample_size: Number of query vectors (default: 100)
+            top_k: K for recall@K (default: 10)
+            n_probe: IVF cells to scan (default: ``ann_n_probe``)
+            seed: Random seed for query sampling
+
+        Returns:
+            dict: recall_at_k, exact_avg_ms, ann_avg_ms, queries, n_probe
+
+        Example:
+            >>> report = store.evaluate_ann(model="text-embedding-004", n_probe=16)
+            >>> print(f"recall@10={report['recall_at_k']:.3f}")
+        """
+        n_probe = n_probe or self.ann_n_probe
+        blocks = self._get_model_blocks(model)
+        rng = np.random.default_rng(seed)
+
+        hits = expected = 0
+        exact_seconds = ann_seconds = 0.0
+        queries = 0
+
+        with self._cache_lock:
+            for dimension, block in blocks.items():
+                if block.size == 0:
+                    continue
+                index = self._get_ann_index(model, dimension, block)
+                count = min(sample_size, block.size)
+                rows = rng.choice(block.size, count, replace=False)
+
+                for row in rows:
+                    query = block.matrix[row].copy()
+
+                    start = time.perf_counter()
+                    exact = self._exact_search(block, query, top_k, -1.0)
+                    exact_seconds += time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    approx = index.search(query, top_k, -1.0, n_probe)
+                    ann_seconds += time.perf_counter() - start
+
+                    exact_ids = {article_id for article_id, _ in exact}
+                    hits += len(exact_ids & {article_id for article_id, _ in approx})
+                    expected += len(exact_ids)
+                    queries += 1
+
+        report = {
+            "model": model,
+            "queries": queries,
+            "top_k": top_k,
+            "n_probe": n_probe,
+            "recall_at_k": hits / expected if expected else 1.0,
+            "exact_avg_ms": exact_seconds / queries * 1000 if queries else 0.0,
+            "ann_avg_ms": ann_seconds / queries * 1000 if queries else 0.0
+        }
+
+        self.logger.info(
+            f"ANN evaluation ({model}): recall@{top_k}={report['recall_at_k']:.3f}, "
+            f"exact {report['exact_avg_ms']:.2f}ms, ann {report['ann_avg_ms']:.2f}ms"
+        )
+
+        return report
+
+    def _ann_index_path(self, model: str, dimension: int) -> Optional[Path]:
+        """Sidecar index path beside the database file (None for in-memory DBs)"""
+        if self.database.database_file is None:
+            return None
+
+        base = self._vector_file_base(model, dimension)
+        return base.with_name(base.name + ".ivf.npz")
+
+    def _get_ann_index(self, model: str, dimension: int, block: _VectorBlock) -> IVFIndex:
+        """
+        Get the ANN index for a cached block (caller holds the cache lock)
+
+        Loads the sidecar file on first use and reconciles it with the cache;
+        rebuilds when missing or past the staleness threshold.
+        """
+        key = (model, dimension)
+        index = self._ann_indexes.get(key)
+
+        if index is None:
+            path = self._ann_index_path(model, dimension)
+            index = IVFIndex.load(path) if path else None
+            if index is not None and index.dimension == dimension:
+                self._reconcile_ann_index(index, block)
+                self._ann_indexes[key] = index
+                self.logger.debug(f"Loaded ANN index from {path}")
+            else:
+                index = None
+
+        if index is None or index.stale_fraction > self.ann_staleness_threshold:
+            index = self._build_ann_index(model, dimension, block)
+
+        return index
+
+    def _build_ann_index(
+        self,
+        model: str,
+        dimension: int,
+        block: _VectorBlock,
+        n_lists: Optional[int] = None
+    ) -> IVFIndex:
+        """Build, persist and register an index (caller holds the cache lock)"""
+        ids, matrix = block.view()
+        index = IVFIndex(dimension, n_lists=n_lists, n_probe=self.ann_n_probe)
+        index.build(ids, matrix, versions=block.versions[:block.size])
+        self._ann_indexes[(model, dimension)] = index
+
+        path = self._ann_index_path(model, dimension)
+        if path is not None:
+            try:
+                index.save(path)
+            except OSError as e:
+                self.logger.warning(f"Failed to persist ANN index to {path}: {e}")
+
+        self.logger.info(
+            f"Built ANN index for model '{model}' (dim {dimension}): "
+            f"{len(index)} vectors, {index.n_lists} cells, {index.build_seconds:.2f}s"
+        )
+
+        return index
+
+    @staticmethod
+    def _reconcile_ann_index(index: IVFIndex, block: _VectorBlock) -> None:
+        """
+        Apply changes made since the sidecar was saved (counted as staleness)
+
+        Entries are matched on (article ID, embedding row ID), so a vector
+        deleted and stored again since the save is replaced as well.
+        """
+        ids, matrix = block.view()
+        versions = block.versions[:block.size]
+        indexed = dict(zip(index.ids().tolist(), index.versions().tolist()))
+
+        for article_id in indexed.keys() - set(ids.tolist()):
+            index.remove(article_id)
+
+        for row, (article_id, version) in enumerate(zip(ids.tolist(), versions.tolist())):
+            if indexed.get(article_id) != version:
+                index.add(article_id, matrix[row], version=version)
+
+    def invalidate_cache(self, model: Optional[str] = None) -> None:
+        """
+        Drop the in-memory similarity cache
+
+        The next ``find_similar`` call reloads the matrix from the database.
+        Use this after embeddings were written by another process or store.
+        In-memory ANN indexes are dropped too and re-read from their sidecar
+        files on the next ANN query; vector files are re-synced on next use.
+
+        Args:
+            model: Model name to invalidate (if None, invalidate all models)
+
+        Example:
+            >>> store.invalidate_cache(model="text-embedding-004")
+        """
+        with self._cache_lock:
+            if model is None:
+                self._matrix_cache.clear()
+                self._ann_indexes.clear()
+            else:
+                self._matrix_cache.pop(model, None)
+                for key in [k for k in self._ann_indexes if k[0] == model]:
+                    del self._ann_indexes[key]
+
+        with self._vector_file_lock:
+            for key in [k for k in self._vector_files if model is None or k[0] == model]:
+                del self._vector_files[key]
+
+    def close(self) -> None:
+        """
+        Release open vector files and drop the in-memory caches
+
+        For in-memory databases the temporary vector file directory is
+        removed as well. The store can still be used afterwards; caches and
+        files are rebuilt on demand.
+
+        Example:
+            >>> store.close()
+        """
+        self.invalidate_cache()
+
+        with self._vector_file_lock:
+            if self._vector_dir is not None:
+                shutil.rmtree(self._vector_dir, ignore_errors=True)
+                self._vector_dir = None
+
+    def get_matrix(
+        self,
+        article_ids: Optional[List[int]] = None,
+        model: str = "default",
+        dimension: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get raw vectors as a matrix backed by the memory-mapped vector file
+
+        Args:
+            article_ids: Articles to return, in this order (if None, all vectors)
+            model: Model name (default: "default")
+            dimension: Vector dimension (if None, the model's only dimension)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (article_ids, matrix) for articles
+                that have an embedding; ``matrix[i]`` belongs to ``article_ids[i]``
+
+        Raises:
+            ValueError: If dimension is None and the model has mixed dimensions
+
+        Example:
+            >>> ids, matrix = store.get_matrix([1, 2, 3], model="text-embedding-004")
+            >>> matrix.shape
+            (3, 768)
+
+        Note:
+            The matrix is read-only. For all vectors, or for articles whose
+            rows are contiguous in the file (e.g. stored in ID order), it is a
+            view of the memmap and nothing is copied; otherwise the requested
+            rows are gathered into a new array.
+        """
+        try:
+            if dimension is None:
+                with self.database.get_read_session() as session:
+                    dimensions = [
+                        row[0] for row in session.query(Embedding.dimension).filter(
+                            Embedding.model == model
+                        ).distinct()
+                    ]
+                if not dimensions:
+                    return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)
+                if len(dimensions) > 1:
+                    raise ValueError(
+                        f"Model '{model}' has embeddings of dimensions {sorted(dimensions)}; "
+                        f"pass dimension explicitly"
+                    )
+                dimension = dimensions[0]
+
+            vector_file = self._get_vector_file(model, dimension)
+
+            if article_ids is None:
+                return vector_file.view()
+            return vector_file.take(article_ids)
 
         except Exception as e:
-            self.logger.error(f"Failed to find similar articles: {e}")
+            self.logger.error(f"Failed to get embedding matrix: {e}")
             raise
 
+    def _get_vector_file(self, model: str, dimension: int) -> VectorFile:
+        """
+        Open the vector file for (model, dimension), syncing it with the database
+
+        Each row carries the ID of the embedding row it was written from, so
+        a vector that was deleted and stored again (by any store or process)
+        is detected even though its article ID is unchanged. Rows missing
+        from the file or written from another embedding row are (re)appended
+        in article ID order; rows no longer in the database are tombstoned.
+        """
+        with self._vector_file_lock:
+            key = (model, dimension)
+            vector_file = self._vector_files.get(key)
+            if vector_file is not None:
+                return vector_file
+
+            vector_file = VectorFile(self._vector_file_base(model, dimension), dimension)
+
+            with self.database.get_read_session() as session:
+                db_versions = dict(
+                    session.query(Embedding.article_id, Embedding.id).filter(
+                        Embedding.model == model,
+                        Embedding.dimension == dimension
+                    )
+                )
+
+            file_versions = vector_file.live_versions()
+            for article_id in file_versions.keys() - db_versions.keys():
+                vector_file.remove(article_id)
+
+            missing = sorted(
+                article_id for article_id, version in db_versions.items()
+                if file_versions.get(article_id) != version
+            )
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                with self.database.get_read_session() as session:
+                    rows = session.query(
+                        Embedding.article_id, Embedding.id, Embedding.embedding
+                    ).filter(
+                        Embedding.model == model,
+                        Embedding.article_id.in_(chunk)
+                    ).order_by(Embedding.article_id).all()
+                    vector_file.append_many(
+                        [article_id for article_id, _, _ in rows],
+                        np.array([self.deserialize_vector(data) for _, _, data in rows]),
+                        versions=[embedding_id for _, embedding_id, _ in rows]
+                    )
+
+            if vector_file.tombstones > len(vector_file):
+                vector_file.compact()
+
+            self._vector_files[key] = vector_file
+
+            self.logger.debug(
+                f"Opened vector file {vector_file.vectors_path} "
+                f"({len(vector_file)} vectors, {len(missing)} appended)"
+            )
+
+            return vector_file
+
+    def _vector_file_base(self, model: str, dimension: int) -> Path:
+        """Base path of a vector file (beside the DB, or a temp dir for in-memory DBs)"""
+        db_file = self.database.database_file
+        safe_model = re.sub(r"[^A-Za-z0-9_.-]", "_", model)
+
+        if db_file is None:
+            if self._vector_dir is None:
+                self._vector_dir = Path(tempfile.mkdtemp(prefix="insightcosmos-vectors-"))
+            return self._vector_dir / f"{safe_model}.{dimension}"
+
+        return db_file.with_name(f"{db_file.stem}.{safe_model}.{dimension}")
+
+    def _vector_file_add(
+        self,
+        model: str,
+        article_id: int,
+        vector: np.ndarray,
+        embedding_id: int
+    ) -> None:
+        """Append a stored vector to its vector file if the file is open"""
+        with self._vector_file_lock:
+            vector_file = self._vector_files.get((model, len(vector)))
+            if vector_file is not None:
+                vector_file.append(article_id, vector, version=embedding_id)
+
+    def _vector_file_remove(self, article_id: int, model: Optional[str] = None) -> None:
+        """Tombstone an article in open vector files (all models if None)"""
+        with self._vector_file_lock:
+            for (file_model, _), vector_file in self._vector_files.items():
+                if model is None or file_model == model:
+                    vector_file.remove(article_id)
+
+    def _get_model_blocks(self, model: str) -> Dict[int, _VectorBlock]:
+        """
+        Get cached matrix blocks for a model, loading them on first use
+
+        The database is read outside the cache lock. ``store()`` and
+        ``delete()`` calls that finish during the read are recorded and
+        replayed onto the loaded blocks before they are published, so a
+        steady stream of writes cannot force the load to start over.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Dict[int, _VectorBlock]: Blocks keyed by vector dimension
+        """
+        with self._cache_lock:
+            blocks = self._matrix_cache.get(model)
+            if blocks is not None:
+                return blocks
+            # Start recording writes before the read; concurrent loaders
+            # share the log, which then begins before either read
+            loading = self._loading.setdefault(model, [0, []])
+            loading[0] += 1
+
+        try:
+            loaded: Dict[int, _VectorBlock] = {}
+
+            with self.database.get_read_session() as session:
+                rows = session.query(
+                    Embedding.article_id, Embedding.id, Embedding.embedding
+                ).filter(
+                    Embedding.model == model
+                ).all()
+
+                for article_id, embedding_id, data in rows:
+                    stored_vector = self.deserialize_vector(data)
+                    dimension = len(stored_vector)
+                    block = loaded.get(dimension)
+                    if block is None:
+                        block = loaded[dimension] = _VectorBlock(dimension)
+                    # (article_id, model) is unique, so no replacement scan is needed
+                    block.append(
+                        article_id, self._normalize(stored_vector),
+                        replace=False, version=embedding_id
+                    )
+
+            with self._cache_lock:
+                # Another thread may have loaded the model meanwhile; keep the first
+                blocks = self._matrix_cache.get(model)
+                if blocks is not None:
+                    return blocks
+
+                # Each write sets the final state of one article, so replaying
+                # them in order is correct whether or not the read saw them
+                replayed = len(loading[1])
+                for op, args in loading[1]:
+                    if op == "add":
+                        self._apply_add(loaded, *args)
+                    else:
+                        self._apply_remove(loaded, *args)
+                self._matrix_cache[model] = loaded
+
+        finally:
+            with self._cache_lock:
+                loading[0] -= 1
+                if loading[0] == 0 and self._loading.get(model) is loading:
+                    del self._loading[model]
+
+        self.logger.debug(
+            f"Loaded similarity cache for model '{model}' "
+            f"({len(rows)} vectors, {replayed} concurrent writes replayed)"
+        )
+
+        return loaded
+
+    def _cache_add(
+        self,
+        model: str,
+        article_id: int,
+        vector: np.ndarray,
+        embedding_id: int
+    ) -> None:
+        """Add a stored vector to the similarity cache if the model is loaded"""
+        unit_vector = self._normalize(vector)
+
+        with self._cache_lock:
+            loading = self._loading.get(model)
+            if loading is not None:
+                loading[1].append(("add", (article_id, unit_vector, embedding_id)))
+
+            blocks = self._matrix_cache.get(model)
+            if blocks is None:
+                return
+
+            self._apply_add(blocks, article_id, unit_vector, embedding_id)
+
+            index = self._ann_indexes.get((model, len(unit_vector)))
+            if index is not None:
+                index.add(article_id, unit_vector, version=embedding_id)
+
+    def _cache_remove(self, article_id: int, model: Optional[str] = None) -> None:
+        """Remove an article from the similarity cache (all models if None)"""
+        with self._cache_lock:
+            for loading_model, loading in self._loading.items():
+                if model is None or loading_model == model:
+                    loading[1].append(("remove", (article_id,)))
+
+            if model is None:
+                targets = list(self._matrix_cache.values())
+            else:
+                targets = [self._matrix_cache[model]] if model in self._matrix_cache else []
+
+            for blocks in targets:
+                self._apply_remove(blocks, article_id)
+
+            for (index_model, _), index in self._ann_indexes.items():
+                if model is None or index_model == model:
+                    index.remove(article_id)
+
+    @staticmethod
+    def _apply_add(
+        blocks: Dict[int, _VectorBlock],
+        article_id: int,
+        unit_vector: np.ndarray,
+        embedding_id: int
+    ) -> None:
+        """Insert or replace a normalized vector in a model's blocks"""
+        dimension = len(unit_vector)
+        block = blocks.get(dimension)
+        if block is None:
+            block = blocks[dimension] = _VectorBlock(dimension)
+        block.append(article_id, unit_vector, version=embedding_id)
+
+    @staticmethod
+    def _apply_remove(blocks: Dict[int, _VectorBlock], article_id: int) -> None:
+        """Remove an article from every block of a model"""
+        for block in blocks.values():
+            block.remove(article_id)
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        """Return the vector as a float32 unit vector (zero vectors stay zero)"""
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return vector
+        return vector / norm
+
     def delete(self, article_id: int, model: Optional[str] = None) -> bool:
         """
         Delete embedding(s) for an article
@@ -285,17 +1169,20 @@ class EmbeddingStore:
 
                 count = query.delete()
 
-                if count == 0:
-                    self.logger.warning(
-                        f"No embeddings found for deletion: article_id={article_id}, model={model}"
-                    )
-                    return False
-
-                self.logger.info(
-                    f"Deleted {count} embedding(s) for article {article_id}"
+            if count == 0:
+                self.logger.warning(
+                    f"No embeddings found for deletion: article_id={article_id}, model={model}"
                 )
+                return False
+
+            self._cache_remove(article_id, model)
+            self._vector_file_remove(article_id, model)
+
+            self.logger.info(
+                f"Deleted {count} embedding(s) for article {article_id}"
+            )
 
-                return True
+            return True
 
         except Exception as e:
             self.logger.error(f"Failed to delete embedding: {e}")
@@ -317,7 +1204,7 @@ class EmbeddingStore:
             ...     store.store(article_id=1, vector=vector, model="text-embedding-3")
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 count = session.query(Embedding).filter(
                     Embedding.article_id == article_id,
                     Embedding.model == model
@@ -369,24 +1256,35 @@ class EmbeddingStore:
     @staticmethod
     def serialize_vector(vector: np.ndarray) -> bytes:
         """
-        Serialize numpy array to bytes using pickle
+        Serialize numpy array to the versioned float32 binary format
 
         Args:
-            vector: Numpy array to serialize
+            vector: Numpy array to serialize (1-dimensional)
 
         Returns:
-            bytes: Serialized vector
+            bytes: 16-byte header followed by little-endian float32 values
 
         Example:
             >>> vector = np.array([0.1, 0.2, 0.3])
             >>> vector_bytes = EmbeddingStore.serialize_vector(vector)
+            >>> len(vector_bytes)
+            28
         """
-        return pickle.dumps(vector)
+        dtype = _VECTOR_DTYPES[1]
+        values = np.ascontiguousarray(vector, dtype=dtype)
+        header = _VECTOR_HEADER.pack(
+            VECTOR_MAGIC, VECTOR_FORMAT_VERSION, _VECTOR_DTYPE_CODES[dtype], len(values)
+        )
+        return header + values.tobytes()
 
     @staticmethod
     def deserialize_vector(data: bytes) -> np.ndarray:
         """
-        Deserialize bytes to numpy array using pickle
+        Deserialize bytes to numpy array
+
+        Reads the versioned float32 format without copying (``np.frombuffer``),
+        so the returned array is read-only. Legacy pickle blobs written before
+        migration 002 are still accepted.
 
         Args:
             data: Serialized vector bytes
@@ -394,11 +1292,40 @@ class EmbeddingStore:
         Returns:
             np.ndarray: Deserialized numpy array
 
+        Raises:
+            ValueError: If the header has an unsupported version or dtype
+
         Example:
             >>> vector = EmbeddingStore.deserialize_vector(vector_bytes)
         """
+        if not EmbeddingStore.is_legacy_format(data):
+            magic, version, dtype_code, dimension = _VECTOR_HEADER.unpack_from(data)
+            if version != VECTOR_FORMAT_VERSION or dtype_code not in _VECTOR_DTYPES:
+                raise ValueError(
+                    f"Unsupported vector format: version={version}, dtype={dtype_code}"
+                )
+            return np.frombuffer(
+                data,
+                dtype=_VECTOR_DTYPES[dtype_code],
+                count=dimension,
+                offset=_VECTOR_HEADER.size
+            )
+
         return pickle.loads(data)
 
+    @staticmethod
+    def is_legacy_format(data: bytes) -> bool:
+        """
+        Check whether a blob uses the legacy pickle format
+
+        Args:
+            data: Serialized vector bytes
+
+        Returns:
+            bool: True if the blob was not written by ``serialize_vector`` (v1)
+        """
+        return bytes(data[:len(VECTOR_MAGIC)]) != VECTOR_MAGIC
+
     def get_embeddings(
         self,
         article_ids: List[int],
@@ -418,7 +1345,7 @@ class EmbeddingStore:
             >>> embeddings = store.get_embeddings([1, 2, 3])
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 query = session.query(Embedding).filter(
                     Embedding.article_id.in_(article_ids)
                 )
@@ -448,6 +1375,65 @@ class EmbeddingStore:
             self.logger.error(f"Failed to get embeddings: {e}")
             raise
 
+    def iter_embeddings(
+        self,
+        model: Optional[str] = None,
+        batch_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over embeddings (with vector data) in ID order
+
+        Uses keyset pagination on the embedding ID, one short session per
+        batch, so memory stays bounded by batch_size.
+
+        Args:
+            model: Filter by model name (optional)
+            batch_size: Rows fetched per query (default: 500)
+
+        Yields:
+            dict: Embedding with vector data (same keys as get_embeddings)
+
+        Example:
+            >>> for emb in store.iter_embeddings(model="text-embedding-004"):
+            ...     process(emb["article_id"], emb["embedding"])
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        last_id = 0
+        while True:
+            try:
+                with self.database.get_read_session() as session:
+                    query = session.query(
+                        Embedding.id, Embedding.article_id, Embedding.embedding,
+                        Embedding.model, Embedding.dimension, Embedding.created_at
+                    ).filter(Embedding.id > last_id)
+
+                    if model:
+                        query = query.filter(Embedding.model == model)
+
+                    rows = query.order_by(Embedding.id).limit(batch_size).all()
+
+            except Exception as e:
+                self.logger.error(f"Failed to iterate embeddings after ID {last_id}: {e}")
+                raise
+
+            if not rows:
+                return
+
+            last_id = rows[-1].id
+            for row in rows:
+                yield {
+                    "article_id": row.article_id,
+                    "embedding": self.deserialize_vector(row.embedding),
+                    "model": row.model,
+                    "dimension": row.dimension,
+                    "created_at": row.created_at.isoformat() if row.created_at else None
+                }
+
+            if len(rows) < batch_size:
+                return
+
     def get_all_embeddings(
         self,
         model: Optional[str] = None,
@@ -469,7 +1455,7 @@ class EmbeddingStore:
             ...     print(f"Article {emb['article_id']}: dim={emb['dimension']}")
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 query = session.query(Embedding)
 
                 if model:
@@ -501,7 +1487,7 @@ class EmbeddingStore:
             >>> by_model = store.count_embeddings(model="text-embedding-3")
         """
         try:
-            with self.database.get_session() as session:
+            with self.database.get_read_session() as session:
                 query = session.query(Embedding)
 
                 if model:
@@ -0,0 +1,236 @@
+"""
+Migration 002: Rewrite embedding blobs from pickle to raw float32
+
+This migration converts the embeddings.embedding column from pickled float64
+numpy arrays to the versioned binary format written by
+EmbeddingStore.serialize_vector (16-byte header + little-endian float32).
+
+Effects:
+    - Roughly halves the size of the embeddings table (after VACUUM)
+    - Vectors can be read with np.frombuffer instead of unpickling
+
+Usage:
+    python -m src.memory.migrations.002_embeddings_float32
+    python -m src.memory.migrations.002_embeddings_float32 --batch-size 1000 --vacuum
+
+Note:
+    - This migration is idempotent (rows already in the new format are skipped)
+    - Rows are rewritten in batches, one transaction per batch
+    - Float64 values are rounded to float32 (well within embedding precision)
+"""
+
+import sqlite3
+import pickle
+from pathlib import Path
+import sys
+
+import numpy as np
+
+from src.memory.embedding_store import EmbeddingStore
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def get_db_path() -> Path:
+    """Get the database file path"""
+    # Try multiple possible locations
+    possible_paths = [
+        Path(__file__).parent.parent.parent.parent / 'data' / 'insights.db',
+        Path.cwd() / 'data' / 'insights.db',
+    ]
+
+    for path in possible_paths:
+        if path.exists():
+            return path
+
+    # Default path (will be created if running from project root)
+    return possible_paths[0]
+
+
+def _rewrite_blobs(
+    conn: sqlite3.Connection,
+    convert,
+    batch_size: int
+) -> tuple:
+    """
+    Rewrite embedding blobs in id order, one transaction per batch
+
+    Args:
+        conn: SQLite connection
+        convert: Callable(bytes) -> Optional[bytes], None means "skip row"
+        batch_size: Number of rows per batch
+
+    Returns:
+        tuple: (converted_count, skipped_count, bytes_before, bytes_after)
+    """
+    cursor = conn.cursor()
+    last_id = 0
+    converted = skipped = 0
+    bytes_before = bytes_after = 0
+
+    while True:
+        cursor.execute(
+            "SELECT id, embedding FROM embeddings WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, batch_size)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for row_id, blob in rows:
+            new_blob = convert(blob)
+            if new_blob is None:
+                skipped += 1
+                continue
+            bytes_before += len(blob)
+            bytes_after += len(new_blob)
+            updates.append((new_blob, row_id))
+
+        if updates:
+            cursor.executemany("UPDATE embeddings SET embedding = ? WHERE id = ?", updates)
+        conn.commit()
+
+        converted += len(updates)
+        last_id = rows[-1][0]
+        print(f"  Processed up to id {last_id} ({converted} converted, {skipped} skipped)")
+
+    return converted, skipped, bytes_before, bytes_after
+
+
+def migrate(
+    db_path: Path = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    vacuum: bool = False
+) -> bool:
+    """
+    Run the migration
+
+    Args:
+        db_path: Path to the database file (optional, auto-detected if not provided)
+        batch_size: Number of rows rewritten per transaction
+        vacuum: Run VACUUM afterwards to return freed pages to the filesystem
+
+    Returns:
+        bool: True if migration successful, False otherwise
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    print(f"Migration 002: Rewrite embeddings as raw float32")
+    print(f"Database: {db_path}")
+    print("-" * 50)
+
+    if not db_path.exists():
+        print(f"ERROR: Database file not found: {db_path}")
+        print("Please run the application first to create the database.")
+        return False
+
+    conn = sqlite3.connect(db_path)
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='embeddings'
+        """)
+        if not cursor.fetchone():
+            print("Table 'embeddings' does not exist. Nothing to migrate.")
+            return True
+
+        def convert(blob: bytes):
+            if not EmbeddingStore.is_legacy_format(blob):
+                return None
+            vector = np.asarray(pickle.loads(blob)).ravel()
+            return EmbeddingStore.serialize_vector(vector)
+
+        converted, skipped, before, after = _rewrite_blobs(conn, convert, batch_size)
+
+        print("-" * 50)
+        print(f"Converted {converted} row(s), skipped {skipped} already-migrated row(s)")
+        if converted:
+            print(f"Blob bytes: {before} -> {after} ({after / before:.0%})")
+
+        if vacuum:
+            print("Running VACUUM...")
+            conn.execute("VACUUM")
+
+        print("Migration completed successfully!")
+        return True
+
+    except Exception as e:
+        conn.rollback()
+        print(f"ERROR: Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    finally:
+        conn.close()
+
+
+def rollback(db_path: Path = None, batch_size: int = DEFAULT_BATCH_SIZE) -> bool:
+    """
+    Rollback the migration (rewrite blobs back to pickled float64 arrays)
+
+    Precision lost by the float32 conversion is not restored.
+
+    Args:
+        db_path: Path to the database file
+        batch_size: Number of rows rewritten per transaction
+
+    Returns:
+        bool: True if rollback successful, False otherwise
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    print("Rollback Migration 002")
+    print(f"Database: {db_path}")
+    print("-" * 50)
+
+    if not db_path.exists():
+        print(f"ERROR: Database file not found: {db_path}")
+        return False
+
+    conn = sqlite3.connect(db_path)
+
+    try:
+        def convert(blob: bytes):
+            if EmbeddingStore.is_legacy_format(blob):
+                return None
+            vector = np.array(EmbeddingStore.deserialize_vector(blob), dtype=np.float64)
+            return pickle.dumps(vector)
+
+        converted, skipped, _, _ = _rewrite_blobs(conn, convert, batch_size)
+        print(f"Restored {converted} row(s) to pickle format, skipped {skipped}")
+        return True
+
+    except Exception as e:
+        conn.rollback()
+        print(f"ERROR: Rollback failed: {e}")
+        return False
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Migration 002: Rewrite embeddings as raw float32')
+    parser.add_argument('--rollback', action='store_true', help='Rewrite blobs back to pickle')
+    parser.add_argument('--db', type=str, help='Database file path')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Rows per transaction')
+    parser.add_argument('--vacuum', action='store_true', help='Run VACUUM after migrating')
+
+    args = parser.parse_args()
+    db_path = Path(args.db) if args.db else None
+
+    if args.rollback:
+        success = rollback(db_path, args.batch_size)
+    else:
+        success = migrate(db_path, args.batch_size, args.vacuum)
+
+    sys.exit(0 if success else 1)
@@ -0,0 +1,165 @@
+"""
+Migration 003: Add composite indexes for the hot article queries
+
+This migration adds multi-column indexes matching the filters and ordering
+of the article listing queries, so they no longer need a temporary sort or
+a lookup of every row with the same status.
+
+Indexes added:
+    - idx_articles_status_fetched (status, fetched_at, priority_score):
+      get_by_status, get_by_date_range (weekly report), and
+      get_top_priority with a fetched_at window (daily report)
+    - idx_articles_status_priority (status, priority_score, fetched_at):
+      get_top_priority ordered by priority_score
+
+Usage:
+    python -m src.memory.migrations.003_article_composite_indexes
+
+Note:
+    - This migration is idempotent (CREATE INDEX IF NOT EXISTS)
+    - ANALYZE is run afterwards so the query planner has statistics
+    - New databases get the same indexes from models.py / schema.sql
+"""
+
+import sqlite3
+from pathlib import Path
+import sys
+
+
+INDEXES = {
+    "idx_articles_status_fetched": "articles(status, fetched_at, priority_score)",
+    "idx_articles_status_priority": "articles(status, priority_score, fetched_at)",
+}
+
+
+def get_db_path() -> Path:
+    """Get the database file path"""
+    # Try multiple possible locations
+    possible_paths = [
+        Path(__file__).parent.parent.parent.parent / 'data' / 'insights.db',
+        Path.cwd() / 'data' / 'insights.db',
+    ]
+
+    for path in possible_paths:
+        if path.exists():
+            return path
+
+    # Default path (will be created if running from project root)
+    return possible_paths[0]
+
+
+def migrate(db_path: Path = None) -> bool:
+    """
+    Run the migration
+
+    Args:
+        db_path: Path to the database file (optional, auto-detected if not provided)
+
+    Returns:
+        bool: True if migration successful, False otherwise
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    print("Migration 003: Add composite indexes to articles")
+    print(f"Database: {db_path}")
+    print("-" * 50)
+
+    if not db_path.exists():
+        print(f"ERROR: Database file not found: {db_path}")
+        print("Please run the application first to create the database.")
+        return False
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='articles'
+        """)
+        if not cursor.fetchone():
+            print("Table 'articles' does not exist. Nothing to migrate.")
+            return True
+
+        for name, definition in INDEXES.items():
+            print(f"Creating index {name}...")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+            print("  Index ready")
+
+        conn.commit()
+
+        print("Running ANALYZE...")
+        cursor.execute("ANALYZE articles")
+        conn.commit()
+
+        print("-" * 50)
+        print("Migration completed successfully!")
+        return True
+
+    except Exception as e:
+        conn.rollback()
+        print(f"ERROR: Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    finally:
+        conn.close()
+
+
+def rollback(db_path: Path = None) -> bool:
+    """
+    Rollback the migration (drop the composite indexes)
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        bool: True if rollback successful, False otherwise
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    print("Rollback Migration 003")
+    print(f"Database: {db_path}")
+    print("-" * 50)
+
+    if not db_path.exists():
+        print(f"ERROR: Database file not found: {db_path}")
+        return False
+
+    conn = sqlite3.connect(db_path)
+
+    try:
+        for name in INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+            print(f"  Dropped index {name}")
+        conn.commit()
+        return True
+
+    except Exception as e:
+        conn.rollback()
+        print(f"ERROR: Rollback failed: {e}")
+        return False
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Migration 003: Add composite indexes to articles')
+    parser.add_argument('--rollback', action='store_true', help='Drop the composite indexes')
+    parser.add_argument('--db', type=str, help='Database file path')
+
+    args = parser.parse_args()
+    db_path = Path(args.db) if args.db else None
+
+    if args.rollback:
+        success = rollback(db_path)
+    else:
+        success = migrate(db_path)
+
+    sys.exit(0 if success else 1)
@@ -6,6 +6,8 @@ This module contains database migration scripts.
 Usage:
     # Run a specific migration
     python -m src.memory.migrations.001_add_period_columns
+    python -m src.memory.migrations.002_embeddings_float32
+    python -m src.memory.migrations.003_article_composite_indexes
 
     # Or import and run programmatically
     from src.memory.migrations.001_add_period_columns import migrate
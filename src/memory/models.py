@@ -8,6 +8,7 @@ Models:
     - Embedding: Article embedding vectors
     - DailyReport: Daily digest reports
     - WeeklyReport: Weekly summary reports
+    - UrlRedirect: Redirect URL to canonical article URL map
 
 Usage:
     from src.memory.models import Article, Embedding
@@ -20,7 +21,7 @@ Usage:
     )
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, LargeBinary
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -55,6 +56,12 @@ class Article(Base):
         embeddings (relationship): Related embeddings
     """
     __tablename__ = 'articles'
+    __table_args__ = (
+        # get_by_status / get_by_date_range: status filter, fetched_at range and order
+        Index('idx_articles_status_fetched', 'status', 'fetched_at', 'priority_score'),
+        # get_top_priority: status filter, ordered by priority_score
+        Index('idx_articles_status_priority', 'status', 'priority_score', 'fetched_at'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     url = Column(Text, unique=True, nullable=False, index=True)
@@ -79,10 +86,46 @@ class Article(Base):
         cascade="all, delete-orphan"
     )
 
-    def to_dict(self) -> Dict[str, Any]:
+    # Serialized fields, in to_dict() order
+    FIELDS = (
+        'id', 'url', 'title', 'content', 'summary', 'source', 'source_name',
+        'published_at', 'fetched_at', 'status', 'priority_score', 'analysis',
+        'tags', 'created_at', 'updated_at'
+    )
+
+    @staticmethod
+    def serialize_field(name: str, value: Any, parse_analysis: bool = True) -> Any:
+        """
+        Convert a raw column value to its to_dict() representation
+
+        Args:
+            name: Field name (one of FIELDS)
+            value: Raw column value
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
+
+        Returns:
+            Any: ISO string for datetimes, parsed JSON (or the raw string)
+                for analysis, list for tags, the value itself otherwise
+        """
+        if name == 'analysis':
+            if not parse_analysis:
+                return value or None
+            return json.loads(value) if value else None
+        if name == 'tags':
+            return value.split(',') if value else []
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def to_dict(self, parse_analysis: bool = True) -> Dict[str, Any]:
         """
         Convert Article to dictionary
 
+        Args:
+            parse_analysis: Parse the analysis JSON (default: True; False
+                            returns the stored JSON string as is)
+
         Returns:
             dict: Article data as dictionary
 
@@ -92,21 +135,8 @@ class Article(Base):
             >>> print(data['title'])
         """
         return {
-            'id': self.id,
-            'url': self.url,
-            'title': self.title,
-            'content': self.content,
-            'summary': self.summary,
-            'source': self.source,
-            'source_name': self.source_name,
-            'published_at': self.published_at.isoformat() if self.published_at else None,
-            'fetched_at': self.fetched_at.isoformat() if self.fetched_at else None,
-            'status': self.status,
-            'priority_score': self.priority_score,
-            'analysis': json.loads(self.analysis) if self.analysis else None,
-            'tags': self.tags.split(',') if self.tags else [],
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            name: self.serialize_field(name, getattr(self, name), parse_analysis)
+            for name in self.FIELDS
         }
 
     def __repr__(self) -> str:
@@ -123,13 +153,15 @@ class Embedding(Base):
     Attributes:
         id (int): Primary key
         article_id (int): Foreign key to articles table
-        embedding (bytes): Serialized numpy array (using pickle)
+        embedding (bytes): Serialized vector (float32 format, see EmbeddingStore)
         model (str): Model name (e.g., 'text-embedding-3')
         dimension (int): Vector dimension
         created_at (datetime): Record creation time
         article (relationship): Related article
     """
     __tablename__ = 'embeddings'
+    # Never reuse IDs (as schema.sql does): vector files use them as row versions
+    __table_args__ = {'sqlite_autoincrement': True}
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     article_id = Column(
@@ -138,7 +170,7 @@ class Embedding(Base):
         nullable=False,
         index=True
     )
-    embedding = Column(LargeBinary, nullable=False)  # Serialized numpy array
+    embedding = Column(LargeBinary, nullable=False)  # Serialized float32 vector
     model = Column(Text, nullable=False, index=True)
     dimension = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -170,8 +202,8 @@ class Embedding(Base):
         }
 
         if include_vector:
-            import pickle
-            result['embedding'] = pickle.loads(self.embedding).tolist()
+            from src.memory.embedding_store import EmbeddingStore
+            result['embedding'] = EmbeddingStore.deserialize_vector(self.embedding).tolist()
 
         return result
 
@@ -285,3 +317,46 @@ class WeeklyReport(Base):
     def __repr__(self) -> str:
         """String representation"""
         return f"<WeeklyReport(id={self.id}, {self.week_start} to {self.week_end}, articles={self.article_count})>"
+
+
+class UrlRedirect(Base):
+    """
+    URL Redirect ORM model
+
+    Maps an opaque redirect URL (e.g. a Google Search Grounding link) to the
+    canonical URL of the article it leads to, so each redirect is resolved
+    over the network only once.
+
+    Attributes:
+        id (int): Primary key
+        redirect_url (str): Redirect URL (unique)
+        canonical_url (str): Normalized final URL
+        status_code (int): HTTP status of the final response
+        resolved_at (datetime): When the redirect was resolved
+    """
+    __tablename__ = 'url_redirects'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    redirect_url = Column(Text, unique=True, nullable=False, index=True)
+    canonical_url = Column(Text, nullable=False, index=True)
+    status_code = Column(Integer)
+    resolved_at = Column(DateTime, default=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert UrlRedirect to dictionary
+
+        Returns:
+            dict: Redirect data as dictionary
+        """
+        return {
+            'id': self.id,
+            'redirect_url': self.redirect_url,
+            'canonical_url': self.canonical_url,
+            'status_code': self.status_code,
+            'resolved_at': self.resolved_at.isoformat() if self.resolved_at else None,
+        }
+
+    def __repr__(self) -> str:
+        """String representation"""
+        return f"<UrlRedirect(id={self.id}, canonical_url='{self.canonical_url[:50]}')>"
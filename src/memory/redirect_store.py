@@ -0,0 +1,151 @@
+"""
+InsightCosmos Redirect Store
+
+Persistent map from redirect URLs to canonical article URLs.
+
+Classes:
+    RedirectStore: url_redirects table access
+
+Usage:
+    from src.memory.database import Database
+    from src.memory.redirect_store import RedirectStore
+
+    db = Database.from_config(config)
+    store = RedirectStore(db)
+
+    store.store_many([
+        {"redirect_url": "https://vertexaisearch.cloud.google.com/grounding-api-redirect/AUZIYQ...",
+         "canonical_url": "https://example.com/post", "status_code": 200}
+    ])
+    mapping = store.get_many(urls)   # {redirect_url: canonical_url}
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime
+import logging
+
+from src.memory.models import UrlRedirect
+from src.memory.database import Database
+from src.utils.logger import Logger
+
+
+class RedirectStore:
+    """
+    Redirect URL to canonical URL storage
+
+    Attributes:
+        database (Database): Database instance
+        logger (Logger): Logger instance
+
+    Example:
+        >>> store = RedirectStore(db)
+        >>> store.get("https://vertexaisearch.cloud.google.com/grounding-api-redirect/AUZIYQ")
+        'https://example.com/post'
+    """
+
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, database: Database, logger: Optional[logging.Logger] = None):
+        """
+        Initialize RedirectStore
+
+        Args:
+            database: Database instance
+            logger: Logger instance (optional)
+        """
+        self.database = database
+        self.logger = logger or Logger.get_logger("RedirectStore")
+
+    def get(self, redirect_url: str) -> Optional[str]:
+        """
+        Get the canonical URL of a redirect
+
+        Args:
+            redirect_url: Redirect URL
+
+        Returns:
+            Optional[str]: Canonical URL, or None if not resolved yet
+        """
+        return self.get_many([redirect_url]).get(redirect_url)
+
+    def get_many(self, redirect_urls: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the canonical URLs of several redirects
+
+        Args:
+            redirect_urls: Redirect URLs
+
+        Returns:
+            dict: {redirect_url: canonical_url} for the resolved ones
+        """
+        urls = list(dict.fromkeys(redirect_urls))
+        mapping: Dict[str, str] = {}
+
+        try:
+            with self.database.get_read_session() as session:
+                for start in range(0, len(urls), self.LOOKUP_CHUNK_SIZE):
+                    chunk = urls[start:start + self.LOOKUP_CHUNK_SIZE]
+                    mapping.update(
+                        session.query(UrlRedirect.redirect_url, UrlRedirect.canonical_url)
+                        .filter(UrlRedirect.redirect_url.in_(chunk))
+                    )
+            return mapping
+
+        except Exception as e:
+            self.logger.error(f"Failed to look up redirects: {e}")
+            raise
+
+    def store_many(self, redirects: List[Dict[str, Any]]) -> int:
+        """
+        Store resolved redirects in one transaction (existing rows are updated)
+
+        Args:
+            redirects: Dictionaries with redirect_url, canonical_url and
+                status_code (optional)
+
+        Returns:
+            int: Number of redirects stored
+
+        Example:
+            >>> store.store_many([
+            ...     {"redirect_url": "https://vertexaisearch.cloud.google.com/...",
+            ...      "canonical_url": "https://example.com/post", "status_code": 200}
+            ... ])
+            1
+        """
+        latest = {item['redirect_url']: item for item in redirects}
+        if not latest:
+            return 0
+
+        try:
+            with self.database.get_session() as session:
+                existing = {}
+                urls = list(latest)
+                for start in range(0, len(urls), self.LOOKUP_CHUNK_SIZE):
+                    chunk = urls[start:start + self.LOOKUP_CHUNK_SIZE]
+                    existing.update(
+                        (row.redirect_url, row) for row in
+                        session.query(UrlRedirect).filter(UrlRedirect.redirect_url.in_(chunk))
+                    )
+
+                now = datetime.utcnow()
+                for url, item in latest.items():
+                    row = existing.get(url)
+                    if row is None:
+                        session.add(UrlRedirect(
+                            redirect_url=url,
+                            canonical_url=item['canonical_url'],
+                            status_code=item.get('status_code'),
+                            resolved_at=now
+                        ))
+                    else:
+                        row.canonical_url = item['canonical_url']
+                        row.status_code = item.get('status_code')
+                        row.resolved_at = now
+
+            self.logger.info(f"Stored {len(latest)} resolved redirects")
+            return len(latest)
+
+        except Exception as e:
+            self.logger.error(f"Failed to store redirects: {e}")
+            raise
@@ -40,6 +40,8 @@ CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status);
 CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at DESC);
 CREATE INDEX IF NOT EXISTS idx_articles_priority_score ON articles(priority_score DESC);
 CREATE INDEX IF NOT EXISTS idx_articles_fetched_at ON articles(fetched_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_status_fetched ON articles(status, fetched_at, priority_score);
+CREATE INDEX IF NOT EXISTS idx_articles_status_priority ON articles(status, priority_score, fetched_at);
 
 -- Trigger to update updated_at timestamp
 CREATE TRIGGER IF NOT EXISTS update_articles_timestamp
@@ -60,7 +62,7 @@ END;
 CREATE TABLE IF NOT EXISTS embeddings (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     article_id INTEGER NOT NULL,
-    embedding BLOB NOT NULL,    -- Serialized numpy array (using pickle)
+    embedding BLOB NOT NULL,    -- 16-byte header + float32 values (see EmbeddingStore)
     model TEXT NOT NULL,         -- Model name (e.g., 'text-embedding-3')
     dimension INTEGER NOT NULL,  -- Vector dimension
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -122,6 +124,26 @@ CREATE TABLE IF NOT EXISTS weekly_reports (
 CREATE INDEX IF NOT EXISTS idx_weekly_reports_dates ON weekly_reports(week_start DESC, week_end DESC);
 
 
+-- ========================================
+-- Table 5: url_redirects
+-- ========================================
+-- Description: Maps redirect URLs (e.g. Google Search Grounding links) to
+--              the canonical article URL they resolve to
+-- Primary Key: id (auto-increment)
+-- Unique Constraint: redirect_url - each redirect is resolved once
+
+CREATE TABLE IF NOT EXISTS url_redirects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    redirect_url TEXT UNIQUE NOT NULL,
+    canonical_url TEXT NOT NULL,  -- Normalized final URL
+    status_code INTEGER,          -- HTTP status of the final response
+    resolved_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Indexes for url_redirects table
+CREATE INDEX IF NOT EXISTS idx_url_redirects_canonical ON url_redirects(canonical_url);
+
+
 -- ========================================
 -- Sample Data for Testing (Optional)
 -- ========================================
@@ -0,0 +1,315 @@
+"""
+InsightCosmos Vector File
+
+Append-only, memory-mapped float32 vector storage with an article-id index.
+
+Classes:
+    VectorFile: Raw float32 matrix file plus parallel int64 article-id and
+        version files
+
+File layout (all headerless, little-endian):
+    <base>.f32  N x dimension float32 values, one row per append
+    <base>.ids  N int64 article IDs; -1 marks a deleted (tombstoned) row
+    <base>.ver  N int64 row versions set by the owner (e.g. the embedding
+                row ID); 0 means unknown, e.g. files written before .ver
+
+Rows are never rewritten in place: re-storing an article tombstones its old
+row and appends a new one. ``compact()`` rewrites the files without
+tombstones. Only one process should write a given file.
+
+Usage:
+    from src.memory.vector_file import VectorFile
+
+    vectors = VectorFile(Path("data/insights.text-embedding-004.768"), dimension=768)
+    vectors.append_many(article_ids, matrix, versions=embedding_ids)
+
+    ids, matrix = vectors.take([3, 4, 5])   # zero-copy when rows are contiguous
+    ids, matrix = vectors.view()            # whole file as a read-only memmap
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+import os
+import threading
+
+import numpy as np
+
+
+TOMBSTONE = -1
+
+_VECTOR_DTYPE = np.dtype("<f4")
+_ID_DTYPE = np.dtype("<i8")
+
+
+class VectorFile:
+    """
+    Append-only float32 matrix file with an article-id index
+
+    Attributes:
+        dimension (int): Vector dimension
+        vectors_path (Path): Path of the float32 matrix file
+        ids_path (Path): Path of the article-id file
+        versions_path (Path): Path of the row-version file
+        rows (int): Number of rows in the file (including tombstones)
+        tombstones (int): Number of deleted rows
+
+    Example:
+        >>> vf = VectorFile(Path("/tmp/vectors"), dimension=3)
+        >>> vf.append(1, np.array([0.1, 0.2, 0.3]))
+        >>> ids, matrix = vf.take([1])
+    """
+
+    def __init__(self, base_path: Path, dimension: int):
+        """
+        Open (or create) a vector file
+
+        Inconsistent files (e.g. a crash between the two appends) are
+        truncated to the rows present in both.
+
+        Args:
+            base_path: Path prefix; ``.f32``, ``.ids`` and ``.ver`` are appended
+            dimension: Vector dimension
+        """
+        base_path = Path(base_path)
+        self.dimension = dimension
+        self.vectors_path = base_path.with_name(base_path.name + ".f32")
+        self.ids_path = base_path.with_name(base_path.name + ".ids")
+        self.versions_path = base_path.with_name(base_path.name + ".ver")
+
+        self._lock = threading.RLock()
+        self._row_size = dimension * _VECTOR_DTYPE.itemsize
+        self._ids = np.empty(0, dtype=_ID_DTYPE)
+        self._versions = np.empty(0, dtype=_ID_DTYPE)
+        self._row_of: Dict[int, int] = {}
+        self._memmap = None
+
+        self.rows = 0
+        self.tombstones = 0
+
+        self._open()
+
+    def __len__(self) -> int:
+        """Number of live (non-deleted) rows"""
+        return len(self._row_of)
+
+    def __contains__(self, article_id: int) -> bool:
+        return int(article_id) in self._row_of
+
+    def live_ids(self) -> np.ndarray:
+        """Sorted article IDs of live rows"""
+        with self._lock:
+            return np.array(sorted(self._row_of), dtype=np.int64)
+
+    def live_versions(self) -> Dict[int, int]:
+        """Version of each live row, keyed by article ID"""
+        with self._lock:
+            return {
+                article_id: int(self._versions[row])
+                for article_id, row in self._row_of.items()
+            }
+
+    def append(self, article_id: int, vector: np.ndarray, version: int = 0) -> None:
+        """
+        Append one vector (tombstoning any previous row for the article)
+
+        Args:
+            article_id: Article ID
+            vector: 1-dimensional vector of length ``dimension``
+            version: Row version (default: 0, unknown)
+        """
+        self.append_many([article_id], np.asarray(vector).reshape(1, -1), [version])
+
+    def append_many(
+        self,
+        article_ids: Iterable[int],
+        matrix: np.ndarray,
+        versions: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Append several vectors in one write per file
+
+        Args:
+            article_ids: Article IDs, one per row
+            matrix: Vectors, shape (len(article_ids), dimension)
+            versions: Row versions, one per row (default: all 0, unknown)
+        """
+        ids = np.asarray(list(article_ids), dtype=_ID_DTYPE)
+        values = np.ascontiguousarray(matrix, dtype=_VECTOR_DTYPE)
+        if values.shape != (len(ids), self.dimension):
+            raise ValueError(
+                f"Expected shape ({len(ids)}, {self.dimension}), got {values.shape}"
+            )
+        if versions is None:
+            row_versions = np.zeros(len(ids), dtype=_ID_DTYPE)
+        else:
+            row_versions = np.asarray(list(versions), dtype=_ID_DTYPE)
+            if len(row_versions) != len(ids):
+                raise ValueError(
+                    f"Expected {len(ids)} versions, got {len(row_versions)}"
+                )
+        if len(ids) == 0:
+            return
+
+        with self._lock:
+            for article_id in ids:
+                self.remove(int(article_id))
+
+            # Ids last: a crash before that write leaves extra vector and
+            # version bytes that _open() truncates, never ids without vectors
+            with open(self.vectors_path, "ab") as f:
+                f.write(values.tobytes())
+            with open(self.versions_path, "ab") as f:
+                f.write(row_versions.tobytes())
+            with open(self.ids_path, "ab") as f:
+                f.write(ids.tobytes())
+
+            first_row = self.rows
+            self._ids = np.concatenate([self._ids, ids])
+            self._versions = np.concatenate([self._versions, row_versions])
+            for offset, article_id in enumerate(ids):
+                self._row_of[int(article_id)] = first_row + offset
+            self.rows += len(ids)
+            self._memmap = None
+
+    def remove(self, article_id: int) -> bool:
+        """
+        Tombstone the row of an article
+
+        Args:
+            article_id: Article ID
+
+        Returns:
+            bool: True if the article had a live row
+        """
+        with self._lock:
+            row = self._row_of.pop(int(article_id), None)
+            if row is None:
+                return False
+
+            with open(self.ids_path, "r+b") as f:
+                f.seek(row * _ID_DTYPE.itemsize)
+                f.write(np.array([TOMBSTONE], dtype=_ID_DTYPE).tobytes())
+
+            self._ids[row] = TOMBSTONE
+            self.tombstones += 1
+            return True
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Whole file as (ids, read-only memmap), compacting first if needed
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Article IDs and matrix (zero-copy)
+        """
+        with self._lock:
+            if self.tombstones:
+                self.compact()
+            return self._ids.copy(), self._matrix()
+
+    def take(self, article_ids: Iterable[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rows for the given articles, in the requested order
+
+        Articles without a row are skipped. The matrix is a slice of the
+        memmap (no copy) when the rows are contiguous and ascending, which is
+        the case for articles stored in ID order; otherwise the rows are
+        gathered into a new array straight from the mapped pages.
+
+        Args:
+            article_ids: Article IDs
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Found article IDs and matrix
+        """
+        with self._lock:
+            found = []
+            rows = []
+            for article_id in article_ids:
+                row = self._row_of.get(int(article_id))
+                if row is not None:
+                    found.append(int(article_id))
+                    rows.append(row)
+
+            matrix = self._matrix()
+            found_ids = np.array(found, dtype=np.int64)
+            if not rows:
+                return found_ids, matrix[:0]
+
+            first, last = rows[0], rows[-1]
+            if last - first + 1 == len(rows) and rows == list(range(first, last + 1)):
+                return found_ids, matrix[first:last + 1]
+
+            return found_ids, matrix[np.array(rows)]
+
+    def compact(self) -> None:
+        """Rewrite the files without tombstoned rows"""
+        with self._lock:
+            live_rows = np.nonzero(self._ids != TOMBSTONE)[0]
+            ids = self._ids[live_rows]
+            versions = self._versions[live_rows]
+            matrix = np.array(self._matrix()[live_rows]) if len(live_rows) else \
+                np.empty((0, self.dimension), dtype=_VECTOR_DTYPE)
+            self._memmap = None
+
+            for path, data in (
+                (self.vectors_path, matrix),
+                (self.versions_path, versions),
+                (self.ids_path, ids)
+            ):
+                tmp_path = path.with_name(path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(np.ascontiguousarray(data).tobytes())
+                os.replace(tmp_path, path)
+
+            self._ids = ids.astype(_ID_DTYPE)
+            self._versions = versions.astype(_ID_DTYPE)
+            self._row_of = {int(article_id): row for row, article_id in enumerate(ids)}
+            self.rows = len(ids)
+            self.tombstones = 0
+
+    def _matrix(self) -> np.ndarray:
+        """Read-only memmap over all rows (cached until the next append)"""
+        if self.rows == 0:
+            return np.empty((0, self.dimension), dtype=_VECTOR_DTYPE)
+        if self._memmap is None:
+            self._memmap = np.memmap(
+                self.vectors_path, dtype=_VECTOR_DTYPE, mode="r",
+                shape=(self.rows, self.dimension)
+            )
+        return self._memmap
+
+    def _open(self) -> None:
+        """Load the id index from disk, repairing partial appends"""
+        self.vectors_path.parent.mkdir(parents=True, exist_ok=True)
+        for path in (self.vectors_path, self.ids_path, self.versions_path):
+            if not path.exists():
+                path.touch()
+
+        vector_rows = os.path.getsize(self.vectors_path) // self._row_size
+        id_rows = os.path.getsize(self.ids_path) // _ID_DTYPE.itemsize
+        rows = min(vector_rows, id_rows)
+
+        if os.path.getsize(self.vectors_path) != rows * self._row_size:
+            os.truncate(self.vectors_path, rows * self._row_size)
+        if os.path.getsize(self.ids_path) != rows * _ID_DTYPE.itemsize:
+            os.truncate(self.ids_path, rows * _ID_DTYPE.itemsize)
+
+        # Versions: extra bytes are a partial append; missing ones (files
+        # written before .ver existed) are padded with 0 (unknown)
+        version_bytes = rows * _ID_DTYPE.itemsize
+        if os.path.getsize(self.versions_path) > version_bytes:
+            os.truncate(self.versions_path, version_bytes)
+        elif os.path.getsize(self.versions_path) < version_bytes:
+            padding = version_bytes - os.path.getsize(self.versions_path)
+            with open(self.versions_path, "ab") as f:
+                f.write(bytes(padding))
+
+        self._ids = np.fromfile(self.ids_path, dtype=_ID_DTYPE, count=rows)
+        self._versions = np.fromfile(self.versions_path, dtype=_ID_DTYPE, count=rows)
+        self._row_of = {
+            int(article_id): row
+            for row, article_id in enumerate(self._ids)
+            if article_id != TOMBSTONE
+        }
+        self.rows = rows
+        self.tombstones = rows - len(self._row_of)
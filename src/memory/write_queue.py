@@ -0,0 +1,400 @@
+"""
+InsightCosmos Write-Behind Queue
+
+Coalesces analysis and embedding writes into batched transactions.
+
+Classes:
+    WriteBehindQueue: Bounded queue drained by a single writer thread
+
+How it works:
+    - Producers (e.g. concurrent analyses) enqueue writes and return at once
+    - One writer thread collects up to ``max_batch`` writes, or whatever
+      arrived within ``flush_interval``, and persists them with one
+      ArticleStore.update_analysis_many and one EmbeddingStore.store_many
+      call in a single transaction, so an article's analysis and embedding
+      are saved together or not at all
+    - Repeated writes for the same article (and model) within a batch are
+      coalesced; the last one wins
+    - When ``max_pending`` writes are waiting, producers block (backpressure)
+    - flush() waits until everything enqueued so far is persisted; close()
+      flushes and stops the writer, and also runs at interpreter exit
+    - Writes that could not be persisted are counted in stats() (failed,
+      failed_articles), since producers have already moved on
+
+Usage:
+    from src.memory.write_queue import WriteBehindQueue
+
+    with WriteBehindQueue(article_store, embedding_store) as writes:
+        writes.submit_result(article_id, analysis, priority_score=0.8,
+                             vector=vector, model="text-embedding-004")
+    # Leaving the block flushes all pending writes
+"""
+
+from typing import Any, Dict, List, Optional
+import atexit
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+from src.memory.article_store import ArticleStore
+from src.memory.embedding_store import EmbeddingStore
+from src.utils.logger import Logger
+
+
+class _FlushMarker:
+    """Queue item signalling that everything before it has been written"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """
+    Bounded write-behind queue with a single writer thread
+
+    Both stores must share one Database, since each batch is written in one
+    of its writer sessions.
+
+    Attributes:
+        article_store (ArticleStore): Target for analysis results
+        embedding_store (EmbeddingStore): Target for embeddings
+        flush_interval (float): Maximum seconds a write waits for its batch
+        max_batch (int): Maximum writes per batch
+        max_pending (int): Queue length at which producers block
+
+    Example:
+        >>> writes = WriteBehindQueue(article_store, embedding_store, max_pending=200)
+        >>> writes.submit_analysis(1, {"summary": "..."}, priority_score=0.7)
+        >>> writes.flush()
+        >>> print(writes.stats())
+        >>> writes.close()
+    """
+
+    def __init__(
+        self,
+        article_store: ArticleStore,
+        embedding_store: EmbeddingStore,
+        flush_interval: float = 0.5,
+        max_batch: int = 100,
+        max_pending: int = 500,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the queue and start the writer thread
+
+        Args:
+            article_store: ArticleStore receiving analysis results
+            embedding_store: EmbeddingStore receiving vectors
+            flush_interval: Maximum seconds a write waits for its batch (default: 0.5)
+            max_batch: Maximum writes per batch (default: 100)
+            max_pending: Pending writes at which submit() blocks (default: 500)
+            logger: Logger instance (optional)
+        """
+        self.article_store = article_store
+        self.embedding_store = embedding_store
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+        self.max_pending = max(1, max_pending)
+        self.logger = logger or Logger.get_logger("WriteBehindQueue")
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "coalesced": 0,
+            "failed": 0,
+            "failed_articles": 0,
+            "batches": 0,
+            "blocked_seconds": 0.0,
+        }
+
+        self._thread = threading.Thread(
+            target=self._run, name="write-behind-queue", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> "WriteBehindQueue":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Approximate number of writes waiting to be persisted"""
+        return self._queue.qsize()
+
+    def submit_analysis(
+        self,
+        article_id: int,
+        analysis: Dict[str, Any],
+        priority_score: float,
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        Enqueue an analysis result (see ArticleStore.update_analysis)
+
+        Args:
+            article_id: Article ID
+            analysis: Analysis result dictionary
+            priority_score: Priority score (0.0 - 1.0)
+            timeout: Seconds to wait while the queue is full (default: forever)
+
+        Raises:
+            RuntimeError: If the queue is closed
+            queue.Full: If the queue stayed full for ``timeout`` seconds
+        """
+        self._submit(
+            ("analysis", {
+                "article_id": article_id,
+                "analysis": analysis,
+                "priority_score": priority_score
+            }),
+            timeout
+        )
+
+    def submit_embedding(
+        self,
+        article_id: int,
+        vector: np.ndarray,
+        model: str = "default",
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        Enqueue an embedding (see EmbeddingStore.store)
+
+        Args:
+            article_id: Article ID
+            vector: Embedding vector (1-D numpy array)
+            model: Model name (default: "default")
+            timeout: Seconds to wait while the queue is full (default: forever)
+
+        Raises:
+            RuntimeError: If the queue is closed
+            queue.Full: If the queue stayed full for ``timeout`` seconds
+        """
+        self._submit(
+            ("embedding", {"article_id": article_id, "vector": vector, "model": model}),
+            timeout
+        )
+
+    def submit_result(
+        self,
+        article_id: int,
+        analysis: Dict[str, Any],
+        priority_score: float,
+        vector: Optional[np.ndarray] = None,
+        model: str = "default",
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        Enqueue an analysis result together with its embedding
+
+        Both are written in the same batch, and thus the same transaction.
+
+        Args:
+            article_id: Article ID
+            analysis: Analysis result dictionary
+            priority_score: Priority score (0.0 - 1.0)
+            vector: Embedding vector (1-D numpy array, optional)
+            model: Embedding model name (default: "default")
+            timeout: Seconds to wait while the queue is full (default: forever)
+
+        Raises:
+            RuntimeError: If the queue is closed
+            queue.Full: If the queue stayed full for ``timeout`` seconds
+        """
+        self._submit(
+            ("result", {
+                "article_id": article_id,
+                "analysis": analysis,
+                "priority_score": priority_score,
+                "vector": vector,
+                "model": model
+            }),
+            timeout
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every write submitted so far is persisted
+
+        Args:
+            timeout: Maximum seconds to wait (default: forever)
+
+        Returns:
+            bool: True if everything was flushed within the timeout
+        """
+        if not self._thread.is_alive():
+            return self._queue.empty()
+
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush pending writes and stop the writer thread (idempotent)
+
+        Args:
+            timeout: Maximum seconds to wait for the writer (default: forever)
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+        stats = self.stats()
+        self.logger.info(
+            f"Write-behind queue closed: {stats['written']} written in "
+            f"{stats['batches']} batches, {stats['failed']} failed"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics
+
+        Returns:
+            dict: submitted, written, coalesced, failed (writes lost),
+                failed_articles (articles with lost writes), batches,
+                blocked_seconds (time producers spent waiting) and pending
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["pending"] = self._queue.qsize()
+        return stats
+
+    def _submit(self, item: tuple, timeout: Optional[float]) -> None:
+        """Enqueue a write, blocking while the queue is full"""
+        if self._closed:
+            raise RuntimeError("WriteBehindQueue is closed")
+
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            start = time.monotonic()
+            self.logger.debug(f"Write queue full ({self.max_pending}), waiting")
+            self._queue.put(item, timeout=timeout)
+            with self._stats_lock:
+                self._stats["blocked_seconds"] += time.monotonic() - start
+
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+
+    def _run(self) -> None:
+        """Writer loop: collect a batch, persist it, release flush waiters"""
+        stopping = False
+
+        while not stopping:
+            first = self._queue.get()
+            items = [first]
+            deadline = time.monotonic() + self.flush_interval
+
+            # Keep collecting until the batch is full, the interval elapsed,
+            # or a flush/stop request asks for the batch to go out now
+            while (
+                len(items) < self.max_batch
+                and not isinstance(items[-1], _FlushMarker)
+                and items[-1] is not _STOP
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            writes = [item for item in items if isinstance(item, tuple)]
+            if writes:
+                self._write_batch(writes)
+
+            for item in items:
+                if isinstance(item, _FlushMarker):
+                    item.done.set()
+                elif item is _STOP:
+                    stopping = True
+
+    def _write_batch(self, writes: List[tuple]) -> None:
+        """Coalesce and persist one batch (per-article fallback on failure)"""
+        parts: List[tuple] = []
+        for kind, payload in writes:
+            if kind == "result":
+                parts.append(("analysis", payload))
+                if payload["vector"] is not None:
+                    parts.append(("embedding", payload))
+            else:
+                parts.append((kind, payload))
+
+        analyses: Dict[int, Dict[str, Any]] = {}
+        embeddings: Dict[tuple, Dict[str, Any]] = {}
+
+        for kind, payload in parts:
+            if kind == "analysis":
+                analyses[payload["article_id"]] = payload
+            else:
+                embeddings[(payload["article_id"], payload["model"])] = payload
+
+        with self._stats_lock:
+            self._stats["coalesced"] += len(parts) - len(analyses) - len(embeddings)
+            self._stats["batches"] += 1
+
+        try:
+            self._persist(list(analyses.values()), list(embeddings.values()))
+            with self._stats_lock:
+                self._stats["written"] += len(analyses) + len(embeddings)
+            return
+        except Exception as e:
+            self.logger.warning(
+                f"Batched write of {len(analyses) + len(embeddings)} items failed ({e}), "
+                f"retrying article by article"
+            )
+
+        article_ids = list(dict.fromkeys(
+            list(analyses) + [article_id for article_id, _ in embeddings]
+        ))
+        for article_id in article_ids:
+            article_analyses = [analyses[article_id]] if article_id in analyses else []
+            article_embeddings = [
+                payload for (embedding_article_id, _), payload in embeddings.items()
+                if embedding_article_id == article_id
+            ]
+            count = len(article_analyses) + len(article_embeddings)
+            try:
+                self._persist(article_analyses, article_embeddings)
+                with self._stats_lock:
+                    self._stats["written"] += count
+            except Exception as item_error:
+                with self._stats_lock:
+                    self._stats["failed"] += count
+                    self._stats["failed_articles"] += 1
+                self.logger.error(
+                    f"Failed to persist writes for article {article_id}: {item_error}"
+                )
+
+    def _persist(
+        self,
+        analyses: List[Dict[str, Any]],
+        embeddings: List[Dict[str, Any]]
+    ) -> None:
+        """Write analyses and embeddings in one transaction"""
+        with self.article_store.database.get_session() as session:
+            # Same order as AnalystAgentRunner: analysis, then embedding
+            if analyses:
+                self.article_store.update_analysis_many(analyses, session=session)
+            if embeddings:
+                self.embedding_store.store_many(embeddings, session=session)
@@ -15,9 +15,10 @@ Daily Pipeline Orchestrator
 
 import sys
 import argparse
+import asyncio
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 # 確保可以導入專案模組
@@ -30,6 +31,10 @@ from src.utils.logger import Logger
 from src.memory.database import Database
 from src.memory.article_store import ArticleStore
 from src.memory.embedding_store import EmbeddingStore
+from src.memory.redirect_store import RedirectStore
+from src.memory.write_queue import WriteBehindQueue
+from src.utils.disk_cache import DiskCache
+from src.utils.llm_cache import LLMResponseCache
 
 
 class DailyPipelineOrchestrator:
@@ -164,37 +169,58 @@ class DailyPipelineOrchestrator:
         Raises:
             Exception: 如果收集過程失敗
         """
-        from src.agents.scout_agent import ScoutAgentRunner, create_scout_agent
+        from src.agents.scout_agent import (
+            ScoutAgentRunner, create_scout_agent, get_search_cache
+        )
+        from src.tools.redirect_resolver import RedirectResolver
 
-        try:
-            # 調用 Scout Agent（傳遞 user_interests 配置）
-            self.logger.info("  Calling Scout Agent...")
-            self.logger.info(f"  User interests: {self.config.user_interests}")
+        # 搜索結果的跳轉 URL 在去重前解析為原始 URL（結果保存在 url_redirects）
+        redirect_resolver = RedirectResolver(store=RedirectStore(self.db))
 
-            # 創建帶有 user_interests 的 Scout Agent
-            agent = create_scout_agent(user_interests=self.config.user_interests)
-            runner = ScoutAgentRunner(agent=agent)
+        try:
+            # fast：按來源計劃直接並行抓取；explore：由 Scout Agent（LLM）決定
+            if self.config.scout_mode == "explore":
+                self.logger.info("  Calling Scout Agent (explore mode)...")
+                self.logger.info(f"  User interests: {self.config.user_interests}")
+
+                # 創建帶有 user_interests 的 Scout Agent
+                agent = create_scout_agent(user_interests=self.config.user_interests)
+                runner = ScoutAgentRunner(
+                    agent=agent, mode="explore", redirect_resolver=redirect_resolver
+                )
+            else:
+                self.logger.info("  Collecting from scout plan (fast mode)...")
+                runner = ScoutAgentRunner(mode="fast", redirect_resolver=redirect_resolver)
             result = runner.collect_articles()
 
+            stats = redirect_resolver.stats()
+            self.logger.info(
+                f"  Redirects: {stats['resolved']} resolved, {stats['stored']} from store, "
+                f"{stats['failed']} failed"
+            )
+
+            search_cache = get_search_cache()
+            if search_cache is not None:
+                stats = search_cache.stats()
+                self.logger.info(
+                    f"  Search cache: {stats['hits']} fresh / {stats['stale_hits']} stale hits, "
+                    f"{stats['misses']} misses (hit rate {stats['hit_rate']:.0%})"
+                )
+
             if result["status"] != "success":
                 raise Exception(f"Scout failed: {result.get('error_message', 'Unknown error')}")
 
             articles = result["articles"]
             self.logger.info(f"  Scout collected {len(articles)} articles")
 
-            # 存儲到 ArticleStore（去重）
-            stored_count = 0
+            # 存儲到 ArticleStore（一次查詢去重 + 單一交易寫入）
+            from dateutil import parser as date_parser
+
+            batch = []
             for article in articles:
                 try:
-                    # 檢查是否已存在
-                    existing = self.article_store.get_by_url(article["url"])
-                    if existing:
-                        self.logger.debug(f"  Article already exists: {article['url']}")
-                        continue
-
                     # 準備文章數據（status='collected' 表示待分析）
                     # 處理 published_at 時間格式
-                    from dateutil import parser as date_parser
                     published_at = article.get("published_at")
                     if published_at and isinstance(published_at, str):
                         try:
@@ -202,7 +228,7 @@ class DailyPipelineOrchestrator:
                         except:
                             published_at = None
 
-                    article_data = {
+                    batch.append({
                         "url": article["url"],
                         "title": article["title"],
                         "summary": article.get("summary", ""),
@@ -210,18 +236,19 @@ class DailyPipelineOrchestrator:
                         "source_name": article.get("source_name", "Unknown"),
                         "published_at": published_at,
                         "status": "collected"
-                    }
-
-                    # 存儲新文章
-                    article_id = self.article_store.store_article(article_data)
-                    if article_id:
-                        stored_count += 1
-                        self.logger.debug(f"  Stored article {article_id}: {article['title'][:50]}")
+                    })
 
                 except Exception as e:
-                    self.logger.warning(f"  Failed to store article {article.get('url', 'unknown')}: {e}")
+                    self.logger.warning(f"  Failed to prepare article {article.get('url', 'unknown')}: {e}")
                     continue
 
+            new_ids = self.article_store.bulk_upsert(batch)
+            stored_count = len(new_ids)
+            self.logger.info(
+                f"  Stored {stored_count} new articles "
+                f"({len(batch) - stored_count} already existed)"
+            )
+
             return len(articles), stored_count
 
         except Exception as e:
@@ -229,15 +256,22 @@ class DailyPipelineOrchestrator:
             self._handle_error("phase1_scout", e)
             raise
 
+        finally:
+            redirect_resolver.close()
+
     def _run_phase2_analyst(self) -> int:
         """
         Phase 2: 使用 Analyst Agent 分析文章
 
+        內容提取由共用的 ContentExtractor 並行執行（每網域限速），
+        每篇文章提取完成後立即交給 Analyst 分析；整個階段共用一個事件迴圈，
+        同時進行的分析數由 ``config.analysis_concurrency`` 限制。
+
         Returns:
             int: 成功分析的文章數量
         """
         from src.agents.analyst_agent import AnalystAgentRunner, create_analyst_agent
-        from src.tools.content_extractor import extract_content
+        from src.tools.content_extractor import ContentExtractor
 
         # 創建 Analyst Agent
         agent = create_analyst_agent(
@@ -245,19 +279,42 @@ class DailyPipelineOrchestrator:
             user_interests=self.config.user_interests
         )
 
+        # 分析結果與 embedding 由單一寫入執行緒批次寫入（階段結束前全部寫完）
+        write_queue = WriteBehindQueue(
+            article_store=self.article_store,
+            embedding_store=self.embedding_store,
+            logger=self.logger
+        )
+
+        # 相同文字（同模型）的 embedding 只計算一次，重跑與回填時直接重用
+        embedding_cache = DiskCache(
+            Path(self.config.cache_dir) / "cache.db",
+            namespace="embeddings",
+            max_bytes=256 * 1024 * 1024
+        )
+
+        # 相同 prompt 與文章內容的分析結果直接重用（重試、dry-run 重跑不耗 token）
+        llm_cache = LLMResponseCache.from_config(self.config)
+
         # 創建 Runner
         runner = AnalystAgentRunner(
             agent=agent,
             article_store=self.article_store,
             embedding_store=self.embedding_store,
             logger=self.logger,
-            config=self.config
+            config=self.config,
+            write_queue=write_queue,
+            embedding_cache=embedding_cache,
+            llm_cache=llm_cache,
+            embedding_batch_size=self.config.embedding_batch_size,
+            embedding_batch_wait=self.config.embedding_batch_wait_seconds
         )
-        analyzed_count = 0
 
         # 獲取 'collected' 狀態的文章（限制最多分析 30 篇以節省 API 費用）
         MAX_ARTICLES_TO_ANALYZE = 30
-        pending_articles = self.article_store.get_by_status("collected")
+        pending_articles = self.article_store.get_by_status(
+            "collected", fields=["id", "url", "title"]
+        )
         self.logger.info(f"  Found {len(pending_articles)} pending articles to analyze")
 
         if len(pending_articles) > MAX_ARTICLES_TO_ANALYZE:
@@ -267,50 +324,184 @@ class DailyPipelineOrchestrator:
         if len(pending_articles) == 0:
             self.logger.info("  No pending articles, checking if we should re-analyze recent articles...")
             # 可選：分析最近未分析的文章
+            write_queue.close()
+            embedding_cache.close()
+            if llm_cache is not None:
+                llm_cache.close()
             return 0
 
-        for idx, article_dict in enumerate(pending_articles, 1):
-            article_id = article_dict["id"]
-            url = article_dict["url"]
-            title = article_dict["title"]
+        # 1. 並行提取完整內容（依完成順序串流；HTML 解析可交由行程池）
+        #    重跑時已提取過的網址直接從磁碟快取重播，不再連網
+        content_cache = DiskCache(
+            Path(self.config.cache_dir) / "cache.db",
+            namespace="content",
+            ttl_seconds=7 * 86400,
+            max_bytes=512 * 1024 * 1024
+        )
+        extractor = ContentExtractor(
+            parse_workers=self.config.extraction_parse_workers,
+            cache=content_cache
+        )
+        urls = [article["url"] for article in pending_articles]
+        self.logger.info(f"  Extracting content from {len(urls)} URLs...")
+
+        try:
+            with extractor:
+                analyzed_count = asyncio.run(self._analyze_pipeline(
+                    runner, pending_articles, extractor.iter_extract(urls)
+                ))
+        finally:
+            write_queue.close()
+            session_stats = runner.session_stats()
+            self.logger.info(
+                f"  Analyst sessions: {session_stats['sessions_created']} created, "
+                f"{session_stats['active_sessions']} still active "
+                f"(peak {session_stats['peak_active_sessions']})"
+            )
+            for name, cache in (("Content", content_cache), ("Embedding", embedding_cache)):
+                cache_stats = cache.stats()
+                self.logger.info(
+                    f"  {name} cache: {cache_stats['hits']} hits, "
+                    f"{cache_stats['misses']} misses "
+                    f"(hit rate {cache_stats['hit_rate']:.0%})"
+                )
+                cache.close()
+            if llm_cache is not None:
+                llm_stats = llm_cache.stats()
+                self.logger.info(
+                    f"  LLM cache: {llm_stats['hits']} hits, {llm_stats['misses']} misses, "
+                    f"{llm_stats['bypassed']} bypassed"
+                )
+                llm_cache.close()
+
+        # 分析在寫入佇列落盤前就回報成功；寫入失敗的文章不計入成功數
+        failed_articles = write_queue.stats()["failed_articles"]
+        if failed_articles:
+            self._handle_error(
+                "phase2_analyst_write",
+                RuntimeError(f"Failed to save results of {failed_articles} analyzed articles")
+            )
+            analyzed_count = max(0, analyzed_count - failed_articles)
+
+        return analyzed_count
+
+    async def _analyze_pipeline(
+        self,
+        runner: Any,
+        pending_articles: List[Dict[str, Any]],
+        extracted: Iterator[Tuple[int, Dict[str, Any]]]
+    ) -> int:
+        """
+        依提取完成順序分析文章（提取與 LLM 分析同時進行）
+
+        提取結果由背景執行緒從 ``extracted`` 讀出並送入佇列，每篇文章一到
+        就建立分析任務；同時進行的分析數由 ``config.analysis_concurrency``
+        限制。單篇文章的失敗只記錄，不影響其他文章。
 
+        Args:
+            runner: AnalystAgentRunner 實例
+            pending_articles: 待分析文章列表
+            extracted: (文章索引, 提取結果) 的迭代器
+
+        Returns:
+            int: 成功分析的文章數量
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        def produce() -> None:
             try:
-                self.logger.info(f"  [{idx}/{len(pending_articles)}] Processing: {title[:60]}...")
+                for item in extracted:
+                    loop.call_soon_threadsafe(queue.put_nowait, item)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
 
-                # 1. 提取完整內容
-                self.logger.info(f"    → Extracting content from {url}")
-                content_result = extract_content(url)
+        semaphore = asyncio.Semaphore(max(1, self.config.analysis_concurrency))
+        producer = loop.run_in_executor(None, produce)
+        tasks = []
 
-                if content_result["status"] != "success":
-                    self.logger.warning(f"    ✗ Content extraction failed: {content_result.get('error_message', 'Unknown error')}")
-                    # 標記為失敗，但繼續處理其他文章
-                    self.article_store.update_status(article_id, "extraction_failed")
-                    continue
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                position, content_result = item
+                tasks.append(asyncio.create_task(self._analyze_one(
+                    runner, semaphore, len(tasks) + 1, pending_articles, position, content_result
+                )))
+        finally:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 提取端的例外（例如執行緒池失敗）在所有分析完成後才拋出
+        await producer
+
+        return sum(1 for analyzed in results if analyzed is True)
+
+    async def _analyze_one(
+        self,
+        runner: Any,
+        semaphore: asyncio.Semaphore,
+        idx: int,
+        pending_articles: List[Dict[str, Any]],
+        position: int,
+        content_result: Dict[str, Any]
+    ) -> bool:
+        """
+        儲存單篇文章的提取內容並分析
+
+        Args:
+            runner: AnalystAgentRunner 實例
+            semaphore: 限制同時 LLM 呼叫數的 semaphore（embedding 等待不佔名額）
+            idx: 完成順序（僅供日誌使用）
+            pending_articles: 待分析文章列表
+            position: 文章在 pending_articles 中的索引
+            content_result: 內容提取結果
 
-                full_content = content_result["content"]
-                self.logger.info(f"    ✓ Content extracted ({len(full_content)} chars)")
+        Returns:
+            bool: 是否分析成功
+        """
+        article_dict = pending_articles[position]
+        article_id = article_dict["id"]
+        title = article_dict["title"]
 
-                # 更新文章內容到數據庫
-                self.article_store.update(article_id, content=full_content)
+        try:
+            self.logger.info(f"  [{idx}/{len(pending_articles)}] Processing: {title[:60]}...")
+
+            if content_result["status"] != "success":
+                self.logger.warning(f"    ✗ Content extraction failed: {content_result.get('error_message', 'Unknown error')}")
+                # 標記為失敗，但繼續處理其他文章（資料庫寫入不佔用事件迴圈）
+                await asyncio.to_thread(
+                    self.article_store.update_status, article_id, "extraction_failed"
+                )
+                return False
 
-                # 2. 分析文章
-                self.logger.info(f"    → Analyzing article with LLM...")
-                import asyncio
-                analysis_result = asyncio.run(runner.analyze_article(article_id=article_id))
+            full_content = content_result["content"]
+            self.logger.info(f"    ✓ Content extracted ({len(full_content)} chars)")
 
-                if analysis_result["status"] == "success":
-                    analyzed_count += 1
-                    priority = analysis_result.get("priority_score", 0.0)
-                    self.logger.info(f"    ✓ Analysis complete (priority: {priority:.2f})")
-                else:
-                    self.logger.warning(f"    ✗ Analysis failed: {analysis_result.get('error_message', 'Unknown error')}")
+            # 更新文章內容到數據庫（在工作執行緒寫入，其他分析照常進行）
+            await asyncio.to_thread(
+                self.article_store.update, article_id, content=full_content
+            )
 
-            except Exception as e:
-                self.logger.error(f"  Error analyzing article {article_id}: {e}", exc_info=True)
-                self._handle_error(f"phase2_analyst_article_{article_id}", e)
-                continue
+            # 2. 分析文章
+            self.logger.info(f"    → Analyzing article {article_id} with LLM...")
+            analysis_result = await runner.analyze_article(
+                article_id=article_id, llm_slots=semaphore
+            )
 
-        return analyzed_count
+            if analysis_result["status"] == "success":
+                priority = analysis_result.get("priority_score", 0.0)
+                self.logger.info(f"    ✓ Analysis complete for article {article_id} (priority: {priority:.2f})")
+                return True
+
+            self.logger.warning(f"    ✗ Analysis failed for article {article_id}: {analysis_result.get('error_message', 'Unknown error')}")
+            return False
+
+        except Exception as e:
+            self.logger.error(f"  Error analyzing article {article_id}: {e}", exc_info=True)
+            self._handle_error(f"phase2_analyst_article_{article_id}", e)
+            return False
 
     def _run_phase3_curator(self, dry_run: bool) -> bool:
         """
@@ -336,11 +527,17 @@ class DailyPipelineOrchestrator:
                 return True
 
             # Normal mode: Generate and send digest
-            result = generate_daily_digest(
-                config=self.config,
-                recipient_email=self.config.email_account,
-                max_articles=10
-            )
+            llm_cache = LLMResponseCache.from_config(self.config)
+            try:
+                result = generate_daily_digest(
+                    config=self.config,
+                    recipient_email=self.config.email_account,
+                    max_articles=10,
+                    llm_cache=llm_cache
+                )
+            finally:
+                if llm_cache is not None:
+                    llm_cache.close()
 
             if result["status"] == "success":
                 self.logger.info(f"  ✓ Email sent to: {result.get('recipients', [])}")
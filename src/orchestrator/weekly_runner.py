@@ -32,6 +32,7 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from src.utils.config import Config
+from src.utils.llm_cache import LLMResponseCache
 from src.utils.logger import setup_logger
 from src.agents.curator_weekly import CuratorWeeklyRunner
 
@@ -123,12 +124,17 @@ class WeeklyPipelineOrchestrator:
 
             # 3. 執行 Weekly Runner
             self.logger.info("Starting Weekly Pipeline...")
-            runner = CuratorWeeklyRunner(self.config)
-            result = runner.generate_weekly_report(
-                week_start=week_start,
-                week_end=week_end,
-                dry_run=dry_run
-            )
+            llm_cache = LLMResponseCache.from_config(self.config)
+            try:
+                runner = CuratorWeeklyRunner(self.config, llm_cache=llm_cache)
+                result = runner.generate_weekly_report(
+                    week_start=week_start,
+                    week_end=week_end,
+                    dry_run=dry_run
+                )
+            finally:
+                if llm_cache is not None:
+                    llm_cache.close()
 
             # 4. 檢查執行結果
             if result["status"] != "success":
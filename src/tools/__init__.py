@@ -8,6 +8,7 @@ Tools:
     - RSSFetcher: RSS/Atom feed fetching and parsing
     - GoogleSearchGroundingTool: Google Search via Gemini Grounding (official SDK)
     - ContentExtractor: Article content extraction from URLs
+    - RedirectResolver: Grounding redirect URL to canonical URL resolution
     - EmailSender: Email sending utility with SMTP support
     - DigestFormatter: Format digest data into HTML and plain text emails
     - VectorClusteringTool: Vector clustering for topic identification (K-Means/DBSCAN)
@@ -39,6 +40,7 @@ Version History:
 from src.tools.fetcher import RSSFetcher
 from src.tools.google_search_grounding_v2 import GoogleSearchGroundingTool
 from src.tools.content_extractor import ContentExtractor, extract_content
+from src.tools.redirect_resolver import RedirectResolver
 from src.tools.email_sender import EmailSender, EmailConfig, send_email
 from src.tools.digest_formatter import DigestFormatter, format_html, format_text
 from src.tools.vector_clustering import VectorClusteringTool, cluster_articles
@@ -57,6 +59,7 @@ __all__ = [
     'GoogleSearchGroundingTool',
     'ContentExtractor',
     'extract_content',
+    'RedirectResolver',
     'EmailSender',
     'EmailConfig',
     'send_email',
@@ -9,15 +9,23 @@ BeautifulSoup 作為備用方案。
 - 智能內容提取（移除廣告、導航等）
 - 元數據提取（標題、作者、日期）
 - 結構化輸出格式
-- 批量提取支援
+- 批量提取支援（工作執行緒池 + 每網域 token bucket 限速，可串流取得結果）
+- 可選的行程池解析（HTML 解析為 CPU 密集工作，交由多個行程以避開 GIL）
+- 可選的磁碟快取（以正規化 URL 為鍵，保存原始 HTML 與提取結果）
 
 Author: Ray 張瑞涵
 Date: 2025-11-23
 """
 
 import time
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -26,10 +34,69 @@ from urllib3.util.retry import Retry
 import trafilatura
 from bs4 import BeautifulSoup
 
+from src.utils.disk_cache import DiskCache
+from src.utils.url_utils import normalize_url
+
 # 設定日誌
 logger = logging.getLogger(__name__)
 
 
+class DomainRateLimiter:
+    """
+    每網域 token bucket 速率限制器（執行緒安全）
+
+    每個網域各自有一個 bucket，以 ``rate_per_second`` 的速度補充 token，
+    最多累積 ``burst`` 個。取不到 token 的請求會預約下一個 token 並等待，
+    因此同一網域的請求依到達順序放行，不同網域之間互不影響。
+
+    Example:
+        >>> limiter = DomainRateLimiter(rate_per_second=1.0, burst=2)
+        >>> limiter.acquire("https://example.com/a")  # 立即放行
+        0.0
+    """
+
+    def __init__(self, rate_per_second: float = 1.0, burst: int = 2):
+        """
+        初始化限速器
+
+        Args:
+            rate_per_second: 每個網域每秒補充的 token 數，預設 1.0
+            burst: 每個網域可累積的最大 token 數，預設 2
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """
+        取得該 URL 網域的一個 token，必要時阻塞等待
+
+        Args:
+            url: 請求的 URL
+
+        Returns:
+            float: 實際等待的秒數
+        """
+        domain = urlparse(url).netloc.lower()
+
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(domain, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate_per_second)
+            # 預約 token（可為負數，代表排隊中的請求）
+            tokens -= 1.0
+            self._buckets[domain] = (tokens, now)
+            wait = -tokens / self.rate_per_second if tokens < 0 else 0.0
+
+        if wait > 0:
+            logger.debug(f"Rate limiting {domain}: waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+
 class ContentExtractor:
     """
     文章內容提取器
@@ -37,6 +104,13 @@ class ContentExtractor:
     使用 trafilatura 作為主力提取引擎，提供統一的接口。
     當 trafilatura 無法提取時，自動降級使用 BeautifulSoup 備用方案。
 
+    同一個實例可重複使用：所有請求共用一個連線池化的 Session，
+    批量提取時以執行緒池並行，並由每網域 token bucket 控制請求頻率。
+    設定 ``parse_workers > 0`` 時，HTML 由 I/O 執行緒抓取後送到行程池解析；
+    使用完畢請呼叫 ``close()``（或使用 with 語句）關閉行程池。
+    提供 ``cache`` 時，成功結果直接從快取返回；解析失敗的頁面保留原始
+    HTML，下次只重新解析而不再連網；404/410 以較短的 TTL 記錄。
+
     Example:
         >>> extractor = ContentExtractor()
         >>> article = extractor.extract("https://example.com/article")
@@ -46,6 +120,9 @@ class ContentExtractor:
         1234
     """
 
+    # 404 / 410 等永久性錯誤的快取時間（秒）
+    NEGATIVE_CACHE_TTL = 6 * 3600
+
     DEFAULT_USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -56,7 +133,11 @@ class ContentExtractor:
         self,
         timeout: int = 30,
         max_retries: int = 3,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        max_workers: int = 8,
+        rate_limiter: Optional[DomainRateLimiter] = None,
+        parse_workers: int = 0,
+        cache: Optional[DiskCache] = None
     ):
         """
         初始化提取器
@@ -65,12 +146,39 @@ class ContentExtractor:
             timeout: HTTP 請求超時時間（秒），預設 30 秒
             max_retries: 最大重試次數，預設 3 次
             user_agent: 自定義 User-Agent，預設使用標準瀏覽器 UA
+            max_workers: 批量提取的工作執行緒數，預設 8（1 = 順序執行）
+            rate_limiter: 每網域限速器，預設每網域每秒 1 個請求、突發 2 個
+            parse_workers: HTML 解析行程數，預設 0（在呼叫端執行緒內解析）
+            cache: 內容快取（可選），保存壓縮的原始 HTML 與提取結果
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = rate_limiter or DomainRateLimiter()
+        self.parse_workers = max(0, parse_workers)
+        self.cache = cache
         self._session = self._create_session()
 
+        # 解析行程池：在此建立，避免之後在已有其他執行緒時才啟動行程
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+        self._get_parse_pool()
+
+    def __enter__(self) -> "ContentExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """關閉解析行程池與 HTTP Session"""
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
+        self._session.close()
+
     def _create_session(self) -> requests.Session:
         """
         創建配置好重試策略的 requests Session
@@ -86,7 +194,12 @@ class ContentExtractor:
             allowed_methods=["GET", "HEAD"]
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # 連線池大小與工作執行緒數一致，讓並行請求可重用連線
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers
+        )
         session = requests.Session()
         session.mount("http://", adapter)
         session.mount("https://", adapter)
@@ -141,6 +254,8 @@ class ContentExtractor:
             "Upgrade-Insecure-Requests": "1"
         }
 
+        self.rate_limiter.acquire(url)
+
         logger.debug(f"Fetching URL: {url}")
         response = self._session.get(url, headers=headers, timeout=self.timeout)
         response.raise_for_status()
@@ -351,26 +466,35 @@ class ContentExtractor:
             "extraction_method": None
         }
 
+        cache_key = None
+
         try:
             # 1. 驗證 URL
             self._validate_url(url)
 
-            # 2. 抓取 HTML
-            html = self._fetch_html(url)
+            # 2. 取得 HTML（優先使用快取：已有結果直接返回，已有 HTML 則免連網）
+            cached = None
+            if self.cache is not None:
+                cache_key = normalize_url(url)
+                cached = self._cache_get(cache_key)
+
+            if cached and cached.get("result"):
+                result.update(cached["result"])
+                result["url"] = url
+                logger.info(f"Served {url} from content cache ({result['status']})")
+                return result
+
+            fetched = not (cached and cached.get("html"))
+            html = self._fetch_html(url) if fetched else cached["html"]
 
             # 3. 提取內容（先嘗試 trafilatura，失敗則用 BeautifulSoup）
-            extraction_error = None
             try:
-                extracted = self._extract_with_trafilatura(html, url)
-                result["extraction_method"] = "trafilatura"
-            except Exception as e:
-                extraction_error = str(e)
-                logger.warning(f"Trafilatura extraction failed: {e}, falling back to BeautifulSoup")
-                try:
-                    extracted = self._extract_with_beautifulsoup(html)
-                    result["extraction_method"] = "beautifulsoup"
-                except Exception as e2:
-                    raise ValueError(f"Both extraction methods failed. Trafilatura: {extraction_error}, BeautifulSoup: {str(e2)}")
+                extracted, result["extraction_method"] = self._parse(html, url)
+            except ValueError:
+                # 保留 HTML，之後可僅重新解析
+                if fetched:
+                    self._cache_put(cache_key, html, None)
+                raise
 
             # 4. 合併提取結果
             result.update(extracted)
@@ -385,6 +509,8 @@ class ContentExtractor:
             result["status"] = "success"
             logger.info(f"Successfully extracted content from {url} ({result['word_count']} words)")
 
+            self._cache_put(cache_key, html, result)
+
         except ValueError as e:
             result["error_message"] = str(e)
             logger.error(f"Validation error for {url}: {e}")
@@ -398,6 +524,9 @@ class ContentExtractor:
                 result["error_message"] = f"HTTP error ({e.response.status_code}): {str(e)}"
             logger.error(result["error_message"])
 
+            if e.response.status_code in (404, 410):
+                self._cache_put(cache_key, None, result, ttl_seconds=self.NEGATIVE_CACHE_TTL)
+
         except requests.Timeout:
             result["error_message"] = f"Connection timeout after {self.timeout}s: {url}"
             logger.error(result["error_message"])
@@ -416,9 +545,157 @@ class ContentExtractor:
 
         return result
 
+    def _cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """讀取內容快取（快取錯誤只記錄，不影響提取）"""
+        try:
+            return self.cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Content cache read failed for {cache_key}: {e}")
+            return None
+
+    def _cache_put(
+        self,
+        cache_key: Optional[str],
+        html: Optional[str],
+        result: Optional[Dict[str, Any]],
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        寫入內容快取
+
+        Args:
+            cache_key: 正規化 URL（None 表示未啟用快取）
+            html: 原始 HTML（None 表示沒有內容，例如 404）
+            result: 提取結果（None 表示解析失敗，只保留 HTML）
+            ttl_seconds: 此項目的 TTL（預設使用快取的 TTL）
+        """
+        if self.cache is None or cache_key is None:
+            return
+
+        entry = {
+            "html": html,
+            "html_sha256": hashlib.sha256(html.encode("utf-8")).hexdigest() if html else None,
+            "result": dict(result) if result is not None else None
+        }
+        try:
+            self.cache.set(cache_key, entry, ttl_seconds=ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Content cache write failed for {cache_key}: {e}")
+
+    def _parse(self, html: str, url: str) -> Tuple[Dict[str, Any], str]:
+        """
+        解析 HTML：有行程池時送到行程池，否則在目前執行緒執行
+
+        Args:
+            html: HTML 內容
+            url: 原始 URL
+
+        Returns:
+            Tuple[dict, str]: (提取結果, 提取方法)
+
+        Raises:
+            ValueError: 兩種提取方法都失敗
+        """
+        pool = self._get_parse_pool()
+        if pool is None:
+            return self._parse_local(html, url)
+
+        try:
+            return pool.submit(_parse_in_worker, html, url).result()
+        except BrokenProcessPool as e:
+            logger.warning(f"Parse process pool broken ({e}), parsing in-thread")
+            with self._parse_pool_lock:
+                self._parse_pool = None
+            return self._parse_local(html, url)
+
+    def _parse_local(self, html: str, url: str) -> Tuple[Dict[str, Any], str]:
+        """
+        在目前行程內解析 HTML（trafilatura 優先，失敗時改用 BeautifulSoup）
+
+        Args:
+            html: HTML 內容
+            url: 原始 URL
+
+        Returns:
+            Tuple[dict, str]: (提取結果, "trafilatura" | "beautifulsoup")
+
+        Raises:
+            ValueError: 兩種提取方法都失敗
+        """
+        try:
+            return self._extract_with_trafilatura(html, url), "trafilatura"
+        except Exception as e:
+            extraction_error = str(e)
+            logger.warning(f"Trafilatura extraction failed: {e}, falling back to BeautifulSoup")
+            try:
+                return self._extract_with_beautifulsoup(html), "beautifulsoup"
+            except Exception as e2:
+                raise ValueError(f"Both extraction methods failed. Trafilatura: {extraction_error}, BeautifulSoup: {str(e2)}")
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        取得（必要時建立）解析行程池；parse_workers 為 0 時返回 None
+
+        使用 spawn 啟動子行程：以 fork 複製多執行緒行程時，子行程可能
+        卡在 fork 當下被其他執行緒持有的鎖（logging、寫入佇列等）上。
+        """
+        if self.parse_workers <= 0:
+            return None
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_parse_worker
+                )
+                logger.info(f"Started HTML parse pool with {self.parse_workers} processes")
+            return self._parse_pool
+
+    def iter_extract(
+        self,
+        urls: List[str],
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        並行提取多個 URL，依完成順序串流回傳結果
+
+        URL 會以網域輪流（round-robin）的順序送入執行緒池，避免所有
+        執行緒同時卡在同一個被限速的網域上。
+
+        Args:
+            urls: URL 列表
+            max_workers: 工作執行緒數（預設使用 self.max_workers）
+
+        Yields:
+            Tuple[int, dict]: (URL 在 urls 中的索引, extract() 的結果)
+
+        Example:
+            >>> extractor = ContentExtractor()
+            >>> for index, article in extractor.iter_extract(urls):
+            ...     print(urls[index], article["status"])
+        """
+        workers = min(max_workers or self.max_workers, len(urls))
+
+        if workers <= 1:
+            for index, url in enumerate(urls):
+                yield index, self._safe_extract(url)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract")
+        try:
+            futures = {
+                executor.submit(self._safe_extract, urls[index]): index
+                for index in self._interleave_by_domain(urls)
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # 提前停止迭代時取消尚未開始的工作
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def extract_batch(self, urls: List[str]) -> List[Dict[str, Any]]:
         """
-        批量提取多個 URL（順序執行）
+        批量提取多個 URL（並行執行，結果依輸入順序排列）
 
         Args:
             urls: URL 列表
@@ -436,29 +713,83 @@ class ContentExtractor:
             True
         """
         logger.info(f"Starting batch extraction for {len(urls)} URLs")
+        start_time = time.time()
 
-        results = []
-        for i, url in enumerate(urls, 1):
-            logger.info(f"Extracting {i}/{len(urls)}: {url}")
-            result = self.extract(url)
-            results.append(result)
-
-            # 簡單的速率限制（避免被封鎖）
-            if i < len(urls):
-                time.sleep(0.5)  # 每個請求間隔 0.5 秒
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        for completed, (index, result) in enumerate(self.iter_extract(urls), 1):
+            logger.info(f"Extracted {completed}/{len(urls)}: {urls[index]} ({result['status']})")
+            results[index] = result
 
         success_count = sum(1 for r in results if r["status"] == "success")
-        logger.info(f"Batch extraction completed: {success_count}/{len(urls)} successful")
+        logger.info(
+            f"Batch extraction completed: {success_count}/{len(urls)} successful "
+            f"in {time.time() - start_time:.1f}s"
+        )
 
         return results
 
+    def _safe_extract(self, url: str) -> Dict[str, Any]:
+        """extract() 的包裝：確保工作執行緒不會拋出例外"""
+        try:
+            return self.extract(url)
+        except Exception as e:
+            logger.exception(f"Unexpected error extracting {url}")
+            return {
+                "status": "error",
+                "url": url,
+                "error_message": f"Unexpected error: {str(e)}"
+            }
+
+    @staticmethod
+    def _interleave_by_domain(urls: List[str]) -> List[int]:
+        """
+        將 URL 索引依網域輪流排列
+
+        Args:
+            urls: URL 列表
+
+        Returns:
+            List[int]: 重新排列後的索引，例如 [a1, b1, c1, a2, b2, a3]
+        """
+        by_domain: "OrderedDict[str, List[int]]" = OrderedDict()
+        for index, url in enumerate(urls):
+            domain = urlparse(url).netloc.lower() if isinstance(url, str) else ""
+            by_domain.setdefault(domain, []).append(index)
+
+        order = []
+        queues = list(by_domain.values())
+        depth = max((len(q) for q in queues), default=0)
+        for position in range(depth):
+            for queue in queues:
+                if position < len(queue):
+                    order.append(queue[position])
+        return order
+
+
+# Process pool workers: each process keeps its own extractor (no session use)
+_worker_extractor: Optional[ContentExtractor] = None
+
+
+def _init_parse_worker() -> None:
+    """行程池初始化：建立該行程專用的提取器"""
+    global _worker_extractor
+    _worker_extractor = ContentExtractor(max_workers=1)
+
+
+def _parse_in_worker(html: str, url: str) -> Tuple[Dict[str, Any], str]:
+    """在行程池中解析 HTML（與 ContentExtractor._parse_local 相同的降級順序）"""
+    if _worker_extractor is None:
+        _init_parse_worker()
+    return _worker_extractor._parse_local(html, url)
+
 
 # Convenience function for one-off extractions
 def extract_content(url: str, **kwargs) -> Dict[str, Any]:
     """
     便捷函式：從 URL 提取內容
 
-    這是一個便捷函式，用於一次性提取單個 URL。
+    這是一個便捷函式，用於一次性提取單個 URL。未傳入額外參數時
+    會重用模組層級的共用提取器（共用 Session 與限速器）。
     如需批量提取或自定義配置，請使用 ContentExtractor 類。
 
     Args:
@@ -473,5 +804,19 @@ def extract_content(url: str, **kwargs) -> Dict[str, Any]:
         >>> print(article["title"])
         "Article Title"
     """
-    extractor = ContentExtractor(**kwargs)
-    return extractor.extract(url)
+    if kwargs:
+        return ContentExtractor(**kwargs).extract(url)
+    return _get_default_extractor().extract(url)
+
+
+_default_extractor: Optional[ContentExtractor] = None
+_default_extractor_lock = threading.Lock()
+
+
+def _get_default_extractor() -> ContentExtractor:
+    """取得（必要時建立）模組層級的共用提取器"""
+    global _default_extractor
+    with _default_extractor_lock:
+        if _default_extractor is None:
+            _default_extractor = ContentExtractor()
+        return _default_extractor
@@ -18,19 +18,34 @@ Usage:
     print(f"Total articles: {result['summary']['total_articles']}")
     for article in result['articles']:
         print(f"- {article['title']}")
+
+    # Feeds are fetched concurrently (max_workers threads, at most
+    # per_host_limit requests per host) over one pooled session
+    fetcher = RSSFetcher(timeout=30, max_workers=16, per_host_limit=2)
+
+    # Conditional GET: ETag / Last-Modified / content hash persisted per feed
+    from src.utils.disk_cache import DiskCache
+    cache = DiskCache("data/cache/cache.db", namespace="rss_feeds")
+    fetcher = RSSFetcher(timeout=30, cache=cache)
 """
 
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from urllib.parse import urlparse
+import hashlib
 import logging
+import threading
 import time
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 from email.utils import parsedate_to_datetime
 
 from src.utils.logger import Logger
+from src.utils.disk_cache import DiskCache
+from src.utils.url_utils import normalize_url
 
 
 class RSSFetcher:
@@ -41,12 +56,16 @@ class RSSFetcher:
     - Fetching RSS/Atom feeds
     - Parsing feed entries
     - Extracting article metadata
-    - Batch processing multiple feeds
+    - Batch processing multiple feeds (concurrent, per-host limited)
     - Error handling and recovery
 
     Attributes:
         timeout (int): HTTP request timeout in seconds
         user_agent (str): HTTP User-Agent string
+        max_workers (int): Maximum feeds fetched in parallel
+        per_host_limit (int): Maximum concurrent requests to one host
+        session (requests.Session): Shared pooled HTTP session
+        cache (Optional[DiskCache]): Per-feed validator cache for conditional GETs
         logger (Logger): Logger instance
 
     Example:
@@ -59,7 +78,11 @@ class RSSFetcher:
         self,
         timeout: int = 30,
         user_agent: str = "InsightCosmos/1.0 (AI News Aggregator)",
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        session: Optional[requests.Session] = None,
+        cache: Optional[DiskCache] = None
     ):
         """
         Initialize RSS Fetcher
@@ -68,18 +91,61 @@ class RSSFetcher:
             timeout: HTTP request timeout in seconds (default: 30)
             user_agent: HTTP User-Agent string
             logger: Logger instance (optional)
+            max_workers: Maximum feeds fetched in parallel (default: 8, 1 = serial)
+            per_host_limit: Maximum concurrent requests per host (default: 2)
+            session: Shared requests session (optional, a pooled one is created)
+            cache: Cache for ETag / Last-Modified / content hash and parsed
+                   articles per feed (optional, disables conditional GETs if None)
 
         Example:
             >>> fetcher = RSSFetcher(timeout=15)
+            >>> fetcher = RSSFetcher(timeout=15, max_workers=16, per_host_limit=1)
         """
         self.timeout = timeout
         self.user_agent = user_agent
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
         self.logger = logger or Logger.get_logger("RSSFetcher")
+        self.session = session or self._create_session()
+        self.cache = cache
+
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
 
         # Configure feedparser
         feedparser.USER_AGENT = user_agent
 
-        self.logger.info(f"RSSFetcher initialized (timeout={timeout}s)")
+        self.logger.info(
+            f"RSSFetcher initialized (timeout={timeout}s, max_workers={self.max_workers}, "
+            f"per_host_limit={self.per_host_limit})"
+        )
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled session shared by all worker threads
+
+        Returns:
+            requests.Session: Session with a connection pool sized for max_workers
+        """
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers['User-Agent'] = self.user_agent
+        return session
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to the URL's host"""
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
 
     def fetch_rss_feeds(
         self,
@@ -89,6 +155,10 @@ class RSSFetcher:
         """
         Batch fetch multiple RSS feeds
 
+        Feeds are fetched concurrently by up to ``max_workers`` threads, so
+        wall-clock time is bounded by the slowest feeds rather than the sum.
+        Results keep the order of ``feed_urls``.
+
         Args:
             feed_urls: List of RSS feed URLs
             max_articles_per_feed: Maximum articles per feed (optional)
@@ -102,7 +172,9 @@ class RSSFetcher:
                     "total_feeds": int,
                     "successful_feeds": int,
                     "failed_feeds": int,
-                    "total_articles": int
+                    "total_articles": int,
+                    "skipped_feeds": int,  # Unchanged feeds served from cache
+                    "bytes_saved": int     # Body bytes not downloaded (304)
                 }
             }
 
@@ -114,19 +186,40 @@ class RSSFetcher:
             >>> print(result['summary'])
         """
         self.logger.info(f"Starting batch fetch: {len(feed_urls)} feeds")
+        start_time = time.time()
 
         all_articles = []
         errors = []
         successful_count = 0
         failed_count = 0
+        skipped_count = 0
+        bytes_saved = 0
 
-        for feed_url in feed_urls:
+        def fetch(feed_url: str) -> Any:
+            # Exceptions are returned, not raised, so one feed can't abort the batch
             try:
-                result = self.fetch_single_feed(feed_url, max_articles_per_feed)
+                return self.fetch_single_feed(feed_url, max_articles_per_feed)
+            except Exception as e:
+                return e
+
+        workers = min(self.max_workers, len(feed_urls))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as executor:
+                results = list(executor.map(fetch, feed_urls))
+        else:
+            results = [fetch(feed_url) for feed_url in feed_urls]
+
+        for feed_url, result in zip(feed_urls, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
 
                 if result['status'] == 'success':
                     all_articles.extend(result['articles'])
                     successful_count += 1
+                    if result.get('not_modified'):
+                        skipped_count += 1
+                    bytes_saved += result.get('bytes_saved', 0)
                     self.logger.info(
                         f"✓ {feed_url}: {len(result['articles'])} articles"
                     )
@@ -161,12 +254,15 @@ class RSSFetcher:
             'total_feeds': len(feed_urls),
             'successful_feeds': successful_count,
             'failed_feeds': failed_count,
-            'total_articles': len(all_articles)
+            'total_articles': len(all_articles),
+            'skipped_feeds': skipped_count,
+            'bytes_saved': bytes_saved
         }
 
         self.logger.info(
             f"Batch fetch complete: {successful_count}/{len(feed_urls)} feeds, "
-            f"{len(all_articles)} articles"
+            f"{len(all_articles)} articles in {time.time() - start_time:.1f}s "
+            f"({skipped_count} unchanged, {bytes_saved} bytes saved)"
         )
 
         return {
@@ -184,6 +280,11 @@ class RSSFetcher:
         """
         Fetch single RSS feed
 
+        With a cache, the request carries If-None-Match / If-Modified-Since
+        from the previous fetch. On ``304 Not Modified`` or a body identical
+        to the last one, parsing is skipped and the cached articles are
+        returned with ``not_modified=True``.
+
         Args:
             feed_url: RSS feed URL
             max_articles: Maximum number of articles to return (optional)
@@ -195,7 +296,9 @@ class RSSFetcher:
                 "feed_title": str,
                 "articles": List[Dict],
                 "error_message": str (if error),
-                "fetched_at": datetime
+                "fetched_at": datetime,
+                "not_modified": bool,  # Served from cache
+                "bytes_saved": int
             }
 
         Example:
@@ -221,15 +324,40 @@ class RSSFetcher:
             # Fetch feed with timeout
             self.logger.debug(f"Fetching feed: {feed_url}")
 
-            # Use requests to fetch with timeout, then parse
+            # Use the pooled session to fetch with timeout, then parse
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(
-                feed_url,
-                headers=headers,
-                timeout=self.timeout
-            )
+
+            cached = self._get_cached_feed(feed_url, max_articles)
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+
+            with self._host_semaphore(feed_url):
+                response = self.session.get(
+                    feed_url,
+                    headers=headers,
+                    timeout=self.timeout
+                )
+
+            if cached and response.status_code == 304:
+                return self._cached_result(
+                    cached, feed_url, max_articles, fetched_at,
+                    bytes_saved=cached['content_length']
+                )
+
             response.raise_for_status()
 
+            content_hash = None
+            if self.cache is not None:
+                content_hash = hashlib.sha256(response.content).hexdigest()
+                if cached and content_hash == cached['content_hash']:
+                    self._store_cached_feed(feed_url, response, content_hash, cached)
+                    return self._cached_result(
+                        cached, feed_url, max_articles, fetched_at, bytes_saved=0
+                    )
+
             # Parse feed
             feed = feedparser.parse(response.content)
 
@@ -265,12 +393,21 @@ class RSSFetcher:
                     self.logger.warning(f"Failed to parse entry: {e}")
                     continue
 
+            if content_hash is not None:
+                self._store_cached_feed(feed_url, response, content_hash, {
+                    'feed_title': feed_title,
+                    'articles': articles,
+                    'max_articles': max_articles
+                })
+
             return {
                 'status': 'success',
                 'feed_url': feed_url,
                 'feed_title': feed_title,
                 'articles': articles,
-                'fetched_at': fetched_at
+                'fetched_at': fetched_at,
+                'not_modified': False,
+                'bytes_saved': 0
             }
 
         except requests.exceptions.Timeout:
@@ -297,6 +434,86 @@ class RSSFetcher:
                 'fetched_at': fetched_at
             }
 
+    def _get_cached_feed(
+        self,
+        feed_url: str,
+        max_articles: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached state of a feed if it can serve this request
+
+        Cached articles were parsed with a possibly smaller limit; such an
+        entry cannot serve a request for more articles.
+
+        Args:
+            feed_url: RSS feed URL
+            max_articles: Requested article limit
+
+        Returns:
+            Optional[dict]: Cached feed state, or None
+        """
+        if self.cache is None:
+            return None
+
+        try:
+            cached = self.cache.get(feed_url)
+        except Exception as e:
+            self.logger.warning(f"Feed cache read failed for {feed_url}: {e}")
+            return None
+
+        if not cached:
+            return None
+
+        cached_limit = cached.get('max_articles')
+        if cached_limit is not None and (max_articles is None or max_articles > cached_limit):
+            return None
+
+        return cached
+
+    def _store_cached_feed(
+        self,
+        feed_url: str,
+        response: requests.Response,
+        content_hash: str,
+        parsed: Dict[str, Any]
+    ) -> None:
+        """Persist validators, content hash and parsed articles of a feed"""
+        try:
+            self.cache.set(feed_url, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_hash': content_hash,
+                'content_length': len(response.content),
+                'feed_title': parsed['feed_title'],
+                'articles': parsed['articles'],
+                'max_articles': parsed['max_articles']
+            })
+        except Exception as e:
+            self.logger.warning(f"Feed cache write failed for {feed_url}: {e}")
+
+    @staticmethod
+    def _cached_result(
+        cached: Dict[str, Any],
+        feed_url: str,
+        max_articles: Optional[int],
+        fetched_at: datetime,
+        bytes_saved: int
+    ) -> Dict[str, Any]:
+        """Build a fetch result from cached articles"""
+        articles = cached['articles']
+        if max_articles:
+            articles = articles[:max_articles]
+
+        return {
+            'status': 'success',
+            'feed_url': feed_url,
+            'feed_title': cached['feed_title'],
+            'articles': [dict(article) for article in articles],
+            'fetched_at': fetched_at,
+            'not_modified': True,
+            'bytes_saved': bytes_saved
+        }
+
     def parse_feed_entry(
         self,
         entry: Any,
@@ -327,10 +544,12 @@ class RSSFetcher:
             >>> article = fetcher.parse_feed_entry(entry, "TechCrunch", "...")
             >>> print(article['title'])
         """
-        # Extract URL (required)
+        # Extract URL (required); normalized so tracking parameters do not
+        # hide duplicates of articles found by other sources
         url = entry.get('link', '')
         if not url:
             raise ValueError("Entry missing 'link' field")
+        url = normalize_url(url)
 
         # Extract title (required)
         title = entry.get('title', 'Untitled')
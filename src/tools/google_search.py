@@ -21,6 +21,9 @@ Usage:
     print(f"Total articles: {len(result['articles'])}")
     for article in result['articles']:
         print(f"- {article['title']}")
+
+    # Serve repeated queries from a persistent cache
+    search_tool = GoogleSearchTool(search_cache=SearchResultCache.from_config(config))
 """
 
 from typing import List, Dict, Any, Optional
@@ -32,6 +35,7 @@ import requests
 
 from src.utils.logger import Logger
 from src.utils.config import Config
+from src.utils.search_cache import SearchResultCache
 
 
 class GoogleSearchTool:
@@ -48,6 +52,7 @@ class GoogleSearchTool:
         api_key (str): Google Search API key
         engine_id (str): Custom Search Engine ID
         timeout (int): HTTP request timeout in seconds
+        search_cache (SearchResultCache): Result cache (optional)
         logger (Logger): Logger instance
 
     Example:
@@ -63,7 +68,8 @@ class GoogleSearchTool:
         api_key: Optional[str] = None,
         engine_id: Optional[str] = None,
         timeout: int = 30,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        search_cache: Optional[SearchResultCache] = None
     ):
         """
         Initialize Google Search Tool
@@ -73,6 +79,7 @@ class GoogleSearchTool:
             engine_id: Custom Search Engine ID (None to read from Config)
             timeout: HTTP request timeout in seconds (default: 30)
             logger: Logger instance (optional)
+            search_cache: Cache for search results (default: no caching)
 
         Raises:
             ValueError: If API key or Engine ID is missing
@@ -107,6 +114,7 @@ class GoogleSearchTool:
             )
 
         self.timeout = timeout
+        self.search_cache = search_cache
 
         self.logger.info(
             f"GoogleSearchTool initialized (timeout={timeout}s, "
@@ -123,6 +131,10 @@ class GoogleSearchTool:
         """
         Search articles and return structured results
 
+        With a search_cache, fresh cached results are returned without a
+        request (no quota used); stale ones are returned and refreshed in the
+        background.
+
         Args:
             query: Search query string
             max_results: Maximum number of results (1-10, default: 10)
@@ -144,11 +156,52 @@ class GoogleSearchTool:
             >>> result = search_tool.search_articles("AI agents", max_results=5)
             >>> print(result['total_results'])
         """
-        self.logger.info(f"Searching articles: query='{query}', max_results={max_results}")
-
         # Validate and adjust max_results
         max_results = max(1, min(max_results, 10))
 
+        if self.search_cache is None:
+            return self._search(query, max_results, date_restrict, language)
+
+        key = self.search_cache.make_key(
+            "custom_search", self.engine_id, query,
+            max_results=max_results, date_restrict=date_restrict, language=language
+        )
+        cached, stale = self.search_cache.lookup(key)
+        if cached is not None:
+            self.logger.info(
+                f"Search cache {'stale hit' if stale else 'hit'}: query='{query}'"
+            )
+            if stale:
+                self.search_cache.revalidate(
+                    key, lambda: self._search(query, max_results, date_restrict, language)
+                )
+            return cached
+
+        result = self._search(query, max_results, date_restrict, language)
+        self.search_cache.store(key, result)
+        return result
+
+    def _search(
+        self,
+        query: str,
+        max_results: int,
+        date_restrict: str,
+        language: str
+    ) -> Dict[str, Any]:
+        """
+        Run one Custom Search API request (no caching)
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results (already clamped to 1-10)
+            date_restrict: Date restriction
+            language: Language restriction
+
+        Returns:
+            dict: Search result (see search_articles)
+        """
+        self.logger.info(f"Searching articles: query='{query}', max_results={max_results}")
+
         # Build API URL
         url = self.build_api_url(query, max_results, date_restrict, language)
 
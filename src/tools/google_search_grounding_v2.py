@@ -6,6 +6,7 @@ Uses the new unified Google Gen AI SDK (google-genai) for Google Search Groundin
 Based on official documentation from googleapis/python-genai v1.33.0
 
 Classes:
+    RateLimiter: Request-rate limiter shared by concurrent (async) searches
     GoogleSearchGroundingTool: Gemini-based search client using official SDK
 
 Usage:
@@ -17,6 +18,16 @@ Usage:
         max_results=10
     )
 
+    # Several queries concurrently (async client, bounded concurrency);
+    # ``async with`` closes the async client, which close() does not
+    async def run():
+        async with GoogleSearchGroundingTool() as search_tool:
+            return await search_tool.abatch_search(queries, max_results_per_query=5)
+    result = asyncio.run(run())
+
+    # Serve repeated queries from a persistent cache
+    search_tool = GoogleSearchGroundingTool(search_cache=SearchResultCache.from_config(config))
+
 References:
     - Official SDK: https://github.com/googleapis/python-genai
     - Context7 Documentation: /googleapis/python-genai v1.33.0
@@ -24,13 +35,58 @@ References:
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
+import asyncio
 import logging
+import threading
+import time
 
 from google import genai
 from google.genai import types
 
 from src.utils.logger import Logger
 from src.utils.config import Config
+from src.utils.search_cache import SearchResultCache
+
+
+class RateLimiter:
+    """
+    Spaces out requests to at most ``requests_per_second``
+
+    Thread-safe and not bound to an event loop, so one instance can be
+    shared by every search tool (and every event loop) in the process.
+
+    Attributes:
+        requests_per_second (float): Maximum request rate
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_second=2)
+        >>> await limiter.acquire()  # returns immediately
+        >>> await limiter.acquire()  # waits ~0.5s
+    """
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize the limiter
+
+        Args:
+            requests_per_second: Maximum request rate (must be positive)
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.requests_per_second = requests_per_second
+        self._interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 class GoogleSearchGroundingTool:
@@ -44,6 +100,7 @@ class GoogleSearchGroundingTool:
         api_key (str): Google Gemini API key
         model_name (str): Gemini model to use
         client (genai.Client): Gen AI client instance
+        search_cache (SearchResultCache): Result cache (optional)
         logger (Logger): Logger instance
 
     Example:
@@ -54,11 +111,16 @@ class GoogleSearchGroundingTool:
 
     DEFAULT_MODEL = "gemini-2.5-flash"
 
+    # Shared by all instances unless a rate_limiter is passed in
+    shared_rate_limiter = RateLimiter(requests_per_second=4.0)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model_name: str = DEFAULT_MODEL,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        search_cache: Optional[SearchResultCache] = None
     ):
         """
         Initialize Google Search Grounding Tool
@@ -67,6 +129,8 @@ class GoogleSearchGroundingTool:
             api_key: Google Gemini API key (None to read from Config)
             model_name: Gemini model name (default: gemini-2.5-flash)
             logger: Logger instance (optional)
+            rate_limiter: Limiter for async searches (default: shared_rate_limiter)
+            search_cache: Cache for search results (default: no caching)
 
         Raises:
             ValueError: If API key is missing
@@ -99,6 +163,13 @@ class GoogleSearchGroundingTool:
             )
 
         self.model_name = model_name
+        self.rate_limiter = rate_limiter or self.shared_rate_limiter
+        self.search_cache = search_cache
+
+        # Background cache revalidations still using the client
+        self._revalidations: set = set()
+        self._revalidation_lock = threading.Lock()
+        self._close_requested = False
 
         # Initialize client using official SDK
         self.client = genai.Client(api_key=self.api_key)
@@ -117,6 +188,9 @@ class GoogleSearchGroundingTool:
         """
         Search articles using Gemini Grounding and return structured results
 
+        With a search_cache, fresh cached results are returned without a
+        request; stale ones are returned and refreshed in the background.
+
         Args:
             query: Search query string
             max_results: Maximum number of results (default: 10)
@@ -137,54 +211,267 @@ class GoogleSearchGroundingTool:
             >>> result = search_tool.search_articles("AI agents", max_results=5)
             >>> print(result['total_results'])
         """
+        if self.search_cache is None:
+            return self._search(query, max_results, date_restrict, language)
+
+        key = self._cache_key(query, max_results, date_restrict, language)
+        cached, _ = self._lookup_cached(key, query, max_results, date_restrict, language)
+        if cached is not None:
+            return cached
+
+        result = self._search(query, max_results, date_restrict, language)
+        self.search_cache.store(key, result)
+        return result
+
+    def _search(
+        self,
+        query: str,
+        max_results: int,
+        date_restrict: Optional[str],
+        language: str
+    ) -> Dict[str, Any]:
+        """
+        Run one grounded search with the sync client (no caching)
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results
+            date_restrict: Date restriction hint
+            language: Language preference
+
+        Returns:
+            dict: Search result (see search_articles)
+        """
         self.logger.info(f"Searching articles: query='{query}', max_results={max_results}")
 
         try:
-            # Build search prompt
-            prompt = self.build_search_prompt(query, max_results, date_restrict, language)
-
             # Perform search using official SDK
             response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    tools=[
-                        types.Tool(google_search=types.GoogleSearch())
-                    ]
-                )
+                **self._build_request(query, max_results, date_restrict, language)
             )
+            return self._build_result(response, query, max_results)
 
-            searched_at = datetime.now(timezone.utc)
+        except Exception as e:
+            self.logger.error(f"Search request failed: {e}")
+            return self._error_result(query, f"Search error: {str(e)}")
 
-            # Extract articles from grounding metadata
-            articles = self.extract_articles_from_response(response, query)
+    async def asearch_articles(
+        self,
+        query: str,
+        max_results: int = 10,
+        date_restrict: Optional[str] = None,
+        language: str = 'en',
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of search_articles using the async client
 
-            # Limit to max_results
-            articles = articles[:max_results]
+        Waits for a slot from the rate limiter before sending the request.
+        Uses the search_cache like search_articles (stale entries are
+        refreshed in a background thread).
 
-            self.logger.info(
-                f"Search completed: {len(articles)} articles returned"
+        Args:
+            query: Search query string
+            max_results: Maximum number of results (default: 10)
+            date_restrict: Date restriction hint (e.g., "past week")
+            language: Language preference (default: "en")
+            timeout: Seconds before the request is abandoned (default: none)
+
+        Returns:
+            dict: Same structure as search_articles
+
+        Example:
+            >>> result = await search_tool.asearch_articles("AI agents", timeout=30)
+
+        Note:
+            Opens the async client's connections; release them with
+            ``await aclose()`` or ``async with`` (close() does not).
+        """
+        key = None
+        if self.search_cache is not None:
+            key = self._cache_key(query, max_results, date_restrict, language)
+            cached, _ = self._lookup_cached(key, query, max_results, date_restrict, language)
+            if cached is not None:
+                return cached
+
+        result = await self._asearch(query, max_results, date_restrict, language, timeout)
+        if key is not None:
+            self.search_cache.store(key, result)
+        return result
+
+    async def _asearch(
+        self,
+        query: str,
+        max_results: int,
+        date_restrict: Optional[str],
+        language: str,
+        timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Run one grounded search with the async client (no caching)
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results
+            date_restrict: Date restriction hint
+            language: Language preference
+            timeout: Seconds before the request is abandoned
+
+        Returns:
+            dict: Search result (see search_articles)
+        """
+        self.logger.info(f"Searching articles (async): query='{query}', max_results={max_results}")
+
+        try:
+            await self.rate_limiter.acquire()
+            response = await asyncio.wait_for(
+                self.client.aio.models.generate_content(
+                    **self._build_request(query, max_results, date_restrict, language)
+                ),
+                timeout=timeout
             )
+            return self._build_result(response, query, max_results)
 
-            return {
-                "status": "success",
-                "query": query,
-                "articles": articles,
-                "total_results": len(articles),
-                "error_message": None,
-                "searched_at": searched_at
-            }
+        except asyncio.TimeoutError:
+            self.logger.error(f"Search request timed out after {timeout}s: '{query}'")
+            return self._error_result(query, f"Search timeout after {timeout}s")
 
         except Exception as e:
             self.logger.error(f"Search request failed: {e}")
-            return {
-                "status": "error",
-                "query": query,
-                "articles": [],
-                "total_results": 0,
-                "error_message": f"Search error: {str(e)}",
-                "searched_at": datetime.now(timezone.utc)
-            }
+            return self._error_result(query, f"Search error: {str(e)}")
+
+    def _cache_key(
+        self,
+        query: str,
+        max_results: int,
+        date_restrict: Optional[str],
+        language: str
+    ) -> str:
+        """Cache key for a search with this tool's model"""
+        return self.search_cache.make_key(
+            "grounding", self.model_name, query,
+            max_results=max_results, date_restrict=date_restrict, language=language
+        )
+
+    def _lookup_cached(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        date_restrict: Optional[str],
+        language: str
+    ) -> tuple:
+        """
+        Look up a cached result, scheduling a refresh if it is stale
+
+        Returns:
+            tuple: (cached result or None, stale)
+        """
+        cached, stale = self.search_cache.lookup(key)
+        if cached is not None:
+            self.logger.info(
+                f"Search cache {'stale hit' if stale else 'hit'}: query='{query}'"
+            )
+            if stale:
+                future = self.search_cache.revalidate(
+                    key, lambda: self._search(query, max_results, date_restrict, language)
+                )
+                if future is not None:
+                    with self._revalidation_lock:
+                        self._revalidations.add(future)
+                    future.add_done_callback(self._revalidation_done)
+        return cached, stale
+
+    def _revalidation_done(self, future) -> None:
+        """Forget a finished revalidation; close the client if close() was deferred"""
+        with self._revalidation_lock:
+            self._revalidations.discard(future)
+            close_now = self._close_requested and not self._revalidations
+        if close_now:
+            self._close_client()
+
+    def _build_request(
+        self,
+        query: str,
+        max_results: int,
+        date_restrict: Optional[str],
+        language: str
+    ) -> Dict[str, Any]:
+        """
+        Build generate_content arguments for a grounded search
+
+        Args:
+            query: Search query
+            max_results: Number of results
+            date_restrict: Date restriction hint
+            language: Language preference
+
+        Returns:
+            dict: Keyword arguments for ``models.generate_content``
+        """
+        return {
+            "model": self.model_name,
+            "contents": self.build_search_prompt(query, max_results, date_restrict, language),
+            "config": types.GenerateContentConfig(
+                tools=[
+                    types.Tool(google_search=types.GoogleSearch())
+                ]
+            )
+        }
+
+    def _build_result(self, response, query: str, max_results: int) -> Dict[str, Any]:
+        """
+        Build a successful search result from a grounded response
+
+        Args:
+            response: Gemini API response object
+            query: Original search query
+            max_results: Maximum number of articles
+
+        Returns:
+            dict: Search result (see search_articles)
+        """
+        searched_at = datetime.now(timezone.utc)
+
+        # Extract articles from grounding metadata
+        articles = self.extract_articles_from_response(response, query)
+
+        # Limit to max_results
+        articles = articles[:max_results]
+
+        self.logger.info(
+            f"Search completed: {len(articles)} articles returned"
+        )
+
+        return {
+            "status": "success",
+            "query": query,
+            "articles": articles,
+            "total_results": len(articles),
+            "error_message": None,
+            "searched_at": searched_at
+        }
+
+    @staticmethod
+    def _error_result(query: str, error_message: str) -> Dict[str, Any]:
+        """
+        Build a failed search result
+
+        Args:
+            query: Original search query
+            error_message: Error description
+
+        Returns:
+            dict: Search result with status "error"
+        """
+        return {
+            "status": "error",
+            "query": query,
+            "articles": [],
+            "total_results": 0,
+            "error_message": error_message,
+            "searched_at": datetime.now(timezone.utc)
+        }
 
     def batch_search(
         self,
@@ -220,13 +507,84 @@ class GoogleSearchGroundingTool:
         """
         self.logger.info(f"Batch search started: {len(queries)} queries")
 
+        results = [
+            self.search_articles(query, max_results=max_results_per_query)
+            for query in queries
+        ]
+        return self._merge_batch_results(queries, results)
+
+    async def abatch_search(
+        self,
+        queries: List[str],
+        max_results_per_query: int = 10,
+        max_concurrency: int = 5,
+        timeout: Optional[float] = 60.0
+    ) -> Dict[str, Any]:
+        """
+        Batch search multiple queries concurrently
+
+        Queries run through the async client with at most ``max_concurrency``
+        requests in flight, each limited to ``timeout`` seconds and paced by
+        the rate limiter. Results are merged in query order, so the output
+        matches batch_search.
+
+        Args:
+            queries: List of search query strings
+            max_results_per_query: Maximum results per query (default: 10)
+            max_concurrency: Maximum concurrent requests (default: 5)
+            timeout: Per-query timeout in seconds (default: 60)
+
+        Returns:
+            dict: Same structure as batch_search
+
+        Example:
+            >>> result = await search_tool.abatch_search(
+            ...     ["AI agents", "robotics news"],
+            ...     max_results_per_query=5
+            ... )
+            >>> print(result['summary'])
+
+        Note:
+            Use the tool as ``async with GoogleSearchGroundingTool() as tool``
+            or call ``await tool.aclose()`` when done: close() only closes
+            the sync client and leaves the async client's connections open.
+        """
+        self.logger.info(
+            f"Async batch search started: {len(queries)} queries "
+            f"(max_concurrency={max_concurrency})"
+        )
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _search(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.asearch_articles(
+                    query, max_results=max_results_per_query, timeout=timeout
+                )
+
+        results = await asyncio.gather(*[_search(query) for query in queries])
+        return self._merge_batch_results(queries, results)
+
+    def _merge_batch_results(
+        self,
+        queries: List[str],
+        results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge per-query results (in query order) into a batch result
+
+        Args:
+            queries: Search queries
+            results: search_articles results, one per query
+
+        Returns:
+            dict: Batch result (see batch_search)
+        """
         all_articles = []
         errors = []
         successful_queries = 0
 
-        for query in queries:
-            result = self.search_articles(query, max_results=max_results_per_query)
-
+        for query, result in zip(queries, results):
             if result['status'] == 'success':
                 all_articles.extend(result['articles'])
                 successful_queries += 1
@@ -541,10 +899,43 @@ class GoogleSearchGroundingTool:
             >>> search_tool = GoogleSearchGroundingTool()
             >>> # ... use the tool
             >>> search_tool.close()
+
+        Note:
+            While cache revalidations started by this tool are running, the
+            client is closed when the last one finishes instead.
+        """
+        if not hasattr(self, 'client'):
+            return
+
+        with self._revalidation_lock:
+            self._close_requested = True
+            pending = len(self._revalidations)
+        if pending:
+            self.logger.info(f"Client close deferred until {pending} cache revalidations finish")
+            return
+
+        self._close_client()
+
+    def _close_client(self) -> None:
+        """Close the Gen AI client"""
+        self.client.close()
+        self.logger.info("Client closed successfully")
+
+    async def aclose(self):
+        """
+        Close the async client, then the sync client (see close())
+
+        Call this (or use ``async with``) after asearch_articles or
+        abatch_search; close() alone does not close the async client.
+
+        Example:
+            >>> await search_tool.aclose()
         """
-        if hasattr(self, 'client'):
-            self.client.close()
-            self.logger.info("Client closed successfully")
+        if not hasattr(self, 'client'):
+            return
+
+        await self.client.aio.aclose()
+        self.close()
 
     def __enter__(self):
         """Context manager entry"""
@@ -553,3 +944,11 @@ class GoogleSearchGroundingTool:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.close()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
@@ -0,0 +1,257 @@
+"""
+InsightCosmos Redirect Resolver Tool
+
+Resolves opaque redirect URLs (Google Search Grounding links) to the
+canonical article URL, so search results can be deduplicated against RSS
+articles and the database before extraction and analysis.
+
+Classes:
+    RedirectResolver: Concurrent redirect resolution with a persistent map
+
+Usage:
+    from src.memory.redirect_store import RedirectStore
+    from src.tools.redirect_resolver import RedirectResolver
+
+    with RedirectResolver(store=RedirectStore(db), max_workers=8) as resolver:
+        articles = resolver.resolve_articles(articles)
+
+    # Redirects are resolved with HEAD (GET if HEAD is refused) over one
+    # pooled session; resolved URLs are stored in url_redirects and never
+    # requested again
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.memory.redirect_store import RedirectStore
+from src.tools.google_search_grounding_v2 import GoogleSearchGroundingTool
+from src.utils.logger import Logger
+from src.utils.url_utils import is_redirect_url, normalize_url
+
+
+class RedirectResolver:
+    """
+    Concurrent redirect URL resolver backed by a persistent URL map
+
+    Attributes:
+        store (RedirectStore): Persistent redirect map (optional)
+        max_workers (int): Maximum concurrent requests
+        timeout (float): Per-request timeout in seconds
+        logger (Logger): Logger instance
+
+    Example:
+        >>> resolver = RedirectResolver(store=RedirectStore(db))
+        >>> mapping = resolver.resolve_many([redirect_url])
+        >>> print(mapping[redirect_url])
+        'https://example.com/post'
+    """
+
+    DEFAULT_USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    def __init__(
+        self,
+        store: Optional[RedirectStore] = None,
+        max_workers: int = 8,
+        timeout: float = 10.0,
+        user_agent: Optional[str] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize Redirect Resolver
+
+        Args:
+            store: Persistent redirect map (None = resolve every time)
+            max_workers: Maximum concurrent requests (default: 8)
+            timeout: Per-request timeout in seconds (default: 10)
+            user_agent: Custom User-Agent (default: desktop browser UA)
+            logger: Logger instance (optional)
+        """
+        self.store = store
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.logger = logger or Logger.get_logger("RedirectResolver")
+
+        # Connection pool sized to the worker count so parallel requests reuse connections
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = user_agent or self.DEFAULT_USER_AGENT
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._stats_lock = threading.Lock()
+        self._stats = {"stored": 0, "resolved": 0, "failed": 0}
+
+    def __enter__(self) -> "RedirectResolver":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session"""
+        self._session.close()
+
+    def resolve_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """
+        Resolve redirect URLs to canonical URLs
+
+        Known redirects come from the store; the rest are requested
+        concurrently and the results stored in one transaction. URLs that
+        are not redirects map to themselves; redirects that cannot be
+        resolved are left out.
+
+        Args:
+            urls: URLs to resolve
+
+        Returns:
+            dict: {url: canonical_url}
+
+        Example:
+            >>> mapping = resolver.resolve_many(article_urls)
+        """
+        urls = list(dict.fromkeys(url for url in urls if url))
+        mapping = {url: url for url in urls if not is_redirect_url(url)}
+        pending = [url for url in urls if url not in mapping]
+        if not pending:
+            return mapping
+
+        if self.store is not None:
+            try:
+                known = self.store.get_many(pending)
+            except Exception as e:
+                self.logger.warning(f"Redirect lookup failed, resolving all: {e}")
+                known = {}
+            mapping.update(known)
+            pending = [url for url in pending if url not in known]
+            with self._stats_lock:
+                self._stats["stored"] += len(known)
+
+        if not pending:
+            return mapping
+
+        workers = min(self.max_workers, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="redirect") as executor:
+            results = list(executor.map(self._resolve_one, pending))
+
+        resolved = []
+        for url, result in zip(pending, results):
+            if result is None:
+                continue
+            canonical_url, status_code = result
+            mapping[url] = canonical_url
+            resolved.append({
+                "redirect_url": url,
+                "canonical_url": canonical_url,
+                "status_code": status_code
+            })
+
+        with self._stats_lock:
+            self._stats["resolved"] += len(resolved)
+            self._stats["failed"] += len(pending) - len(resolved)
+
+        self.logger.info(
+            f"Resolved {len(resolved)}/{len(pending)} redirects "
+            f"({len(urls) - len(pending)} known or direct)"
+        )
+
+        if resolved and self.store is not None:
+            try:
+                self.store.store_many(resolved)
+            except Exception as e:
+                self.logger.warning(f"Failed to persist resolved redirects: {e}")
+
+        return mapping
+
+    def resolve_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Replace redirect URLs in articles with their canonical URLs
+
+        Resolved articles also get the real domain as source_name, and a
+        title derived from the redirect URL is re-derived from the canonical
+        URL. Articles whose redirect cannot be resolved are kept unchanged.
+
+        Args:
+            articles: Article dictionaries (with "url")
+
+        Returns:
+            List[dict]: Articles in the same order (resolved ones are copies)
+
+        Example:
+            >>> articles = resolver.resolve_articles(search_result["articles"])
+        """
+        redirect_urls = [
+            article.get("url", "") for article in articles
+            if is_redirect_url(article.get("url", ""))
+        ]
+        if not redirect_urls:
+            return articles
+
+        mapping = self.resolve_many(redirect_urls)
+
+        resolved_articles = []
+        for article in articles:
+            url = article.get("url", "")
+            canonical_url = mapping.get(url)
+            if canonical_url and canonical_url != url:
+                article = dict(article)
+                article["url"] = canonical_url
+                article["source_name"] = GoogleSearchGroundingTool.extract_domain(canonical_url)
+
+                url_title = GoogleSearchGroundingTool.extract_title_from_url(url)
+                if url_title and article.get("title") == url_title:
+                    title = GoogleSearchGroundingTool.extract_title_from_url(canonical_url)
+                    if title:
+                        if article.get("summary") == url_title:
+                            article["summary"] = title
+                        article["title"] = title
+            resolved_articles.append(article)
+
+        return resolved_articles
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get resolver statistics
+
+        Returns:
+            dict: stored (answered from the store), resolved (over the
+                network) and failed redirects
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _resolve_one(self, url: str) -> Optional[Tuple[str, int]]:
+        """
+        Follow one redirect (HEAD first, GET if HEAD does not leave the redirect host)
+
+        Args:
+            url: Redirect URL
+
+        Returns:
+            Optional[Tuple[str, int]]: (normalized final URL, status code),
+                or None if the redirect could not be followed
+        """
+        for method in ("HEAD", "GET"):
+            try:
+                response = self._session.request(
+                    method, url, allow_redirects=True, timeout=self.timeout, stream=True
+                )
+                response.close()
+            except requests.RequestException as e:
+                self.logger.debug(f"{method} {url} failed: {e}")
+                continue
+
+            # The final site may refuse bots (403 etc.); its URL is still the article
+            if response.url and not is_redirect_url(response.url):
+                return normalize_url(response.url), response.status_code
+
+        self.logger.warning(f"Could not resolve redirect: {url[:100]}")
+        return None
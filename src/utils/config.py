@@ -27,6 +27,18 @@ class Config:
         smtp_port: SMTP 端口
         smtp_use_tls: 是否使用 TLS 加密
         database_path: SQLite 数据库路径
+        database_profile: SQLite 连接调优配置（default / throughput）
+        cache_dir: 本地缓存目录（RSS 条件请求等）
+        extraction_parse_workers: HTML 解析进程数（0 = 在抓取线程内解析）
+        analysis_concurrency: Phase 2 同时进行的 LLM 分析数
+        embedding_batch_size: 每个 embedding 请求最多合并的文本数（1-100）
+        embedding_batch_wait_seconds: embedding 文本等待合并的最长时间（秒；
+            进行中的分析都在等待 embedding 时会提前发送）
+        llm_cache_ttl_hours: LLM 回应缓存有效时间（小时，0 = 停用缓存）
+        llm_cache_bypass: 是否跳过 LLM 缓存查询（仍会写入，用于强制刷新）
+        search_cache_ttl_hours: 搜索结果缓存新鲜时间（小时，0 = 停用缓存）
+        search_cache_stale_hours: 过期后仍可返回、并于后台刷新的时间（小时）
+        scout_mode: Phase 1 收集模式（fast = 按来源计划直接抓取，explore = LLM Agent）
         user_name: 用户名（个性化用）
         user_interests: 用户兴趣（逗号分隔）
         log_level: 日志级别
@@ -49,6 +61,29 @@ class Config:
 
     # Database
     database_path: str = "data/insights.db"
+    database_profile: str = "default"
+
+    # Cache
+    cache_dir: str = "data/cache"
+
+    # Content extraction
+    extraction_parse_workers: int = 0
+
+    # Analysis
+    analysis_concurrency: int = 5
+    embedding_batch_size: int = 100
+    embedding_batch_wait_seconds: float = 30.0
+
+    # LLM response cache
+    llm_cache_ttl_hours: int = 168
+    llm_cache_bypass: bool = False
+
+    # Search result cache
+    search_cache_ttl_hours: int = 12
+    search_cache_stale_hours: int = 24
+
+    # Scout
+    scout_mode: str = "fast"
 
     # User Profile
     user_name: str = "Ray"
@@ -113,6 +148,17 @@ class Config:
                 smtp_port=int(os.getenv("SMTP_PORT", "587")),
                 smtp_use_tls=os.getenv("SMTP_USE_TLS", "true").lower() == "true",
                 database_path=os.getenv("DATABASE_PATH", "data/insights.db"),
+                database_profile=os.getenv("DATABASE_PROFILE", "default"),
+                cache_dir=os.getenv("CACHE_DIR", "data/cache"),
+                extraction_parse_workers=int(os.getenv("EXTRACTION_PARSE_WORKERS", "0")),
+                analysis_concurrency=int(os.getenv("ANALYSIS_CONCURRENCY", "5")),
+                embedding_batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", "100")),
+                embedding_batch_wait_seconds=float(os.getenv("EMBEDDING_BATCH_WAIT_SECONDS", "30")),
+                llm_cache_ttl_hours=int(os.getenv("LLM_CACHE_TTL_HOURS", "168")),
+                llm_cache_bypass=os.getenv("LLM_CACHE_BYPASS", "false").lower() == "true",
+                search_cache_ttl_hours=int(os.getenv("SEARCH_CACHE_TTL_HOURS", "12")),
+                search_cache_stale_hours=int(os.getenv("SEARCH_CACHE_STALE_HOURS", "24")),
+                scout_mode=os.getenv("SCOUT_MODE", "fast"),
                 user_name=os.getenv("USER_NAME", "Ray"),
                 user_interests=os.getenv("USER_INTERESTS", "AI,Robotics,Multi-Agent Systems"),
                 log_level=os.getenv("LOG_LEVEL", "INFO")
@@ -164,6 +210,64 @@ class Config:
                 f"Must be a positive integer."
             )
 
+        # 验证解析进程数
+        if not isinstance(self.extraction_parse_workers, int) or self.extraction_parse_workers < 0:
+            raise ValueError(
+                f"Invalid extraction parse workers: {self.extraction_parse_workers}. "
+                f"Must be a non-negative integer."
+            )
+
+        # 验证分析并发数
+        if not isinstance(self.analysis_concurrency, int) or self.analysis_concurrency < 1:
+            raise ValueError(
+                f"Invalid analysis concurrency: {self.analysis_concurrency}. "
+                f"Must be a positive integer."
+            )
+
+        # 验证 embedding 批次大小
+        if (
+            not isinstance(self.embedding_batch_size, int)
+            or not 1 <= self.embedding_batch_size <= 100
+        ):
+            raise ValueError(
+                f"Invalid embedding batch size: {self.embedding_batch_size}. "
+                f"Must be an integer between 1 and 100."
+            )
+
+        # 验证 embedding 批次等待时间
+        if (
+            not isinstance(self.embedding_batch_wait_seconds, (int, float))
+            or self.embedding_batch_wait_seconds < 0
+        ):
+            raise ValueError(
+                f"Invalid embedding batch wait: {self.embedding_batch_wait_seconds}. "
+                f"Must be a non-negative number of seconds."
+            )
+
+        # 验证 LLM 缓存有效时间
+        if not isinstance(self.llm_cache_ttl_hours, int) or self.llm_cache_ttl_hours < 0:
+            raise ValueError(
+                f"Invalid LLM cache TTL: {self.llm_cache_ttl_hours}. "
+                f"Must be a non-negative integer (0 disables the cache)."
+            )
+
+        # 验证搜索结果缓存时间
+        for name in ("search_cache_ttl_hours", "search_cache_stale_hours"):
+            value = getattr(self, name)
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(
+                    f"Invalid {name}: {value}. "
+                    f"Must be a non-negative integer."
+                )
+
+        # 验证 Scout 收集模式
+        valid_scout_modes = ["fast", "explore"]
+        if self.scout_mode not in valid_scout_modes:
+            raise ValueError(
+                f"Invalid scout mode: {self.scout_mode}. "
+                f"Must be one of {valid_scout_modes}."
+            )
+
         # 验证日志级别
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if self.log_level.upper() not in valid_log_levels:
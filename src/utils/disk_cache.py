@@ -0,0 +1,339 @@
+"""
+Disk Cache for InsightCosmos
+
+A small persistent key-value cache backed by a SQLite file.
+
+Classes:
+    CacheEntry: A cached value with its timestamps
+    DiskCache: Namespaced, TTL- and size-bounded cache shared across threads
+
+Features:
+    - Several namespaces can share one cache file
+    - Values are pickled and zlib-compressed
+    - Per-entry TTL (expired entries are misses, but can still be read for
+      stale-while-revalidate via ``get_entry(allow_expired=True)``)
+    - LRU eviction when ``max_entries`` or ``max_bytes`` is exceeded
+    - Hit / miss / eviction counters
+
+Usage:
+    from src.utils.disk_cache import DiskCache
+
+    cache = DiskCache("data/cache/cache.db", namespace="rss_feeds", ttl_seconds=86400)
+    cache.set("https://example.com/feed/", {"etag": "abc"})
+    value = cache.get("https://example.com/feed/")
+    print(cache.stats())
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+
+
+_MISSING = object()
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached value with its timestamps
+
+    Attributes:
+        value: Cached value
+        stored_at: Unix time the value was written
+        expires_at: Unix time the value expires (None = never)
+    """
+
+    value: Any
+    stored_at: float
+    expires_at: Optional[float] = None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the value was written"""
+        return time.time() - self.stored_at
+
+    @property
+    def expired(self) -> bool:
+        """Whether the entry is past its TTL"""
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+
+class DiskCache:
+    """
+    Namespaced persistent cache backed by SQLite
+
+    The SQLite file is opened lazily on first use, so constructing a cache
+    that is never used does not touch the disk.
+
+    Attributes:
+        path (Path): Cache file path
+        namespace (str): Key namespace
+        ttl_seconds (Optional[float]): Default TTL (None = no expiry)
+        max_entries (Optional[int]): Maximum entries in this namespace
+        max_bytes (Optional[int]): Maximum stored bytes in this namespace
+
+    Example:
+        >>> cache = DiskCache("data/cache/cache.db", namespace="search", ttl_seconds=3600)
+        >>> cache.set("query", ["result"])
+        >>> cache.get("query")
+        ['result']
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        namespace: str = "default",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite file path (parent directories are created on first use)
+            namespace: Key namespace, so several caches can share one file
+            ttl_seconds: Default time-to-live for entries (None = no expiry)
+            max_entries: Maximum number of entries kept in the namespace
+            max_bytes: Maximum total compressed size kept in the namespace
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            Any: Cached value or default
+        """
+        entry = self.get_entry(key)
+        return default if entry is None else entry.value
+
+    def get_entry(self, key: str, allow_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Get a cached entry with its timestamps
+
+        Args:
+            key: Cache key
+            allow_expired: Return expired entries instead of treating them as misses
+
+        Returns:
+            Optional[CacheEntry]: Entry, or None on a miss
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, stored_at, expires_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            entry = CacheEntry(
+                value=_MISSING, stored_at=row[1], expires_at=row[2]
+            )
+            if entry.expired and not allow_expired:
+                self._stats["misses"] += 1
+                return None
+
+            try:
+                entry.value = pickle.loads(zlib.decompress(row[0]))
+            except Exception:
+                # Unreadable entry (e.g. class changed): drop it
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key)
+                )
+                conn.commit()
+                self._stats["misses"] += 1
+                return None
+
+            conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (time.time(), self.namespace, key)
+            )
+            conn.commit()
+            self._stats["hits"] += 1
+            return entry
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Picklable value
+            ttl_seconds: TTL for this entry (default: the cache's ttl_seconds)
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.time()
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, size, stored_at, accessed_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, blob, len(blob), now, now,
+                 now + ttl if ttl is not None else None)
+            )
+            self._stats["sets"] += 1
+            self._evict(conn)
+            conn.commit()
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete an entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if the entry existed
+        """
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Delete all entries in this namespace"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            conn.commit()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+        return row is not None and (row[0] is None or time.time() < row[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for this instance and namespace
+
+        Returns:
+            dict: hits, misses, sets, evictions, hit_rate, entries, bytes
+        """
+        with self._lock:
+            entries, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+            stats = dict(self._stats)
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = entries
+        stats["bytes"] = size
+        return stats
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite file and create the table on first use (lock held)"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_lru "
+                "ON cache_entries(namespace, accessed_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then least recently used ones over the limits"""
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        cursor = conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL "
+            "AND expires_at <= ?",
+            (self.namespace, time.time())
+        )
+        evicted = cursor.rowcount
+
+        entries, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()
+
+        over_entries = self.max_entries is not None and entries > self.max_entries
+        over_bytes = self.max_bytes is not None and size > self.max_bytes
+        if over_entries or over_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY accessed_at",
+                (self.namespace,)
+            ).fetchall()
+
+            doomed = []
+            for key, row_size in rows:
+                if not over_entries and not over_bytes:
+                    break
+                doomed.append((self.namespace, key))
+                entries -= 1
+                size -= row_size
+                over_entries = self.max_entries is not None and entries > self.max_entries
+                over_bytes = self.max_bytes is not None and size > self.max_bytes
+
+            conn.executemany(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", doomed
+            )
+            evicted += len(doomed)
+
+        self._stats["evictions"] += evicted
@@ -0,0 +1,187 @@
+"""
+LLM Response Cache for InsightCosmos
+
+Persists LLM responses so retries, dry-runs and development reruns with
+identical inputs do not spend tokens again.
+
+Classes:
+    LLMResponseCache: Response cache keyed by agent, model, prompt and input
+
+Cache key:
+    (agent name, model, SHA-256 of the agent instruction, SHA-256 of the
+    user input). Editing a prompt template or changing the model therefore
+    never serves an old response.
+
+Usage:
+    from src.utils.llm_cache import LLMResponseCache
+
+    llm_cache = LLMResponseCache.from_config(config)
+
+    response = llm_cache.get(agent, user_input)
+    if response is None:
+        response = await call_llm(user_input)
+        llm_cache.set(agent, user_input, response)
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import logging
+
+from src.utils.disk_cache import DiskCache
+from src.utils.logger import Logger
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Disk-persisted LLM response cache
+
+    Any object with DiskCache's ``get`` / ``set`` / ``stats`` / ``close``
+    methods can be plugged in as the backend.
+
+    Attributes:
+        cache (DiskCache): Storage backend
+        bypass (bool): Skip lookups (responses are still stored, so a
+            bypassed run refreshes the cache)
+
+    Example:
+        >>> llm_cache = LLMResponseCache(DiskCache("data/cache/cache.db", namespace="llm_responses"))
+        >>> llm_cache.set(agent, "prompt", "response")
+        >>> llm_cache.get(agent, "prompt")
+        'response'
+    """
+
+    NAMESPACE = "llm_responses"
+
+    def __init__(
+        self,
+        cache: DiskCache,
+        bypass: bool = False,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            cache: Storage backend (usually a DiskCache)
+            bypass: Skip lookups but keep storing responses (default: False)
+            logger: Logger instance (optional)
+        """
+        self.cache = cache
+        self.bypass = bypass
+        self.logger = logger or Logger.get_logger("LLMResponseCache")
+        self._bypassed = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["LLMResponseCache"]:
+        """
+        Create the cache from configuration
+
+        Uses ``llm_responses`` in ``<cache_dir>/cache.db`` with
+        ``config.llm_cache_ttl_hours`` as TTL and ``config.llm_cache_bypass``
+        as bypass flag.
+
+        Args:
+            config: Configuration instance
+
+        Returns:
+            Optional[LLMResponseCache]: Cache, or None if disabled (TTL of 0)
+
+        Example:
+            >>> llm_cache = LLMResponseCache.from_config(Config.load())
+        """
+        if config.llm_cache_ttl_hours <= 0:
+            return None
+
+        cache = DiskCache(
+            Path(config.cache_dir) / "cache.db",
+            namespace=cls.NAMESPACE,
+            ttl_seconds=config.llm_cache_ttl_hours * 3600,
+            max_bytes=256 * 1024 * 1024
+        )
+        return cls(cache, bypass=config.llm_cache_bypass)
+
+    @staticmethod
+    def make_key(agent_name: str, model: str, instruction: str, user_input: str) -> str:
+        """
+        Build a cache key
+
+        Args:
+            agent_name: Agent name
+            model: Model name
+            instruction: Agent instruction (rendered prompt template)
+            user_input: User message sent to the agent
+
+        Returns:
+            str: Cache key
+        """
+        return f"{agent_name}:{model}:{_sha256(instruction)}:{_sha256(user_input)}"
+
+    def key_for(self, agent: Any, user_input: str) -> str:
+        """
+        Build the cache key for an ADK agent and its input
+
+        Args:
+            agent: LlmAgent (name, model and instruction are used)
+            user_input: User message sent to the agent
+
+        Returns:
+            str: Cache key
+        """
+        return self.make_key(
+            str(getattr(agent, "name", "")),
+            str(getattr(agent, "model", "")),
+            str(getattr(agent, "instruction", "")),
+            user_input
+        )
+
+    def get(self, agent: Any, user_input: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            agent: LlmAgent that would answer
+            user_input: User message
+
+        Returns:
+            Optional[str]: Cached response, or None on a miss or when bypassed
+        """
+        if self.bypass:
+            self._bypassed += 1
+            return None
+
+        response = self.cache.get(self.key_for(agent, user_input))
+        if response is not None:
+            self.logger.debug(f"LLM cache hit for {getattr(agent, 'name', 'agent')}")
+        return response
+
+    def set(self, agent: Any, user_input: str, response: str) -> None:
+        """
+        Store a response (empty responses are not cached)
+
+        Args:
+            agent: LlmAgent that answered
+            user_input: User message
+            response: Response text
+        """
+        if response:
+            self.cache.set(self.key_for(agent, user_input), response)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Backend statistics plus ``bypassed`` lookups
+        """
+        stats = self.cache.stats()
+        stats["bypassed"] = self._bypassed
+        return stats
+
+    def close(self) -> None:
+        """Close the storage backend"""
+        self.cache.close()
@@ -0,0 +1,285 @@
+"""
+Search Result Cache for InsightCosmos
+
+Persists search results so repeated and retried queries within a freshness
+window do not spend search (grounding) quota again.
+
+Classes:
+    SearchResultCache: Stale-while-revalidate cache for search results
+
+Functions:
+    normalize_query: Canonical form of a query for cache keys
+
+Freshness:
+    - Younger than ``fresh_seconds``: served from the cache
+    - Older, but within a further ``stale_seconds``: served from the cache
+      while a background thread re-runs the search and replaces the entry
+    - Older than both: a miss, the caller searches synchronously
+    Only successful results are cached.
+
+Usage:
+    from src.utils.search_cache import SearchResultCache
+
+    search_cache = SearchResultCache.from_config(config)
+
+    key = search_cache.make_key("grounding", model, query, max_results=10)
+    result, stale = search_cache.lookup(key)
+    if result is None:
+        result = search(query)
+        search_cache.store(key, result)
+    elif stale:
+        search_cache.revalidate(key, lambda: search(query))
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+import threading
+
+from src.utils.disk_cache import DiskCache
+from src.utils.logger import Logger
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query so near-identical queries share a cache entry
+
+    Only case-folds and collapses whitespace. Term order, quotes and
+    operators (``"exact phrase"``, ``-term``, ``site:``) change the results,
+    so they are kept.
+
+    Args:
+        query: Search query
+
+    Returns:
+        str: Normalized query
+
+    Example:
+        >>> normalize_query('  Humanoid "Figure AI"   -Tesla ')
+        'humanoid "figure ai" -tesla'
+    """
+    return " ".join((query or "").casefold().split())
+
+
+class SearchResultCache:
+    """
+    Persistent search result cache with stale-while-revalidate
+
+    Entries are stored with a TTL of ``fresh_seconds + stale_seconds``;
+    whether an entry is fresh or stale is decided by its age.
+
+    Attributes:
+        cache (DiskCache): Storage backend
+        fresh_seconds (float): Age up to which entries are served as is
+        stale_seconds (float): Extra age during which entries are served
+            while being refreshed in the background
+
+    Example:
+        >>> search_cache = SearchResultCache(
+        ...     DiskCache("data/cache/cache.db", namespace="search_results"),
+        ...     fresh_seconds=12 * 3600, stale_seconds=24 * 3600
+        ... )
+        >>> result, stale = search_cache.lookup(key)
+    """
+
+    NAMESPACE = "search_results"
+
+    def __init__(
+        self,
+        cache: DiskCache,
+        fresh_seconds: float,
+        stale_seconds: float = 0.0,
+        max_workers: int = 2,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            cache: Storage backend (usually a DiskCache)
+            fresh_seconds: Freshness window in seconds
+            stale_seconds: Stale-while-revalidate window in seconds (default: 0)
+            max_workers: Background revalidation threads (default: 2)
+            logger: Logger instance (optional)
+        """
+        self.cache = cache
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self.logger = logger or Logger.get_logger("SearchResultCache")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="search-revalidate"
+        )
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self._closed = False
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "revalidation_failures": 0,
+        }
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["SearchResultCache"]:
+        """
+        Create the cache from configuration
+
+        Uses ``search_results`` in ``<cache_dir>/cache.db`` with
+        ``config.search_cache_ttl_hours`` as freshness window and
+        ``config.search_cache_stale_hours`` as stale window.
+
+        Args:
+            config: Configuration instance
+
+        Returns:
+            Optional[SearchResultCache]: Cache, or None if disabled (TTL of 0)
+
+        Example:
+            >>> search_cache = SearchResultCache.from_config(Config.load())
+        """
+        if config.search_cache_ttl_hours <= 0:
+            return None
+
+        cache = DiskCache(
+            Path(config.cache_dir) / "cache.db",
+            namespace=cls.NAMESPACE,
+            max_entries=5000
+        )
+        return cls(
+            cache,
+            fresh_seconds=config.search_cache_ttl_hours * 3600,
+            stale_seconds=config.search_cache_stale_hours * 3600
+        )
+
+    @staticmethod
+    def make_key(provider: str, model: str, query: str, **params: Any) -> str:
+        """
+        Build a cache key
+
+        Args:
+            provider: Search backend (e.g. "grounding", "custom_search")
+            model: Model or engine the results come from
+            query: Search query (normalized with normalize_query)
+            **params: Other request parameters (max_results, language, ...)
+
+        Returns:
+            str: Cache key
+
+        Example:
+            >>> SearchResultCache.make_key("grounding", "gemini-2.5-flash", "AI  Agents", max_results=5)
+            'grounding:gemini-2.5-flash:ai agents:max_results=5'
+        """
+        options = ",".join(f"{name}={params[name]}" for name in sorted(params))
+        return f"{provider}:{model}:{normalize_query(query)}:{options}"
+
+    def lookup(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple[Optional[dict], bool]: Cached result (None on a miss) and
+                whether it is stale and should be revalidated
+        """
+        entry = self.cache.get_entry(key)
+
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None, False
+
+            stale = entry.age >= self.fresh_seconds
+            self._stats["stale_hits" if stale else "hits"] += 1
+
+        self.logger.debug(f"Search cache {'stale hit' if stale else 'hit'}: {key}")
+        return entry.value, stale
+
+    def store(self, key: str, result: Dict[str, Any]) -> bool:
+        """
+        Store a result (only successful results are cached)
+
+        Args:
+            key: Cache key
+            result: Search result dictionary
+
+        Returns:
+            bool: True if the result was stored
+        """
+        if result.get("status") != "success":
+            return False
+
+        self.cache.set(key, result, ttl_seconds=self.fresh_seconds + self.stale_seconds)
+        return True
+
+    def revalidate(
+        self,
+        key: str,
+        search: Callable[[], Dict[str, Any]]
+    ) -> Optional[Future]:
+        """
+        Re-run a search in the background and replace the cached result
+
+        At most one revalidation per key runs at a time; a failed search
+        leaves the stale entry in place.
+
+        Args:
+            key: Cache key
+            search: Callable performing the search synchronously
+
+        Returns:
+            Optional[Future]: Future of the refresh, or None if one is
+                already running or the cache is closed
+        """
+        with self._lock:
+            if self._closed or key in self._refreshing:
+                return None
+            self._refreshing.add(key)
+            self._stats["revalidations"] += 1
+
+        return self._executor.submit(self._refresh, key, search)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            dict: hits, stale_hits, misses, revalidations,
+                revalidation_failures, hit_rate (fresh and stale hits),
+                entries and bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        )
+        backend = self.cache.stats()
+        stats["entries"] = backend.get("entries", 0)
+        stats["bytes"] = backend.get("bytes", 0)
+        return stats
+
+    def close(self) -> None:
+        """Wait for running revalidations and close the storage backend"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+        self.cache.close()
+
+    def _refresh(self, key: str, search: Callable[[], Dict[str, Any]]) -> None:
+        """Run one revalidation (executor thread)"""
+        try:
+            if not self.store(key, search()):
+                raise RuntimeError("search returned no successful result")
+        except Exception as e:
+            with self._lock:
+                self._stats["revalidation_failures"] += 1
+            self.logger.warning(f"Search cache revalidation failed for {key}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -0,0 +1,104 @@
+"""
+URL Utilities for InsightCosmos
+
+Functions:
+    normalize_url: Canonical form of a URL for cache keys and deduplication
+    is_redirect_url: Whether a URL is an opaque redirect (e.g. grounding links)
+
+Usage:
+    from src.utils.url_utils import normalize_url
+
+    normalize_url("HTTPS://Example.com:443/a/?utm_source=x&b=2&a=1#top")
+    # 'https://example.com/a/?a=1&b=2'
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# Query parameters that only track the referrer and never change the content
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid",
+    "igshid", "ref_src", "_ga", "yclid",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+# Hosts whose URLs only redirect to the real article
+REDIRECT_HOSTS = frozenset({
+    "vertexaisearch.cloud.google.com",
+})
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so equivalent addresses map to the same string
+
+    - Lowercases scheme and host and drops default ports (``www.`` is kept,
+      since it can serve different content)
+    - Removes the fragment and tracking parameters (utm_*, fbclid, ...)
+    - Sorts the remaining query parameters
+    - Uses "/" for an empty path
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        str: Normalized URL (input returned stripped if it cannot be parsed)
+
+    Example:
+        >>> normalize_url("https://Example.com/post?utm_source=rss&id=7#comments")
+        'https://example.com/post?id=7'
+    """
+    url = (url or "").strip()
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if not scheme or not parts.netloc:
+        return url
+
+    host = (parts.hostname or "").lower()
+    if port and _DEFAULT_PORTS.get(scheme) != port:
+        host = f"{host}:{port}"
+    if parts.username:
+        userinfo = parts.username + (f":{parts.password}" if parts.password else "")
+        host = f"{userinfo}@{host}"
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def is_redirect_url(url: str) -> bool:
+    """
+    Check whether a URL is an opaque redirect to the real article
+
+    Google Search Grounding returns ``vertexaisearch.cloud.google.com``
+    redirect links instead of article URLs.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        bool: True if the URL host is in REDIRECT_HOSTS
+
+    Example:
+        >>> is_redirect_url("https://vertexaisearch.cloud.google.com/grounding-api-redirect/AUZIYQ")
+        True
+    """
+    try:
+        host = (urlsplit((url or "").strip()).hostname or "").lower()
+    except ValueError:
+        return False
+    return host in REDIRECT_HOSTS
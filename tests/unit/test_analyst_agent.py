@@ -25,7 +25,8 @@ from datetime import datetime
 
 from src.agents.analyst_agent import (
     create_analyst_agent,
-    AnalystAgentRunner
+    AnalystAgentRunner,
+    EmbeddingBatcher
 )
 from src.utils.config import Config
 
@@ -476,6 +477,339 @@ class TestAnalystAgentIntegration:
 
         assert result['status'] == 'skipped'
         assert result['article_id'] == 1
+        # The stored analysis is never read, so it is left unparsed
+        mock_article_store.get_by_id.assert_called_once_with(1, parse_analysis=False)
+
+    @pytest.mark.asyncio
+    async def test_analyze_article_with_write_queue(self, runner, mock_article_store, mock_embedding_store):
+        """Test results go to the write-behind queue instead of the stores"""
+        runner.write_queue = Mock()
+        mock_llm_response = json.dumps({
+            "summary": "Queued analysis.",
+            "key_insights": ["insight"],
+            "priority_score": 0.7,
+            "relevance_score": 0.7
+        })
+
+        with patch.object(runner, '_invoke_llm', new_callable=AsyncMock) as mock_invoke, \
+                patch.object(runner, '_generate_embedding', new_callable=AsyncMock) as mock_embed:
+            mock_invoke.return_value = mock_llm_response
+            mock_embed.return_value = [0.1] * 768
+
+            result = await runner.analyze_article(article_id=1, skip_if_analyzed=False)
+
+        assert result['status'] == 'success'
+        assert result['embedding_id'] is None
+        runner.write_queue.submit_result.assert_called_once()
+        kwargs = runner.write_queue.submit_result.call_args.kwargs
+        assert kwargs['article_id'] == 1
+        assert len(kwargs['vector']) == 768
+        mock_article_store.update_analysis.assert_not_called()
+        mock_embedding_store.store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invoke_llm_reuses_runner_and_deletes_sessions(self, runner):
+        """One ADK Runner serves all calls; sessions are removed afterwards"""
+        seen_sessions = []
+
+        def fake_run_async(user_id, session_id, new_message):
+            seen_sessions.append(
+                session_id in runner.session_service.sessions[runner.app_name][user_id]
+                and runner.session_stats()["active_sessions"] == 1
+            )
+
+            async def events():
+                event = Mock()
+                event.is_final_response.return_value = True
+                event.content.parts = [Mock(text='{"summary": "ok"}')]
+                yield event
+
+            return events()
+
+        with patch("src.agents.analyst_agent.Runner") as mock_runner_class:
+            mock_runner_class.return_value.run_async.side_effect = fake_run_async
+
+            assert await runner._invoke_llm(1, "first") == '{"summary": "ok"}'
+            assert await runner._invoke_llm(2, "second") == '{"summary": "ok"}'
+
+            mock_runner_class.return_value.run_async.side_effect = Exception("boom")
+            with pytest.raises(RuntimeError):
+                await runner._invoke_llm(3, "third")
+
+        assert mock_runner_class.call_count == 1
+        assert seen_sessions == [True, True]
+        stats = runner.session_stats()
+        assert stats["sessions_created"] == 3
+        assert stats["sessions_deleted"] == 3
+        assert stats["active_sessions"] == 0
+        assert stats["active_events"] == 0
+        assert stats["peak_active_sessions"] == 1
+
+
+class _StubModels:
+    """Local stand-in for genai Client.models recording embed_content calls"""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def embed_content(self, model, contents):
+        import threading
+        self.calls.append((model, list(contents), threading.current_thread().name))
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        return Mock(embeddings=[Mock(values=[float(len(text))]) for text in contents])
+
+
+class _StubClient:
+    def __init__(self, fail=False):
+        self.models = _StubModels(fail)
+
+
+class TestEmbeddingBatcher:
+    """Test EmbeddingBatcher against a local stub client"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_texts_share_one_request(self):
+        """Concurrent embeds are sent as one multi-content request off the loop"""
+        import asyncio
+        import threading
+
+        client = _StubClient()
+        batcher = EmbeddingBatcher(client, max_wait=0.01)
+        texts = ["a", "bb", "ccc", "dddd"]
+
+        vectors = await asyncio.gather(*[batcher.embed(t) for t in texts])
+
+        assert vectors == [[1.0], [2.0], [3.0], [4.0]]
+        assert len(client.models.calls) == 1
+        model, contents, thread_name = client.models.calls[0]
+        assert model == "text-embedding-004"
+        assert contents == texts
+        assert thread_name != threading.current_thread().name
+        assert batcher.stats() == {"texts": 4, "requests": 1, "failed_requests": 0}
+
+    @pytest.mark.asyncio
+    async def test_batches_split_at_max_batch_size(self):
+        """A full batch is sent immediately; the rest follows"""
+        import asyncio
+
+        client = _StubClient()
+        batcher = EmbeddingBatcher(client, max_batch_size=3, max_wait=0.01)
+
+        vectors = await asyncio.gather(*[batcher.embed("x" * n) for n in range(1, 8)])
+
+        assert vectors == [[float(n)] for n in range(1, 8)]
+        assert [len(call[1]) for call in client.models.calls] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_staggered_analyses_share_one_request(self):
+        """Texts arriving seconds apart (scaled down) still share one request"""
+        import asyncio
+
+        client = _StubClient()
+        # Window tuned to analysis latency: longer than the spread of finishes
+        batcher = EmbeddingBatcher(client, max_wait=0.5)
+
+        async def analysis(i):
+            await asyncio.sleep(0.05 * i)  # LLM calls finish one after another
+            return await batcher.embed("x" * (i + 1))
+
+        vectors = await asyncio.gather(*[analysis(i) for i in range(5)])
+
+        assert vectors == [[float(n)] for n in range(1, 6)]
+        assert len(client.models.calls) == 1
+        assert batcher.stats()["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_participants_flush_before_the_window_ends(self):
+        """Once every registered analysis waits, the batch is sent right away"""
+        import asyncio
+        import time
+
+        client = _StubClient()
+        batcher = EmbeddingBatcher(client, max_wait=30.0)
+
+        async def analysis(i):
+            with batcher.participant():
+                await asyncio.sleep(0.05 * i)
+                return await batcher.embed("x" * (i + 1))
+
+        started = time.monotonic()
+        vectors = await asyncio.wait_for(
+            asyncio.gather(*[analysis(i) for i in range(5)]), timeout=5
+        )
+
+        assert vectors == [[float(n)] for n in range(1, 6)]
+        assert len(client.models.calls) == 1
+        assert time.monotonic() - started < 5
+
+    @pytest.mark.asyncio
+    async def test_finished_participant_releases_waiting_texts(self):
+        """An analysis that ends without embedding no longer holds the batch"""
+        import asyncio
+
+        client = _StubClient()
+        batcher = EmbeddingBatcher(client, max_wait=30.0)
+
+        async def embeds():
+            with batcher.participant():
+                return await batcher.embed("abc")
+
+        async def fails():
+            with batcher.participant():
+                await asyncio.sleep(0.05)
+                raise RuntimeError("LLM timeout")
+
+        results = await asyncio.wait_for(
+            asyncio.gather(embeds(), fails(), return_exceptions=True), timeout=5
+        )
+
+        assert results[0] == [3.0]
+        assert isinstance(results[1], RuntimeError)
+        assert len(client.models.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_embeds_beyond_llm_concurrency(self):
+        """analyze_batch limits LLM calls, not the size of embedding batches"""
+        import asyncio
+
+        config = Mock(spec=Config)
+        config.google_api_key = "test_key"
+        article_store = Mock()
+        article_store.get_by_id.side_effect = lambda aid, parse_analysis=True: {
+            "id": aid, "title": f"Article {aid}", "content": "text", "status": "pending"
+        }
+        with patch("src.agents.analyst_agent.Client", return_value=_StubClient()):
+            runner = AnalystAgentRunner(
+                agent=Mock(), article_store=article_store, embedding_store=Mock(),
+                config=config, embedding_batch_wait=30.0
+            )
+
+        active = {"now": 0, "peak": 0}
+
+        async def fake_llm(article_id, user_input):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.02 * article_id)
+            active["now"] -= 1
+            return json.dumps({
+                "summary": f"Summary {article_id}", "key_insights": ["insight"],
+                "relevance_score": 0.5, "priority_score": 0.5, "reasoning": "ok"
+            })
+
+        with patch.object(runner, "_invoke_llm", side_effect=fake_llm):
+            result = await asyncio.wait_for(
+                runner.analyze_batch(list(range(1, 7)), max_concurrent=2), timeout=5
+            )
+
+        assert result["succeeded"] == 6
+        assert active["peak"] == 2
+        calls = runner.genai_client.models.calls
+        assert len(calls) == 1
+        assert len(calls[0][1]) == 6
+
+    @pytest.mark.asyncio
+    async def test_failed_request_raises_for_every_caller(self):
+        """A failed request is reported to each text in the batch"""
+        import asyncio
+
+        batcher = EmbeddingBatcher(_StubClient(fail=True), max_wait=0.01)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.stats()["failed_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_runner_generate_embedding_uses_batcher(self):
+        """_generate_embedding batches and returns None on failure"""
+        import asyncio
+
+        config = Mock(spec=Config)
+        config.google_api_key = "test_key"
+        with patch("src.agents.analyst_agent.Client", return_value=_StubClient()):
+            runner = AnalystAgentRunner(
+                agent=Mock(), article_store=Mock(), embedding_store=Mock(), config=config
+            )
+
+        vectors = await asyncio.gather(
+            runner._generate_embedding("one"), runner._generate_embedding("three")
+        )
+        assert vectors == [[3.0], [5.0]]
+        assert len(runner.genai_client.models.calls) == 1
+
+        runner.genai_client.models.fail = True
+        assert await runner._generate_embedding("text") is None
+
+    @pytest.mark.asyncio
+    async def test_embedding_cache_skips_repeated_text(self, tmp_path):
+        """Identical text (modulo whitespace) is embedded once per model"""
+        from src.utils.disk_cache import DiskCache
+
+        config = Mock(spec=Config)
+        config.google_api_key = "test_key"
+        cache = DiskCache(tmp_path / "cache.db", namespace="embeddings")
+        with patch("src.agents.analyst_agent.Client", return_value=_StubClient()):
+            runner = AnalystAgentRunner(
+                agent=Mock(), article_store=Mock(), embedding_store=Mock(),
+                config=config, embedding_cache=cache
+            )
+
+        first = await runner._generate_embedding("same summary")
+        second = await runner._generate_embedding("  same   summary\n")
+        other_model = await runner._generate_embedding("same summary", model="other-model")
+
+        assert first == second == other_model == [12.0]
+        assert [call[0] for call in runner.genai_client.models.calls] == [
+            "text-embedding-004", "other-model"
+        ]
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["entries"] == 2
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_calls_run_off_the_event_loop(self):
+        """Embedding and LLM cache reads/writes run in worker threads"""
+        import threading
+
+        loop_thread = threading.current_thread()
+        cache_threads = []
+
+        def record(*args):
+            cache_threads.append(threading.current_thread())
+            return None
+
+        config = Mock(spec=Config)
+        config.google_api_key = "test_key"
+        embedding_cache = Mock(get=Mock(side_effect=record), set=Mock(side_effect=record))
+        llm_cache = Mock(get=Mock(side_effect=record), set=Mock(side_effect=record))
+        with patch("src.agents.analyst_agent.Client", return_value=_StubClient()):
+            runner = AnalystAgentRunner(
+                agent=Mock(), article_store=Mock(), embedding_store=Mock(),
+                config=config, embedding_cache=embedding_cache, llm_cache=llm_cache
+            )
+
+        await runner._generate_embedding("some summary")
+
+        def fake_run_async(user_id, session_id, new_message):
+            async def events():
+                event = Mock()
+                event.is_final_response.return_value = True
+                event.content.parts = [Mock(text='{"summary": "ok"}')]
+                yield event
+
+            return events()
+
+        with patch("src.agents.analyst_agent.Runner") as mock_runner_class:
+            mock_runner_class.return_value.run_async.side_effect = fake_run_async
+            await runner._invoke_llm(1, "input")
+
+        assert len(cache_threads) == 4
+        assert loop_thread not in cache_threads
 
 
 def test_module_imports():
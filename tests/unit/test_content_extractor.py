@@ -7,11 +7,14 @@ Author: Ray 張瑞涵
 Date: 2025-11-23
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
 
-from src.tools.content_extractor import ContentExtractor, extract_content
+from src.tools.content_extractor import ContentExtractor, DomainRateLimiter, extract_content
+from src.utils.disk_cache import DiskCache
 
 
 class TestContentExtractor:
@@ -283,12 +286,10 @@ class TestContentExtractor:
     @patch('src.tools.content_extractor.ContentExtractor.extract')
     def test_extract_batch_success(self, mock_extract):
         """測試批量提取 - 成功情況"""
-        # 模擬 extract 方法返回成功結果
-        mock_extract.side_effect = [
-            {"status": "success", "url": "https://example.com/1", "content": "Content 1"},
-            {"status": "success", "url": "https://example.com/2", "content": "Content 2"},
-            {"status": "success", "url": "https://example.com/3", "content": "Content 3"}
-        ]
+        # 模擬 extract 方法返回成功結果（並行執行，依 URL 回傳）
+        mock_extract.side_effect = lambda url: {
+            "status": "success", "url": url, "content": f"Content {url[-1]}"
+        }
 
         extractor = ContentExtractor()
         urls = [
@@ -306,12 +307,13 @@ class TestContentExtractor:
     @patch('src.tools.content_extractor.ContentExtractor.extract')
     def test_extract_batch_mixed_results(self, mock_extract):
         """測試批量提取 - 成功與失敗混合"""
-        # 模擬部分成功、部分失敗
-        mock_extract.side_effect = [
-            {"status": "success", "url": "https://example.com/1", "content": "Content 1"},
-            {"status": "error", "url": "https://example.com/2", "error_message": "404"},
-            {"status": "success", "url": "https://example.com/3", "content": "Content 3"}
-        ]
+        # 模擬部分成功、部分失敗（並行執行，依 URL 回傳）
+        responses = {
+            "https://example.com/1": {"status": "success", "url": "https://example.com/1", "content": "Content 1"},
+            "https://example.com/2": {"status": "error", "url": "https://example.com/2", "error_message": "404"},
+            "https://example.com/3": {"status": "success", "url": "https://example.com/3", "content": "Content 3"}
+        }
+        mock_extract.side_effect = lambda url: responses[url]
 
         extractor = ContentExtractor()
         urls = ["https://example.com/1", "https://example.com/2", "https://example.com/3"]
@@ -354,6 +356,136 @@ class TestContentExtractor:
         assert len(images) == 5
 
 
+class TestParallelExtraction:
+    """並行批量提取與每網域限速測試"""
+
+    def test_rate_limiter_per_domain(self):
+        """測試 token bucket 只限制同一網域"""
+        limiter = DomainRateLimiter(rate_per_second=10.0, burst=1)
+
+        assert limiter.acquire("https://a.example.com/1") == 0.0
+        assert limiter.acquire("https://b.example.com/1") == 0.0
+
+        start = time.monotonic()
+        waited = limiter.acquire("https://a.example.com/2")
+        assert waited > 0
+        assert time.monotonic() - start >= 0.08
+
+    def test_interleave_by_domain(self):
+        """測試 URL 依網域輪流排入工作佇列"""
+        urls = [
+            "https://a.com/1", "https://a.com/2", "https://a.com/3",
+            "https://b.com/1", "https://c.com/1", "https://b.com/2"
+        ]
+
+        order = ContentExtractor._interleave_by_domain(urls)
+
+        assert order == [0, 3, 4, 1, 5, 2]
+
+    @patch('src.tools.content_extractor.ContentExtractor._extract_with_trafilatura')
+    @patch('src.tools.content_extractor.requests.Session.get')
+    def test_extract_batch_parallel_across_domains(self, mock_get, mock_trafilatura):
+        """測試多網域批量提取為並行執行且結果依輸入順序"""
+        def slow_get(url, *args, **kwargs):
+            time.sleep(0.1)
+            response = Mock()
+            response.text = f"<html>{url}</html>"
+            return response
+
+        mock_get.side_effect = slow_get
+        mock_trafilatura.side_effect = lambda html, url: {"content": url, "title": url}
+
+        urls = [f"https://site{i % 10}.example.com/{i}" for i in range(20)]
+        extractor = ContentExtractor(max_workers=10)
+
+        start = time.monotonic()
+        results = extractor.extract_batch(urls)
+        elapsed = time.monotonic() - start
+
+        assert [r["url"] for r in results] == urls
+        assert all(r["status"] == "success" for r in results)
+        assert elapsed < 1.0  # 順序執行約需 2 秒以上
+
+    @patch('src.tools.content_extractor.ContentExtractor.extract')
+    def test_iter_extract_streams_in_completion_order(self, mock_extract):
+        """測試 iter_extract 依完成順序回傳（索引對應輸入）"""
+        def delayed(url):
+            time.sleep(0.2 if url.endswith("slow") else 0.0)
+            return {"status": "success", "url": url}
+
+        mock_extract.side_effect = delayed
+        urls = ["https://a.com/slow", "https://b.com/fast"]
+
+        streamed = list(ContentExtractor(max_workers=2).iter_extract(urls))
+
+        assert [index for index, _ in streamed] == [1, 0]
+        assert all(result["url"] == urls[index] for index, result in streamed)
+
+
+class TestContentCache:
+    """內容快取測試"""
+
+    @patch('src.tools.content_extractor.ContentExtractor._extract_with_trafilatura')
+    @patch('src.tools.content_extractor.requests.Session.get')
+    def test_cached_result_replayed_without_network(self, mock_get, mock_trafilatura, tmp_path):
+        """測試重跑時以正規化 URL 命中快取，不再連網"""
+        mock_get.return_value = Mock(text="<html>article</html>")
+        mock_trafilatura.return_value = {"content": "Cached body text", "title": "T"}
+        cache = DiskCache(tmp_path / "cache.db", namespace="content")
+
+        first = ContentExtractor(cache=cache).extract("https://example.com/a?utm_source=rss")
+        second = ContentExtractor(cache=cache).extract("https://EXAMPLE.com/a#top")
+
+        assert mock_get.call_count == 1
+        assert second["status"] == "success"
+        assert second["content"] == first["content"]
+        assert second["url"] == "https://EXAMPLE.com/a#top"
+        entry = cache.get("https://example.com/a")
+        assert entry["html"] == "<html>article</html>"
+        assert len(entry["html_sha256"]) == 64
+
+    @patch('src.tools.content_extractor.ContentExtractor._extract_with_beautifulsoup')
+    @patch('src.tools.content_extractor.ContentExtractor._extract_with_trafilatura')
+    @patch('src.tools.content_extractor.requests.Session.get')
+    def test_parse_failure_reparses_cached_html(
+        self, mock_get, mock_trafilatura, mock_bs, tmp_path
+    ):
+        """測試解析失敗時保留 HTML，重試只重新解析"""
+        mock_get.return_value = Mock(text="<html>hard to parse</html>")
+        mock_trafilatura.side_effect = Exception("no main content")
+        mock_bs.side_effect = Exception("parse error")
+        extractor = ContentExtractor(cache=DiskCache(tmp_path / "cache.db", namespace="content"))
+
+        failed = extractor.extract("https://example.com/hard")
+        assert failed["status"] == "error"
+
+        mock_trafilatura.side_effect = None
+        mock_trafilatura.return_value = {"content": "Now it works", "title": "T"}
+        retried = extractor.extract("https://example.com/hard")
+
+        assert retried["status"] == "success"
+        assert mock_get.call_count == 1
+
+    @patch('src.tools.content_extractor.requests.Session.get')
+    def test_not_found_negative_cached(self, mock_get, tmp_path):
+        """測試 404 以短 TTL 快取"""
+        response = Mock(status_code=404)
+        mock_get.return_value = Mock(
+            raise_for_status=Mock(side_effect=requests.HTTPError(response=response))
+        )
+        cache = DiskCache(tmp_path / "cache.db", namespace="content")
+        extractor = ContentExtractor(cache=cache)
+
+        extractor.extract("https://example.com/gone")
+        result = extractor.extract("https://example.com/gone")
+
+        assert result["status"] == "error"
+        assert "404" in result["error_message"]
+        assert mock_get.call_count == 1
+        entry = cache.get_entry("https://example.com/gone")
+        assert entry.expires_at - entry.stored_at == ContentExtractor.NEGATIVE_CACHE_TTL
+
+
 class TestConvenienceFunction:
     """測試便捷函式"""
 
@@ -430,3 +562,48 @@ class TestWordCount:
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+class TestProcessPoolParsing:
+    """行程池解析測試"""
+
+    HTML = (
+        "<html><head><title>Pool Article</title></head><body><article>"
+        + "<p>" + "Parsing happens in a worker process. " * 20 + "</p>"
+        + "</article></body></html>"
+    )
+
+    @patch('src.tools.content_extractor.ContentExtractor._fetch_html')
+    def test_extract_with_parse_pool_matches_in_thread(self, mock_fetch):
+        """測試行程池解析與執行緒內解析的結果格式一致"""
+        mock_fetch.return_value = self.HTML
+
+        local = ContentExtractor().extract("https://example.com/a")
+        with ContentExtractor(parse_workers=2) as extractor:
+            # 行程池在建構時以 spawn 建立，而非在工作執行緒中 fork
+            assert extractor._parse_pool is not None
+            assert extractor._parse_pool._mp_context.get_start_method() == "spawn"
+            pooled = extractor.extract("https://example.com/a")
+
+        assert pooled["status"] == "success"
+        assert set(pooled) == set(local)
+        assert pooled["content"] == local["content"]
+        assert pooled["extraction_method"] == local["extraction_method"]
+
+    @patch('src.tools.content_extractor.ContentExtractor._fetch_html')
+    def test_parse_pool_error_keeps_error_shape(self, mock_fetch):
+        """測試行程池中兩種方法都失敗時仍返回 error 結果"""
+        mock_fetch.return_value = "<html><body><p>short</p></body></html>"
+
+        with ContentExtractor(parse_workers=1) as extractor:
+            result = extractor.extract("https://example.com/short")
+
+        assert result["status"] == "error"
+        assert "Both extraction methods failed" in result["error_message"]
+
+    def test_parse_workers_default_disabled(self):
+        """測試預設不建立行程池"""
+        extractor = ContentExtractor()
+
+        assert extractor.parse_workers == 0
+        assert extractor._get_parse_pool() is None
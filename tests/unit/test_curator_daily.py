@@ -19,7 +19,7 @@ Unit Tests for Curator Daily Agent
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import date, datetime, timedelta
 
 from src.agents.curator_daily import (
@@ -326,6 +326,80 @@ class TestCuratorDailyRunner:
             assert digest['total_articles'] == 2
             assert len(digest['top_articles']) == 2
 
+    def test_invoke_llm_uses_response_cache(self, mock_config, mock_article_store, tmp_path):
+        """測試相同輸入第二次直接使用 LLM 回應快取，不再呼叫 Runner"""
+        from src.utils.disk_cache import DiskCache
+        from src.utils.llm_cache import LLMResponseCache
+
+        llm_cache = LLMResponseCache(DiskCache(tmp_path / "cache.db", namespace="llm"))
+        agent = create_curator_agent(mock_config)
+        runner = CuratorDailyRunner(
+            agent=agent,
+            article_store=mock_article_store,
+            config=mock_config,
+            llm_cache=llm_cache
+        )
+
+        calls = []
+
+        def fake_run_async(user_id, session_id, new_message):
+            calls.append(session_id)
+
+            async def events():
+                event = Mock()
+                event.is_final_response.return_value = True
+                event.content.parts = [Mock(text=' {"date": "2025-11-24"} ')]
+                yield event
+
+            return events()
+
+        runner.runner = Mock()
+        runner.runner.run_async.side_effect = fake_run_async
+
+        assert runner._invoke_llm("same input") == '{"date": "2025-11-24"}'
+        runner.session_service = Mock(create_session=AsyncMock())
+        assert runner._invoke_llm("same input") == '{"date": "2025-11-24"}'
+
+        assert len(calls) == 1
+        runner.session_service.create_session.assert_not_called()
+        llm_cache.close()
+
+    def test_llm_cache_calls_run_off_the_event_loop(self, mock_config, mock_article_store):
+        """測試 LLM 快取讀寫在工作執行緒執行，不阻塞事件迴圈"""
+        import threading
+
+        caller_thread = threading.current_thread()
+        cache_threads = []
+
+        def record(*args):
+            cache_threads.append(threading.current_thread())
+            return None
+
+        llm_cache = Mock(get=Mock(side_effect=record), set=Mock(side_effect=record))
+        agent = create_curator_agent(mock_config)
+        runner = CuratorDailyRunner(
+            agent=agent,
+            article_store=mock_article_store,
+            config=mock_config,
+            llm_cache=llm_cache
+        )
+
+        def fake_run_async(user_id, session_id, new_message):
+            async def events():
+                event = Mock()
+                event.is_final_response.return_value = True
+                event.content.parts = [Mock(text='{"date": "2025-11-24"}')]
+                yield event
+
+            return events()
+
+        runner.runner = Mock()
+        runner.runner.run_async.side_effect = fake_run_async
+
+        assert runner._invoke_llm("input") == '{"date": "2025-11-24"}'
+        assert len(cache_threads) == 2
+        assert caller_thread not in cache_threads
+
     def test_generate_digest_empty_articles(self, mock_config, mock_article_store):
         """測試空文章列表時生成報告"""
         agent = create_curator_agent(mock_config)
@@ -794,5 +868,6 @@ class TestCuratorTimeFilter:
                 limit=30,  # 10 * 3
                 status='analyzed',
                 fetched_after=period_start,
-                fetched_before=period_end
+                fetched_before=period_end,
+                fields=ArticleStore.LISTING_FIELDS + ('analysis',)
             )
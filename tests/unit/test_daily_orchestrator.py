@@ -4,6 +4,7 @@
 測試 DailyPipelineOrchestrator 類的核心邏輯。
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime
@@ -20,7 +21,7 @@ from src.memory.database import Database
 
 
 @pytest.fixture
-def mock_config():
+def mock_config(tmp_path):
     """創建 Mock 配置對象"""
     config = Mock(spec=Config)
     config.database_path = ":memory:"
@@ -29,6 +30,14 @@ def mock_config():
     config.email_password = "test_password"
     config.user_name = "Test User"
     config.user_interests = "AI, Robotics"
+    config.extraction_parse_workers = 0
+    config.analysis_concurrency = 5
+    config.embedding_batch_size = 100
+    config.embedding_batch_wait_seconds = 30.0
+    config.cache_dir = str(tmp_path / "cache")
+    config.llm_cache_ttl_hours = 168
+    config.llm_cache_bypass = False
+    config.scout_mode = "fast"
     return config
 
 
@@ -172,14 +181,20 @@ class TestDailyPipelineOrchestrator:
                 mock_create_agent.return_value = Mock()
 
                 # Mock article_store
-                orchestrator.article_store.get_by_url.return_value = None
-                orchestrator.article_store.store_article.side_effect = [1, 2]
+                orchestrator.article_store.bulk_upsert.return_value = [1, 2]
 
                 collected, stored = orchestrator._run_phase1_scout()
 
                 assert collected == 2
                 assert stored == 2
-                assert orchestrator.article_store.store_article.call_count == 2
+                orchestrator.article_store.bulk_upsert.assert_called_once()
+                batch = orchestrator.article_store.bulk_upsert.call_args[0][0]
+                assert [a["url"] for a in batch] == [
+                    "https://example.com/article1",
+                    "https://example.com/article2"
+                ]
+                assert all(a["status"] == "collected" for a in batch)
+                assert batch[0]["published_at"].year == 2025
 
     def test_run_phase1_scout_with_duplicates(self, orchestrator):
         """測試 Phase 1: Scout 有重複文章"""
@@ -212,17 +227,13 @@ class TestDailyPipelineOrchestrator:
                 mock_create_agent.return_value = Mock()
 
                 # 第一篇已存在，第二篇是新的
-                orchestrator.article_store.get_by_url.side_effect = [
-                    {"id": 1, "url": "https://example.com/article1"},  # 已存在
-                    None  # 不存在
-                ]
-                orchestrator.article_store.store_article.return_value = 2
+                orchestrator.article_store.bulk_upsert.return_value = [2]
 
                 collected, stored = orchestrator._run_phase1_scout()
 
                 assert collected == 2
                 assert stored == 1  # 只有 1 篇新文章
-                assert orchestrator.article_store.store_article.call_count == 1
+                orchestrator.article_store.store_article.assert_not_called()
 
     def test_run_phase1_scout_failure(self, orchestrator):
         """測試 Phase 1: Scout 失敗"""
@@ -262,15 +273,16 @@ class TestDailyPipelineOrchestrator:
         orchestrator.article_store.get_by_status.return_value = pending_articles
 
         # Mock content extraction (lazy import 位置)
-        with patch("src.tools.content_extractor.extract_content") as mock_extract:
-            mock_extract.return_value = {
-                "status": "success",
-                "content": "Full article content"
-            }
+        with patch("src.tools.content_extractor.ContentExtractor") as mock_extractor_class:
+            mock_extractor = mock_extractor_class.return_value
+            mock_extractor.iter_extract.side_effect = lambda urls: iter([
+                (i, {"status": "success", "content": "Full article content"})
+                for i in range(len(urls))
+            ])
 
             # Mock AnalystAgentRunner (lazy import 位置)
             with patch("src.agents.analyst_agent.AnalystAgentRunner") as mock_runner_class:
-                mock_runner = Mock()
+                mock_runner = MagicMock()
                 # analyze_article 是 async 方法，返回 coroutine
                 async def mock_analyze(*args, **kwargs):
                     return {
@@ -286,7 +298,11 @@ class TestDailyPipelineOrchestrator:
                     analyzed_count = orchestrator._run_phase2_analyst()
 
                     assert analyzed_count == 2
-                    assert mock_extract.call_count == 2
+                    mock_extractor_class.assert_called_once()
+                    mock_extractor.iter_extract.assert_called_once_with([
+                        "https://example.com/article1",
+                        "https://example.com/article2"
+                    ])
 
     def test_run_phase2_analyst_partial_failure(self, orchestrator):
         """測試 Phase 2: Analyst 部分失敗"""
@@ -297,15 +313,15 @@ class TestDailyPipelineOrchestrator:
 
         orchestrator.article_store.get_by_status.return_value = pending_articles
 
-        with patch("src.tools.content_extractor.extract_content") as mock_extract:
-            # 第一篇提取失敗，第二篇成功
-            mock_extract.side_effect = [
-                {"status": "error", "error_message": "Extraction failed"},
-                {"status": "success", "content": "Full content"}
-            ]
+        with patch("src.tools.content_extractor.ContentExtractor") as mock_extractor_class:
+            # 第二篇先完成且成功，第一篇提取失敗
+            mock_extractor_class.return_value.iter_extract.return_value = iter([
+                (1, {"status": "success", "content": "Full content"}),
+                (0, {"status": "error", "error_message": "Extraction failed"})
+            ])
 
             with patch("src.agents.analyst_agent.AnalystAgentRunner") as mock_runner_class:
-                mock_runner = Mock()
+                mock_runner = MagicMock()
                 async def mock_analyze(*args, **kwargs):
                     return {
                         "status": "success",
@@ -320,6 +336,112 @@ class TestDailyPipelineOrchestrator:
                     analyzed_count = orchestrator._run_phase2_analyst()
 
                     assert analyzed_count == 1  # 只有 1 篇成功
+                    orchestrator.article_store.update_status.assert_called_once_with(
+                        1, "extraction_failed"
+                    )
+
+    def test_run_phase2_analyst_concurrent_and_isolated(self, orchestrator):
+        """測試 Phase 2: 分析並行執行，單篇失敗不影響其他文章"""
+        pending_articles = [
+            {"id": i, "url": f"https://example.com/article{i}", "title": f"Test Article {i}"}
+            for i in range(1, 6)
+        ]
+        orchestrator.article_store.get_by_status.return_value = pending_articles
+
+        with patch("src.tools.content_extractor.ContentExtractor") as mock_extractor_class:
+            mock_extractor_class.return_value.iter_extract.side_effect = lambda urls: iter([
+                (i, {"status": "success", "content": "Full content"})
+                for i in range(len(urls))
+            ])
+
+            with patch("src.agents.analyst_agent.AnalystAgentRunner") as mock_runner_class:
+                active = {"now": 0, "peak": 0}
+
+                async def mock_analyze(article_id, llm_slots, **kwargs):
+                    async with llm_slots:
+                        active["now"] += 1
+                        active["peak"] = max(active["peak"], active["now"])
+                        await asyncio.sleep(0.05)
+                        active["now"] -= 1
+                    if article_id == 3:
+                        raise RuntimeError("LLM timeout")
+                    return {"status": "success", "priority_score": 0.5}
+
+                mock_runner_class.return_value.analyze_article = mock_analyze
+
+                with patch("src.agents.analyst_agent.create_analyst_agent"):
+                    orchestrator.config.analysis_concurrency = 2
+                    analyzed_count = orchestrator._run_phase2_analyst()
+
+        assert analyzed_count == 4
+        assert active["peak"] == 2
+        assert len(orchestrator.stats["errors"]) == 1
+
+    def test_run_phase2_analyst_store_writes_off_event_loop(self, orchestrator):
+        """測試 Phase 2: 內容與狀態寫入在工作執行緒執行，不阻塞事件迴圈"""
+        import threading
+
+        pending_articles = [
+            {"id": 1, "url": "https://example.com/article1", "title": "Test Article 1"},
+            {"id": 2, "url": "https://example.com/article2", "title": "Test Article 2"}
+        ]
+        orchestrator.article_store.get_by_status.return_value = pending_articles
+
+        loop_threads = []
+        write_threads = []
+        orchestrator.article_store.update.side_effect = \
+            lambda *args, **kwargs: write_threads.append(threading.current_thread())
+        orchestrator.article_store.update_status.side_effect = \
+            lambda *args, **kwargs: write_threads.append(threading.current_thread())
+
+        with patch("src.tools.content_extractor.ContentExtractor") as mock_extractor_class, \
+                patch("src.agents.analyst_agent.AnalystAgentRunner") as mock_runner_class, \
+                patch("src.agents.analyst_agent.create_analyst_agent"):
+            mock_extractor_class.return_value.iter_extract.return_value = iter([
+                (0, {"status": "success", "content": "Full content"}),
+                (1, {"status": "error", "error_message": "Extraction failed"})
+            ])
+
+            async def mock_analyze(article_id, **kwargs):
+                loop_threads.append(threading.current_thread())
+                return {"status": "success", "priority_score": 0.5}
+
+            mock_runner_class.return_value.analyze_article = mock_analyze
+
+            analyzed_count = orchestrator._run_phase2_analyst()
+
+        assert analyzed_count == 1
+        assert len(write_threads) == 2
+        assert loop_threads[0] not in write_threads
+
+    def test_run_phase2_analyst_discounts_failed_writes(self, orchestrator):
+        """測試 Phase 2: 寫入佇列落盤失敗的文章不計入成功數"""
+        pending_articles = [
+            {"id": i, "url": f"https://example.com/article{i}", "title": f"Test Article {i}"}
+            for i in range(1, 4)
+        ]
+        orchestrator.article_store.get_by_status.return_value = pending_articles
+
+        with patch("src.tools.content_extractor.ContentExtractor") as mock_extractor_class, \
+                patch("src.orchestrator.daily_runner.WriteBehindQueue") as mock_queue_class, \
+                patch("src.agents.analyst_agent.AnalystAgentRunner") as mock_runner_class, \
+                patch("src.agents.analyst_agent.create_analyst_agent"):
+            mock_extractor_class.return_value.iter_extract.side_effect = lambda urls: iter([
+                (i, {"status": "success", "content": "Full content"})
+                for i in range(len(urls))
+            ])
+            mock_queue_class.return_value.stats.return_value = {"failed": 2, "failed_articles": 1}
+
+            async def mock_analyze(article_id, **kwargs):
+                return {"status": "success", "priority_score": 0.5}
+
+            mock_runner_class.return_value.analyze_article = mock_analyze
+
+            analyzed_count = orchestrator._run_phase2_analyst()
+
+        assert analyzed_count == 2
+        mock_queue_class.return_value.close.assert_called_once()
+        assert orchestrator.stats["errors"][-1]["phase"] == "phase2_analyst_write"
 
     def test_run_phase2_analyst_no_pending(self, orchestrator):
         """測試 Phase 2: 沒有待分析文章"""
@@ -23,6 +23,10 @@ Test Cases:
     TC-3-10: Parse published date (RFC 2822)
     TC-3-11: Parse published date (ISO 8601)
     TC-3-12: Parse published date (invalid format)
+    TC-3-13: Concurrent batch fetch keeps feed order
+    TC-3-14: Per-host concurrency limit
+    TC-3-15: Conditional GET (304 Not Modified)
+    TC-3-16: Identical body skips parsing
 
 Run with: pytest tests/unit/test_fetcher.py -v
 """
@@ -136,7 +140,7 @@ def test_validate_url_invalid():
 # TC-3-04: Single RSS Feed Fetch (Success)
 # ========================================
 
-@patch('src.tools.fetcher.requests.get')
+@patch('src.tools.fetcher.requests.Session.get')
 @patch('src.tools.fetcher.feedparser.parse')
 def test_fetch_single_feed_success(mock_parse, mock_get, fetcher, mock_feed_response):
     """
@@ -187,7 +191,7 @@ def test_fetch_single_feed_invalid_url(fetcher):
 # TC-3-06: Batch Fetch (All Success)
 # ========================================
 
-@patch('src.tools.fetcher.requests.get')
+@patch('src.tools.fetcher.requests.Session.get')
 @patch('src.tools.fetcher.feedparser.parse')
 def test_fetch_rss_feeds_all_success(mock_parse, mock_get, fetcher, mock_feed_response):
     """
@@ -226,7 +230,7 @@ def test_fetch_rss_feeds_all_success(mock_parse, mock_get, fetcher, mock_feed_re
 # TC-3-07: Batch Fetch (Partial Failure)
 # ========================================
 
-@patch('src.tools.fetcher.requests.get')
+@patch('src.tools.fetcher.requests.Session.get')
 @patch('src.tools.fetcher.feedparser.parse')
 def test_fetch_rss_feeds_partial_failure(mock_parse, mock_get, fetcher, mock_feed_response):
     """
@@ -268,7 +272,7 @@ def test_fetch_rss_feeds_partial_failure(mock_parse, mock_get, fetcher, mock_fee
 # TC-3-08: Article Limit Enforcement
 # ========================================
 
-@patch('src.tools.fetcher.requests.get')
+@patch('src.tools.fetcher.requests.Session.get')
 @patch('src.tools.fetcher.feedparser.parse')
 def test_fetch_with_max_articles(mock_parse, mock_get, fetcher):
     """
@@ -426,7 +430,7 @@ def test_parse_entry_missing_link(fetcher):
         fetcher.parse_feed_entry(mock_entry, 'Test Feed', 'https://example.com/feed/')
 
 
-@patch('src.tools.fetcher.requests.get')
+@patch('src.tools.fetcher.requests.Session.get')
 def test_fetch_timeout(mock_get, fetcher):
     """Test network timeout handling"""
     import requests
@@ -438,7 +442,7 @@ def test_fetch_timeout(mock_get, fetcher):
     assert 'timeout' in result['error_message'].lower()
 
 
-@patch('src.tools.fetcher.requests.get')
+@patch('src.tools.fetcher.requests.Session.get')
 @patch('src.tools.fetcher.feedparser.parse')
 def test_fetch_malformed_feed(mock_parse, mock_get, fetcher):
     """Test handling of malformed feed XML"""
@@ -459,3 +463,175 @@ def test_fetch_malformed_feed(mock_parse, mock_get, fetcher):
 
     assert result['status'] == 'error'
     assert 'parsing error' in result['error_message'].lower()
+
+
+# ========================================
+# TC-3-13 ~ TC-3-14: Concurrent Batch Fetch
+# ========================================
+
+def _feed_for(url):
+    """Build a parsed feed whose single entry links back to the feed URL"""
+    return feedparser.FeedParserDict(
+        feed=feedparser.FeedParserDict(title=f'Feed {url}'),
+        entries=[feedparser.FeedParserDict(link=f'{url}article', title=url)],
+        bozo=False
+    )
+
+
+@patch('src.tools.fetcher.feedparser.parse')
+@patch('src.tools.fetcher.requests.Session.get')
+def test_fetch_rss_feeds_concurrent_order(mock_get, mock_parse):
+    """
+    TC-3-13: Test concurrent batch fetch
+
+    Expected:
+    - Feeds run in parallel (wall time close to one slow feed)
+    - Articles and errors keep the order of feed_urls
+    """
+    import time
+
+    def slow_get(url, *args, **kwargs):
+        time.sleep(0.2)
+        if 'fail' in url:
+            raise TimeoutError("too slow")
+        response = Mock()
+        response.content = url.encode()
+        return response
+
+    mock_get.side_effect = slow_get
+    mock_parse.side_effect = lambda content: _feed_for(content.decode())
+
+    feed_urls = [f'https://host{i}.example.com/feed/' for i in range(6)]
+    feed_urls.insert(3, 'https://host-fail.example.com/feed/')
+
+    fetcher = RSSFetcher(timeout=10, max_workers=8)
+    start = time.time()
+    result = fetcher.fetch_rss_feeds(feed_urls)
+    elapsed = time.time() - start
+
+    assert elapsed < 0.2 * len(feed_urls) / 2
+    assert result['status'] == 'partial'
+    assert result['summary']['successful_feeds'] == 6
+    assert [a['title'] for a in result['articles']] == [u for u in feed_urls if 'fail' not in u]
+    assert result['errors'][0]['feed_url'] == 'https://host-fail.example.com/feed/'
+
+
+@patch('src.tools.fetcher.feedparser.parse')
+@patch('src.tools.fetcher.requests.Session.get')
+def test_fetch_rss_feeds_per_host_limit(mock_get, mock_parse):
+    """
+    TC-3-14: Test requests to one host never exceed per_host_limit
+
+    Expected:
+    - At most per_host_limit concurrent requests to the same host
+    - All feeds still succeed
+    """
+    import threading
+    import time
+
+    lock = threading.Lock()
+    active = {'now': 0, 'peak': 0}
+
+    def tracked_get(url, *args, **kwargs):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        time.sleep(0.05)
+        with lock:
+            active['now'] -= 1
+        response = Mock()
+        response.content = url.encode()
+        return response
+
+    mock_get.side_effect = tracked_get
+    mock_parse.side_effect = lambda content: _feed_for(content.decode())
+
+    feed_urls = [f'https://same.example.com/feed/{i}/' for i in range(8)]
+    fetcher = RSSFetcher(timeout=10, max_workers=8, per_host_limit=2)
+    result = fetcher.fetch_rss_feeds(feed_urls)
+
+    assert result['status'] == 'success'
+    assert result['summary']['total_articles'] == 8
+    assert active['peak'] == 2
+
+
+# ========================================
+# TC-3-15 ~ TC-3-16: Conditional GET Cache
+# ========================================
+
+def _feed_response(status_code=200, content=b'<rss>v1</rss>', headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+@patch('src.tools.fetcher.feedparser.parse')
+@patch('src.tools.fetcher.requests.Session.get')
+def test_fetch_conditional_get_not_modified(mock_get, mock_parse, tmp_path):
+    """
+    TC-3-15: Test validators are sent and 304 serves cached articles
+
+    Expected:
+    - Second request carries If-None-Match / If-Modified-Since
+    - 304 skips parsing and returns the cached articles
+    - Summary counts skipped feeds and bytes saved
+    """
+    from src.utils.disk_cache import DiskCache
+
+    url = 'https://example.com/feed/'
+    cache = DiskCache(tmp_path / 'cache.db', namespace='rss_feeds')
+    fetcher = RSSFetcher(timeout=10, cache=cache)
+    mock_parse.return_value = _feed_for(url)
+
+    mock_get.return_value = _feed_response(
+        headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 20 Nov 2024 10:00:00 GMT'}
+    )
+    first = fetcher.fetch_rss_feeds([url])
+    assert first['summary']['skipped_feeds'] == 0
+
+    mock_get.return_value = _feed_response(status_code=304, content=b'')
+    second = fetcher.fetch_rss_feeds([url])
+
+    headers = mock_get.call_args.kwargs['headers']
+    assert headers['If-None-Match'] == '"v1"'
+    assert headers['If-Modified-Since'] == 'Wed, 20 Nov 2024 10:00:00 GMT'
+    assert mock_parse.call_count == 1
+    assert second['status'] == 'success'
+    assert second['articles'] == first['articles']
+    assert second['summary']['skipped_feeds'] == 1
+    assert second['summary']['bytes_saved'] == len(b'<rss>v1</rss>')
+
+
+@patch('src.tools.fetcher.feedparser.parse')
+@patch('src.tools.fetcher.requests.Session.get')
+def test_fetch_identical_body_skips_parse(mock_get, mock_parse, tmp_path):
+    """
+    TC-3-16: Test an unchanged body is not re-parsed
+
+    Expected:
+    - Same content hash returns cached articles without parsing
+    - Changed content is parsed again
+    - A larger article limit than cached bypasses the cache
+    """
+    from src.utils.disk_cache import DiskCache
+
+    url = 'https://example.com/feed/'
+    fetcher = RSSFetcher(timeout=10, cache=DiskCache(tmp_path / 'cache.db', namespace='rss'))
+    mock_parse.return_value = _feed_for(url)
+    mock_get.return_value = _feed_response()
+
+    fetcher.fetch_single_feed(url, max_articles=5)
+    result = fetcher.fetch_single_feed(url, max_articles=5)
+    assert result['not_modified'] is True
+    assert result['bytes_saved'] == 0
+    assert mock_parse.call_count == 1
+
+    fetcher.fetch_single_feed(url, max_articles=10)
+    assert mock_parse.call_count == 2
+
+    mock_get.return_value = _feed_response(content=b'<rss>v2</rss>')
+    result = fetcher.fetch_single_feed(url, max_articles=10)
+    assert result['not_modified'] is False
+    assert mock_parse.call_count == 3
@@ -28,6 +28,9 @@ Test Cases:
     TC-4-14: Validate API credentials (success)
     TC-4-15: Validate API credentials (failure)
     TC-4-16: max_results range enforcement
+    TC-4-17: Search cache hit (no second request)
+    TC-4-18: Search cache stale hit (revalidated in background)
+    TC-4-19: Search cache skips error results
 
 Run with: pytest tests/unit/test_google_search.py -v
 """
@@ -37,6 +40,8 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
 
 from src.tools.google_search import GoogleSearchTool
+from src.utils.disk_cache import DiskCache
+from src.utils.search_cache import SearchResultCache
 
 
 # ========================================
@@ -58,6 +63,25 @@ def search_tool():
         )
 
 
+@pytest.fixture
+def make_search_cache(tmp_path):
+    """Factory for SearchResultCache instances backed by a temp DiskCache"""
+    caches = []
+
+    def factory(fresh_seconds, stale_seconds=0.0):
+        cache = SearchResultCache(
+            DiskCache(tmp_path / "cache.db", namespace="search"),
+            fresh_seconds=fresh_seconds, stale_seconds=stale_seconds
+        )
+        caches.append(cache)
+        return cache
+
+    yield factory
+
+    for cache in caches:
+        cache.close()
+
+
 @pytest.fixture
 def mock_search_response():
     """Mock Google Search API response"""
@@ -512,6 +536,108 @@ def test_max_results_range_enforcement(mock_get, search_tool, mock_search_respon
     assert 'num=1' in call_args[0][0]  # URL should have num=1
 
 
+# ========================================
+# TC-4-17: Search Cache Hit
+# ========================================
+
+@patch('src.tools.google_search.requests.get')
+def test_search_cache_hit(mock_get, search_tool, mock_search_response, make_search_cache):
+    """
+    TC-4-17: Test search cache hit
+
+    Given: A search tool with a result cache
+    When: Repeating a query (differing only in case and whitespace)
+    Then: The cached result is returned without a second request
+    """
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = mock_search_response
+    mock_get.return_value = mock_response
+    search_tool.search_cache = make_search_cache(fresh_seconds=3600)
+
+    first = search_tool.search_articles("AI robotics", max_results=5)
+    second = search_tool.search_articles("  ai   ROBOTICS ", max_results=5)
+
+    assert mock_get.call_count == 1
+    assert second['articles'] == first['articles']
+    assert search_tool.search_cache.stats()['hits'] == 1
+
+    # Term order is part of the key
+    search_tool.search_articles("robotics AI", max_results=5)
+    assert mock_get.call_count == 2
+
+
+# ========================================
+# TC-4-18: Search Cache Stale Hit (Revalidate)
+# ========================================
+
+@patch('src.tools.google_search.requests.get')
+def test_search_cache_stale_revalidate(mock_get, search_tool, mock_search_response, make_search_cache):
+    """
+    TC-4-18: Test search cache stale hit
+
+    Given: A cached result past its fresh window but within the stale window
+    When: Repeating the query
+    Then: The stale result is returned and refreshed in the background
+    """
+    refreshed_response = {
+        'items': [{'title': 'Fresh Article', 'link': 'https://example.com/fresh', 'snippet': 'New'}],
+        'searchInformation': {'totalResults': '1'}
+    }
+    first_response = Mock(status_code=200)
+    first_response.json.return_value = mock_search_response
+    second_response = Mock(status_code=200)
+    second_response.json.return_value = refreshed_response
+    mock_get.side_effect = [first_response, second_response]
+    search_cache = make_search_cache(fresh_seconds=0, stale_seconds=3600)
+    search_tool.search_cache = search_cache
+
+    search_tool.search_articles("AI robotics", max_results=5)
+    stale = search_tool.search_articles("AI robotics", max_results=5)
+
+    assert stale['articles'][0]['url'] == 'https://example.com/article1'
+    assert search_cache.stats()['stale_hits'] == 1
+
+    key = search_cache.make_key(
+        "custom_search", search_tool.engine_id, "AI robotics",
+        max_results=5, date_restrict='d7', language='lang_en'
+    )
+    search_cache.close()
+
+    assert mock_get.call_count == 2
+    assert search_cache.stats()['revalidations'] == 1
+    refreshed, _ = search_cache.lookup(key)
+    assert refreshed['articles'][0]['url'] == 'https://example.com/fresh'
+
+
+# ========================================
+# TC-4-19: Search Cache Skips Errors
+# ========================================
+
+@patch('src.tools.google_search.requests.get')
+def test_search_cache_skips_errors(mock_get, search_tool, make_search_cache):
+    """
+    TC-4-19: Test error results are not cached
+
+    Given: A search tool with a result cache
+    When: A search fails (quota exceeded) and is repeated
+    Then: The failure is not cached and the query is requested again
+    """
+    mock_response = Mock()
+    mock_response.status_code = 403
+    mock_response.text = 'quotaExceeded'
+    mock_get.return_value = mock_response
+    search_tool.search_cache = make_search_cache(fresh_seconds=3600)
+
+    first = search_tool.search_articles("AI robotics")
+    second = search_tool.search_articles("AI robotics")
+
+    assert first['status'] == 'error'
+    assert second['status'] == 'error'
+    assert mock_get.call_count == 2
+    assert search_tool.search_cache.stats()['hits'] == 0
+
+
 # ========================================
 # Summary Statistics
 # ========================================
@@ -520,7 +646,7 @@ def test_summary():
     """
     Test Summary for Stage 4: Google Search Tool
 
-    Total Tests: 16
+    Total Tests: 19
     Coverage:
     - Initialization: 2 tests
     - URL Building: 1 test
@@ -531,5 +657,6 @@ def test_summary():
     - Quota Detection: 3 tests
     - Credential Validation: 2 tests
     - Range Enforcement: 1 test
+    - Search Cache: 3 tests
     """
     pass
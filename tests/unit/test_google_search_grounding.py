@@ -6,18 +6,23 @@
 测试 Gemini Search Grounding 功能
 
 测试案例:
-- TC-4V2-01 到 TC-4V2-14
+- TC-4V2-01 到 TC-4V2-21
 """
 
+import asyncio
+import tempfile
+import threading
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import sys
 import os
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.tools.google_search_grounding_v2 import GoogleSearchGroundingTool
+from src.tools.google_search_grounding_v2 import GoogleSearchGroundingTool, RateLimiter
+from src.utils.disk_cache import DiskCache
+from src.utils.search_cache import SearchResultCache
 
 
 class TestGoogleSearchGroundingTool(unittest.TestCase):
@@ -382,6 +387,226 @@ class TestGoogleSearchGroundingTool(unittest.TestCase):
         self.assertEqual(result['total_results'], 0)
 
 
+def _make_response(url):
+    """建立只含一个 Grounding Chunk 的 Mock Response"""
+    mock_web = Mock()
+    mock_web.uri = url
+    mock_web.title = url
+    mock_chunk = Mock()
+    mock_chunk.web = mock_web
+
+    mock_grounding_metadata = Mock()
+    mock_grounding_metadata.grounding_chunks = [mock_chunk]
+    mock_candidate = Mock()
+    mock_candidate.grounding_metadata = mock_grounding_metadata
+    mock_response = Mock()
+    mock_response.candidates = [mock_candidate]
+    return mock_response
+
+
+class TestAsyncBatchSearch(unittest.TestCase):
+    """GoogleSearchGroundingTool.abatch_search 单元测试"""
+
+    def setUp(self):
+        """测试前准备（不限速，避免测试等待）"""
+        patcher = patch('google.genai.Client')
+        self.mock_client = Mock()
+        patcher.start().return_value = self.mock_client
+        self.addCleanup(patcher.stop)
+
+        self.tool = GoogleSearchGroundingTool(
+            api_key="test_api_key_12345",
+            rate_limiter=RateLimiter(requests_per_second=1000)
+        )
+
+    # TC-4V2-15: 并发执行且结果依查询顺序合并
+    def test_abatch_search_merges_in_query_order(self):
+        """测试并发搜索结果依查询顺序合并，且并发数受限"""
+        delays = {"slow": 0.05, "medium": 0.02, "fast": 0.0}
+        in_flight = {"now": 0, "peak": 0}
+
+        async def generate_content(model, contents, config):
+            query = next(q for q in delays if f"about: {q} " in contents)
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(delays[query])
+            in_flight["now"] -= 1
+            return _make_response(f"https://{query}.example.com/post")
+
+        self.mock_client.aio.models.generate_content = AsyncMock(side_effect=generate_content)
+
+        result = asyncio.run(self.tool.abatch_search(
+            ["slow", "medium", "fast"], max_results_per_query=3, max_concurrency=2
+        ))
+
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(
+            [a['url'] for a in result['articles']],
+            ["https://slow.example.com/post", "https://medium.example.com/post",
+             "https://fast.example.com/post"]
+        )
+        self.assertEqual(result['summary']['total_articles'], 3)
+        self.assertEqual(in_flight["peak"], 2)
+        self.mock_client.models.generate_content.assert_not_called()
+
+    # TC-4V2-16: 单一查询逾时与失败
+    def test_abatch_search_timeout_and_error(self):
+        """测试逾时与错误的查询记录于 errors，其余结果保留"""
+        async def generate_content(model, contents, config):
+            if "about: hang " in contents:
+                await asyncio.sleep(5)
+            if "about: boom " in contents:
+                raise Exception("API Error")
+            return _make_response("https://ok.example.com/post")
+
+        self.mock_client.aio.models.generate_content = AsyncMock(side_effect=generate_content)
+
+        result = asyncio.run(self.tool.abatch_search(
+            ["ok", "hang", "boom"], timeout=0.05
+        ))
+
+        self.assertEqual(result['status'], 'partial')
+        self.assertEqual(result['summary']['successful_queries'], 1)
+        self.assertEqual(result['summary']['failed_queries'], 2)
+        self.assertEqual([e['query'] for e in result['errors']], ["hang", "boom"])
+        self.assertIn("timeout", result['errors'][0]['error_message'])
+
+    # TC-4V2-17: 全部失败
+    def test_abatch_search_all_failed(self):
+        """测试全部查询失败时 status 为 error"""
+        self.mock_client.aio.models.generate_content = AsyncMock(
+            side_effect=Exception("API Error")
+        )
+
+        result = asyncio.run(self.tool.abatch_search(["AI", "robotics"]))
+
+        self.assertEqual(result['status'], 'error')
+        self.assertEqual(result['articles'], [])
+        self.assertEqual(len(result['errors']), 2)
+
+    # TC-4V2-18: 限速器间隔
+    def test_rate_limiter_spaces_requests(self):
+        """测试限速器依速率间隔请求"""
+        limiter = RateLimiter(requests_per_second=20)
+
+        async def acquire_three():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(3):
+                await limiter.acquire()
+            return loop.time() - start
+
+        elapsed = asyncio.run(acquire_three())
+
+        self.assertGreaterEqual(elapsed, 0.09)
+        with self.assertRaises(ValueError):
+            RateLimiter(requests_per_second=0)
+
+    # TC-4V2-21: async with 关闭 async 与 sync Client
+    def test_async_context_manager_closes_async_client(self):
+        """测试 async with 结束时 await aio.aclose()，并关闭 sync Client"""
+        self.mock_client.aio.aclose = AsyncMock()
+        self.mock_client.aio.models.generate_content = AsyncMock(
+            return_value=_make_response("https://ok.example.com/post")
+        )
+
+        async def run():
+            async with self.tool as tool:
+                return await tool.abatch_search(["AI"])
+
+        result = asyncio.run(run())
+
+        self.assertEqual(result['status'], 'success')
+        self.mock_client.aio.aclose.assert_awaited_once()
+        self.mock_client.close.assert_called_once()
+
+
+class TestSearchResultCaching(unittest.TestCase):
+    """GoogleSearchGroundingTool 搜索结果缓存单元测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        patcher = patch('google.genai.Client')
+        self.mock_client = Mock()
+        patcher.start().return_value = self.mock_client
+        self.addCleanup(patcher.stop)
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_path = os.path.join(tmp_dir.name, "cache.db")
+
+    def _tool(self, fresh_seconds, stale_seconds=0.0):
+        search_cache = SearchResultCache(
+            DiskCache(self.cache_path, namespace="search"),
+            fresh_seconds=fresh_seconds, stale_seconds=stale_seconds
+        )
+        self.addCleanup(search_cache.close)
+        return GoogleSearchGroundingTool(
+            api_key="test_api_key_12345",
+            rate_limiter=RateLimiter(requests_per_second=1000),
+            search_cache=search_cache
+        )
+
+    # TC-4V2-19: 新鲜缓存命中不再请求（同步与异步共用）
+    def test_repeated_query_served_from_cache(self):
+        """测试相同与近似查询在新鲜期内只请求一次，失败结果不缓存"""
+        self.mock_client.models.generate_content.side_effect = [
+            Exception("API Error"),
+            _make_response("https://example.com/robots")
+        ]
+        self.mock_client.aio.models.generate_content = AsyncMock()
+        tool = self._tool(fresh_seconds=3600)
+
+        failed = tool.search_articles("Humanoid robot Unitree", max_results=5)
+        first = tool.search_articles("Humanoid robot Unitree", max_results=5)
+        second = tool.search_articles("  humanoid ROBOT   unitree ", max_results=5)
+        third = asyncio.run(tool.asearch_articles("Humanoid robot Unitree", max_results=5))
+
+        self.assertEqual(failed['status'], 'error')
+        self.assertEqual(first['articles'], second['articles'])
+        self.assertEqual(first['articles'], third['articles'])
+        self.assertEqual(self.mock_client.models.generate_content.call_count, 2)
+        self.mock_client.aio.models.generate_content.assert_not_called()
+        self.assertEqual(tool.search_cache.stats()['hits'], 2)
+
+    # TC-4V2-20: 过期结果先返回，背景刷新后才关闭 Client
+    def test_stale_result_revalidated_in_background(self):
+        """测试过期结果立即返回、背景刷新，close() 等待刷新完成后才关闭 Client"""
+        release = threading.Event()
+        responses = iter([
+            _make_response("https://example.com/old"),
+            _make_response("https://example.com/new")
+        ])
+
+        def generate_content(**kwargs):
+            response = next(responses)
+            if "new" in response.candidates[0].grounding_metadata.grounding_chunks[0].web.uri:
+                release.wait(5)
+            return response
+
+        self.mock_client.models.generate_content.side_effect = generate_content
+        tool = self._tool(fresh_seconds=0, stale_seconds=3600)
+
+        tool.search_articles("AI agents")
+        stale = tool.search_articles("AI agents")
+        self.assertEqual(stale['articles'][0]['url'], "https://example.com/old")
+
+        tool.close()
+        self.mock_client.close.assert_not_called()
+
+        release.set()
+        tool.search_cache.close()
+        self.mock_client.close.assert_called_once()
+
+        refreshed, _ = tool.search_cache.lookup(
+            tool.search_cache.make_key(
+                "grounding", tool.model_name, "AI agents",
+                max_results=10, date_restrict=None, language="en"
+            )
+        )
+        self.assertEqual(refreshed['articles'][0]['url'], "https://example.com/new")
+
+
 if __name__ == '__main__':
     # 运行测试
     unittest.main(verbosity=2)
@@ -26,6 +26,8 @@ Run with: pytest tests/unit/test_memory.py -v
 
 import pytest
 import numpy as np
+import json
+from sqlalchemy import event
 from datetime import datetime, timedelta
 from pathlib import Path
 import tempfile
@@ -1039,3 +1041,976 @@ def test_get_top_priority_order_preserved(article_store_with_time_data):
     # Should be sorted by priority_score descending
     scores = [a['priority_score'] for a in articles]
     assert scores == sorted(scores, reverse=True)
+
+
+# ========================================
+# TC-2-29 ~ TC-2-30: EmbeddingStore Similarity Cache
+# ========================================
+
+def test_find_similar_matches_bruteforce(article_store, embedding_store):
+    """
+    TC-2-29: Test matrix-backed search matches per-vector cosine similarity
+
+    Expected:
+    - Same article ranking as computing cosine similarity one by one
+    - Threshold excludes low scores
+    """
+    rng = np.random.default_rng(42)
+    vectors = {}
+    for i in range(40):
+        article_id = article_store.create(
+            url=f"https://example.com/matrix-{i}",
+            title=f"Matrix Test {i}",
+            source="rss"
+        )
+        vectors[article_id] = rng.normal(size=16)
+        embedding_store.store(article_id=article_id, vector=vectors[article_id], model="test-model")
+
+    query = rng.normal(size=16)
+    expected = sorted(
+        ((aid, EmbeddingStore.cosine_similarity(query, vec)) for aid, vec in vectors.items()),
+        key=lambda x: x[1],
+        reverse=True
+    )
+
+    similar = embedding_store.find_similar(vector=query, top_k=5, model="test-model")
+
+    assert [aid for aid, _ in similar] == [aid for aid, _ in expected[:5]]
+    for (_, score), (_, expected_score) in zip(similar, expected[:5]):
+        assert abs(score - expected_score) < 1e-5
+
+    filtered = embedding_store.find_similar(vector=query, top_k=40, model="test-model", threshold=0.3)
+    assert all(score >= 0.3 for _, score in filtered)
+    assert len(filtered) == sum(1 for _, score in expected if score >= 0.3)
+
+
+def test_find_similar_cache_updates_incrementally(article_store, embedding_store):
+    """
+    TC-2-30: Test store()/delete() keep the similarity cache in sync
+
+    Expected:
+    - Queries after warm-up do not open a database session
+    - Newly stored vectors are searchable, deleted vectors disappear
+    """
+    first_id = article_store.create(url="https://example.com/cache-1", title="Cache 1", source="rss")
+    embedding_store.store(article_id=first_id, vector=np.array([1.0, 0.0, 0.0]), model="test-model")
+
+    # Warm up the cache
+    assert embedding_store.find_similar(np.array([1.0, 0.0, 0.0]), model="test-model")[0][0] == first_id
+
+    second_id = article_store.create(url="https://example.com/cache-2", title="Cache 2", source="rss")
+    embedding_store.store(article_id=second_id, vector=np.array([0.0, 1.0, 0.0]), model="test-model")
+
+    original_get_session = embedding_store.database.get_session
+    original_get_read_session = embedding_store.database.get_read_session
+
+    def _fail_session():
+        raise AssertionError("find_similar should be served from the cache")
+
+    embedding_store.database.get_session = _fail_session
+    embedding_store.database.get_read_session = _fail_session
+    try:
+        similar = embedding_store.find_similar(np.array([0.0, 1.0, 0.0]), top_k=1, model="test-model")
+        assert similar[0][0] == second_id
+    finally:
+        embedding_store.database.get_session = original_get_session
+        embedding_store.database.get_read_session = original_get_read_session
+
+    embedding_store.delete(second_id, model="test-model")
+
+    similar = embedding_store.find_similar(np.array([0.0, 1.0, 0.0]), top_k=5, model="test-model")
+    assert second_id not in [aid for aid, _ in similar]
+
+
+def test_find_similar_cache_load_races_store(article_store, embedding_store):
+    """
+    TC-2-30b: Test a store() finishing while the cache loads is not lost
+
+    Expected:
+    - A vector stored after the load read the database, but before the
+      cache was published, is still searchable
+    """
+    from contextlib import contextmanager
+
+    first_id = article_store.create(url="https://example.com/race-1", title="Race 1", source="rss")
+    embedding_store.store(article_id=first_id, vector=np.array([1.0, 0.0, 0.0]), model="test-model")
+    second_id = article_store.create(url="https://example.com/race-2", title="Race 2", source="rss")
+
+    original_get_read_session = embedding_store.database.get_read_session
+    raced = []
+
+    @contextmanager
+    def _racing_read_session():
+        with original_get_read_session() as session:
+            yield session
+        if not raced:
+            raced.append(True)
+            embedding_store.store(
+                article_id=second_id, vector=np.array([0.0, 1.0, 0.0]), model="test-model"
+            )
+
+    embedding_store.database.get_read_session = _racing_read_session
+    try:
+        similar = embedding_store.find_similar(np.array([0.0, 1.0, 0.0]), top_k=1, model="test-model")
+    finally:
+        embedding_store.database.get_read_session = original_get_read_session
+
+    assert raced
+    assert similar[0][0] == second_id
+
+
+def test_find_similar_cache_load_replays_writes(article_store, embedding_store):
+    """
+    TC-2-30c: Test writes during every read do not make the load start over
+
+    Expected:
+    - The database is read once even though each read races a write
+    - Stores and deletes made during the read are applied in order
+    """
+    from contextlib import contextmanager
+
+    ids = [
+        article_store.create(url=f"https://example.com/replay-{i}", title=f"Replay {i}", source="rss")
+        for i in range(3)
+    ]
+    embedding_store.store(article_id=ids[0], vector=np.array([1.0, 0.0, 0.0]), model="test-model")
+
+    original_get_read_session = embedding_store.database.get_read_session
+    reads = []
+
+    @contextmanager
+    def _busy_read_session():
+        with original_get_read_session() as session:
+            yield session
+        reads.append(True)
+        if len(reads) > 5:
+            return
+        # A write-behind queue flushing while the load runs
+        embedding_store.store(article_id=ids[1], vector=np.array([0.0, 1.0, 0.0]), model="test-model")
+        embedding_store.delete(ids[0], model="test-model")
+        embedding_store.store(article_id=ids[0], vector=np.array([0.0, 0.0, 1.0]), model="test-model")
+        embedding_store.delete(ids[2], model="test-model")
+
+    embedding_store.database.get_read_session = _busy_read_session
+    try:
+        similar = embedding_store.find_similar(np.array([0.0, 1.0, 0.0]), top_k=5, model="test-model")
+    finally:
+        embedding_store.database.get_read_session = original_get_read_session
+
+    assert len(reads) == 1
+    assert similar[0][0] == ids[1]
+    rows = dict(embedding_store.find_similar(np.array([0.0, 0.0, 1.0]), top_k=5, model="test-model"))
+    assert rows[ids[0]] == pytest.approx(1.0)
+    assert ids[2] not in rows
+
+
+# ========================================
+# TC-2-31 ~ TC-2-32: Float32 Vector Format
+# ========================================
+
+def test_vector_serialization_float32_format():
+    """
+    TC-2-31: Test versioned float32 serialization
+
+    Expected:
+    - Blob is a 16-byte header plus 4 bytes per value
+    - Round trip returns float32 values
+    - Legacy pickle blobs are still readable
+    """
+    import pickle
+
+    vector = np.array([0.1, 0.2, 0.3, 0.4])
+    data = EmbeddingStore.serialize_vector(vector)
+
+    assert len(data) == 16 + 4 * len(vector)
+    assert EmbeddingStore.is_legacy_format(data) is False
+
+    restored = EmbeddingStore.deserialize_vector(data)
+    assert restored.dtype == np.float32
+    np.testing.assert_array_almost_equal(restored, vector)
+
+    legacy = pickle.dumps(vector)
+    assert EmbeddingStore.is_legacy_format(legacy) is True
+    np.testing.assert_array_equal(EmbeddingStore.deserialize_vector(legacy), vector)
+
+
+def test_migration_002_rewrites_pickle_blobs(article_store, embedding_store, database, temp_db_path):
+    """
+    TC-2-32: Test migration 002 converts legacy pickle rows in batches
+
+    Expected:
+    - All legacy rows are rewritten to the float32 format
+    - Vectors are preserved
+    - Running the migration twice is a no-op
+    """
+    import importlib
+    import pickle
+    from sqlalchemy import text
+
+    migration = importlib.import_module("src.memory.migrations.002_embeddings_float32")
+
+    vectors = {}
+    for i in range(5):
+        article_id = article_store.create(url=f"https://example.com/migrate-{i}", title=f"M {i}", source="rss")
+        vectors[article_id] = np.random.rand(8)
+        embedding_store.store(article_id=article_id, vector=vectors[article_id], model="test-model")
+
+    # Simulate a pre-migration database
+    with database.engine.connect() as conn:
+        for article_id, vector in vectors.items():
+            conn.execute(
+                text("UPDATE embeddings SET embedding = :blob WHERE article_id = :aid"),
+                {"blob": pickle.dumps(vector), "aid": article_id}
+            )
+        conn.commit()
+
+    assert migration.migrate(Path(temp_db_path), batch_size=2) is True
+
+    with database.engine.connect() as conn:
+        blobs = [row[0] for row in conn.execute(text("SELECT embedding FROM embeddings"))]
+    assert not any(EmbeddingStore.is_legacy_format(blob) for blob in blobs)
+
+    for article_id, vector in vectors.items():
+        np.testing.assert_array_almost_equal(embedding_store.get(article_id, model="test-model"), vector)
+
+    assert migration.migrate(Path(temp_db_path)) is True
+
+
+# ========================================
+# TC-2-33 ~ TC-2-34: EmbeddingStore ANN Index
+# ========================================
+
+def test_find_similar_ann_mode(article_store, embedding_store, database):
+    """
+    TC-2-33: Test ANN search, sidecar persistence and recall stats
+
+    Expected:
+    - Probing every cell returns exactly the brute-force results
+    - The index is persisted beside the database and reused by a new store
+    - evaluate_ann reports recall and latency for both modes
+    - Unknown search modes are rejected
+    """
+    from unittest.mock import patch
+    from src.memory.ann_index import IVFIndex
+
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(4, 16))
+    for i in range(60):
+        article_id = article_store.create(url=f"https://example.com/ann-{i}", title=f"A {i}", source="rss")
+        vector = centers[i % 4] + 0.1 * rng.normal(size=16)
+        embedding_store.store(article_id=article_id, vector=vector, model="test-model")
+
+    query = centers[1] + 0.1 * rng.normal(size=16)
+    exact = embedding_store.find_similar(query, top_k=5, model="test-model", threshold=-1.0)
+    ann = embedding_store.find_similar(
+        query, top_k=5, model="test-model", threshold=-1.0, search_mode="ann", n_probe=1000
+    )
+    assert [aid for aid, _ in ann] == [aid for aid, _ in exact]
+
+    stats = embedding_store.get_ann_stats(model="test-model")
+    index_stats = stats["indexes"][16]
+    assert index_stats["vectors"] == 60
+    assert Path(index_stats["path"]).exists()
+    assert Path(index_stats["path"]).parent == database.database_file.parent
+    assert stats["latency"]["ann"]["queries"] == 1
+
+    report = embedding_store.evaluate_ann(model="test-model", sample_size=20, top_k=5, n_probe=2)
+    assert report["queries"] == 20
+    assert 0.0 < report["recall_at_k"] <= 1.0
+    assert report["ann_avg_ms"] >= 0.0
+
+    # A fresh store loads the sidecar instead of rebuilding
+    fresh_store = EmbeddingStore(database)
+    with patch.object(IVFIndex, "build", side_effect=AssertionError("unexpected rebuild")):
+        results = fresh_store.find_similar(query, top_k=5, model="test-model", search_mode="ann")
+    assert len(results) == 5
+
+    with pytest.raises(ValueError):
+        embedding_store.find_similar(query, model="test-model", search_mode="fuzzy")
+
+
+def test_ann_index_updates_and_rebuilds(article_store, embedding_store):
+    """
+    TC-2-34: Test the ANN index follows inserts/deletes and rebuilds when stale
+
+    Expected:
+    - New vectors are searchable without a rebuild
+    - Deleted vectors disappear from ANN results
+    - Crossing the staleness threshold triggers a rebuild on the next query
+    """
+    embedding_store.ann_staleness_threshold = 0.5
+
+    ids = []
+    for i in range(8):
+        article_id = article_store.create(url=f"https://example.com/stale-{i}", title=f"S {i}", source="rss")
+        vector = np.zeros(8)
+        vector[i] = 1.0
+        embedding_store.store(article_id=article_id, vector=vector, model="test-model")
+        ids.append(article_id)
+
+    probe = np.zeros(8)
+    probe[0] = 1.0
+    embedding_store.find_similar(probe, top_k=1, model="test-model", search_mode="ann")
+    assert embedding_store.get_ann_stats("test-model")["indexes"][8]["stale_fraction"] == 0.0
+
+    new_id = article_store.create(url="https://example.com/stale-new", title="New", source="rss")
+    embedding_store.store(article_id=new_id, vector=np.ones(8), model="test-model")
+    similar = embedding_store.find_similar(
+        np.ones(8), top_k=1, model="test-model", search_mode="ann", n_probe=100
+    )
+    assert similar[0][0] == new_id
+    assert embedding_store.get_ann_stats("test-model")["indexes"][8]["stale_fraction"] == 0.125
+
+    embedding_store.delete(new_id, model="test-model")
+    similar = embedding_store.find_similar(
+        np.ones(8), top_k=10, model="test-model", search_mode="ann", n_probe=100
+    )
+    assert new_id not in [aid for aid, _ in similar]
+
+    for article_id in ids[:3]:
+        embedding_store.delete(article_id, model="test-model")
+    embedding_store.find_similar(probe, top_k=1, model="test-model", search_mode="ann")
+
+    index_stats = embedding_store.get_ann_stats("test-model")["indexes"][8]
+    assert index_stats["stale_fraction"] == 0.0
+    assert index_stats["vectors"] == 5
+
+
+def test_ann_sidecar_detects_restored_vectors(article_store, embedding_store, database):
+    """
+    TC-2-34b: Test a loaded ANN sidecar picks up vectors re-stored elsewhere
+
+    Expected:
+    - A vector deleted and stored again by a second store (same article ID,
+      new embedding row) replaces the stale entry of the persisted index
+    """
+    ids = []
+    for i in range(8):
+        article_id = article_store.create(url=f"https://example.com/ann-restore-{i}", title=f"R {i}", source="rss")
+        vector = np.zeros(8)
+        vector[i] = 1.0
+        embedding_store.store(article_id=article_id, vector=vector, model="test-model")
+        ids.append(article_id)
+    embedding_store.build_ann_index(model="test-model")
+
+    other_store = EmbeddingStore(database)
+    other_store.delete(ids[0], model="test-model")
+    other_store.store(article_id=ids[0], vector=-np.ones(8), model="test-model")
+
+    fresh_store = EmbeddingStore(database, ann_staleness_threshold=1.0)
+    similar = fresh_store.find_similar(
+        -np.ones(8), top_k=1, model="test-model", threshold=-1.0,
+        search_mode="ann", n_probe=100
+    )
+    assert similar[0][0] == ids[0]
+    assert similar[0][1] == pytest.approx(1.0)
+    assert fresh_store.get_ann_stats("test-model")["indexes"][8]["vectors"] == 8
+
+
+# ========================================
+# TC-2-35 ~ TC-2-36: Memory-Mapped Vector File
+# ========================================
+
+def test_get_matrix_memmap_view(article_store, embedding_store, database):
+    """
+    TC-2-35: Test get_matrix serves vectors from the memory-mapped file
+
+    Expected:
+    - Rows follow the requested article order, missing articles are skipped
+    - Contiguous rows and the full view share memory with the memmap
+    - store()/delete() keep an open file in sync
+    """
+    vectors = {}
+    for i in range(6):
+        article_id = article_store.create(url=f"https://example.com/mmap-{i}", title=f"V {i}", source="rss")
+        vectors[article_id] = np.random.rand(4)
+        embedding_store.store(article_id=article_id, vector=vectors[article_id], model="test-model")
+    ids = sorted(vectors)
+
+    found, matrix = embedding_store.get_matrix([ids[3], 99999, ids[1]], model="test-model")
+    assert found.tolist() == [ids[3], ids[1]]
+    np.testing.assert_array_almost_equal(matrix, [vectors[ids[3]], vectors[ids[1]]])
+
+    found, matrix = embedding_store.get_matrix(ids[1:4], model="test-model")
+    assert found.tolist() == ids[1:4]
+    assert isinstance(matrix.base, np.memmap) or isinstance(matrix, np.memmap)
+    assert not matrix.flags.writeable
+
+    all_ids, full = embedding_store.get_matrix(model="test-model")
+    assert isinstance(full, np.memmap)
+    assert sorted(all_ids.tolist()) == ids
+
+    new_id = article_store.create(url="https://example.com/mmap-new", title="New", source="rss")
+    embedding_store.store(article_id=new_id, vector=np.ones(4), model="test-model")
+    embedding_store.delete(ids[0], model="test-model")
+
+    found, matrix = embedding_store.get_matrix([ids[0], new_id], model="test-model")
+    assert found.tolist() == [new_id]
+    np.testing.assert_array_equal(matrix[0], np.ones(4, dtype=np.float32))
+
+    all_ids, full = embedding_store.get_matrix(model="test-model")
+    assert sorted(all_ids.tolist()) == sorted(ids[1:] + [new_id])
+    assert full.shape == (6, 4)
+
+
+def test_vector_file_resyncs_with_database(article_store, embedding_store, database):
+    """
+    TC-2-36: Test a vector file catches up with writes from another store
+
+    Expected:
+    - A new store reuses the file on disk and appends only missing rows
+    - Rows deleted elsewhere are dropped
+    - Mixed dimensions require an explicit dimension
+    """
+    ids = []
+    for i in range(3):
+        article_id = article_store.create(url=f"https://example.com/sync-{i}", title=f"S {i}", source="rss")
+        embedding_store.store(article_id=article_id, vector=np.full(4, float(i)), model="test-model")
+        ids.append(article_id)
+    embedding_store.get_matrix(model="test-model")
+
+    other_store = EmbeddingStore(database)
+    extra_id = article_store.create(url="https://example.com/sync-extra", title="Extra", source="rss")
+    other_store.store(article_id=extra_id, vector=np.full(4, 9.0), model="test-model")
+    other_store.delete(ids[0], model="test-model")
+
+    fresh_store = EmbeddingStore(database)
+    found, matrix = fresh_store.get_matrix(ids + [extra_id], model="test-model")
+    assert found.tolist() == ids[1:] + [extra_id]
+    np.testing.assert_array_equal(matrix[-1], np.full(4, 9.0, dtype=np.float32))
+
+    odd_id = article_store.create(url="https://example.com/sync-odd", title="Odd", source="rss")
+    fresh_store.store(article_id=odd_id, vector=np.ones(3), model="test-model")
+    with pytest.raises(ValueError):
+        fresh_store.get_matrix(model="test-model")
+    found, _ = fresh_store.get_matrix(model="test-model", dimension=3)
+    assert found.tolist() == [odd_id]
+
+
+def test_vector_file_detects_restored_vectors(article_store, embedding_store, database):
+    """
+    TC-2-36b: Test a vector re-stored elsewhere replaces the stale file row
+
+    Expected:
+    - A vector deleted and stored again by another store (same article ID,
+      new embedding row) is re-read from the database, not served stale
+    - close() removes the temporary vector directory of an in-memory DB
+    """
+    article_id = article_store.create(url="https://example.com/restore", title="R", source="rss")
+    embedding_store.store(article_id=article_id, vector=np.full(4, 1.0), model="test-model")
+    embedding_store.get_matrix(model="test-model")
+    embedding_store.invalidate_cache()
+
+    other_store = EmbeddingStore(database)
+    other_store.delete(article_id, model="test-model")
+    other_store.store(article_id=article_id, vector=np.full(4, 2.0), model="test-model")
+
+    found, matrix = embedding_store.get_matrix([article_id], model="test-model")
+    assert found.tolist() == [article_id]
+    np.testing.assert_array_equal(matrix[0], np.full(4, 2.0, dtype=np.float32))
+
+    memory_db = Database("sqlite:///:memory:")
+    memory_db.init_db()
+    try:
+        memory_id = ArticleStore(memory_db).create(url="https://example.com/m", title="M", source="rss")
+        memory_store = EmbeddingStore(memory_db)
+        memory_store.store(article_id=memory_id, vector=np.ones(4), model="test-model")
+        memory_store.get_matrix(model="test-model")
+        vector_dir = memory_store._vector_dir
+        assert vector_dir.exists()
+
+        memory_store.close()
+        assert not vector_dir.exists()
+    finally:
+        memory_db.close()
+
+
+# ========================================
+# TC-2-37: ArticleStore Bulk Ingestion
+# ========================================
+
+def test_bulk_upsert_dedupes_in_one_transaction(article_store, database):
+    """
+    TC-2-37: Test bulk_upsert skips existing and repeated URLs
+
+    Expected:
+    - Only new URLs are inserted, IDs returned in input order
+    - Duplicates inside the batch keep the first occurrence
+    - All inserts share a single commit
+    """
+    existing_id = article_store.create(url="https://example.com/bulk-0", title="Existing", source="rss")
+
+    batch = [
+        {"url": "https://example.com/bulk-0", "title": "Duplicate of existing"},
+        {"url": "https://example.com/bulk-1", "title": "First", "status": "collected", "tags": ["AI"]},
+        {"url": "https://example.com/bulk-2", "title": "Second", "status": "collected"},
+        {"url": "https://example.com/bulk-1", "title": "Repeated in batch"},
+    ]
+
+    commits = []
+
+    def count_commit(conn):
+        commits.append(conn)
+
+    event.listen(database.engine, "commit", count_commit)
+    try:
+        new_ids = article_store.bulk_upsert(batch)
+    finally:
+        event.remove(database.engine, "commit", count_commit)
+
+    assert len(new_ids) == 2
+    assert existing_id not in new_ids
+    assert len(commits) == 1
+
+    first = article_store.get_by_id(new_ids[0])
+    assert first["title"] == "First"
+    assert first["status"] == "collected"
+    assert first["tags"] == ["AI"]
+    assert article_store.get_by_url("https://example.com/bulk-0")["title"] == "Existing"
+
+    assert article_store.bulk_upsert(batch) == []
+    assert article_store.bulk_upsert([]) == []
+
+
+def test_bulk_upsert_skips_invalid_articles(article_store):
+    """
+    TC-2-37b: Test bulk_upsert skips articles missing url or title
+
+    Expected:
+    - An empty title or url drops only that article
+    - The rest of the batch is stored
+    """
+    new_ids = article_store.bulk_upsert([
+        {"url": "https://example.com/valid-1", "title": "Valid 1"},
+        {"url": "https://example.com/no-title", "title": ""},
+        {"url": "", "title": "No URL"},
+        {"title": "Missing URL"},
+        {"url": "https://example.com/valid-2", "title": "Valid 2"},
+    ])
+
+    assert len(new_ids) == 2
+    assert article_store.get_by_url("https://example.com/valid-2")["title"] == "Valid 2"
+    assert article_store.get_by_url("https://example.com/no-title") is None
+
+
+# ========================================
+# TC-2-38: ArticleStore Column Projection
+# ========================================
+
+def test_listing_fields_projection(article_store):
+    """
+    TC-2-38: Test fields= loads only the requested columns
+
+    Expected:
+    - Projected rows contain exactly the requested keys
+    - Values are serialized the same way as Article.to_dict()
+    - parse_analysis=False skips parsing the analysis JSON
+    - Unknown fields raise ValueError
+    """
+    article_id = article_store.store_article({
+        "url": "https://example.com/projection",
+        "title": "Projection",
+        "content": "x" * 10000,
+        "tags": ["AI", "Robotics"],
+        "key_insights": ["one"],
+        "priority_score": 0.9,
+        "status": "analyzed"
+    })
+    full = article_store.get_by_id(article_id)
+
+    rows = article_store.get_by_status("analyzed", fields=["id", "url", "title"])
+    assert rows == [{"id": article_id, "url": full["url"], "title": "Projection"}]
+
+    listing = article_store.get_all(fields=ArticleStore.LISTING_FIELDS)[0]
+    assert "content" not in listing and "analysis" not in listing
+    assert listing == {name: full[name] for name in ArticleStore.LISTING_FIELDS}
+
+    top = article_store.get_top_priority(fields=["id", "analysis"])[0]
+    assert top["analysis"] == {"key_insights": ["one"]}
+
+    # parse_analysis=False hands back the stored JSON string unparsed
+    raw = article_store.get_top_priority(fields=["id", "analysis"], parse_analysis=False)[0]
+    assert json.loads(raw["analysis"]) == {"key_insights": ["one"]}
+    raw_full = article_store.get_all(parse_analysis=False)[0]
+    assert isinstance(raw_full["analysis"], str)
+    assert isinstance(article_store.get_by_id(article_id, parse_analysis=False)["analysis"], str)
+    raw_by_url = article_store.get_by_url(full["url"], parse_analysis=False)
+    assert json.loads(raw_by_url["analysis"]) == full["analysis"]
+
+    with pytest.raises(ValueError):
+        article_store.get_recent(fields=["id", "not_a_column"])
+
+
+# ========================================
+# TC-2-39: Streaming Iterators
+# ========================================
+
+def test_iter_articles_and_embeddings_keyset(article_store, embedding_store):
+    """
+    TC-2-39: Test iter_articles / iter_embeddings page through all rows
+
+    Expected:
+    - Every matching row is yielded once, in ID order, across batch boundaries
+    - Filters and projections apply; id is only returned when requested
+    """
+    ids = []
+    for i in range(7):
+        article_id = article_store.store_article({
+            "url": f"https://example.com/iter-{i}",
+            "title": f"Iter {i}",
+            "status": "analyzed" if i % 2 == 0 else "pending"
+        })
+        embedding_store.store(article_id=article_id, vector=np.full(4, float(i + 1)), model="iter-model")
+        ids.append(article_id)
+
+    streamed = list(article_store.iter_articles(batch_size=3))
+    assert [a["id"] for a in streamed] == ids
+
+    analyzed = list(article_store.iter_articles(status="analyzed", fields=["title"], batch_size=2))
+    assert analyzed == [{"title": f"Iter {i}"} for i in range(0, 7, 2)]
+
+    embeddings = list(embedding_store.iter_embeddings(model="iter-model", batch_size=2))
+    assert [e["article_id"] for e in embeddings] == ids
+    np.testing.assert_allclose(embeddings[-1]["embedding"], np.full(4, 7.0))
+    assert list(embedding_store.iter_embeddings(model="missing-model")) == []
+
+
+# ========================================
+# TC-2-40: Query Plans for Hot Article Queries
+# ========================================
+
+def _capture_queries(database, fn):
+    """Run fn and return the (statement, parameters) pairs it executed"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engines = {database.engine, database.read_engine}
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", capture)
+    try:
+        fn()
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+
+def test_hot_article_queries_use_indexes(article_store, database, temp_db_path):
+    """
+    TC-2-40: Test EXPLAIN QUERY PLAN of the hot listing queries
+
+    Expected:
+    - No full table scan of articles
+    - get_by_status / get_by_date_range need no temporary sort
+    - Migration 003 is idempotent on an existing database
+    """
+    import importlib
+    import re
+
+    migration = importlib.import_module("src.memory.migrations.003_article_composite_indexes")
+    assert migration.migrate(Path(temp_db_path)) is True
+
+    now = datetime.utcnow()
+    queries = {
+        "get_by_status": lambda: article_store.get_by_status(
+            "collected", fields=["id", "url", "title"]
+        ),
+        "get_by_date_range": lambda: article_store.get_by_date_range(
+            (now - timedelta(days=7)).isoformat(), now.isoformat(),
+            status="analyzed", min_priority=0.6, fields=ArticleStore.LISTING_FIELDS
+        ),
+        "get_top_priority": lambda: article_store.get_top_priority(
+            limit=30, status="analyzed", fields=ArticleStore.LISTING_FIELDS
+        ),
+        "get_top_priority_window": lambda: article_store.get_top_priority(
+            limit=30, status="analyzed",
+            fetched_after=now - timedelta(days=1), fetched_before=now
+        ),
+    }
+    sorted_ok = {"get_top_priority_window"}
+
+    raw = database.read_engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for name, query in queries.items():
+            statements = [
+                (sql, params) for sql, params in _capture_queries(database, query)
+                if sql.lstrip().upper().startswith("SELECT")
+            ]
+            assert statements, name
+
+            for sql, params in statements:
+                plan = [row[3] for row in cursor.execute("EXPLAIN QUERY PLAN " + sql, params)]
+                full_scans = [
+                    step for step in plan
+                    if re.match(r"SCAN (TABLE )?articles\b", step) and "USING" not in step
+                ]
+                assert not full_scans, f"{name}: {plan}"
+                if name not in sorted_ok:
+                    assert not any("TEMP B-TREE" in step for step in plan), f"{name}: {plan}"
+    finally:
+        raw.close()
+
+
+# ========================================
+# TC-2-41: Database Profiles and Connection Pools
+# ========================================
+
+def test_database_profile_and_reader_pool(temp_db_path):
+    """
+    TC-2-41: Test pragma profiles and the reader/writer connection split
+
+    Expected:
+    - Profile pragmas (and overrides) are applied to every connection
+    - Read sessions are query_only and use their own connections in parallel
+    - Writes are visible to later read sessions
+    - Unknown profiles raise ValueError
+    """
+    import threading
+    from sqlalchemy import text
+
+    db = Database(
+        f"sqlite:///{temp_db_path}", profile="throughput", pragmas={"cache_size": -4096}
+    )
+    db.init_db()
+    try:
+        with db.get_session() as session:
+            assert session.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert session.execute(text("PRAGMA cache_size")).scalar() == -4096
+            assert session.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+            session.add(Article(url="https://example.com/pool", title="Pool",
+                                source="rss", fetched_at=datetime.utcnow()))
+
+        connections = []
+        barrier = threading.Barrier(3)
+
+        def read():
+            with db.get_read_session() as session:
+                assert session.execute(text("PRAGMA query_only")).scalar() == 1
+                assert session.query(Article).count() == 1
+                connections.append(id(session.connection().connection.dbapi_connection))
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(connections)) == 3
+
+        with pytest.raises(Exception, match="readonly"):
+            with db.get_read_session() as session:
+                session.execute(text("DELETE FROM articles"))
+    finally:
+        db.close()
+
+    with pytest.raises(ValueError):
+        Database(f"sqlite:///{temp_db_path}", profile="turbo")
+
+
+# ========================================
+# TC-2-42 ~ TC-2-43: Write-Behind Queue
+# ========================================
+
+def test_write_behind_queue_batches_and_flushes(article_store, embedding_store, database):
+    """
+    TC-2-42: Test WriteBehindQueue coalesces writes into batched transactions
+
+    Expected:
+    - Analysis and embedding writes of a batch land in one transaction
+    - Repeated writes for an article are coalesced (last wins)
+    - close() flushes pending writes; submitting afterwards fails
+    - A failing item does not lose the rest of its batch
+    """
+    from src.memory.write_queue import WriteBehindQueue
+
+    ids = [
+        article_store.create(url=f"https://example.com/wbq-{i}", title=f"W {i}", source="rss")
+        for i in range(4)
+    ]
+
+    commits = []
+
+    def count_commit(conn):
+        commits.append(conn)
+
+    writes = WriteBehindQueue(article_store, embedding_store, flush_interval=5.0, max_batch=100)
+    for i, article_id in enumerate(ids):
+        writes.submit_analysis(article_id, {"summary": "draft"}, priority_score=0.1)
+        writes.submit_analysis(article_id, {"summary": f"final {i}"}, priority_score=0.5 + i / 10)
+        writes.submit_embedding(article_id, np.full(4, float(i + 1)), model="wbq-model")
+    writes.submit_embedding(999999, np.ones(4), model="wbq-model")  # unknown article
+
+    event.listen(database.engine, "commit", count_commit)
+    try:
+        assert writes.flush(timeout=10) is True
+    finally:
+        event.remove(database.engine, "commit", count_commit)
+
+    assert len(commits) == 1
+    stats = writes.stats()
+    assert stats["coalesced"] == 4
+    assert stats["batches"] == 1
+
+    article = article_store.get_by_id(ids[2])
+    assert article["status"] == "analyzed"
+    assert article["analysis"] == {"summary": "final 2"}
+    assert embedding_store.exists(ids[3], model="wbq-model")
+
+    writes.submit_analysis(ids[0], {"summary": "on close"}, priority_score=0.9)
+    writes.close()
+    assert article_store.get_by_id(ids[0])["priority_score"] == 0.9
+    with pytest.raises(RuntimeError):
+        writes.submit_analysis(ids[0], {}, priority_score=0.1)
+
+
+def test_write_behind_queue_backpressure():
+    """
+    TC-2-43: Test producers block while the queue is full
+
+    Expected:
+    - With max_pending=1 and a slow writer, submit() waits for space
+    - Every write is still persisted
+    """
+    import time
+    from unittest.mock import MagicMock, Mock
+    from src.memory.write_queue import WriteBehindQueue
+
+    written = []
+
+    def slow_update(batch, session=None):
+        time.sleep(0.05)
+        written.extend(update["article_id"] for update in batch)
+        return [update["article_id"] for update in batch]
+
+    article_store = MagicMock()
+    article_store.update_analysis_many.side_effect = slow_update
+
+    with WriteBehindQueue(article_store, Mock(), flush_interval=0.0, max_batch=1, max_pending=1) as writes:
+        for article_id in range(5):
+            writes.submit_analysis(article_id, {}, priority_score=0.5)
+        assert writes.stats()["blocked_seconds"] > 0
+
+    assert sorted(written) == list(range(5))
+
+
+def test_write_behind_queue_result_is_atomic(article_store, embedding_store, database):
+    """
+    TC-2-43b: Test an article's analysis and embedding are saved together
+
+    Expected:
+    - submit_result writes analysis and embedding in one commit
+    - If the embedding cannot be written, the analysis is rolled back too
+    - Lost writes are counted in failed / failed_articles
+    """
+    from src.memory.write_queue import WriteBehindQueue
+
+    ok_id, bad_id = [
+        article_store.create(url=f"https://example.com/atomic-{i}", title=f"A {i}", source="rss")
+        for i in range(2)
+    ]
+
+    commits = []
+
+    def count_commit(conn):
+        commits.append(conn)
+
+    with WriteBehindQueue(article_store, embedding_store, flush_interval=5.0) as writes:
+        event.listen(database.engine, "commit", count_commit)
+        try:
+            writes.submit_result(ok_id, {"summary": "ok"}, priority_score=0.6,
+                                 vector=np.ones(4), model="atomic-model")
+            assert writes.flush(timeout=10) is True
+        finally:
+            event.remove(database.engine, "commit", count_commit)
+        assert len(commits) == 1
+
+        # A 2-D vector makes store_many raise after the analysis was applied
+        writes.submit_result(bad_id, {"summary": "lost"}, priority_score=0.9,
+                             vector=np.ones((2, 2)), model="atomic-model")
+        assert writes.flush(timeout=10) is True
+        stats = writes.stats()
+
+    assert article_store.get_by_id(ok_id)["status"] == "analyzed"
+    assert embedding_store.exists(ok_id, model="atomic-model")
+
+    bad = article_store.get_by_id(bad_id)
+    assert bad["status"] != "analyzed"
+    assert bad["analysis"] is None
+    assert stats["failed"] == 2
+    assert stats["failed_articles"] == 1
+
+
+# ========================================
+# TC-2-44: Redirect Store
+# ========================================
+
+def test_redirect_store_maps_redirects_to_canonical(article_store, database):
+    """
+    TC-2-44: Test RedirectStore persistence and get_by_url through redirects
+
+    Expected:
+    - store_many inserts new redirects and updates existing ones
+    - get_many only returns resolved redirects
+    - ArticleStore.get_by_url finds an article by a resolved redirect URL
+    """
+    from src.memory import RedirectStore
+
+    store = RedirectStore(database)
+    redirect = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/AUZIYQ-1"
+
+    assert store.store_many([
+        {"redirect_url": redirect, "canonical_url": "https://example.com/old", "status_code": 200}
+    ]) == 1
+    assert store.store_many([
+        {"redirect_url": redirect, "canonical_url": "https://example.com/post", "status_code": 200}
+    ]) == 1
+    assert store.store_many([]) == 0
+
+    assert store.get(redirect) == "https://example.com/post"
+    assert store.get_many([redirect, "https://vertexaisearch.cloud.google.com/unknown"]) == {
+        redirect: "https://example.com/post"
+    }
+
+    article_store.create(url="https://example.com/post", title="Post", source="rss")
+    assert article_store.get_by_url(redirect)["title"] == "Post"
+    assert article_store.get_by_url("https://vertexaisearch.cloud.google.com/unknown") is None
+
+
+def test_rss_url_and_resolved_redirect_are_one_article(article_store, database):
+    """
+    TC-2-44b: Test an RSS link with tracking parameters and a search redirect
+    that later resolves to the same article are deduplicated
+
+    Expected:
+    - bulk_upsert stores the RSS URL in normalized form
+    - The resolved redirect maps to that URL, so it is skipped as a duplicate
+    - get_by_url finds the article by the raw RSS URL and by the redirect
+    """
+    from unittest.mock import Mock
+    from src.memory import RedirectStore
+    from src.tools.redirect_resolver import RedirectResolver
+
+    rss_url = "https://Example.com/2025/robots?utm_source=rss&utm_medium=feed#comments"
+    redirect = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/AUZIYQ-robots"
+
+    [article_id] = article_store.bulk_upsert([
+        {"url": rss_url, "title": "Robots", "source": "rss", "status": "collected"}
+    ])
+    assert article_store.get_by_id(article_id)["url"] == "https://example.com/2025/robots"
+
+    resolver = RedirectResolver(store=RedirectStore(database))
+    response = Mock(url="https://example.com/2025/robots?utm_source=google", status_code=200)
+    resolver._session.request = Mock(return_value=response)
+    try:
+        search_articles = resolver.resolve_articles([
+            {"url": redirect, "title": "Robots", "source": "search", "status": "collected"}
+        ])
+    finally:
+        resolver.close()
+
+    assert article_store.bulk_upsert(search_articles) == []
+    assert article_store.get_by_url(rss_url)["id"] == article_id
+    assert article_store.get_by_url(redirect)["id"] == article_id
@@ -0,0 +1,115 @@
+"""
+Unit Tests for Redirect Resolver Tool
+
+測試 RedirectResolver 的並行解析、持久化對照表與文章改寫。
+"""
+
+import threading
+import time
+
+from unittest.mock import Mock
+import requests
+
+from src.tools.redirect_resolver import RedirectResolver
+
+
+REDIRECT = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/"
+
+
+def _response(url, status_code=200):
+    response = Mock()
+    response.url = url
+    response.status_code = status_code
+    return response
+
+
+class TestRedirectResolver:
+    """RedirectResolver 類的測試集"""
+
+    def test_resolve_many_uses_store_and_persists_new(self):
+        """測試已知跳轉取自對照表，新解析結果一次寫入，非跳轉 URL 原樣返回"""
+        store = Mock()
+        store.get_many.return_value = {REDIRECT + "known": "https://example.com/known"}
+        resolver = RedirectResolver(store=store)
+        resolver._session.request = Mock(return_value=_response(
+            "https://Example.com/new?utm_source=google"
+        ))
+
+        mapping = resolver.resolve_many([
+            REDIRECT + "known", REDIRECT + "new", "https://example.com/direct"
+        ])
+
+        assert mapping == {
+            REDIRECT + "known": "https://example.com/known",
+            REDIRECT + "new": "https://example.com/new",
+            "https://example.com/direct": "https://example.com/direct",
+        }
+        resolver._session.request.assert_called_once()
+        assert resolver._session.request.call_args[0] == ("HEAD", REDIRECT + "new")
+        store.store_many.assert_called_once_with([{
+            "redirect_url": REDIRECT + "new",
+            "canonical_url": "https://example.com/new",
+            "status_code": 200
+        }])
+        assert resolver.stats() == {"stored": 1, "resolved": 1, "failed": 0}
+
+    def test_falls_back_to_get_and_skips_failures(self):
+        """測試 HEAD 未離開跳轉主機時改用 GET；無法解析的跳轉不寫入"""
+        def request(method, url, **kwargs):
+            if url.endswith("broken"):
+                raise requests.ConnectionError("refused")
+            if method == "HEAD":
+                return _response(url, status_code=405)
+            return _response("https://example.com/article", status_code=403)
+
+        resolver = RedirectResolver()
+        resolver._session.request = Mock(side_effect=request)
+
+        mapping = resolver.resolve_many([REDIRECT + "a", REDIRECT + "broken"])
+
+        assert mapping == {REDIRECT + "a": "https://example.com/article"}
+        assert resolver.stats()["failed"] == 1
+
+    def test_requests_run_concurrently(self):
+        """測試跳轉以多個執行緒並行解析，且不超過 max_workers"""
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def request(method, url, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            return _response(url.replace(REDIRECT, "https://example.com/"))
+
+        resolver = RedirectResolver(max_workers=3)
+        resolver._session.request = Mock(side_effect=request)
+
+        mapping = resolver.resolve_many([REDIRECT + str(i) for i in range(6)])
+
+        assert len(mapping) == 6
+        assert in_flight["peak"] == 3
+
+    def test_resolve_articles_rewrites_url_source_and_title(self):
+        """測試文章改用原始 URL，並以其網域與路徑更新來源與標題"""
+        redirect_url = REDIRECT + "AUZIYQH-long-opaque-token"
+        resolver = RedirectResolver()
+        resolver._session.request = Mock(return_value=_response(
+            "https://www.techcrunch.com/2025/01/figure-raises-new-funding/"
+        ))
+        garbled = "Auziyqh Long Opaque Token"
+        rss_article = {"url": "https://example.com/rss", "title": "RSS"}
+
+        articles = resolver.resolve_articles([
+            rss_article,
+            {"url": redirect_url, "title": garbled, "summary": garbled,
+             "source_name": "vertexaisearch.cloud.google.com"},
+        ])
+
+        assert articles[0] is rss_article
+        assert articles[1]["url"] == "https://www.techcrunch.com/2025/01/figure-raises-new-funding/"
+        assert articles[1]["source_name"] == "techcrunch.com"
+        assert articles[1]["title"] == "Figure Raises New Funding"
+        assert articles[1]["summary"] == "Figure Raises New Funding"
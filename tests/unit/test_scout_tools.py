@@ -9,16 +9,26 @@ Test Coverage:
     - search_articles tool wrapper
     - Tool docstring completeness
     - Error handling
+    - Run-scoped artifact store (tools return handles, runner assembles)
+    - Fast mode: declarative source plan collected without the LLM
 
 Usage:
     pytest tests/unit/test_scout_tools.py -v
 """
 
+import json
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, ANY
 from datetime import datetime, timezone
 
-from src.agents.scout_agent import fetch_rss, search_articles
+from src.agents.scout_agent import (
+    fetch_rss,
+    search_articles,
+    ScoutAgentRunner,
+    ScoutArtifactStore,
+    load_scout_plan,
+    _current_artifacts
+)
 
 
 class TestFetchRSSTool:
@@ -60,7 +70,7 @@ class TestFetchRSSTool:
             assert 'title' in result['articles'][0]
 
             # Verify RSSFetcher was called correctly
-            MockFetcher.assert_called_once_with(timeout=30)
+            MockFetcher.assert_called_once_with(timeout=30, cache=ANY)
             mock_instance.fetch_rss_feeds.assert_called_once_with(
                 feed_urls=['https://example.com/feed/'],
                 max_articles_per_feed=10
@@ -231,6 +241,202 @@ class TestSearchArticlesTool:
         assert 'Example:' in search_articles.__doc__
 
 
+class TestScoutArtifactStore:
+    """Test suite for the run-scoped artifact store"""
+
+    @staticmethod
+    def _event(text):
+        event = Mock()
+        event.content.parts = [Mock(text=text)]
+        return event
+
+    @staticmethod
+    def _runner():
+        with patch('src.agents.scout_agent.Runner'):
+            return ScoutAgentRunner(agent=Mock())
+
+    def test_tools_stash_articles_and_return_handles(self):
+        """TC-5-08: 收集运行中工具只返回 handle 与数量"""
+        store = ScoutArtifactStore()
+        token = _current_artifacts.set(store)
+        try:
+            with patch('src.agents.scout_agent.RSSFetcher') as MockFetcher, \
+                 patch('src.agents.scout_agent.GoogleSearchGroundingTool') as MockSearch:
+                MockFetcher.return_value.fetch_rss_feeds.return_value = {
+                    'status': 'success',
+                    'articles': [{'url': 'https://a.com/1'}, {'url': 'https://a.com/2'}],
+                    'errors': [],
+                    'summary': {'total_articles': 2}
+                }
+                MockSearch.return_value.search_articles.return_value = {
+                    'status': 'success',
+                    'query': 'robots',
+                    'articles': [{'url': 'https://b.com/1'}],
+                    'total_results': 1
+                }
+
+                rss_result = fetch_rss(['https://example.com/feed/'])
+                search_result = search_articles('robots')
+        finally:
+            _current_artifacts.reset(token)
+
+        assert 'articles' not in rss_result
+        assert rss_result['handle'] == 'rss-1'
+        assert rss_result['article_count'] == 2
+        assert rss_result['summary'] == {'total_articles': 2}
+        assert search_result['handle'] == 'search-1'
+        assert store.handles == ['rss-1', 'search-1']
+        assert len(store) == 3
+
+    def test_runner_assembles_selected_handles(self):
+        """TC-5-09: Runner 依 Agent 选择的 handle 从暂存区组装文章"""
+        runner = self._runner()
+        store = ScoutArtifactStore()
+        store.put('rss', [
+            {'url': 'https://a.com/1', 'source': 'rss'},
+            {'url': 'https://a.com/2', 'source': 'rss'}
+        ])
+        store.put('search', [{'url': 'https://off-topic.com', 'source': 'google_search'}])
+        store.put('search', [
+            {'url': 'https://a.com/1', 'source': 'google_search'},
+            {'url': 'https://b.com/1', 'source': 'google_search'}
+        ])
+
+        result = runner._parse_agent_output(
+            self._event('```json\n{"selected": ["rss-1", "search-2", "unknown-9"]}\n```'),
+            store
+        )
+
+        assert [a['url'] for a in result['articles']] == [
+            'https://a.com/1', 'https://a.com/2', 'https://b.com/1'
+        ]
+        assert result['total_count'] == 3
+        assert result['sources'] == {'rss': 2, 'google_search': 1}
+        assert result['handles'] == ['rss-1', 'search-2']
+
+    def test_runner_uses_all_artifacts_when_selection_invalid(self):
+        """TC-5-10: Agent 输出无法解析时采用全部暂存文章"""
+        runner = self._runner()
+        store = ScoutArtifactStore()
+        store.put('rss', [{'url': 'https://a.com/1'}])
+        store.put('search', [{'url': 'https://b.com/1'}])
+
+        result = runner._parse_agent_output(self._event('Done collecting!'), store)
+
+        assert result['total_count'] == 2
+        assert result['handles'] == ['rss-1', 'search-1']
+
+
+class TestScoutFastMode:
+    """Test suite for plan-driven (fast) collection"""
+
+    def test_load_scout_plan(self, tmp_path):
+        """TC-5-11: 来源计划支持默认上限与单项覆盖"""
+        plan_file = tmp_path / "plan.json"
+        plan_file.write_text(json.dumps({
+            "feeds": ["https://a.com/feed", {"url": "https://b.com/feed", "max_articles": 7}],
+            "max_articles_per_feed": 3,
+            "queries": ["robots", {"query": "agents", "max_results": 2}],
+            "max_results_per_query": 5
+        }))
+
+        plan = load_scout_plan(str(plan_file))
+
+        assert plan["feeds"] == [
+            {"url": "https://a.com/feed", "max_articles": 3},
+            {"url": "https://b.com/feed", "max_articles": 7}
+        ]
+        assert plan["queries"] == [
+            {"query": "robots", "max_results": 5},
+            {"query": "agents", "max_results": 2}
+        ]
+
+        plan_file.write_text(json.dumps({"feeds": [{"max_articles": 1}]}))
+        with pytest.raises(ValueError):
+            load_scout_plan(str(plan_file))
+
+    def test_default_plan_file_is_valid(self):
+        """The shipped plan matches the feeds and queries of the Scout prompt"""
+        plan = load_scout_plan()
+        assert len(plan["feeds"]) == 8
+        assert len(plan["queries"]) == 5
+
+    def test_collect_from_plan_runs_sources_concurrently(self):
+        """TC-5-12: fast 模式不建立 Agent，各来源并行抓取，单一来源失败不影响结果"""
+        import time
+
+        def fake_fetch_rss(feed_urls, max_articles_per_feed):
+            time.sleep(0.2)
+            return {
+                "status": "success",
+                "articles": [{"url": f"{url}/1", "source": "rss"} for url in feed_urls],
+                "errors": []
+            }
+
+        def fake_search(query, max_results):
+            time.sleep(0.2)
+            if query == "broken":
+                return {"status": "error", "query": query, "articles": [],
+                        "error_message": "quota"}
+            return {"status": "success", "query": query,
+                    "articles": [{"url": "https://a.com/1", "source": "google_search"},
+                                 {"url": f"https://s.com/{query}", "source": "google_search"}]}
+
+        with patch('src.agents.scout_agent.create_scout_agent') as mock_create, \
+             patch('src.agents.scout_agent.fetch_rss', side_effect=fake_fetch_rss) as mock_rss, \
+             patch('src.agents.scout_agent.search_articles', side_effect=fake_search):
+            runner = ScoutAgentRunner()
+            plan = {
+                "feeds": [{"url": "https://a.com", "max_articles": 3},
+                          {"url": "https://b.com", "max_articles": 3},
+                          {"url": "https://c.com", "max_articles": 9}],
+                "queries": [{"query": "robots", "max_results": 5},
+                            {"query": "broken", "max_results": 5}]
+            }
+
+            start = time.time()
+            result = runner.collect_from_plan(plan)
+            elapsed = time.time() - start
+
+        mock_create.assert_not_called()
+        assert runner.agent is None
+        assert elapsed < 0.6  # 4 calls of 0.2s each, run in parallel
+        assert mock_rss.call_count == 2  # feeds grouped by cap
+        assert result["status"] == "success"
+        assert [a["url"] for a in result["articles"]] == [
+            "https://a.com/1", "https://b.com/1", "https://c.com/1", "https://s.com/robots"
+        ]
+        assert result["sources"] == {"rss": 3, "google_search": 1}
+        assert result["errors"] == [{"query": "broken", "error_message": "quota"}]
+
+    def test_invalid_mode_rejected(self):
+        """Unknown collection modes are rejected"""
+        with pytest.raises(ValueError):
+            ScoutAgentRunner(mode="turbo")
+
+    def test_deduplicate_resolves_redirects_and_normalizes(self):
+        """TC-5-13: 去重前解析跳转 URL，跨来源与追踪参数不同的重复文章被去除"""
+        redirect = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/AUZIYQ"
+        resolver = Mock()
+        resolver.resolve_articles.side_effect = lambda articles: [
+            dict(a, url="https://example.com/post") if a["url"] == redirect else a
+            for a in articles
+        ]
+        runner = ScoutAgentRunner(redirect_resolver=resolver)
+
+        articles = runner._deduplicate_articles([
+            {"url": "https://example.com/post?utm_source=rss", "source": "rss"},
+            {"url": redirect, "source": "google_search_grounding"},
+            {"url": "https://Example.com/post#comments", "source": "rss"},
+            {"url": "https://example.com/other", "source": "rss"},
+        ])
+
+        assert [a["url"] for a in articles] == [
+            "https://example.com/post?utm_source=rss", "https://example.com/other"
+        ]
+        resolver.resolve_articles.assert_called_once()
+
+
 class TestToolsIntegration:
     """Integration tests for tools working together"""
 
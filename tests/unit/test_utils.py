@@ -4,6 +4,8 @@ Unit tests for utilities module (Config and Logger)
 Tests cover:
 - Config loading and validation
 - Logger creation and functionality
+- DiskCache persistence, TTL and eviction
+- LLMResponseCache keys and bypass
 - Error handling scenarios
 
 Updated for Stage 12: Removed deprecated google_search_api_key and google_search_engine_id
@@ -13,9 +15,14 @@ import pytest
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from src.utils.config import Config
 from src.utils.logger import Logger
+from src.utils.disk_cache import DiskCache
+from src.utils.llm_cache import LLMResponseCache
+from src.utils.search_cache import SearchResultCache, normalize_query
+from src.utils.url_utils import is_redirect_url, normalize_url
 
 
 @pytest.fixture(autouse=True)
@@ -26,7 +33,11 @@ def clear_env_vars():
     keys_to_clear = [
         'GOOGLE_API_KEY', 'EMAIL_ACCOUNT', 'EMAIL_PASSWORD',
         'SMTP_HOST', 'SMTP_PORT', 'SMTP_USE_TLS',
-        'DATABASE_PATH', 'USER_NAME', 'USER_INTERESTS', 'LOG_LEVEL'
+        'DATABASE_PATH', 'USER_NAME', 'USER_INTERESTS', 'LOG_LEVEL',
+        'CACHE_DIR', 'EXTRACTION_PARSE_WORKERS', 'ANALYSIS_CONCURRENCY',
+        'DATABASE_PROFILE', 'LLM_CACHE_TTL_HOURS', 'LLM_CACHE_BYPASS',
+        'SCOUT_MODE', 'SEARCH_CACHE_TTL_HOURS', 'SEARCH_CACHE_STALE_HOURS',
+        'EMBEDDING_BATCH_SIZE', 'EMBEDDING_BATCH_WAIT_SECONDS'
     ]
     for key in keys_to_clear:
         if key in os.environ:
@@ -88,6 +99,74 @@ EMAIL_PASSWORD=test_password
         with pytest.raises(ValueError, match="Missing or invalid config.*GOOGLE_API_KEY"):
             Config.load(str(env_file))
 
+    def test_config_performance_settings(self, tmp_path):
+        """Config 性能相关设置 - 缓存目录与解析进程数"""
+        env_file = tmp_path / ".env.test"
+        env_file.write_text("""
+GOOGLE_API_KEY=test_google_key
+EMAIL_ACCOUNT=test@example.com
+EMAIL_PASSWORD=test_password
+CACHE_DIR=/tmp/insight-cache
+EXTRACTION_PARSE_WORKERS=4
+ANALYSIS_CONCURRENCY=8
+EMBEDDING_BATCH_SIZE=50
+EMBEDDING_BATCH_WAIT_SECONDS=12.5
+DATABASE_PROFILE=throughput
+LLM_CACHE_TTL_HOURS=24
+LLM_CACHE_BYPASS=true
+SCOUT_MODE=explore
+SEARCH_CACHE_TTL_HOURS=6
+SEARCH_CACHE_STALE_HOURS=0
+""".strip())
+
+        config = Config.load(str(env_file))
+
+        assert config.cache_dir == "/tmp/insight-cache"
+        assert config.extraction_parse_workers == 4
+        assert config.analysis_concurrency == 8
+        assert config.embedding_batch_size == 50
+        assert config.embedding_batch_wait_seconds == 12.5
+        assert config.database_profile == "throughput"
+        assert config.llm_cache_ttl_hours == 24
+        assert config.llm_cache_bypass is True
+        assert config.scout_mode == "explore"
+        assert config.search_cache_ttl_hours == 6
+        assert config.search_cache_stale_hours == 0
+
+        config.extraction_parse_workers = -1
+        with pytest.raises(ValueError, match="parse workers"):
+            config.validate()
+
+        config.extraction_parse_workers = 0
+        config.analysis_concurrency = 0
+        with pytest.raises(ValueError, match="analysis concurrency"):
+            config.validate()
+
+        config.analysis_concurrency = 1
+        config.embedding_batch_size = 101
+        with pytest.raises(ValueError, match="embedding batch size"):
+            config.validate()
+
+        config.embedding_batch_size = 100
+        config.embedding_batch_wait_seconds = -1
+        with pytest.raises(ValueError, match="embedding batch wait"):
+            config.validate()
+
+        config.embedding_batch_wait_seconds = 0
+        config.llm_cache_ttl_hours = -1
+        with pytest.raises(ValueError, match="LLM cache TTL"):
+            config.validate()
+
+        config.llm_cache_ttl_hours = 0
+        config.search_cache_stale_hours = -1
+        with pytest.raises(ValueError, match="search_cache_stale_hours"):
+            config.validate()
+
+        config.search_cache_stale_hours = 0
+        config.scout_mode = "llm"
+        with pytest.raises(ValueError, match="scout mode"):
+            config.validate()
+
     def test_config_file_not_found(self):
         """TC-1-03: Config 文件不存在"""
         # 验证抛出 FileNotFoundError
@@ -257,6 +336,203 @@ class TestLogger:
         assert logger.level == logging.DEBUG
 
 
+class TestDiskCache:
+    """DiskCache 測試"""
+
+    def test_disk_cache_roundtrip_and_namespaces(self, tmp_path):
+        """測試存取、命名空間隔離與跨實例持久化"""
+        path = tmp_path / "cache.db"
+        feeds = DiskCache(path, namespace="feeds")
+        search = DiskCache(path, namespace="search")
+
+        feeds.set("key", {"etag": "abc", "items": [1, 2, 3]})
+
+        assert feeds.get("key") == {"etag": "abc", "items": [1, 2, 3]}
+        assert search.get("key") is None
+        assert "key" in feeds
+        assert DiskCache(path, namespace="feeds").get("key")["etag"] == "abc"
+
+        stats = feeds.stats()
+        assert stats["hits"] == 1
+        assert stats["entries"] == 1
+        assert search.stats()["misses"] == 1
+
+    def test_disk_cache_ttl_and_stale_read(self, tmp_path):
+        """測試 TTL 過期與 stale-while-revalidate 讀取"""
+        cache = DiskCache(tmp_path / "cache.db", namespace="ttl", ttl_seconds=60)
+        cache.set("fresh", "value")
+        cache.set("old", "stale-value", ttl_seconds=-1)
+
+        assert cache.get("fresh") == "value"
+        assert cache.get("old") is None
+        assert "old" not in cache
+
+        entry = cache.get_entry("old", allow_expired=True)
+        assert entry.value == "stale-value"
+        assert entry.expired is True
+
+    def test_disk_cache_lru_eviction(self, tmp_path):
+        """測試超過 max_entries 時淘汰最久未使用的項目"""
+        cache = DiskCache(tmp_path / "cache.db", namespace="lru", max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+
+class TestLLMResponseCache:
+    """LLM 回應快取測試"""
+
+    @staticmethod
+    def _agent(name="AnalystAgent", model="gemini-2.5-flash", instruction="prompt v1"):
+        return SimpleNamespace(name=name, model=model, instruction=instruction)
+
+    def test_llm_cache_key_covers_agent_model_prompt_and_input(self, tmp_path):
+        """測試不同 Agent、模型、prompt 或輸入不會互相命中"""
+        llm_cache = LLMResponseCache(DiskCache(tmp_path / "cache.db", namespace="llm"))
+        agent = self._agent()
+        llm_cache.set(agent, "article 1", "response 1")
+        llm_cache.set(agent, "empty", "")
+
+        assert llm_cache.get(self._agent(), "article 1") == "response 1"
+        assert llm_cache.get(agent, "article 2") is None
+        assert llm_cache.get(agent, "empty") is None
+        assert llm_cache.get(self._agent(name="CuratorDailyAgent"), "article 1") is None
+        assert llm_cache.get(self._agent(model="gemini-2.5-pro"), "article 1") is None
+        assert llm_cache.get(self._agent(instruction="prompt v2"), "article 1") is None
+        assert llm_cache.stats()["hits"] == 1
+        llm_cache.close()
+
+    def test_llm_cache_bypass_and_from_config(self, tmp_path):
+        """測試 bypass 只跳過查詢、TTL 為 0 時停用快取"""
+        config = Mock(cache_dir=str(tmp_path), llm_cache_ttl_hours=1, llm_cache_bypass=True)
+        llm_cache = LLMResponseCache.from_config(config)
+        agent = self._agent()
+
+        llm_cache.set(agent, "input", "fresh")
+        assert llm_cache.get(agent, "input") is None
+        assert llm_cache.stats()["bypassed"] == 1
+
+        llm_cache.bypass = False
+        assert llm_cache.get(agent, "input") == "fresh"
+        assert llm_cache.cache.ttl_seconds == 3600
+        llm_cache.close()
+
+        config.llm_cache_ttl_hours = 0
+        assert LLMResponseCache.from_config(config) is None
+
+
+class TestSearchResultCache:
+    """搜尋結果快取測試"""
+
+    @staticmethod
+    def _result(status="success", url="https://example.com/a"):
+        return {"status": status, "query": "q", "articles": [{"url": url}], "total_results": 1}
+
+    def test_normalize_query_and_key(self):
+        """測試只有大小寫與空白不同的查詢共用 key；詞序、引號與運算子保留"""
+        assert normalize_query("  Humanoid robot\tUnitree,  Figure ") == \
+            "humanoid robot unitree, figure"
+        assert normalize_query('"Figure AI" -Tesla site:example.com') == \
+            '"figure ai" -tesla site:example.com'
+        assert normalize_query("robot humanoid") != normalize_query("humanoid robot")
+        assert normalize_query('"humanoid robot"') != normalize_query("humanoid robot")
+        assert normalize_query(None) == ""
+
+        key = SearchResultCache.make_key("grounding", "gemini-2.5-flash", "AI Agents", max_results=5)
+        assert key == SearchResultCache.make_key(
+            "grounding", "gemini-2.5-flash", " ai   AGENTS ", max_results=5
+        )
+        assert key != SearchResultCache.make_key(
+            "grounding", "gemini-2.5-flash", "agents ai", max_results=5
+        )
+        assert key != SearchResultCache.make_key("grounding", "gemini-2.5-pro", "AI Agents", max_results=5)
+        assert key != SearchResultCache.make_key("grounding", "gemini-2.5-flash", "AI Agents", max_results=10)
+
+    def test_fresh_hits_and_failed_results_not_cached(self, tmp_path):
+        """測試新鮮命中與失敗結果不寫入"""
+        search_cache = SearchResultCache(
+            DiskCache(tmp_path / "cache.db", namespace="search"), fresh_seconds=3600
+        )
+
+        assert search_cache.lookup("k") == (None, False)
+        assert search_cache.store("k", self._result()) is True
+        assert search_cache.store("failed", self._result(status="error")) is False
+
+        assert search_cache.lookup("k") == (self._result(), False)
+        assert search_cache.lookup("failed") == (None, False)
+
+        stats = search_cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+        search_cache.close()
+
+    def test_stale_while_revalidate(self, tmp_path):
+        """測試過期結果仍回傳並於背景刷新，刷新失敗時保留舊結果"""
+        search_cache = SearchResultCache(
+            DiskCache(tmp_path / "cache.db", namespace="search"),
+            fresh_seconds=0, stale_seconds=3600
+        )
+        search_cache.store("k", self._result(url="https://example.com/old"))
+
+        result, stale = search_cache.lookup("k")
+        assert stale is True
+        assert result["articles"][0]["url"] == "https://example.com/old"
+
+        search_cache.revalidate("k", lambda: self._result(status="error")).result()
+        assert search_cache.lookup("k")[0]["articles"][0]["url"] == "https://example.com/old"
+
+        search_cache.revalidate("k", lambda: self._result(url="https://example.com/new")).result()
+        assert search_cache.lookup("k")[0]["articles"][0]["url"] == "https://example.com/new"
+
+        stats = search_cache.stats()
+        assert stats["stale_hits"] == 3
+        assert stats["revalidations"] == 2
+        assert stats["revalidation_failures"] == 1
+        search_cache.close()
+        assert search_cache.revalidate("k", self._result) is None
+
+    def test_from_config(self, tmp_path):
+        """測試由設定建立快取，TTL 為 0 時停用"""
+        config = Mock(cache_dir=str(tmp_path), search_cache_ttl_hours=2, search_cache_stale_hours=1)
+        search_cache = SearchResultCache.from_config(config)
+
+        assert search_cache.fresh_seconds == 7200
+        assert search_cache.stale_seconds == 3600
+        assert search_cache.cache.namespace == SearchResultCache.NAMESPACE
+        search_cache.close()
+
+        config.search_cache_ttl_hours = 0
+        assert SearchResultCache.from_config(config) is None
+
+
+class TestUrlUtils:
+    """URL 正規化測試"""
+
+    def test_normalize_url(self):
+        """測試大小寫、預設埠、追蹤參數與 fragment 的正規化"""
+        assert normalize_url("HTTPS://Example.COM:443/a?utm_source=x&b=2&a=1#top") == \
+            "https://example.com/a?a=1&b=2"
+        assert normalize_url("http://example.com") == "http://example.com/"
+        assert normalize_url("http://example.com:8080/x?fbclid=1") == "http://example.com:8080/x"
+        assert normalize_url("https://www.example.com/A") == "https://www.example.com/A"
+        assert normalize_url("not a url") == "not a url"
+
+    def test_is_redirect_url(self):
+        """測試 Grounding 跳轉連結的判斷"""
+        assert is_redirect_url(
+            "https://VertexAISearch.cloud.google.com/grounding-api-redirect/AUZIYQ"
+        )
+        assert not is_redirect_url("https://example.com/grounding-api-redirect/AUZIYQ")
+        assert not is_redirect_url("")
+        assert not is_redirect_url("http://[invalid")
+
+
 class TestIntegration:
     """Integration tests for Config and Logger working together"""
 
@@ -199,6 +199,64 @@ class TestWeeklyPipelineOrchestrator:
         assert "suggestion" in result
 
 
+class TestCuratorWeeklyClustering:
+    """CuratorWeeklyRunner._cluster_articles 的測試集"""
+
+    def test_cluster_articles_uses_memmap_matrix_in_found_ids_order(
+        self, mock_config, tmp_path
+    ):
+        """測試聚類收到 get_matrix 的 memmap 矩陣，列順序與 found_ids 及 metadata 一致"""
+        import numpy as np
+        from src.agents.curator_weekly import CuratorWeeklyRunner
+        from src.memory.article_store import ArticleStore
+        from src.memory.database import Database
+        from src.memory.embedding_store import ANALYSIS_EMBEDDING_MODEL, EmbeddingStore
+
+        db = Database(f"sqlite:///{tmp_path / 'weekly.db'}")
+        db.init_db()
+        article_store = ArticleStore(db)
+        embedding_store = EmbeddingStore(db)
+
+        ids = [
+            article_store.create(url=f"https://example.com/weekly-{i}", title=f"Weekly {i}")
+            for i in range(4)
+        ]
+        vectors = {
+            article_id: np.array([float(i + 1), 0.5, -1.0])
+            for i, article_id in enumerate(ids)
+            if i != 1  # 第二篇沒有 embedding
+        }
+        for article_id, vector in vectors.items():
+            embedding_store.store(article_id, vector, model=ANALYSIS_EMBEDDING_MODEL)
+
+        with patch("src.agents.curator_weekly.Database"):
+            runner = CuratorWeeklyRunner(mock_config)
+        runner.embedding_store = embedding_store
+
+        articles = [
+            {"id": article_id, "title": f"Weekly {i}", "summary": "", "tags": "",
+             "priority_score": 0.8}
+            for i, article_id in enumerate(ids)
+        ]
+
+        with patch("src.agents.curator_weekly.VectorClusteringTool") as mock_tool_class:
+            mock_tool_class.return_value.cluster_embeddings.return_value = {"status": "error"}
+            runner._cluster_articles(articles)
+
+        matrix, metadata = mock_tool_class.return_value.cluster_embeddings.call_args[0]
+        found_ids, expected = embedding_store.get_matrix(ids, model=ANALYSIS_EMBEDDING_MODEL)
+
+        assert isinstance(matrix, np.memmap)
+        assert found_ids.tolist() == [ids[0], ids[2], ids[3]]
+        assert [m["article_id"] for m in metadata] == found_ids.tolist()
+        for row, item in zip(matrix, metadata):
+            np.testing.assert_allclose(row, vectors[item["article_id"]], rtol=1e-6)
+        np.testing.assert_array_equal(matrix, expected)
+
+        embedding_store.close()
+        db.close()
+
+
 class TestParseArgs:
     """測試命令行參數解析"""
 
@@ -272,4 +330,5 @@ def mock_config():
     config.google_api_key = "test_key"
     config.email_account = "test@example.com"
     config.email_password = "test_password"
+    config.llm_cache_ttl_hours = 0
     return config